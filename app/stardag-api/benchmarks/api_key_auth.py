@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Load benchmark of the /builds endpoints with API key authentication.
+
+Each SDK request is authenticated by its API key. Verifying a key with bcrypt
+costs on the order of 100 ms of CPU, so without caching it dominates request
+latency and, when run on the event loop, serializes the whole worker.
+
+Scenarios (same request mix, with and without the verified-key cache):
+- uncached: every request verifies the key with bcrypt (in a worker thread)
+- cached: only the first request verifies the key with bcrypt
+
+Each scenario sends concurrent POST /builds, GET /builds/{id} and
+POST /builds/{id}/tasks requests against an in-process app backed by a
+temporary SQLite database.
+
+Usage:
+    cd app/stardag-api
+    uv run python benchmarks/api_key_auth.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import tempfile
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from stardag_api.db import get_db
+from stardag_api.main import app
+from stardag_api.models import Base, Environment, Workspace
+from stardag_api.services import api_keys as api_key_service
+
+REQUESTS = 120
+CONCURRENCY = 20
+
+
+async def setup_database(
+    path: Path,
+) -> tuple[async_sessionmaker[AsyncSession], str]:
+    """Create the schema and an API key, return session maker and the key."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_maker() as session:
+        workspace = Workspace(name="Benchmark", slug="benchmark")
+        session.add(workspace)
+        await session.flush()
+        environment = Environment(
+            workspace_id=workspace.id, name="Benchmark", slug="benchmark"
+        )
+        session.add(environment)
+        await session.flush()
+        _, full_key = await api_key_service.create_api_key(
+            session, environment.id, "benchmark"
+        )
+        await session.commit()
+
+    return session_maker, full_key
+
+
+async def run_scenario(client: AsyncClient, full_key: str) -> list[float]:
+    """Send the request mix, return the latency (seconds) of each request."""
+    headers = {"X-API-Key": full_key}
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies: list[float] = []
+
+    async def request(index: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                "/api/v1/builds", json={"description": f"b{index}"}, headers=headers
+            )
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+            build_id = response.json()["id"]
+
+            start = time.perf_counter()
+            response = await client.get(f"/api/v1/builds/{build_id}", headers=headers)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            response = await client.post(
+                f"/api/v1/builds/{build_id}/tasks",
+                json={
+                    "task_id": f"task-{index}",
+                    "task_namespace": "",
+                    "task_name": "BenchmarkTask",
+                    "task_data": {},
+                },
+                headers=headers,
+            )
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(request(i) for i in range(REQUESTS // 3)))
+    return latencies
+
+
+async def main_aio(tmp_dir: Path) -> None:
+    session_maker, full_key = await setup_database(tmp_dir / "benchmark.db")
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    cache = api_key_service.verified_api_key_cache
+    default_ttl = cache.ttl_seconds
+
+    print("=" * 70)
+    print("API KEY AUTH LOAD BENCHMARK")
+    print("=" * 70)
+    print(f"{REQUESTS} requests, concurrency {CONCURRENCY}")
+    print(
+        f"{'Scenario':<12}{'Total (s)':>12}{'Req/s':>10}{'p50 (ms)':>12}{'p95 (ms)':>12}"
+    )
+    print("-" * 58)
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://benchmark"
+        ) as client:
+            for name, ttl_seconds in [("uncached", 0.0), ("cached", default_ttl)]:
+                cache.clear()
+                cache.ttl_seconds = ttl_seconds
+                start = time.perf_counter()
+                latencies = await run_scenario(client, full_key)
+                total = time.perf_counter() - start
+                quantiles = statistics.quantiles(latencies, n=20)
+                print(
+                    f"{name:<12}{total:>12.2f}{len(latencies) / total:>10.1f}"
+                    f"{quantiles[9] * 1000:>12.1f}{quantiles[18] * 1000:>12.1f}"
+                )
+    finally:
+        cache.ttl_seconds = default_ttl
+        cache.clear()
+        app.dependency_overrides.clear()
+
+
+def main() -> None:
+    """Run the API key auth load benchmark."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(main_aio(Path(tmp_dir)))
+
+
+if __name__ == "__main__":
+    main()
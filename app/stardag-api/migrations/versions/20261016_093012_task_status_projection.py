@@ -0,0 +1,126 @@
+"""task status projection
+
+Adds projected status columns to builds and tasks, and the task_build_status
+table. Existing data is populated by running the one-off backfill after the
+upgrade: `python -m stardag_api.backfill`.
+
+Revision ID: b3e1c8d27f45
+Revises: 941cd8b749c7
+Create Date: 2026-10-16 09:30:12.512334
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e1c8d27f45"
+down_revision: Union[str, Sequence[str], None] = "941cd8b749c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "builds",
+        sa.Column(
+            "status", sa.String(length=32), server_default="pending", nullable=False
+        ),
+    )
+    op.add_column(
+        "builds", sa.Column("started_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column(
+        "builds", sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column(
+        "builds",
+        sa.Column("status_triggered_by_user_id", sa.String(length=255), nullable=True),
+    )
+    op.create_index(
+        "ix_builds_environment_status",
+        "builds",
+        ["environment_id", "status"],
+        unique=False,
+    )
+
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "status", sa.String(length=32), server_default="pending", nullable=False
+        ),
+    )
+    op.add_column(
+        "tasks", sa.Column("started_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column(
+        "tasks", sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column("tasks", sa.Column("error_message", sa.Text(), nullable=True))
+    op.add_column("tasks", sa.Column("status_build_id", sa.Uuid(), nullable=True))
+    op.add_column(
+        "tasks",
+        sa.Column("waiting_for_lock", sa.Boolean(), server_default="0", nullable=False),
+    )
+    op.create_foreign_key(
+        "fk_tasks_status_build_id_builds",
+        "tasks",
+        "builds",
+        ["status_build_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_index(
+        "ix_tasks_environment_status",
+        "tasks",
+        ["environment_id", "status"],
+        unique=False,
+    )
+
+    op.create_table(
+        "task_build_status",
+        sa.Column("build_id", sa.Uuid(), nullable=False),
+        sa.Column("task_id", sa.Uuid(), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["build_id"], ["builds.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["task_id"], ["tasks.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("build_id", "task_id"),
+    )
+    op.create_index(
+        "ix_task_build_status_build_status",
+        "task_build_status",
+        ["build_id", "status"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_task_build_status_task", "task_build_status", ["task_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_task_build_status_task", table_name="task_build_status")
+    op.drop_index("ix_task_build_status_build_status", table_name="task_build_status")
+    op.drop_table("task_build_status")
+
+    op.drop_index("ix_tasks_environment_status", table_name="tasks")
+    op.drop_constraint("fk_tasks_status_build_id_builds", "tasks", type_="foreignkey")
+    op.drop_column("tasks", "waiting_for_lock")
+    op.drop_column("tasks", "status_build_id")
+    op.drop_column("tasks", "error_message")
+    op.drop_column("tasks", "completed_at")
+    op.drop_column("tasks", "started_at")
+    op.drop_column("tasks", "status")
+
+    op.drop_index("ix_builds_environment_status", table_name="builds")
+    op.drop_column("builds", "status_triggered_by_user_id")
+    op.drop_column("builds", "completed_at")
+    op.drop_column("builds", "started_at")
+    op.drop_column("builds", "status")
@@ -0,0 +1,45 @@
+"""event batches
+
+Adds the event_batches table, recording the client-generated IDs of applied
+event batches so that resent batches are applied at most once.
+
+Revision ID: 6d2a9f4c1e83
+Revises: b3e1c8d27f45
+Create Date: 2026-10-17 09:15:44.203817
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6d2a9f4c1e83"
+down_revision: Union[str, Sequence[str], None] = "b3e1c8d27f45"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "event_batches",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("build_id", sa.Uuid(), nullable=False),
+        sa.Column("registered", sa.Integer(), nullable=False),
+        sa.Column("events", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["build_id"], ["builds.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_event_batches_build_id"), "event_batches", ["build_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_event_batches_build_id"), table_name="event_batches")
+    op.drop_table("event_batches")
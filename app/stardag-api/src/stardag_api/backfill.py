@@ -0,0 +1,137 @@
+"""One-off backfill of the status projections from events.
+
+Rebuilds `Build.status`, `TaskBuildStatus` and `Task.status` (with timestamps) by
+replaying all events in order. Run it once after applying the migration that
+introduced the projections, or at any time to repair them:
+
+    uv run python -m stardag_api.backfill
+"""
+
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from stardag_api.models import (
+    Build,
+    BuildStatus,
+    Event,
+    Task,
+    TaskBuildStatus,
+    TaskStatus,
+)
+from stardag_api.services.status import (
+    apply_build_event,
+    apply_task_build_event,
+    apply_task_global_event,
+)
+
+logger = logging.getLogger(__name__)
+
+# Number of builds/tasks processed (and committed) at a time
+_CHUNK_SIZE = 500
+
+
+async def _backfill_build(db: AsyncSession, build: Build) -> None:
+    build.status = BuildStatus.PENDING
+    build.started_at = None
+    build.completed_at = None
+    build.status_triggered_by_user_id = None
+    await db.execute(
+        delete(TaskBuildStatus).where(TaskBuildStatus.build_id == build.id)
+    )
+
+    task_build_statuses: dict[UUID, TaskBuildStatus] = {}
+    result = await db.stream_scalars(
+        select(Event)
+        .where(Event.build_id == build.id)
+        .order_by(Event.created_at.asc(), Event.id.asc())
+    )
+    async for event in result:
+        if event.task_id is None:
+            apply_build_event(build, event)
+            continue
+        row = task_build_statuses.get(event.task_id)
+        if row is None:
+            row = TaskBuildStatus(
+                build_id=build.id, task_id=event.task_id, status=TaskStatus.PENDING
+            )
+            task_build_statuses[event.task_id] = row
+        apply_task_build_event(row, event)
+    db.add_all(task_build_statuses.values())
+
+
+async def _backfill_tasks(db: AsyncSession, tasks: list[Task]) -> None:
+    tasks_by_id = {task.id: task for task in tasks}
+    for task in tasks:
+        task.status = TaskStatus.PENDING
+        task.started_at = None
+        task.completed_at = None
+        task.error_message = None
+        task.status_build_id = None
+        task.waiting_for_lock = False
+
+    result = await db.stream_scalars(
+        select(Event)
+        .where(Event.task_id.in_(list(tasks_by_id)))
+        .order_by(Event.created_at.asc(), Event.id.asc())
+    )
+    async for event in result:
+        apply_task_global_event(tasks_by_id[event.task_id], event)
+
+
+async def backfill_status_projections(db: AsyncSession) -> tuple[int, int]:
+    """Rebuild the build and task status projections from events.
+
+    Commits after each chunk of builds/tasks.
+
+    Returns:
+        Tuple of (number of builds, number of tasks) processed.
+    """
+    build_count = 0
+    last_build_id = None
+    while True:
+        query = select(Build).order_by(Build.id).limit(_CHUNK_SIZE)
+        if last_build_id is not None:
+            query = query.where(Build.id > last_build_id)
+        builds = (await db.execute(query)).scalars().all()
+        if not builds:
+            break
+        for build in builds:
+            await _backfill_build(db, build)
+        await db.commit()
+        build_count += len(builds)
+        last_build_id = builds[-1].id
+        logger.info("Backfilled %d builds", build_count)
+
+    task_count = 0
+    last_task_id = None
+    while True:
+        query = select(Task).order_by(Task.id).limit(_CHUNK_SIZE)
+        if last_task_id is not None:
+            query = query.where(Task.id > last_task_id)
+        tasks = list((await db.execute(query)).scalars().all())
+        if not tasks:
+            break
+        await _backfill_tasks(db, tasks)
+        await db.commit()
+        task_count += len(tasks)
+        last_task_id = tasks[-1].id
+        logger.info("Backfilled %d tasks", task_count)
+
+    return build_count, task_count
+
+
+async def main() -> None:
+    from stardag_api.db import async_session_maker
+
+    async with async_session_maker() as db:
+        build_count, task_count = await backfill_status_projections(db)
+    print(f"Backfilled status of {build_count} builds and {task_count} tasks.")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -15,6 +15,13 @@ class Settings(BaseSettings):
     # CORS origins (comma-separated)
     cors_origins: str = "http://localhost:5173,http://localhost:3000"
 
+    # Verified API keys are cached for this many seconds (0 disables the cache)
+    api_key_cache_ttl_seconds: float = 300
+    # Max number of cached verified API keys
+    api_key_cache_max_size: int = 10_000
+    # Min interval between updates of an API key's last_used_at
+    api_key_last_used_interval_seconds: float = 60
+
     model_config = SettingsConfigDict(env_prefix="STARDAG_API_")
 
     @property
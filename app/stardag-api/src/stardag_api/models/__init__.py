@@ -11,6 +11,7 @@ from stardag_api.models.enums import (
     TaskStatus,
 )
 from stardag_api.models.event import Event
+from stardag_api.models.event_batch import EventBatch
 from stardag_api.models.invite import Invite
 from stardag_api.models.lock import DistributedLock
 from stardag_api.models.workspace import Workspace
@@ -18,6 +19,7 @@ from stardag_api.models.workspace_member import WorkspaceMember
 from stardag_api.models.target_root import TargetRoot
 from stardag_api.models.task import Task
 from stardag_api.models.task_asset import TaskRegistryAsset
+from stardag_api.models.task_build_status import TaskBuildStatus
 from stardag_api.models.task_dependency import TaskDependency
 from stardag_api.models.user import User
 from stardag_api.models.environment import Environment
@@ -29,6 +31,7 @@ __all__ = [
     "BuildStatus",
     "DistributedLock",
     "Event",
+    "EventBatch",
     "EventType",
     "Invite",
     "InviteStatus",
@@ -37,6 +40,7 @@ __all__ = [
     "WorkspaceRole",
     "TargetRoot",
     "Task",
+    "TaskBuildStatus",
     "TaskRegistryAsset",
     "TaskDependency",
     "TaskStatus",
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, JSON, String, Text, Uuid
+from sqlalchemy import DateTime, ForeignKey, Index, JSON, String, Text, Uuid
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from stardag_api.models.base import Base, TimestampMixin, generate_uuid7
+from stardag_api.models.enums import BuildStatus
 
 if TYPE_CHECKING:
     from stardag_api.models.event import Event
@@ -19,13 +21,15 @@ if TYPE_CHECKING:
 class Build(Base, TimestampMixin):
     """Represents execution of sd.build() for a DAG/set of tasks.
 
-    Status is derived from events (no stored status field).
-    Timestamps (started_at, completed_at) are derived from events.
+    Status and timestamps (started_at, completed_at) are derived from events, and
+    stored as a projection that is updated in the same transaction as each event
+    is recorded (see services.status.StatusProjector).
     """
 
     __tablename__ = "builds"
     __table_args__ = (
         Index("ix_builds_environment_created", "environment_id", "created_at"),
+        Index("ix_builds_environment_status", "environment_id", "status"),
     )
 
     id: Mapped[UUID] = mapped_column(
@@ -62,6 +66,18 @@ class Build(Base, TimestampMixin):
         default=list,
     )
 
+    # Status projection (derived from build-level events)
+    status: Mapped[BuildStatus] = mapped_column(
+        String(32),
+        nullable=False,
+        default=BuildStatus.PENDING,
+        server_default=BuildStatus.PENDING.value,
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    # External ID of the user who manually set the final status (if any)
+    status_triggered_by_user_id: Mapped[str | None] = mapped_column(String(255))
+
     # Relationships
     environment: Mapped[Environment] = relationship(back_populates="builds")
     user: Mapped[User | None] = relationship(back_populates="builds")
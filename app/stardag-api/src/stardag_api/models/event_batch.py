@@ -0,0 +1,41 @@
+"""EventBatch model - record of applied event batches, for idempotent resends."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Integer, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from stardag_api.models.base import Base, utc_now
+
+
+class EventBatch(Base):
+    """An event batch applied to a build.
+
+    The ID is generated by the client, so that a batch resent (e.g. after a
+    timeout) is applied at most once. Stored in the same transaction as the
+    events of the batch.
+    """
+
+    __tablename__ = "event_batches"
+
+    id: Mapped[UUID] = mapped_column(Uuid, primary_key=True)
+
+    build_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("builds.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    # Result of applying the batch, returned for resends
+    registered: Mapped[int] = mapped_column(Integer, nullable=False)
+    events: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+    )
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, JSON, String, UniqueConstraint, Uuid
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    JSON,
+    String,
+    Text,
+    UniqueConstraint,
+    Uuid,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from stardag_api.models.base import Base, TimestampMixin, generate_uuid7
+from stardag_api.models.enums import TaskStatus
 
 if TYPE_CHECKING:
     from stardag_api.models.event import Event
@@ -25,7 +37,9 @@ class Task(Base, TimestampMixin):
     - name
     - parameters (hash)
 
-    A Task can participate in multiple Runs. Status per-run is tracked via Events.
+    A Task can participate in multiple Runs. Status per-run is tracked via Events,
+    and projected to TaskBuildStatus. The global status (across all builds) is
+    projected to the status columns of this table.
     """
 
     __tablename__ = "tasks"
@@ -35,6 +49,7 @@ class Task(Base, TimestampMixin):
         ),
         Index("ix_tasks_environment_name", "environment_id", "task_name"),
         Index("ix_tasks_environment_namespace", "environment_id", "task_namespace"),
+        Index("ix_tasks_environment_status", "environment_id", "status"),
     )
 
     # UUID7 primary key for time-sortable, globally unique IDs
@@ -78,6 +93,29 @@ class Task(Base, TimestampMixin):
     # Output URI (path to task output if it has a FileSystemTarget)
     output_uri: Mapped[str | None] = mapped_column(String(2048))
 
+    # Global status projection (derived from the task's events in all builds)
+    status: Mapped[TaskStatus] = mapped_column(
+        String(32),
+        nullable=False,
+        default=TaskStatus.PENDING,
+        server_default=TaskStatus.PENDING.value,
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    error_message: Mapped[str | None] = mapped_column(Text)
+    # Build where the status-determining event occurred
+    status_build_id: Mapped[UUID | None] = mapped_column(
+        Uuid,
+        ForeignKey("builds.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    waiting_for_lock: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="0",
+    )
+
     # Relationships
     environment: Mapped[Environment] = relationship(back_populates="tasks")
     events: Mapped[list[Event]] = relationship(
@@ -0,0 +1,47 @@
+"""TaskBuildStatus model - status projection of a task within a build."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Uuid
+from sqlalchemy.orm import Mapped, mapped_column
+
+from stardag_api.models.base import Base
+from stardag_api.models.enums import TaskStatus
+
+
+class TaskBuildStatus(Base):
+    """Current status of a task within a build.
+
+    Projection of the task's events in the build, updated in the same transaction
+    as each event is recorded (see services.status.StatusProjector). Events remain
+    the source of truth; the projection can be rebuilt with `stardag_api.backfill`.
+    """
+
+    __tablename__ = "task_build_status"
+    __table_args__ = (
+        Index("ix_task_build_status_build_status", "build_id", "status"),
+        Index("ix_task_build_status_task", "task_id"),
+    )
+
+    build_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("builds.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    task_id: Mapped[UUID] = mapped_column(
+        Uuid,
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    status: Mapped[TaskStatus] = mapped_column(
+        String(32),
+        nullable=False,
+        default=TaskStatus.PENDING,
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    error_message: Mapped[str | None] = mapped_column(Text)
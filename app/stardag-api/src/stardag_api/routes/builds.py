@@ -1,10 +1,12 @@
 """Build management routes - primary interface for SDK."""
 
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from stardag_api.auth import (
@@ -14,7 +16,9 @@ from stardag_api.auth import (
 from stardag_api.db import get_db
 from stardag_api.models import (
     Build,
+    BuildStatus,
     Event,
+    EventBatch,
     EventType,
     Task,
     TaskDependency,
@@ -22,10 +26,14 @@ from stardag_api.models import (
     TaskStatus,
     User,
 )
+from stardag_api.models.base import generate_uuid7, utc_now
 from stardag_api.schemas import (
+    BatchTaskRegistration,
     BuildCreate,
     BuildListResponse,
     BuildResponse,
+    EventBatchCreate,
+    EventBatchResponse,
     EventResponse,
     StatusTriggeredByUser,
     TaskCreate,
@@ -41,12 +49,30 @@ from stardag_api.schemas import (
 )
 from stardag_api.services import generate_build_slug, get_build_status
 from stardag_api.services.status import (
+    StatusProjector,
     get_all_task_global_statuses,
     get_task_status_in_build,
+    record_event,
 )
 
 router = APIRouter(prefix="/builds", tags=["builds"])
 
+# Task lifecycle events that can be recorded through the batch endpoint
+_BATCHABLE_TASK_EVENT_TYPES = frozenset(
+    {
+        EventType.TASK_STARTED,
+        EventType.TASK_COMPLETED,
+        EventType.TASK_FAILED,
+        EventType.TASK_SUSPENDED,
+        EventType.TASK_RESUMED,
+        EventType.TASK_CANCELLED,
+        EventType.TASK_WAITING_FOR_LOCK,
+    }
+)
+
+# Max number of task_ids per IN (...) lookup
+_TASK_LOOKUP_CHUNK_SIZE = 500
+
 
 # --- Helpers ---
 
@@ -70,13 +96,8 @@ async def _get_triggered_by_user(
     )
 
 
-async def _get_build_and_task(
-    build_id: UUID,
-    task_id: str,
-    db: AsyncSession,
-    auth: SdkAuth,
-) -> tuple[Build, Task]:
-    """Get build and task, verifying ownership. Raises HTTPException on errors."""
+async def _get_build(build_id: UUID, db: AsyncSession, auth: SdkAuth) -> Build:
+    """Get build, verifying ownership. Raises HTTPException on errors."""
     build = await db.get(Build, build_id)
     if not build:
         raise HTTPException(status_code=404, detail="Build not found")
@@ -86,6 +107,18 @@ async def _get_build_and_task(
             status_code=403, detail="Build does not belong to this environment"
         )
 
+    return build
+
+
+async def _get_build_and_task(
+    build_id: UUID,
+    task_id: str,
+    db: AsyncSession,
+    auth: SdkAuth,
+) -> tuple[Build, Task]:
+    """Get build and task, verifying ownership. Raises HTTPException on errors."""
+    build = await _get_build(build_id, db, auth)
+
     result = await db.execute(
         select(Task)
         .where(Task.environment_id == build.environment_id)
@@ -98,6 +131,89 @@ async def _get_build_and_task(
     return build, db_task
 
 
+async def _load_tasks(
+    db: AsyncSession, environment_id: UUID, task_ids: list[str]
+) -> dict[str, Task]:
+    """Load existing tasks in the environment, keyed by task_id."""
+    unique_task_ids = list(dict.fromkeys(task_ids))
+    tasks_by_id: dict[str, Task] = {}
+    for start in range(0, len(unique_task_ids), _TASK_LOOKUP_CHUNK_SIZE):
+        result = await db.execute(
+            select(Task)
+            .where(Task.environment_id == environment_id)
+            .where(
+                Task.task_id.in_(
+                    unique_task_ids[start : start + _TASK_LOOKUP_CHUNK_SIZE]
+                )
+            )
+        )
+        for db_task in result.scalars():
+            tasks_by_id[db_task.task_id] = db_task
+    return tasks_by_id
+
+
+async def _register_task(
+    db: AsyncSession,
+    build: Build,
+    task: TaskCreate,
+    tasks_by_id: dict[str, Task],
+    projector: StatusProjector,
+    created_at: datetime | None = None,
+) -> Task:
+    """Add a task (if new), its dependency edges and the build event to the session.
+
+    `tasks_by_id` must contain the task (if it exists) and its dependencies, and
+    is updated with newly created tasks. Does not commit.
+    """
+    db_task = tasks_by_id.get(task.task_id)
+    task_already_existed = db_task is not None
+
+    if db_task is None:
+        db_task = Task(
+            id=generate_uuid7(),
+            task_id=task.task_id,
+            environment_id=build.environment_id,
+            task_namespace=task.task_namespace,
+            task_name=task.task_name,
+            task_data=task.task_data,
+            version=task.version,
+            output_uri=task.output_uri,
+            status=TaskStatus.PENDING,
+            waiting_for_lock=False,
+        )
+        db.add(db_task)
+        tasks_by_id[task.task_id] = db_task
+
+        # A new task has no edges yet; unknown upstream tasks are skipped
+        for dep_task_id in dict.fromkeys(task.dependency_task_ids):
+            dep_task = tasks_by_id.get(dep_task_id)
+            if dep_task is not None:
+                db.add(
+                    TaskDependency(
+                        upstream_task_id=dep_task.id,
+                        downstream_task_id=db_task.id,
+                    )
+                )
+
+    # Create appropriate event for this build:
+    # - TASK_PENDING if this build first registered the task
+    # - TASK_REFERENCED if the task already existed from another build
+    await projector.record(
+        Event(
+            build_id=build.id,
+            task_id=db_task.id,
+            event_type=EventType.TASK_REFERENCED
+            if task_already_existed
+            else EventType.TASK_PENDING,
+            created_at=created_at or utc_now(),
+        ),
+        build=build,
+        task=db_task,
+        new_task=not task_already_existed,
+    )
+    return db_task
+
+
 async def _create_task_event(
     build_id: UUID,
     task_id: str,
@@ -115,7 +231,7 @@ async def _create_task_event(
         event_type=event_type,
         error_message=error_message,
     )
-    db.add(event)
+    await record_event(db, event, task=db_task)
     await db.commit()
 
     status, _, _, _ = await get_task_status_in_build(db, build_id, db_task.id)
@@ -149,6 +265,7 @@ async def create_build(
         description=build.description,
         commit_hash=build.commit_hash,
         root_task_ids=build.root_task_ids,
+        status=BuildStatus.PENDING,
     )
     db.add(db_build)
     await db.flush()  # Get the build ID
@@ -159,7 +276,7 @@ async def create_build(
         task_id=None,
         event_type=EventType.BUILD_STARTED,
     )
-    db.add(start_event)
+    await record_event(db, start_event, build=db_build)
 
     await db.commit()
     await db.refresh(db_build)
@@ -216,13 +333,12 @@ async def list_builds(
     )
     builds = result.scalars().all()
 
-    # Build responses with derived status
+    # Build responses with projected status
     build_responses = []
     for build in builds:
-        status, started_at, completed_at, triggered_by_id = await get_build_status(
-            db, build.id
+        triggered_by_user = await _get_triggered_by_user(
+            db, build.status_triggered_by_user_id
         )
-        triggered_by_user = await _get_triggered_by_user(db, triggered_by_id)
         build_responses.append(
             BuildResponse(
                 id=build.id,
@@ -233,9 +349,9 @@ async def list_builds(
                 commit_hash=build.commit_hash,
                 root_task_ids=build.root_task_ids,
                 created_at=build.created_at,
-                status=status,
-                started_at=started_at,
-                completed_at=completed_at,
+                status=BuildStatus(build.status),
+                started_at=build.started_at,
+                completed_at=build.completed_at,
                 status_triggered_by_user=triggered_by_user,
             )
         )
@@ -322,7 +438,7 @@ async def complete_build(
         event_type=EventType.BUILD_COMPLETED,
         event_metadata=event_metadata,
     )
-    db.add(event)
+    await record_event(db, event, build=build)
     await db.commit()
 
     status, started_at, completed_at, triggered_by_id = await get_build_status(
@@ -382,7 +498,7 @@ async def fail_build(
         error_message=error_message,
         event_metadata=event_metadata,
     )
-    db.add(event)
+    await record_event(db, event, build=build)
     await db.commit()
 
     status, started_at, completed_at, triggered_by_id = await get_build_status(
@@ -439,7 +555,7 @@ async def cancel_build(
         event_type=EventType.BUILD_CANCELLED,
         event_metadata=event_metadata,
     )
-    db.add(event)
+    await record_event(db, event, build=build)
     await db.commit()
 
     status, started_at, completed_at, triggered_by_id = await get_build_status(
@@ -487,7 +603,7 @@ async def exit_early(
         event_type=EventType.BUILD_EXIT_EARLY,
         error_message=reason,  # Reuse error_message field for the reason
     )
-    db.add(event)
+    await record_event(db, event, build=build)
     await db.commit()
 
     status, started_at, completed_at, triggered_by_id = await get_build_status(
@@ -527,73 +643,12 @@ async def register_task(
     TASK_REFERENCED event is created. Otherwise creates the task and a
     TASK_PENDING event.
     """
-    build = await db.get(Build, build_id)
-    if not build:
-        raise HTTPException(status_code=404, detail="Build not found")
+    build = await _get_build(build_id, db, auth)
 
-    # Verify build belongs to authenticated environment
-    if build.environment_id != auth.environment_id:
-        raise HTTPException(
-            status_code=403, detail="Build does not belong to this environment"
-        )
-
-    # Check if task already exists in environment
-    result = await db.execute(
-        select(Task)
-        .where(Task.environment_id == build.environment_id)
-        .where(Task.task_id == task.task_id)
-    )
-    db_task = result.scalar_one_or_none()
-    task_already_existed = db_task is not None
-
-    if not db_task:
-        # Create new task
-        db_task = Task(
-            task_id=task.task_id,
-            environment_id=build.environment_id,
-            task_namespace=task.task_namespace,
-            task_name=task.task_name,
-            task_data=task.task_data,
-            version=task.version,
-            output_uri=task.output_uri,
-        )
-        db.add(db_task)
-        await db.flush()  # Get the id
-
-        # Create dependencies
-        for dep_task_id in task.dependency_task_ids:
-            # Find the upstream task
-            dep_result = await db.execute(
-                select(Task)
-                .where(Task.environment_id == build.environment_id)
-                .where(Task.task_id == dep_task_id)
-            )
-            dep_task = dep_result.scalar_one_or_none()
-            if dep_task:
-                # Check if dependency edge already exists
-                edge_result = await db.execute(
-                    select(TaskDependency)
-                    .where(TaskDependency.upstream_task_id == dep_task.id)
-                    .where(TaskDependency.downstream_task_id == db_task.id)
-                )
-                if not edge_result.scalar_one_or_none():
-                    dep_edge = TaskDependency(
-                        upstream_task_id=dep_task.id,
-                        downstream_task_id=db_task.id,
-                    )
-                    db.add(dep_edge)
-
-    # Create appropriate event for this build:
-    # - TASK_PENDING if this build first registered the task
-    # - TASK_REFERENCED if the task already existed from another build
-    event = Event(
-        build_id=build_id,
-        task_id=db_task.id,
-        event_type=EventType.TASK_REFERENCED
-        if task_already_existed
-        else EventType.TASK_PENDING,
+    tasks_by_id = await _load_tasks(
+        db, build.environment_id, [task.task_id, *task.dependency_task_ids]
     )
-    db.add(event)
+    db_task = await _register_task(db, build, task, tasks_by_id, StatusProjector(db))
 
     await db.commit()
     await db.refresh(db_task)
@@ -611,6 +666,132 @@ async def register_task(
     )
 
 
+@router.post(
+    "/{build_id}/events:batch", response_model=EventBatchResponse, status_code=201
+)
+async def create_events_batch(
+    build_id: UUID,
+    batch: EventBatchCreate,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    auth: Annotated[SdkAuth, Depends(require_sdk_auth)],
+):
+    """Register tasks and record task events in bulk.
+
+    Items are applied in order within a single transaction: either all of them
+    are stored or none are. Registrations behave as in `register_task` and
+    events as in the individual task event endpoints, so a task must be
+    registered (in this batch or earlier) before events can refer to it.
+
+    Events are timestamped with the server time (as build events are), offset by
+    their position in the batch to keep the order of the client. A batch resent
+    with the same `batch_id` is not applied again; the result of the first
+    request is returned.
+    """
+    build = await _get_build(build_id, db, auth)
+
+    if batch.batch_id is not None:
+        applied = await _get_applied_event_batch(db, build.id, batch.batch_id)
+        if applied is not None:
+            return applied
+
+    referenced_task_ids: list[str] = []
+    for item in batch.items:
+        if isinstance(item, BatchTaskRegistration):
+            referenced_task_ids.append(item.task.task_id)
+            referenced_task_ids.extend(item.task.dependency_task_ids)
+        else:
+            if item.event_type not in _BATCHABLE_TASK_EVENT_TYPES:
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Event type not allowed in batch: {item.event_type.value}",
+                )
+            referenced_task_ids.append(item.task_id)
+    tasks_by_id = await _load_tasks(db, build.environment_id, referenced_task_ids)
+    projector = StatusProjector(db)
+    await projector.prefetch(build.id, [db_task.id for db_task in tasks_by_id.values()])
+
+    # Statuses are rebuilt by replaying events in order of their timestamps, so
+    # the events of the batch follow those already recorded for the build.
+    batch_at = utc_now()
+    last_event_at = await db.scalar(
+        select(func.max(Event.created_at)).where(Event.build_id == build.id)
+    )
+    if last_event_at is not None:
+        if last_event_at.tzinfo is None:
+            last_event_at = last_event_at.replace(tzinfo=timezone.utc)
+        batch_at = max(batch_at, last_event_at + timedelta(microseconds=1))
+
+    registered = 0
+    events = 0
+    for sequence, item in enumerate(batch.items):
+        created_at = batch_at + timedelta(microseconds=sequence)
+        if isinstance(item, BatchTaskRegistration):
+            await _register_task(
+                db, build, item.task, tasks_by_id, projector, created_at=created_at
+            )
+            registered += 1
+            continue
+
+        db_task = tasks_by_id.get(item.task_id)
+        if db_task is None:
+            raise HTTPException(
+                status_code=404, detail=f"Task not found: {item.task_id}"
+            )
+        await projector.record(
+            Event(
+                build_id=build_id,
+                task_id=db_task.id,
+                event_type=item.event_type,
+                error_message=item.error_message,
+                event_metadata=item.event_metadata,
+                created_at=created_at,
+            ),
+            build=build,
+            task=db_task,
+        )
+        events += 1
+
+    if batch.batch_id is not None:
+        db.add(
+            EventBatch(
+                id=batch.batch_id,
+                build_id=build.id,
+                registered=registered,
+                events=events,
+            )
+        )
+    try:
+        await db.commit()
+    except IntegrityError:
+        # The same batch was applied concurrently (resent while in flight)
+        await db.rollback()
+        if batch.batch_id is None:
+            raise
+        applied = await _get_applied_event_batch(db, build.id, batch.batch_id)
+        if applied is None:
+            raise
+        return applied
+
+    return EventBatchResponse(registered=registered, events=events)
+
+
+async def _get_applied_event_batch(
+    db: AsyncSession, build_id: UUID, batch_id: UUID
+) -> EventBatchResponse | None:
+    """The result of the event batch, if it was already applied to the build."""
+    event_batch = await db.get(EventBatch, batch_id)
+    if event_batch is None:
+        return None
+    if event_batch.build_id != build_id:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Event batch {batch_id} was applied to another build",
+        )
+    return EventBatchResponse(
+        registered=event_batch.registered, events=event_batch.events
+    )
+
+
 @router.post("/{build_id}/tasks/{task_id}/start", response_model=TaskEventResponse)
 async def start_task(
     build_id: UUID,
@@ -708,7 +889,7 @@ async def task_waiting_for_lock(
         event_type=EventType.TASK_WAITING_FOR_LOCK,
         event_metadata=event_metadata,
     )
-    db.add(event)
+    await record_event(db, event, task=db_task)
     await db.commit()
 
     status, _, _, _ = await get_task_status_in_build(db, build_id, db_task.id)
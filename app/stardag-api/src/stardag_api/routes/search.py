@@ -106,7 +106,7 @@ def build_jsonb_condition(
     - Build fields (build_id, build_name) - requires join
     - param.* fields (task_data JSONB)
     - asset.* fields (asset body_json JSONB) - uses EXISTS subquery
-    - status (from latest event)
+    - status (projected global task status, supports =, != and ~)
 
     Returns:
         Tuple of (condition_string, needs_build_join, asset_name_for_filter)
@@ -131,6 +131,19 @@ def build_jsonb_condition(
             return f"{task_alias}.{key} ILIKE '%' || :{param_name} || '%'", False, None
         return f"{task_alias}.{key} {sql_op} :{param_name}", False, None
 
+    # Status - projected global status column (indexed with environment_id)
+    if key == "status":
+        param_name = f"filter_status{param_suffix}"
+        if sql_op == "ILIKE":
+            return (
+                f"{task_alias}.status LIKE '%' || LOWER(:{param_name}) || '%'",
+                False,
+                None,
+            )
+        if operator in ("=", "!="):
+            return f"{task_alias}.status {sql_op} LOWER(:{param_name})", False, None
+        return None, False, None
+
     # Build fields - require join to events and builds tables
     if key == "build_id":
         param_name = f"filter_build_id{param_suffix}"
@@ -272,17 +285,10 @@ async def search_tasks(
     filter_params: dict[str, str] = {}
     conditions: list[str] = []
     needs_build_join = False
-    # Status filters are applied post-query since status is derived from events
-    status_filters: list[tuple[str, str]] = []  # (operator, value) pairs
 
     if filter:
         parsed_filters = parse_filter_string(filter)
         for i, (key, op, value) in enumerate(parsed_filters):
-            # Handle status filter separately (post-query)
-            if key == "status":
-                status_filters.append((op, value.lower()))
-                continue
-
             # Use index suffix to ensure unique parameter names for range queries
             # e.g., param.x:>:5 and param.x:<:100 need different param names
             param_suffix = f"_{i}"
@@ -357,6 +363,7 @@ async def search_tasks(
         "created_at": Task.created_at,
         "task_name": Task.task_name,
         "task_namespace": Task.task_namespace,
+        "status": Task.status,
     }
     sort_column = sort_columns.get(sort_field, Task.created_at)
     if sort_dir == "asc":
@@ -364,61 +371,15 @@ async def search_tasks(
     else:
         query = query.order_by(sort_column.desc())
 
-    # If status filter is present, we need to:
-    # 1. Fetch all tasks (no SQL pagination) since status is computed post-query
-    # 2. Get global statuses for all tasks
-    # 3. Filter by status in Python
-    # 4. Paginate in Python
-    if status_filters:
-        # Fetch all matching tasks (limit to 10000 to prevent OOM)
-        query = query.limit(10000)
-        result = await db.execute(query)
-        all_tasks = list(result.scalars().all())
-
-        if all_tasks:
-            # Get global statuses for all tasks
-            all_task_ids = [t.id for t in all_tasks]
-            all_statuses = await get_all_task_global_statuses(db, all_task_ids)
-
-            # Filter by status
-            def matches_status_filters(task_id: UUID) -> bool:
-                status_info = all_statuses.get(task_id)
-                if not status_info:
-                    return False
-                status_str = status_info[0].value.lower()  # e.g., "completed"
-                for op, value in status_filters:
-                    if op == "=":
-                        if status_str != value:
-                            return False
-                    elif op == "!=":
-                        if status_str == value:
-                            return False
-                    elif op == "~":  # contains
-                        if value not in status_str:
-                            return False
-                return True
-
-            filtered_tasks = [t for t in all_tasks if matches_status_filters(t.id)]
-            total = len(filtered_tasks)
-
-            # Apply pagination in Python
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            tasks = filtered_tasks[start_idx:end_idx]
-        else:
-            tasks = []
-            total = 0
-    else:
-        # No status filter - use normal SQL pagination
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
+    total_result = await db.execute(count_query)
+    total = total_result.scalar() or 0
 
-        # Apply pagination
-        query = query.offset((page - 1) * page_size).limit(page_size)
+    # Apply pagination
+    query = query.offset((page - 1) * page_size).limit(page_size)
 
-        # Execute query
-        result = await db.execute(query)
-        tasks = result.scalars().all()
+    # Execute query
+    result = await db.execute(query)
+    tasks = result.scalars().all()
 
     # Get global status for each task (considers events across ALL builds)
     task_ids = [t.id for t in tasks]
@@ -18,6 +18,7 @@ from stardag_api.schemas import (
     TaskResponse,
 )
 from stardag_api.services.status import get_task_global_status
+from stardag_api.services.task_refs import rehydrate_task_data
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
@@ -204,12 +205,16 @@ async def get_task_metadata(
     task_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     auth: Annotated[SdkAuth, Depends(require_sdk_auth)],
+    resolve_refs: bool = True,
 ):
     """Get task metadata for SDK task_get_metadata.
 
     Returns task metadata in the format expected by the SDK's TaskMetadata class,
     which is used by AliasTask.from_registry to create alias tasks.
 
+    Upstream tasks are stored as references (`{"__ref": "<task_id>"}`) in the task
+    data. Unless `resolve_refs` is false, they are replaced by the full task data.
+
     Requires authentication via API key or JWT token with environment_id.
     """
     # Find task by task_id (hash) in workspace
@@ -227,9 +232,13 @@ async def get_task_metadata(
         db, task.id
     )
 
+    body = task.task_data
+    if resolve_refs:
+        body = await rehydrate_task_data(db, task.environment_id, body)
+
     return TaskMetadataResponse(
         id=task.task_id,
-        body=task.task_data,
+        body=body,
         name=task.task_name,
         namespace=task.task_namespace,
         version=task.version or "",
@@ -1,9 +1,10 @@
 """Pydantic schemas for API request/response models."""
 
 from datetime import datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from stardag_api.models.enums import BuildStatus, EventType, TaskStatus
 
@@ -225,6 +226,46 @@ class EventListResponse(BaseModel):
     page_size: int
 
 
+class BatchTaskRegistration(BaseModel):
+    """Task registration within an event batch."""
+
+    kind: Literal["register"] = "register"
+    task: TaskCreate
+
+
+class BatchTaskEvent(BaseModel):
+    """Task lifecycle event within an event batch."""
+
+    kind: Literal["event"] = "event"
+    task_id: str
+    event_type: EventType
+    error_message: str | None = None
+    event_metadata: dict | None = None
+
+
+BatchItem = Annotated[
+    BatchTaskRegistration | BatchTaskEvent, Field(discriminator="kind")
+]
+
+
+class EventBatchCreate(BaseModel):
+    """Schema for a batch of task registrations and events.
+
+    Items are applied in order, within a single transaction. Batches with a
+    `batch_id` (generated by the client) are applied at most once.
+    """
+
+    batch_id: UUID | None = None
+    items: list[BatchItem]
+
+
+class EventBatchResponse(BaseModel):
+    """Schema for event batch response."""
+
+    registered: int
+    events: int
+
+
 # --- Graph/Dependency Schemas ---
 
 
@@ -1,13 +1,20 @@
 """API Key service for generating, validating, and managing API keys."""
 
+import asyncio
+import hashlib
 import secrets
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 import bcrypt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from stardag_api.config import settings
 from stardag_api.models import ApiKey
 
 # Key format: sk_<environment_prefix>_<random_bytes>
@@ -58,6 +65,94 @@ def verify_api_key(full_key: str, key_hash: str) -> bool:
         return False
 
 
+class VerifiedApiKeyCache:
+    """Bounded TTL cache of verified API keys.
+
+    Maps a SHA-256 digest of a presented key to the ID of the API key record it
+    was verified against, so that repeated requests with the same key skip the
+    (deliberately slow) bcrypt verification. The key itself is never stored.
+    Least recently used entries are evicted when the cache is full.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, UUID]] = OrderedDict()
+        # Verification locks (and number of holders/waiters) by key digest
+        self._locks: dict[str, tuple[asyncio.Lock, list[int]]] = {}
+
+    @staticmethod
+    def _digest(full_key: str) -> str:
+        return hashlib.sha256(full_key.encode("utf-8")).hexdigest()
+
+    def get(self, full_key: str) -> UUID | None:
+        """Get the ID of the API key the key was verified against, if cached."""
+        digest = self._digest(full_key)
+        entry = self._entries.get(digest)
+        if entry is None:
+            return None
+        expires_at, key_id = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return key_id
+
+    def set(self, full_key: str, key_id: UUID) -> None:
+        """Cache that the key was verified against the API key with the given ID."""
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+        digest = self._digest(full_key)
+        self._entries[digest] = (time.monotonic() + self.ttl_seconds, key_id)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def evict(self, key_id: UUID) -> None:
+        """Evict all entries of the API key with the given ID."""
+        digests = [
+            digest
+            for digest, (_, cached_key_id) in self._entries.items()
+            if cached_key_id == key_id
+        ]
+        for digest in digests:
+            del self._entries[digest]
+
+    @asynccontextmanager
+    async def verification_lock(self, full_key: str) -> AsyncIterator[None]:
+        """Serialize the verification of the same key.
+
+        Lets concurrent requests with an uncached key wait for the first
+        verification instead of all running bcrypt.
+        """
+        digest = self._digest(full_key)
+        if digest not in self._locks:
+            self._locks[digest] = (asyncio.Lock(), [0])
+        lock, users = self._locks[digest]
+        users[0] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            users[0] -= 1
+            if users[0] == 0:
+                del self._locks[digest]
+
+    def clear(self) -> None:
+        """Evict all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Per-process cache of verified API keys
+verified_api_key_cache = VerifiedApiKeyCache(
+    ttl_seconds=settings.api_key_cache_ttl_seconds,
+    max_size=settings.api_key_cache_max_size,
+)
+
+
 async def create_api_key(
     db: AsyncSession,
     environment_id: UUID,
@@ -154,6 +249,7 @@ async def revoke_api_key(
     api_key.revoked_at = datetime.now(timezone.utc)
     await db.flush()
     await db.refresh(api_key)
+    verified_api_key_cache.evict(api_key.id)
 
     return api_key
 
@@ -181,13 +277,41 @@ async def find_api_key_by_prefix(
     return list(result.scalars().all())
 
 
+async def _get_cached_api_key(db: AsyncSession, full_key: str) -> ApiKey | None:
+    """Get the API key for a cached verified key, if it is still active."""
+    key_id = verified_api_key_cache.get(full_key)
+    if key_id is None:
+        return None
+    api_key = await db.get(ApiKey, key_id)
+    if api_key is None or api_key.revoked_at is not None:
+        verified_api_key_cache.evict(key_id)
+        return None
+    await _touch_api_key(db, api_key)
+    return api_key
+
+
+async def _touch_api_key(db: AsyncSession, api_key: ApiKey) -> None:
+    """Update last_used_at, at most once per configured interval."""
+    now = datetime.now(timezone.utc)
+    last_used_at = api_key.last_used_at
+    if last_used_at is not None and last_used_at.tzinfo is None:
+        last_used_at = last_used_at.replace(tzinfo=timezone.utc)
+    if last_used_at is None or now - last_used_at >= timedelta(
+        seconds=settings.api_key_last_used_interval_seconds
+    ):
+        api_key.last_used_at = now
+        await db.flush()
+
+
 async def validate_api_key(
     db: AsyncSession,
     full_key: str,
 ) -> ApiKey | None:
     """Validate an API key and return the associated key record.
 
-    This is the main authentication function for API key auth.
+    This is the main authentication function for API key auth. Verified keys are
+    cached (see `VerifiedApiKeyCache`), and the bcrypt verification of uncached
+    keys runs in a worker thread so that it doesn't block the event loop.
 
     Args:
         db: Database session
@@ -200,21 +324,31 @@ async def validate_api_key(
     if not full_key.startswith(KEY_PREFIX):
         return None
 
-    # Extract prefix for lookup (first 8 chars after "sk_")
-    try:
-        key_prefix = full_key[3:11]
-    except IndexError:
-        return None
-
-    # Find potential matches by prefix
-    candidates = await find_api_key_by_prefix(db, key_prefix)
-
-    # Verify against each candidate's hash
-    for candidate in candidates:
-        if verify_api_key(full_key, candidate.key_hash):
-            # Update last_used_at
-            candidate.last_used_at = datetime.now(timezone.utc)
-            await db.flush()
-            return candidate
+    # Fast path: key verified before, only check that it is still active
+    api_key = await _get_cached_api_key(db, full_key)
+    if api_key is not None:
+        return api_key
+
+    # Concurrent first requests with the same key verify it only once
+    async with verified_api_key_cache.verification_lock(full_key):
+        api_key = await _get_cached_api_key(db, full_key)
+        if api_key is not None:
+            return api_key
+
+        # Extract prefix for lookup (first 8 chars after "sk_")
+        try:
+            key_prefix = full_key[3:11]
+        except IndexError:
+            return None
+
+        # Find potential matches by prefix
+        candidates = await find_api_key_by_prefix(db, key_prefix)
+
+        # Verify against each candidate's hash
+        for candidate in candidates:
+            if await asyncio.to_thread(verify_api_key, full_key, candidate.key_hash):
+                verified_api_key_cache.set(full_key, candidate.id)
+                await _touch_api_key(db, candidate)
+                return candidate
 
     return None
@@ -13,7 +13,15 @@ from sqlalchemy import delete, func, select, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from stardag_api.models import DistributedLock, Environment, Event, EventType, Task
+from stardag_api.models import (
+    DistributedLock,
+    Environment,
+    Event,
+    EventType,
+    Task,
+    TaskStatus,
+)
+from stardag_api.services.status import record_event
 
 
 class LockAcquisitionStatus(StrEnum):
@@ -55,29 +63,16 @@ async def check_task_completed_in_registry(
         task_id: The task_id (hash) to check
 
     Returns:
-        True if the task has at least one TASK_COMPLETED event
+        True if the task has at least one TASK_COMPLETED event (in any build)
     """
-    # First find the task by task_id in the environment
-    task_result = await db.execute(
-        select(Task.id)
+    # COMPLETED is final in the projected global task status
+    result = await db.execute(
+        select(Task.status)
         .where(Task.environment_id == environment_id)
         .where(Task.task_id == task_id)
     )
-    task_db_id = task_result.scalar_one_or_none()
-
-    if task_db_id is None:
-        # Task not registered in environment, so not completed
-        return False
-
-    # Check for any TASK_COMPLETED event for this task
-    event_result = await db.execute(
-        select(func.count())
-        .select_from(Event)
-        .where(Event.task_id == task_db_id)
-        .where(Event.event_type == EventType.TASK_COMPLETED)
-    )
-    count = event_result.scalar() or 0
-    return count > 0
+    # None if the task is not registered in environment, so not completed
+    return result.scalar_one_or_none() == TaskStatus.COMPLETED
 
 
 async def get_environment_lock_count(
@@ -324,20 +319,20 @@ async def release_lock_with_completion(
     """
     # Find the task by task_id
     task_result = await db.execute(
-        select(Task.id)
+        select(Task)
         .where(Task.environment_id == environment_id)
         .where(Task.task_id == lock_name)
     )
-    task_db_id = task_result.scalar_one_or_none()
+    task = task_result.scalar_one_or_none()
 
-    if task_db_id is not None:
+    if task is not None:
         # Record completion event
         completion_event = Event(
             build_id=build_id,
-            task_id=task_db_id,
+            task_id=task.id,
             event_type=EventType.TASK_COMPLETED,
         )
-        db.add(completion_event)
+        await record_event(db, completion_event, task=task)
 
     # Release the lock
     owner_id_str = str(owner_id)
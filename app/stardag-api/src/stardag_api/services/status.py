@@ -1,128 +1,349 @@
-"""Status derivation from events."""
+"""Status derivation from events.
 
+Events are the source of truth for build and task status. To avoid replaying
+all events on each read, statuses are projected to:
+
+- `Build.status` (and timestamps) for build-level events
+- `TaskBuildStatus` for the status of a task within a build
+- `Task.status` (and timestamps) for the global status of a task across builds
+
+The projections are updated by `StatusProjector` in the same transaction as the
+event is inserted, so all event inserts must go through it (or `record_event`).
+Builds share tasks, so the global task status of existing tasks is updated with
+a single conditional `UPDATE` per event, which concurrent builds can't overwrite
+with a stale status (e.g. RUNNING over COMPLETED).
+`stardag_api.backfill` rebuilds the projections from the events.
+"""
+
+from collections.abc import Iterable
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Update, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from stardag_api.models import BuildStatus, Event, EventType, TaskStatus
+from stardag_api.models import (
+    Build,
+    BuildStatus,
+    Event,
+    EventType,
+    Task,
+    TaskBuildStatus,
+    TaskStatus,
+)
+from stardag_api.models.base import utc_now
+
+# Max number of ids per IN (...) lookup
+_LOOKUP_CHUNK_SIZE = 500
+
+
+# --- Projection updates ---
+
+
+def apply_build_event(build: Build, event: Event) -> None:
+    """Apply a build-level event to the build status projection."""
+    if event.event_type == EventType.BUILD_STARTED:
+        build.status = BuildStatus.RUNNING
+        build.started_at = event.created_at
+        build.status_triggered_by_user_id = None  # Not user-triggered
+    elif event.event_type in (
+        EventType.BUILD_COMPLETED,
+        EventType.BUILD_FAILED,
+        EventType.BUILD_CANCELLED,
+    ):
+        build.status = {
+            EventType.BUILD_COMPLETED: BuildStatus.COMPLETED,
+            EventType.BUILD_FAILED: BuildStatus.FAILED,
+            EventType.BUILD_CANCELLED: BuildStatus.CANCELLED,
+        }[event.event_type]
+        build.completed_at = event.created_at
+        # Check if this was user-triggered (manual override)
+        build.status_triggered_by_user_id = (
+            event.event_metadata.get("triggered_by_user_id")
+            if event.event_metadata
+            else None
+        )
+    elif event.event_type == EventType.BUILD_EXIT_EARLY:
+        build.status = BuildStatus.EXIT_EARLY
+        build.completed_at = event.created_at
+        build.status_triggered_by_user_id = None  # Not user-triggered
+
+
+def apply_task_build_event(task_build_status: TaskBuildStatus, event: Event) -> None:
+    """Apply a task event to the status projection of the task within the build."""
+    state = task_build_status
+    if event.event_type == EventType.TASK_PENDING:
+        state.status = TaskStatus.PENDING
+    elif event.event_type == EventType.TASK_REFERENCED:
+        # Informational: task already existed, stays PENDING
+        pass
+    elif event.event_type == EventType.TASK_STARTED:
+        state.status = TaskStatus.RUNNING
+        state.started_at = event.created_at
+    elif event.event_type == EventType.TASK_SUSPENDED:
+        state.status = TaskStatus.SUSPENDED
+    elif event.event_type == EventType.TASK_RESUMED:
+        state.status = TaskStatus.RUNNING
+    elif event.event_type == EventType.TASK_WAITING_FOR_LOCK:
+        # Informational: blocked by global lock, stays PENDING
+        pass
+    elif event.event_type == EventType.TASK_COMPLETED:
+        state.status = TaskStatus.COMPLETED
+        state.completed_at = event.created_at
+    elif event.event_type == EventType.TASK_FAILED:
+        state.status = TaskStatus.FAILED
+        state.completed_at = event.created_at
+        state.error_message = event.error_message
+    elif event.event_type == EventType.TASK_SKIPPED:
+        state.status = TaskStatus.SKIPPED
+        state.completed_at = event.created_at
+    elif event.event_type == EventType.TASK_CANCELLED:
+        state.status = TaskStatus.CANCELLED
+        state.completed_at = event.created_at
+
+
+def apply_task_global_event(task: Task, event: Event) -> None:
+    """Apply a task event (from any build) to the global task status projection.
+
+    Priority: COMPLETED in any build takes precedence over everything, then the
+    latest of RUNNING/FAILED/CANCELLED, then PENDING. `task_global_event_update`
+    is the SQL equivalent, for tasks that other transactions may update.
+    """
+    if event.event_type == EventType.TASK_COMPLETED:
+        task.status = TaskStatus.COMPLETED
+        task.completed_at = event.created_at
+        task.status_build_id = event.build_id
+        task.waiting_for_lock = False  # No longer waiting
+    elif event.event_type == EventType.TASK_STARTED:
+        if task.status != TaskStatus.COMPLETED:
+            task.status = TaskStatus.RUNNING
+            task.status_build_id = event.build_id
+            if task.started_at is None:
+                task.started_at = event.created_at
+            task.waiting_for_lock = False
+    elif event.event_type == EventType.TASK_RESUMED:
+        if task.status != TaskStatus.COMPLETED:
+            task.status = TaskStatus.RUNNING
+            task.status_build_id = event.build_id
+            task.waiting_for_lock = False
+    elif event.event_type == EventType.TASK_FAILED:
+        if task.status != TaskStatus.COMPLETED:
+            task.status = TaskStatus.FAILED
+            task.status_build_id = event.build_id
+            task.completed_at = event.created_at
+            task.error_message = event.error_message
+    elif event.event_type == EventType.TASK_CANCELLED:
+        if task.status != TaskStatus.COMPLETED:
+            task.status = TaskStatus.CANCELLED
+            task.status_build_id = event.build_id
+            task.completed_at = event.created_at
+    elif event.event_type == EventType.TASK_WAITING_FOR_LOCK:
+        # Only mark as waiting if not yet completed/running
+        if task.status == TaskStatus.PENDING:
+            task.waiting_for_lock = True
+
+
+def task_global_event_update(event: Event) -> Update | None:
+    """The statement applying a task event to the global task status projection.
+
+    Same as `apply_task_global_event`, but as a conditional `UPDATE`, so that the
+    transition is atomic in the database. Returns None for events that don't
+    affect the global status.
+    """
+    values: dict
+    condition = Task.status != TaskStatus.COMPLETED
+    if event.event_type == EventType.TASK_COMPLETED:
+        values = {
+            "status": TaskStatus.COMPLETED,
+            "completed_at": event.created_at,
+            "status_build_id": event.build_id,
+            "waiting_for_lock": False,
+        }
+        condition = None
+    elif event.event_type == EventType.TASK_STARTED:
+        values = {
+            "status": TaskStatus.RUNNING,
+            "status_build_id": event.build_id,
+            "started_at": func.coalesce(Task.started_at, event.created_at),
+            "waiting_for_lock": False,
+        }
+    elif event.event_type == EventType.TASK_RESUMED:
+        values = {
+            "status": TaskStatus.RUNNING,
+            "status_build_id": event.build_id,
+            "waiting_for_lock": False,
+        }
+    elif event.event_type == EventType.TASK_FAILED:
+        values = {
+            "status": TaskStatus.FAILED,
+            "status_build_id": event.build_id,
+            "completed_at": event.created_at,
+            "error_message": event.error_message,
+        }
+    elif event.event_type == EventType.TASK_CANCELLED:
+        values = {
+            "status": TaskStatus.CANCELLED,
+            "status_build_id": event.build_id,
+            "completed_at": event.created_at,
+        }
+    elif event.event_type == EventType.TASK_WAITING_FOR_LOCK:
+        values = {"waiting_for_lock": True}
+        condition = Task.status == TaskStatus.PENDING
+    else:
+        return None
+
+    statement = update(Task).where(Task.id == event.task_id).values(**values)
+    if condition is not None:
+        statement = statement.where(condition)
+    return statement.execution_options(synchronize_session="fetch")
+
+
+class StatusProjector:
+    """Records events and applies them to the status projections.
+
+    Rows of the projections are loaded (or created) on demand and cached, so that
+    recording many events in one transaction doesn't query the same rows again.
+    Nothing is committed.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+        # (build_id, task_id) -> row, or None if known not to exist
+        self._task_build_statuses: dict[tuple[UUID, UUID], TaskBuildStatus | None] = {}
+
+    async def prefetch(self, build_id: UUID, task_db_ids: Iterable[UUID]) -> None:
+        """Load the task build statuses of the given tasks in the build in bulk."""
+        missing = [
+            task_db_id
+            for task_db_id in dict.fromkeys(task_db_ids)
+            if (build_id, task_db_id) not in self._task_build_statuses
+        ]
+        for start in range(0, len(missing), _LOOKUP_CHUNK_SIZE):
+            chunk = missing[start : start + _LOOKUP_CHUNK_SIZE]
+            for task_db_id in chunk:
+                self._task_build_statuses[(build_id, task_db_id)] = None
+            result = await self._db.execute(
+                select(TaskBuildStatus)
+                .where(TaskBuildStatus.build_id == build_id)
+                .where(TaskBuildStatus.task_id.in_(chunk))
+            )
+            for row in result.scalars():
+                self._task_build_statuses[(build_id, row.task_id)] = row
+
+    async def record(
+        self,
+        event: Event,
+        build: Build | None = None,
+        task: Task | None = None,
+        new_task: bool = False,
+    ) -> None:
+        """Add the event to the session and apply it to the projections.
+
+        Args:
+            event: The event to record.
+            build: The build of the event, if already loaded.
+            task: The task of the event, if already loaded (kept in sync with the
+                global status projection).
+            new_task: Whether the task was created in this transaction (then it
+                can't have a task build status yet, and no other transaction can
+                update its global status).
+        """
+        if event.created_at is None:
+            event.created_at = utc_now()
+        self._db.add(event)
+
+        if event.task_id is None:
+            if build is None:
+                build = await self._db.get(Build, event.build_id)
+            if build is not None:
+                apply_build_event(build, event)
+            return
+
+        key = (event.build_id, event.task_id)
+        if new_task:
+            self._task_build_statuses.setdefault(key, None)
+        elif key not in self._task_build_statuses:
+            self._task_build_statuses[key] = await self._db.get(TaskBuildStatus, key)
+        task_build_status = self._task_build_statuses[key]
+        if task_build_status is None:
+            task_build_status = await self._create_task_build_status(
+                event.build_id, event.task_id, new_task
+            )
+            self._task_build_statuses[key] = task_build_status
+        apply_task_build_event(task_build_status, event)
+
+        if new_task and task is not None:
+            # Not visible to other transactions yet
+            apply_task_global_event(task, event)
+        else:
+            statement = task_global_event_update(event)
+            if statement is not None:
+                await self._db.execute(statement)
+
+    async def _create_task_build_status(
+        self, build_id: UUID, task_db_id: UUID, new_task: bool
+    ) -> TaskBuildStatus:
+        if new_task:
+            task_build_status = TaskBuildStatus(
+                build_id=build_id, task_id=task_db_id, status=TaskStatus.PENDING
+            )
+            self._db.add(task_build_status)
+            return task_build_status
+
+        # The first events of the task in the build may be recorded concurrently
+        await self._db.execute(
+            pg_insert(TaskBuildStatus)
+            .values(build_id=build_id, task_id=task_db_id, status=TaskStatus.PENDING)
+            .on_conflict_do_nothing()
+        )
+        return await self._db.get_one(TaskBuildStatus, (build_id, task_db_id))
+
+
+async def record_event(
+    db: AsyncSession,
+    event: Event,
+    build: Build | None = None,
+    task: Task | None = None,
+) -> None:
+    """Add a single event to the session and apply it to the status projections."""
+    await StatusProjector(db).record(event, build=build, task=task)
+
+
+# --- Reads ---
 
 
 async def get_build_status(
     db: AsyncSession, build_id: UUID
 ) -> tuple[BuildStatus, datetime | None, datetime | None, str | None]:
-    """Get derived build status from events.
+    """Get derived build status.
 
     Returns:
         Tuple of (status, started_at, completed_at, status_triggered_by_user_id)
     """
-    # Get build-level events (task_id is NULL)
-    result = await db.execute(
-        select(Event)
-        .where(Event.build_id == build_id)
-        .where(Event.task_id.is_(None))
-        .order_by(Event.created_at.desc())
+    build = await db.get(Build, build_id)
+    if build is None:
+        return BuildStatus.PENDING, None, None, None
+    return (
+        BuildStatus(build.status),
+        build.started_at,
+        build.completed_at,
+        build.status_triggered_by_user_id,
     )
-    events = result.scalars().all()
-
-    status = BuildStatus.PENDING
-    started_at: datetime | None = None
-    completed_at: datetime | None = None
-    status_triggered_by_user_id: str | None = None
-
-    # Process events from oldest to newest to build final state
-    for event in reversed(events):
-        if event.event_type == EventType.BUILD_STARTED:
-            status = BuildStatus.RUNNING
-            started_at = event.created_at
-            status_triggered_by_user_id = None  # Not user-triggered
-        elif event.event_type == EventType.BUILD_COMPLETED:
-            status = BuildStatus.COMPLETED
-            completed_at = event.created_at
-            # Check if this was user-triggered (manual override)
-            status_triggered_by_user_id = (
-                event.event_metadata.get("triggered_by_user_id")
-                if event.event_metadata
-                else None
-            )
-        elif event.event_type == EventType.BUILD_FAILED:
-            status = BuildStatus.FAILED
-            completed_at = event.created_at
-            status_triggered_by_user_id = (
-                event.event_metadata.get("triggered_by_user_id")
-                if event.event_metadata
-                else None
-            )
-        elif event.event_type == EventType.BUILD_CANCELLED:
-            status = BuildStatus.CANCELLED
-            completed_at = event.created_at
-            status_triggered_by_user_id = (
-                event.event_metadata.get("triggered_by_user_id")
-                if event.event_metadata
-                else None
-            )
-        elif event.event_type == EventType.BUILD_EXIT_EARLY:
-            status = BuildStatus.EXIT_EARLY
-            completed_at = event.created_at
-            status_triggered_by_user_id = None  # Not user-triggered
-
-    return status, started_at, completed_at, status_triggered_by_user_id
 
 
 async def get_task_status_in_build(
     db: AsyncSession, build_id: UUID, task_db_id: UUID
 ) -> tuple[TaskStatus, datetime | None, datetime | None, str | None]:
-    """Get derived task status from events for a specific build.
+    """Get derived task status for a specific build.
 
     Returns:
         Tuple of (status, started_at, completed_at, error_message)
     """
-    result = await db.execute(
-        select(Event)
-        .where(Event.build_id == build_id)
-        .where(Event.task_id == task_db_id)
-        .order_by(Event.created_at.desc())
-    )
-    events = result.scalars().all()
-
-    status = TaskStatus.PENDING
-    started_at: datetime | None = None
-    completed_at: datetime | None = None
-    error_message: str | None = None
-
-    # Process events from oldest to newest to build final state
-    for event in reversed(events):
-        if event.event_type == EventType.TASK_PENDING:
-            status = TaskStatus.PENDING
-        elif event.event_type == EventType.TASK_REFERENCED:
-            # Informational: task already existed, stays PENDING
-            pass
-        elif event.event_type == EventType.TASK_STARTED:
-            status = TaskStatus.RUNNING
-            started_at = event.created_at
-        elif event.event_type == EventType.TASK_SUSPENDED:
-            status = TaskStatus.SUSPENDED
-        elif event.event_type == EventType.TASK_RESUMED:
-            status = TaskStatus.RUNNING
-        elif event.event_type == EventType.TASK_WAITING_FOR_LOCK:
-            # Informational: blocked by global lock, stays PENDING
-            pass
-        elif event.event_type == EventType.TASK_COMPLETED:
-            status = TaskStatus.COMPLETED
-            completed_at = event.created_at
-        elif event.event_type == EventType.TASK_FAILED:
-            status = TaskStatus.FAILED
-            completed_at = event.created_at
-            error_message = event.error_message
-        elif event.event_type == EventType.TASK_SKIPPED:
-            status = TaskStatus.SKIPPED
-            completed_at = event.created_at
-        elif event.event_type == EventType.TASK_CANCELLED:
-            status = TaskStatus.CANCELLED
-            completed_at = event.created_at
-
-    return status, started_at, completed_at, error_message
+    row = await db.get(TaskBuildStatus, (build_id, task_db_id))
+    if row is None:
+        return TaskStatus.PENDING, None, None, None
+    return TaskStatus(row.status), row.started_at, row.completed_at, row.error_message
 
 
 async def get_all_task_statuses_in_build(
@@ -134,58 +355,17 @@ async def get_all_task_statuses_in_build(
         Dict mapping task_db_id to (status, started_at, completed_at, error_message)
     """
     result = await db.execute(
-        select(Event)
-        .where(Event.build_id == build_id)
-        .where(Event.task_id.isnot(None))
-        .order_by(Event.created_at.asc())
+        select(TaskBuildStatus).where(TaskBuildStatus.build_id == build_id)
     )
-    events = result.scalars().all()
-
-    # Build status for each task
-    statuses: dict[
-        UUID, tuple[TaskStatus, datetime | None, datetime | None, str | None]
-    ] = {}
-
-    for event in events:
-        if event.task_id is None:
-            continue
-
-        task_id = event.task_id
-        current = statuses.get(task_id, (TaskStatus.PENDING, None, None, None))
-        status, started_at, completed_at, error_message = current
-
-        if event.event_type == EventType.TASK_PENDING:
-            status = TaskStatus.PENDING
-        elif event.event_type == EventType.TASK_REFERENCED:
-            # Informational: task already existed, stays PENDING
-            pass
-        elif event.event_type == EventType.TASK_STARTED:
-            status = TaskStatus.RUNNING
-            started_at = event.created_at
-        elif event.event_type == EventType.TASK_SUSPENDED:
-            status = TaskStatus.SUSPENDED
-        elif event.event_type == EventType.TASK_RESUMED:
-            status = TaskStatus.RUNNING
-        elif event.event_type == EventType.TASK_WAITING_FOR_LOCK:
-            # Informational: blocked by global lock, stays PENDING
-            pass
-        elif event.event_type == EventType.TASK_COMPLETED:
-            status = TaskStatus.COMPLETED
-            completed_at = event.created_at
-        elif event.event_type == EventType.TASK_FAILED:
-            status = TaskStatus.FAILED
-            completed_at = event.created_at
-            error_message = event.error_message
-        elif event.event_type == EventType.TASK_SKIPPED:
-            status = TaskStatus.SKIPPED
-            completed_at = event.created_at
-        elif event.event_type == EventType.TASK_CANCELLED:
-            status = TaskStatus.CANCELLED
-            completed_at = event.created_at
-
-        statuses[task_id] = (status, started_at, completed_at, error_message)
-
-    return statuses
+    return {
+        row.task_id: (
+            TaskStatus(row.status),
+            row.started_at,
+            row.completed_at,
+            row.error_message,
+        )
+        for row in result.scalars()
+    }
 
 
 async def get_task_global_status(
@@ -196,54 +376,14 @@ async def get_task_global_status(
     This provides a "global" view of task status across all builds in the workspace.
     Useful for understanding the true state when multiple builds share tasks.
 
-    Priority order:
-    1. TASK_COMPLETED in any build -> completed (with build_id)
-    2. TASK_STARTED/RUNNING in any build -> running
-    3. TASK_PENDING -> pending
-
     Returns:
-        Tuple of (status, started_at, completed_at, error_message, completed_in_build_id)
+        Tuple of (status, started_at, completed_at, error_message, status_build_id)
     """
-    # Get all events for this task across all builds
-    result = await db.execute(
-        select(Event)
-        .where(Event.task_id == task_db_id)
-        .order_by(Event.created_at.asc())
-    )
-    events = result.scalars().all()
-
-    # Track the "best" status we've seen
-    # Priority: COMPLETED > RUNNING > PENDING
-    best_status = TaskStatus.PENDING
-    started_at: datetime | None = None
-    completed_at: datetime | None = None
-    error_message: str | None = None
-    completed_in_build_id: UUID | None = None
-
-    for event in events:
-        if event.event_type == EventType.TASK_COMPLETED:
-            # Completed takes precedence over everything
-            best_status = TaskStatus.COMPLETED
-            completed_at = event.created_at
-            completed_in_build_id = event.build_id
-        elif event.event_type == EventType.TASK_STARTED:
-            # Running takes precedence over pending (but not completed)
-            if best_status != TaskStatus.COMPLETED:
-                best_status = TaskStatus.RUNNING
-                if started_at is None:
-                    started_at = event.created_at
-        elif event.event_type == EventType.TASK_RESUMED:
-            # Resumed also means running
-            if best_status != TaskStatus.COMPLETED:
-                best_status = TaskStatus.RUNNING
-        elif event.event_type == EventType.TASK_FAILED:
-            # Only set failed if not completed elsewhere
-            if best_status != TaskStatus.COMPLETED:
-                best_status = TaskStatus.FAILED
-                completed_at = event.created_at
-                error_message = event.error_message
-
-    return best_status, started_at, completed_at, error_message, completed_in_build_id
+    statuses = await get_all_task_global_statuses(db, [task_db_id])
+    status, started_at, completed_at, error_message, status_build_id, _ = statuses[
+        task_db_id
+    ]
+    return status, started_at, completed_at, error_message, status_build_id
 
 
 async def get_all_task_global_statuses(
@@ -254,8 +394,6 @@ async def get_all_task_global_statuses(
 ]:
     """Get global status for multiple tasks considering events from ALL builds.
 
-    This is a batched version of get_task_global_status for efficiency.
-
     Returns:
         Dict mapping task_db_id to:
         (status, started_at, completed_at, error_message, status_build_id, waiting_for_lock)
@@ -263,18 +401,6 @@ async def get_all_task_global_statuses(
         status_build_id is the build where the status-determining event occurred.
         This allows the UI to show when a task's status came from a different build.
     """
-    if not task_db_ids:
-        return {}
-
-    # Get all events for these tasks across all builds
-    result = await db.execute(
-        select(Event)
-        .where(Event.task_id.in_(task_db_ids))
-        .order_by(Event.created_at.asc())
-    )
-    events = result.scalars().all()
-
-    # Initialize statuses for all requested tasks
     statuses: dict[
         UUID,
         tuple[
@@ -285,70 +411,27 @@ async def get_all_task_global_statuses(
         for task_id in task_db_ids
     }
 
-    # Track per-task state as we process events
-    task_states: dict[UUID, dict] = {
-        task_id: {
-            "status": TaskStatus.PENDING,
-            "started_at": None,
-            "completed_at": None,
-            "error_message": None,
-            "status_build_id": None,
-            "waiting_for_lock": False,
-        }
-        for task_id in task_db_ids
-    }
-
-    for event in events:
-        if event.task_id is None or event.task_id not in task_states:
-            continue
-
-        state = task_states[event.task_id]
-
-        if event.event_type == EventType.TASK_COMPLETED:
-            # Completed takes precedence over everything
-            state["status"] = TaskStatus.COMPLETED
-            state["completed_at"] = event.created_at
-            state["status_build_id"] = event.build_id
-            state["waiting_for_lock"] = False  # No longer waiting
-        elif event.event_type == EventType.TASK_STARTED:
-            # Running takes precedence over pending (but not completed)
-            if state["status"] != TaskStatus.COMPLETED:
-                state["status"] = TaskStatus.RUNNING
-                state["status_build_id"] = event.build_id
-                if state["started_at"] is None:
-                    state["started_at"] = event.created_at
-                state["waiting_for_lock"] = False
-        elif event.event_type == EventType.TASK_RESUMED:
-            if state["status"] != TaskStatus.COMPLETED:
-                state["status"] = TaskStatus.RUNNING
-                state["status_build_id"] = event.build_id
-                state["waiting_for_lock"] = False
-        elif event.event_type == EventType.TASK_FAILED:
-            # Only set failed if not completed elsewhere
-            if state["status"] != TaskStatus.COMPLETED:
-                state["status"] = TaskStatus.FAILED
-                state["status_build_id"] = event.build_id
-                state["completed_at"] = event.created_at
-                state["error_message"] = event.error_message
-        elif event.event_type == EventType.TASK_CANCELLED:
-            if state["status"] != TaskStatus.COMPLETED:
-                state["status"] = TaskStatus.CANCELLED
-                state["status_build_id"] = event.build_id
-                state["completed_at"] = event.created_at
-        elif event.event_type == EventType.TASK_WAITING_FOR_LOCK:
-            # Only mark as waiting if not yet completed/running
-            if state["status"] == TaskStatus.PENDING:
-                state["waiting_for_lock"] = True
-
-    # Convert to return format
-    for task_id, state in task_states.items():
-        statuses[task_id] = (
-            state["status"],
-            state["started_at"],
-            state["completed_at"],
-            state["error_message"],
-            state["status_build_id"],
-            state["waiting_for_lock"],
+    unique_ids = list(statuses)
+    for start in range(0, len(unique_ids), _LOOKUP_CHUNK_SIZE):
+        result = await db.execute(
+            select(
+                Task.id,
+                Task.status,
+                Task.started_at,
+                Task.completed_at,
+                Task.error_message,
+                Task.status_build_id,
+                Task.waiting_for_lock,
+            ).where(Task.id.in_(unique_ids[start : start + _LOOKUP_CHUNK_SIZE]))
         )
+        for row in result.all():
+            statuses[row.id] = (
+                TaskStatus(row.status),
+                row.started_at,
+                row.completed_at,
+                row.error_message,
+                row.status_build_id,
+                row.waiting_for_lock,
+            )
 
     return statuses
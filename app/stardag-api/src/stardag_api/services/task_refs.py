@@ -0,0 +1,84 @@
+"""Rehydration of compact task data.
+
+The SDK registers task data with nested (upstream) tasks replaced by references
+`{"__ref": "<task_id>"}`, since upstream tasks are registered separately. This
+module resolves such references back to the full task data.
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from stardag_api.models import Task
+
+TASK_REF_KEY = "__ref"
+
+# Max number of task_ids per IN (...) lookup
+_LOOKUP_CHUNK_SIZE = 500
+
+
+def _is_ref(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and TASK_REF_KEY in value
+
+
+def _collect_refs(value: Any, refs: set[str]) -> None:
+    """Add the task_ids of all references in value to refs."""
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if _is_ref(item):
+            refs.add(item[TASK_REF_KEY])
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+
+
+async def rehydrate_task_data(
+    db: AsyncSession, environment_id: UUID, task_data: dict
+) -> dict:
+    """Recursively replace task references by the full (rehydrated) task data.
+
+    Referenced tasks are loaded level by level with one query per level (and
+    chunk), and each referenced task is loaded and rehydrated once. References to
+    tasks that are not found are left as is.
+    """
+    # task_id -> (compact) task data of all transitively referenced tasks
+    compact_by_id: dict[str, dict] = {}
+    looked_up: set[str] = set()
+    pending: set[str] = set()
+    _collect_refs(task_data, pending)
+    while pending:
+        batch = sorted(pending)
+        looked_up |= pending
+        pending = set()
+        for start in range(0, len(batch), _LOOKUP_CHUNK_SIZE):
+            result = await db.execute(
+                select(Task.task_id, Task.task_data)
+                .where(Task.environment_id == environment_id)
+                .where(Task.task_id.in_(batch[start : start + _LOOKUP_CHUNK_SIZE]))
+            )
+            for ref_task_id, ref_task_data in result.all():
+                compact_by_id[ref_task_id] = ref_task_data
+                _collect_refs(ref_task_data, pending)
+        pending -= looked_up
+
+    resolved_by_id: dict[str, Any] = {}
+
+    def resolve(value: Any) -> Any:
+        if _is_ref(value):
+            ref_task_id = value[TASK_REF_KEY]
+            if ref_task_id not in compact_by_id:
+                return value
+            if ref_task_id not in resolved_by_id:
+                resolved_by_id[ref_task_id] = resolve(compact_by_id[ref_task_id])
+            return resolved_by_id[ref_task_id]
+        if isinstance(value, dict):
+            return {key: resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [resolve(item) for item in value]
+        return value
+
+    return resolve(task_data)
@@ -0,0 +1,137 @@
+"""Tests for API key validation (services.api_keys)."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from stardag_api.services import api_keys as api_key_service
+from tests.conftest import DEFAULT_ENVIRONMENT_ID
+
+
+@pytest.fixture
+def verify_calls(monkeypatch) -> list[str]:
+    """Record calls to the bcrypt verification, with an empty key cache."""
+    calls: list[str] = []
+    verify = api_key_service.verify_api_key
+
+    def counting_verify(full_key: str, key_hash: str) -> bool:
+        calls.append(full_key)
+        return verify(full_key, key_hash)
+
+    monkeypatch.setattr(api_key_service, "verify_api_key", counting_verify)
+    api_key_service.verified_api_key_cache.clear()
+    yield calls
+    api_key_service.verified_api_key_cache.clear()
+
+
+class TestValidateApiKey:
+    async def test_verified_key_is_cached(
+        self, async_session: AsyncSession, verify_calls: list[str]
+    ):
+        api_key, full_key = await api_key_service.create_api_key(
+            async_session, DEFAULT_ENVIRONMENT_ID, "cached"
+        )
+        await async_session.commit()
+
+        for _ in range(3):
+            validated = await api_key_service.validate_api_key(async_session, full_key)
+            assert validated is not None
+            assert validated.id == api_key.id
+        assert verify_calls == [full_key]
+
+        # Wrong keys are never served from the cache
+        assert (
+            await api_key_service.validate_api_key(async_session, full_key + "x")
+            is None
+        )
+
+    async def test_concurrent_requests_verify_once(
+        self, async_engine, verify_calls: list[str]
+    ):
+        session_maker = async_sessionmaker(async_engine, expire_on_commit=False)
+        async with session_maker() as session:
+            _, full_key = await api_key_service.create_api_key(
+                session, DEFAULT_ENVIRONMENT_ID, "concurrent"
+            )
+            await session.commit()
+
+        async def validate() -> bool:
+            async with session_maker() as session:
+                api_key = await api_key_service.validate_api_key(session, full_key)
+                return api_key is not None
+
+        assert all(await asyncio.gather(*(validate() for _ in range(5))))
+        assert verify_calls == [full_key]
+
+    async def test_revocation_evicts_cached_key(
+        self, async_session: AsyncSession, verify_calls: list[str]
+    ):
+        api_key, full_key = await api_key_service.create_api_key(
+            async_session, DEFAULT_ENVIRONMENT_ID, "revoked"
+        )
+        await async_session.commit()
+        assert await api_key_service.validate_api_key(async_session, full_key)
+        assert len(api_key_service.verified_api_key_cache) == 1
+
+        await api_key_service.revoke_api_key(async_session, api_key.id)
+        await async_session.commit()
+
+        assert len(api_key_service.verified_api_key_cache) == 0
+        assert await api_key_service.validate_api_key(async_session, full_key) is None
+
+    async def test_cached_key_revoked_elsewhere_is_rejected(
+        self, async_session: AsyncSession, verify_calls: list[str]
+    ):
+        """Revocation is effective also when another process holds the cache entry."""
+        api_key, full_key = await api_key_service.create_api_key(
+            async_session, DEFAULT_ENVIRONMENT_ID, "revoked-elsewhere"
+        )
+        await async_session.commit()
+        assert await api_key_service.validate_api_key(async_session, full_key)
+
+        api_key.revoked_at = datetime.now(timezone.utc)
+        await async_session.commit()
+
+        assert await api_key_service.validate_api_key(async_session, full_key) is None
+
+    async def test_last_used_at_updates_are_coalesced(
+        self, async_session: AsyncSession, verify_calls: list[str]
+    ):
+        api_key, full_key = await api_key_service.create_api_key(
+            async_session, DEFAULT_ENVIRONMENT_ID, "last-used"
+        )
+        await async_session.commit()
+
+        await api_key_service.validate_api_key(async_session, full_key)
+        first_used_at = api_key.last_used_at
+        assert first_used_at is not None
+
+        await api_key_service.validate_api_key(async_session, full_key)
+        assert api_key.last_used_at == first_used_at
+
+        api_key.last_used_at = first_used_at - timedelta(minutes=5)
+        await api_key_service.validate_api_key(async_session, full_key)
+        assert api_key.last_used_at > first_used_at
+
+
+class TestVerifiedApiKeyCache:
+    def test_expiry_and_max_size(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(api_key_service.time, "monotonic", lambda: now[0])
+        cache = api_key_service.VerifiedApiKeyCache(ttl_seconds=10, max_size=2)
+        key_ids = [UUID(int=i) for i in range(3)]
+
+        cache.set("sk_a", key_ids[0])
+        cache.set("sk_b", key_ids[1])
+        assert cache.get("sk_a") == key_ids[0]
+        cache.set("sk_c", key_ids[2])  # evicts the least recently used (sk_b)
+        assert cache.get("sk_b") is None
+        assert cache.get("sk_a") == key_ids[0]
+
+        now[0] += 10
+        assert cache.get("sk_a") is None
+        assert cache.get("sk_c") is None
+        assert len(cache) == 0
@@ -1,9 +1,30 @@
 """Tests for build management endpoints."""
 
+import asyncio
+from pathlib import Path
+from uuid import uuid4
+
 import pytest
 from httpx import AsyncClient
-
-from tests.conftest import DEFAULT_ENVIRONMENT_ID_STR
+from sqlalchemy import delete, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from stardag_api.backfill import backfill_status_projections
+from stardag_api.models import (
+    Base,
+    Build,
+    Event,
+    EventType,
+    Task,
+    TaskBuildStatus,
+    TaskStatus,
+)
+from stardag_api.services.status import StatusProjector, record_event
+from tests.conftest import (
+    DEFAULT_ENVIRONMENT_ID,
+    DEFAULT_ENVIRONMENT_ID_STR,
+    seed_defaults,
+)
 
 
 @pytest.mark.asyncio
@@ -376,3 +397,313 @@ async def test_task_reuse_across_runs(client: AsyncClient):
     assert (
         build2_task["status_build_id"] == build1_id
     )  # Completed by build1, not build2
+
+
+@pytest.mark.asyncio
+async def test_events_batch(client: AsyncClient):
+    """Test registering tasks and recording events in a single batch."""
+    response = await client.post("/api/v1/builds", json={})
+    build_id = response.json()["id"]
+
+    def register(task_id: str, deps: list[str] | None = None) -> dict:
+        return {
+            "kind": "register",
+            "task": {
+                "task_id": task_id,
+                "task_namespace": "",
+                "task_name": "BatchTask",
+                "task_data": {},
+                "dependency_task_ids": deps or [],
+            },
+        }
+
+    def event(task_id: str, event_type: str, **kwargs) -> dict:
+        return {"kind": "event", "task_id": task_id, "event_type": event_type, **kwargs}
+
+    response = await client.post(
+        f"/api/v1/builds/{build_id}/events:batch",
+        json={
+            "items": [
+                register("batch-upstream"),
+                register("batch-downstream", deps=["batch-upstream"]),
+                event("batch-upstream", "task_started"),
+                event("batch-upstream", "task_completed"),
+                event("batch-downstream", "task_started"),
+                event("batch-downstream", "task_failed", error_message="boom"),
+            ]
+        },
+    )
+    assert response.status_code == 201
+    assert response.json() == {"registered": 2, "events": 4}
+
+    response = await client.get(f"/api/v1/builds/{build_id}/tasks")
+    statuses = {task["task_id"]: task for task in response.json()}
+    assert statuses["batch-upstream"]["status"] == "completed"
+    assert statuses["batch-downstream"]["status"] == "failed"
+    assert statuses["batch-downstream"]["error_message"] == "boom"
+
+    response = await client.get(f"/api/v1/builds/{build_id}/graph")
+    assert len(response.json()["edges"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_events_batch_is_atomic(client: AsyncClient):
+    """Test that a batch referring to an unknown task stores nothing."""
+    response = await client.post("/api/v1/builds", json={})
+    build_id = response.json()["id"]
+
+    response = await client.post(
+        f"/api/v1/builds/{build_id}/events:batch",
+        json={
+            "items": [
+                {
+                    "kind": "register",
+                    "task": {
+                        "task_id": "atomic-task",
+                        "task_name": "BatchTask",
+                        "task_data": {},
+                    },
+                },
+                {
+                    "kind": "event",
+                    "task_id": "unknown-task",
+                    "event_type": "task_started",
+                },
+            ]
+        },
+    )
+    assert response.status_code == 404
+
+    response = await client.get(f"/api/v1/builds/{build_id}/tasks")
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_events_batch_is_idempotent(client: AsyncClient):
+    """Test that a resent batch is applied once, with events in client order."""
+    response = await client.post("/api/v1/builds", json={})
+    build_id = response.json()["id"]
+
+    batch = {
+        "batch_id": str(uuid4()),
+        "items": [
+            {
+                "kind": "register",
+                "task": {
+                    "task_id": "idempotent-task",
+                    "task_name": "BatchTask",
+                    "task_data": {},
+                },
+            },
+            {
+                "kind": "event",
+                "task_id": "idempotent-task",
+                "event_type": "task_started",
+            },
+            {
+                "kind": "event",
+                "task_id": "idempotent-task",
+                "event_type": "task_completed",
+            },
+        ],
+    }
+    for _ in range(2):
+        response = await client.post(
+            f"/api/v1/builds/{build_id}/events:batch", json=batch
+        )
+        assert response.status_code == 201
+        assert response.json() == {"registered": 1, "events": 2}
+
+    response = await client.get(f"/api/v1/builds/{build_id}/events")
+    events = response.json()
+    task_events = [event["event_type"] for event in events if event["task_id"]]
+    assert task_events == ["task_pending", "task_started", "task_completed"]
+    # Timestamped by the server, after the build events so far
+    assert events[0]["event_type"] == "build_started"
+    assert events[0]["created_at"] < events[1]["created_at"]
+
+    # The batch ID can't be reused for another build
+    response = await client.post("/api/v1/builds", json={})
+    response = await client.post(
+        f"/api/v1/builds/{response.json()['id']}/events:batch", json=batch
+    )
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_events_batch_rejects_build_events(client: AsyncClient):
+    """Test that build-level events cannot be recorded through the batch endpoint."""
+    response = await client.post("/api/v1/builds", json={})
+    build_id = response.json()["id"]
+
+    response = await client.post(
+        f"/api/v1/builds/{build_id}/events:batch",
+        json={
+            "items": [
+                {
+                    "kind": "event",
+                    "task_id": "any-task",
+                    "event_type": "build_completed",
+                }
+            ]
+        },
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_status_projection_backfill(
+    client: AsyncClient, async_session: AsyncSession
+):
+    """Test that the backfill rebuilds the status projections from events."""
+    response = await client.post("/api/v1/builds", json={})
+    build1_id = response.json()["id"]
+    response = await client.post("/api/v1/builds", json={})
+    build2_id = response.json()["id"]
+
+    for task_id in ["projected-a", "projected-b", "projected-c"]:
+        for build_id in [build1_id, build2_id]:
+            await client.post(
+                f"/api/v1/builds/{build_id}/tasks",
+                json={
+                    "task_id": task_id,
+                    "task_namespace": "",
+                    "task_name": "ProjectedTask",
+                    "task_data": {},
+                },
+            )
+    await client.post(f"/api/v1/builds/{build1_id}/tasks/projected-a/start")
+    await client.post(f"/api/v1/builds/{build1_id}/tasks/projected-a/complete")
+    await client.post(f"/api/v1/builds/{build1_id}/tasks/projected-b/start")
+    await client.post(
+        f"/api/v1/builds/{build1_id}/tasks/projected-b/fail",
+        params={"error_message": "boom"},
+    )
+    await client.post(f"/api/v1/builds/{build2_id}/tasks/projected-b/start")
+    await client.post(f"/api/v1/builds/{build2_id}/tasks/projected-c/waiting-for-lock")
+    await client.post(f"/api/v1/builds/{build1_id}/fail")
+    await client.post(
+        f"/api/v1/builds/{build2_id}/cancel",
+        params={"triggered_by_user_id": "default-local-user"},
+    )
+
+    async def snapshot() -> list:
+        builds = (await client.get("/api/v1/builds")).json()["builds"]
+        tasks = [
+            (await client.get(f"/api/v1/builds/{build_id}/tasks")).json()
+            for build_id in [build1_id, build2_id]
+        ]
+        return [builds, tasks]
+
+    expected = await snapshot()
+    assert [build["status"] for build in expected[0]] == ["cancelled", "failed"]
+    assert expected[0][0]["status_triggered_by_user"]["id"] == "default-local-user"
+    build2_tasks = {task["task_id"]: task for task in expected[1][1]}
+    assert build2_tasks["projected-a"]["status"] == "completed"
+    assert build2_tasks["projected-a"]["status_build_id"] == build1_id
+    assert build2_tasks["projected-b"]["status"] == "running"
+    assert build2_tasks["projected-c"]["waiting_for_lock"] is True
+
+    # Wipe the projections, as for data recorded before they existed
+    await async_session.execute(delete(TaskBuildStatus))
+    await async_session.execute(
+        update(Build).values(
+            status="pending",
+            started_at=None,
+            completed_at=None,
+            status_triggered_by_user_id=None,
+        )
+    )
+    await async_session.execute(
+        update(Task).values(
+            status="pending",
+            started_at=None,
+            completed_at=None,
+            error_message=None,
+            status_build_id=None,
+            waiting_for_lock=False,
+        )
+    )
+    await async_session.commit()
+    assert await snapshot() != expected
+
+    assert await backfill_status_projections(async_session) == (2, 3)
+    assert await snapshot() == expected
+
+
+@pytest.fixture
+async def file_engine(tmp_path: Path):
+    """Engine on a database file, so that each session has its own connection."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine)() as session:
+        await seed_defaults(session)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_status_projection_concurrent_builds(file_engine):
+    """Test that concurrent builds reporting on the same task don't lose updates."""
+    session_maker = async_sessionmaker(file_engine, expire_on_commit=False)
+    async with session_maker() as session:
+        builds = [
+            Build(
+                environment_id=DEFAULT_ENVIRONMENT_ID,
+                name=f"build-{index}",
+                root_task_ids=[],
+            )
+            for index in range(3)
+        ]
+        task = Task(
+            task_id="shared-task",
+            environment_id=DEFAULT_ENVIRONMENT_ID,
+            task_namespace="",
+            task_name="SharedTask",
+            task_data={},
+        )
+        session.add_all([*builds, task])
+        await session.commit()
+
+    def event(build: Build, event_type: EventType) -> Event:
+        return Event(build_id=build.id, task_id=task.id, event_type=event_type)
+
+    # A build completes the task, while another one that loaded it before starts it
+    async with session_maker() as session_a, session_maker() as session_b:
+        stale_task = await session_b.get_one(Task, task.id)
+        await record_event(session_a, event(builds[0], EventType.TASK_COMPLETED))
+        await session_a.commit()
+        await record_event(
+            session_b, event(builds[1], EventType.TASK_STARTED), task=stale_task
+        )
+        await session_b.commit()
+
+    # Concurrent first events of the task within a build
+    prefetched = [asyncio.Event(), asyncio.Event()]
+
+    async def record_first_event(index: int) -> None:
+        async with session_maker() as session:
+            projector = StatusProjector(session)
+            await projector.prefetch(builds[2].id, [task.id])
+            # Both find no status of the task in the build
+            prefetched[index].set()
+            await prefetched[1 - index].wait()
+            await projector.record(event(builds[2], EventType.TASK_STARTED))
+            await session.commit()
+
+    await asyncio.gather(record_first_event(0), record_first_event(1))
+
+    async with session_maker() as session:
+        task = await session.get_one(Task, task.id)
+        assert task.status == TaskStatus.COMPLETED
+        assert task.status_build_id == builds[0].id
+        statuses = [
+            (await session.get_one(TaskBuildStatus, (build.id, task.id))).status
+            for build in builds
+        ]
+        assert statuses == [
+            TaskStatus.COMPLETED,
+            TaskStatus.RUNNING,
+            TaskStatus.RUNNING,
+        ]
@@ -148,6 +148,51 @@ async def test_get_task_metadata(client: AsyncClient):
     assert data["error_message"] is None
 
 
+@pytest.mark.asyncio
+async def test_get_task_metadata_resolves_refs(client: AsyncClient):
+    """Test that upstream task references in task data are rehydrated."""
+    response = await client.post("/api/v1/builds", json={})
+    build_id = response.json()["id"]
+
+    def register(task_id: str, task_data: dict, deps: list[str]) -> dict:
+        return {
+            "task_id": task_id,
+            "task_name": "RefTask",
+            "task_data": task_data,
+            "dependency_task_ids": deps,
+        }
+
+    for task in [
+        register("ref-leaf", {"key": "leaf"}, []),
+        register("ref-middle", {"dep": {"__ref": "ref-leaf"}}, ["ref-leaf"]),
+        register(
+            "ref-root",
+            {
+                "deps": [{"__ref": "ref-middle"}, {"__ref": "ref-leaf"}],
+                "missing": {"__ref": "ref-unknown"},
+            },
+            ["ref-middle", "ref-leaf"],
+        ),
+    ]:
+        await client.post(f"/api/v1/builds/{build_id}/tasks", json=task)
+
+    response = await client.get("/api/v1/tasks/ref-root/metadata")
+    assert response.status_code == 200
+    leaf = {"key": "leaf"}
+    assert response.json()["body"] == {
+        "deps": [{"dep": leaf}, leaf],
+        "missing": {"__ref": "ref-unknown"},
+    }
+
+    response = await client.get(
+        "/api/v1/tasks/ref-root/metadata", params={"resolve_refs": False}
+    )
+    assert response.json()["body"]["deps"] == [
+        {"__ref": "ref-middle"},
+        {"__ref": "ref-leaf"},
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_task_metadata_with_status(client: AsyncClient):
     """Test task metadata reflects status changes."""
@@ -212,3 +257,47 @@ async def test_get_task_metadata_empty_version(client: AsyncClient):
     assert response.status_code == 200
     data = response.json()
     assert data["version"] == ""  # Empty string for missing version
+
+
+@pytest.mark.asyncio
+async def test_search_tasks_status_filter(client: AsyncClient):
+    """Test that status filters are applied in the query with correct totals."""
+    response = await client.post("/api/v1/builds", json={})
+    build_id = response.json()["id"]
+
+    for index in range(5):
+        await client.post(
+            f"/api/v1/builds/{build_id}/tasks",
+            json={
+                "task_id": f"search-task-{index}",
+                "task_namespace": "",
+                "task_name": "SearchTask",
+                "task_data": {},
+            },
+        )
+    for index in range(3):
+        await client.post(f"/api/v1/builds/{build_id}/tasks/search-task-{index}/start")
+        await client.post(
+            f"/api/v1/builds/{build_id}/tasks/search-task-{index}/complete"
+        )
+
+    response = await client.get(
+        "/api/v1/tasks/search",
+        params={"filter": "status:=:COMPLETED", "page_size": 2},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert len(data["tasks"]) == 2
+    assert all(task["status"] == "completed" for task in data["tasks"])
+
+    response = await client.get(
+        "/api/v1/tasks/search",
+        params={"filter": "status:!=:completed", "page": 1, "page_size": 10},
+    )
+    data = response.json()
+    assert data["total"] == 2
+    assert {task["task_id"] for task in data["tasks"]} == {
+        "search-task-3",
+        "search-task-4",
+    }
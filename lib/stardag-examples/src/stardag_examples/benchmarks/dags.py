@@ -203,6 +203,38 @@ def io_bound_flat_many(prefix: str = "") -> BenchmarkTask:
     return root
 
 
+def critical_path_dag(
+    prefix: str = "", leaf_count: int = 64, chain_length: int = 16
+) -> BenchmarkTask:
+    """Wide IO-bound DAG with one long chain (0.1s sleep per task).
+
+    Structure:
+        - `leaf_count` independent leaf tasks
+        - A chain of `chain_length` tasks, each depending on the previous one
+        - 1 root task depending on the leaves and the end of the chain
+
+    The chain is the critical path. With 4 workers and the default sizes:
+    - Submission order (FIFO): the leaves are discovered, and queued, before the
+      start of the chain, so the chain only starts after the leaves are done:
+      ~64/4 * 0.1s + 16 * 0.1s + 0.1s = 3.3s
+    - Critical path first: the chain runs alongside the leaves, and the makespan
+      approaches the total work: ~(64 + 16)/4 * 0.1s + 0.1s = 2.1s
+    """
+    chain = IOBoundTask(key=f"{prefix}chain_0", sleep_duration=0.1)
+    for i in range(1, chain_length):
+        chain = IOBoundTask(key=f"{prefix}chain_{i}", deps=(chain,), sleep_duration=0.1)
+    leaves = [
+        IOBoundTask(key=f"{prefix}leaf_{i}", sleep_duration=0.1)
+        for i in range(leaf_count)
+    ]
+    root = IOBoundTask(
+        key=f"{prefix}root",
+        deps=(*leaves, chain),
+        sleep_duration=0.1,
+    )
+    return root
+
+
 # =============================================================================
 # Real File I/O DAGs
 # =============================================================================
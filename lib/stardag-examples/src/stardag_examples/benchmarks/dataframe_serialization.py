@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Benchmark for pandas DataFrame serializers: CSV, Parquet and Feather.
+
+Saves and loads a DataFrame with numeric, string, categorical and datetime
+columns through each serializer, to a local target, and reports dump and load
+time, loading two of the columns only (Parquet and Feather), the file size, and
+whether the loaded DataFrame equals the saved one (including dtypes).
+
+Usage:
+    cd lib/stardag-examples
+    uv run --with pandas --with pyarrow \\
+        python -m stardag_examples.benchmarks.dataframe_serialization
+
+    # Fewer rows, more repetitions
+    uv run --with pandas --with pyarrow \\
+        python -m stardag_examples.benchmarks.dataframe_serialization \\
+        --rows 100000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from stardag.target import LocalTarget, Serializable
+from stardag.target.serialize import (
+    PandasDataFrameCSVSerializer,
+    PandasDataFrameFeatherSerializer,
+    PandasDataFrameParquetSerializer,
+)
+
+PROJECTED_COLUMNS = ["value", "category"]
+
+
+def create_data_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": rng.normal(size=rows),
+            "count": rng.integers(0, 1_000, size=rows),
+            "name": [f"name_{i % 10_000}" for i in range(rows)],
+            "category": pd.Categorical(rng.choice(["a", "b", "c", "d"], size=rows)),
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="s"),
+        }
+    )
+
+
+@dataclass
+class BenchmarkResult:
+    serializer: str
+    dump_seconds: float
+    load_seconds: float
+    load_columns_seconds: float | None
+    size_bytes: int
+    round_trips: bool
+
+
+def _best_of(repeat: int, function: Callable[[], Any]) -> float:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def run_benchmark(
+    name: str, serializer: Any, df: pd.DataFrame, directory: Path, repeat: int
+) -> BenchmarkResult:
+    path = directory / f"df.{serializer.get_default_extension()}"
+    target = Serializable(LocalTarget(str(path)), serializer)
+
+    dump_seconds = _best_of(repeat, lambda: target.save(df))
+    load_seconds = _best_of(repeat, target.load)
+    load_columns_seconds = None
+    if hasattr(serializer, "load_columns"):
+        load_columns_seconds = _best_of(
+            repeat, lambda: target.load_columns(PROJECTED_COLUMNS)
+        )
+    try:
+        pd.testing.assert_frame_equal(target.load(), df)
+        round_trips = True
+    except AssertionError:
+        round_trips = False
+
+    return BenchmarkResult(
+        serializer=name,
+        dump_seconds=dump_seconds,
+        load_seconds=load_seconds,
+        load_columns_seconds=load_columns_seconds,
+        size_bytes=path.stat().st_size,
+        round_trips=round_trips,
+    )
+
+
+def main() -> None:
+    """Run DataFrame serialization benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=1_000_000,
+        help="Number of rows of the DataFrame (default: 1000000)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Repetitions per measurement, the best is reported (default: 3)",
+    )
+    args = parser.parse_args()
+
+    serializers: dict[str, Any] = {
+        "csv": PandasDataFrameCSVSerializer(),
+        "parquet": PandasDataFrameParquetSerializer(),
+        "feather": PandasDataFrameFeatherSerializer(),
+    }
+    df = create_data_frame(args.rows)
+
+    print("=" * 70)
+    print("DATAFRAME SERIALIZATION BENCHMARK")
+    print("=" * 70)
+    print(
+        f"{args.rows} rows x {len(df.columns)} columns, "
+        f"{df.memory_usage(deep=True).sum() / 2**20:.1f} MiB in memory. "
+        f"Best of {args.repeat}, local target."
+    )
+    print()
+    print(
+        f"{'Serializer':<12}{'Dump (s)':>10}{'Load (s)':>10}"
+        f"{'2 columns (s)':>15}{'Size (MiB)':>12}{'Round trip':>12}"
+    )
+    print("-" * 71)
+    with tempfile.TemporaryDirectory() as directory:
+        for name, serializer in serializers.items():
+            result = run_benchmark(name, serializer, df, Path(directory), args.repeat)
+            load_columns = (
+                f"{result.load_columns_seconds:>15.3f}"
+                if result.load_columns_seconds is not None
+                else f"{'-':>15}"
+            )
+            print(
+                f"{result.serializer:<12}{result.dump_seconds:>10.3f}"
+                f"{result.load_seconds:>10.3f}{load_columns}"
+                f"{result.size_bytes / 2**20:>12.1f}"
+                f"{'yes' if result.round_trips else 'no':>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
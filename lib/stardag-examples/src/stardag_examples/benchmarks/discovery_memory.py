@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Benchmark for peak memory of DAG discovery in the concurrent builder.
+
+Builds large DAGs of no-op tasks (see `scheduler_overhead`) and measures, with
+tracemalloc, the peak memory allocated from the start of the build until the end
+of discovery. The DAG itself is created (and task IDs computed) before tracing
+starts, so the peak is what discovery adds: the execution state of each task plus
+the overhead of the traversal, which is bounded by the number of discovery
+workers (`max_concurrent_discover`).
+
+Tracing stops when discovery ends, the build then runs untraced.
+
+Usage:
+    cd lib/stardag-examples
+    uv run python -m stardag_examples.benchmarks.discovery_memory
+
+    # Smaller DAGs, more discovery workers
+    uv run python -m stardag_examples.benchmarks.discovery_memory \\
+        --sizes 100000 --workers 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable
+
+from stardag.build import BuildTracer, HybridConcurrentTaskExecutor, Span, build_aio
+from stardag.registry import NoOpRegistry
+from stardag_examples.benchmarks.scheduler_overhead import (
+    NoOpTask,
+    _collect_ids,
+    _completed_tasks,
+    create_flat_dag,
+    create_layered_dag,
+)
+
+
+class _DiscoveryPeakTracer(BuildTracer):
+    """Keeps no spans, stops tracemalloc when discovery ends."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.peak_bytes = 0
+
+    def on_span(self, span: Span) -> None:
+        if span.name == "discovery":
+            _, self.peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    task_count: int
+    peak_bytes: int
+
+    @property
+    def per_task_bytes(self) -> float:
+        return self.peak_bytes / self.task_count
+
+
+async def run_scenario(
+    scenario: str,
+    dag_factory: Callable[[int, str], list[NoOpTask]],
+    size: int,
+    workers: int,
+) -> BenchmarkResult:
+    """Build the DAG from scratch, tracing memory during discovery."""
+    _completed_tasks.clear()
+    roots = dag_factory(size, f"{scenario}_{size}_")
+    task_count = _collect_ids(roots)
+
+    gc.collect()
+    tracer = _DiscoveryPeakTracer()
+    tracemalloc.start()
+    try:
+        summary = await build_aio(
+            roots,
+            task_executor=HybridConcurrentTaskExecutor(),
+            registry=NoOpRegistry(),
+            max_concurrent_discover=workers,
+            tracer=tracer,
+        )
+    finally:
+        tracemalloc.stop()
+
+    assert summary.task_count.discovered == task_count, summary
+    assert summary.task_count.succeeded == task_count, summary
+    return BenchmarkResult(
+        scenario=scenario, task_count=task_count, peak_bytes=tracer.peak_bytes
+    )
+
+
+def main() -> None:
+    """Run discovery memory benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1_000_000],
+        help="Number of tasks per DAG (default: 1000000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=50,
+        help="Discovery workers, max_concurrent_discover (default: 50)",
+    )
+    args = parser.parse_args()
+
+    scenarios: dict[str, Callable[[int, str], list[NoOpTask]]] = {
+        "flat": create_flat_dag,
+        "layered": create_layered_dag,
+    }
+
+    print("=" * 70)
+    print("DISCOVERY MEMORY BENCHMARK")
+    print("=" * 70)
+    print(
+        f"No-op tasks, NoOp registry, {args.workers} discovery workers. "
+        "Peak traced memory until the end of discovery."
+    )
+    print()
+    print(f"{'Scenario':<12}{'Tasks':>10}{'Peak (MiB)':>14}{'Per task (B)':>16}")
+    print("-" * 52)
+    for size in args.sizes:
+        for scenario, factory in scenarios.items():
+            result = asyncio.run(run_scenario(scenario, factory, size, args.workers))
+            print(
+                f"{result.scenario:<12}{result.task_count:>10}"
+                f"{result.peak_bytes / 2**20:>14.1f}{result.per_task_bytes:>16.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark for process pool startup and task transfer overhead.
+
+Runs several consecutive builds of many short CPU-bound tasks in a process pool:
+
+- spawn per build: `HybridConcurrentTaskExecutor(max_process_workers=...)` starts
+  a new (spawn) process pool for each build, and tasks are pickled in full.
+- warm (spawn): one `WarmProcessPool` shared by all builds, with the task module
+  preloaded.
+- warm (forkserver): as above, workers forked from a server with the modules
+  preloaded.
+
+Also reports the size of the pickled task vs. its compact payload (see
+`WarmProcessPool(compact_transfer=True)`).
+
+Usage:
+    cd lib/stardag-examples
+    uv run python -m stardag_examples.benchmarks.process_pool
+
+    # More, shorter builds
+    uv run python -m stardag_examples.benchmarks.process_pool --builds 10 --tasks 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import pickle
+import tempfile
+import time
+
+from stardag.build import (
+    DefaultExecutionModeSelector,
+    HybridConcurrentTaskExecutor,
+    WarmProcessPool,
+    build_aio,
+)
+from stardag.build._process_pool import dump_task
+from stardag.registry import NoOpRegistry
+from stardag.target import LocalTarget
+from stardag.target._factory import TargetFactory, target_factory_provider
+from stardag_examples.benchmarks.tasks import CPUBoundTask
+
+TASKS_MODULE = "stardag_examples.benchmarks.tasks"
+
+
+def create_flat_dag(prefix: str, task_count: int, iterations: int) -> CPUBoundTask:
+    leaves = tuple(
+        CPUBoundTask(key=f"{prefix}leaf_{i}", iterations=iterations)
+        for i in range(task_count - 1)
+    )
+    return CPUBoundTask(key=f"{prefix}root", deps=leaves, iterations=iterations)
+
+
+async def run_builds(
+    executor: HybridConcurrentTaskExecutor,
+    builds: int,
+    task_count: int,
+    iterations: int,
+    label: str,
+) -> float:
+    """Returns the average duration per build."""
+    start = time.perf_counter()
+    for i in range(builds):
+        dag = create_flat_dag(f"{label}_{i}_", task_count, iterations)
+        summary = await build_aio(
+            [dag], task_executor=executor, registry=NoOpRegistry()
+        )
+        assert summary.task_count.failed == 0, summary
+    return (time.perf_counter() - start) / builds
+
+
+def main() -> None:
+    """Run process pool benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--builds", type=int, default=5, help="Builds per config (5)")
+    parser.add_argument("--tasks", type=int, default=100, help="Tasks per build (100)")
+    parser.add_argument(
+        "--iterations", type=int, default=10_000, help="Hash iterations per task"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Process workers (4)")
+    args = parser.parse_args()
+
+    selector = DefaultExecutionModeSelector(sync_run_default="process")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Workers pick up the target root from the environment
+        target_roots = {"default": tmpdir}
+        os.environ["STARDAG_TARGET_ROOTS"] = json.dumps(target_roots)
+        with target_factory_provider.override(
+            TargetFactory(
+                target_roots=target_roots,
+                prefix_to_target_prototype={"/": LocalTarget},
+            )
+        ):
+            dag = create_flat_dag("size_", args.tasks, args.iterations)
+            print("=" * 60)
+            print("PROCESS POOL BENCHMARK")
+            print("=" * 60)
+            print(
+                f"{args.builds} builds x {args.tasks} tasks "
+                f"({args.iterations} hash iterations each), {args.workers} workers"
+            )
+            print()
+            print(f"Transfer size of root task (with {args.tasks - 1} deps)")
+            print(f"  pickled task:    {len(pickle.dumps(dag)):>10} bytes")
+            print(f"  compact payload: {len(pickle.dumps(dump_task(dag))):>10} bytes")
+            print()
+            print(f"{'Config':<22}{'Per build':>12}")
+            print("-" * 34)
+
+            executor = HybridConcurrentTaskExecutor(
+                execution_mode_selector=selector,
+                max_process_workers=args.workers,
+            )
+            duration = asyncio.run(
+                run_builds(executor, args.builds, args.tasks, args.iterations, "cold")
+            )
+            print(f"{'spawn per build':<22}{duration:>11.3f}s")
+
+            for start_method in ("spawn", "forkserver"):
+                with WarmProcessPool(
+                    max_workers=args.workers,
+                    preload_modules=[TASKS_MODULE],
+                    start_method=start_method,
+                ) as pool:
+                    warm_up_start = time.perf_counter()
+                    pool.warm_up()
+                    warm_up = time.perf_counter() - warm_up_start
+                    executor = HybridConcurrentTaskExecutor(
+                        execution_mode_selector=selector,
+                        process_pool=pool,
+                    )
+                    duration = asyncio.run(
+                        run_builds(
+                            executor,
+                            args.builds,
+                            args.tasks,
+                            args.iterations,
+                            start_method,
+                        )
+                    )
+                label = f"warm ({start_method})"
+                print(f"{label:<22}{duration:>11.3f}s  (warm-up {warm_up:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
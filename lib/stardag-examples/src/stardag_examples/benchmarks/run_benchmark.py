@@ -7,6 +7,11 @@ Key configurations compared:
 - sync_run_default: "thread" vs "process" for CPU-bound sync tasks
 - max_async_workers: concurrency level for async tasks
 - Sequential vs concurrent build
+- Task priority: critical path first (default) vs submission order (FIFO)
+
+For concurrent builds, the scheduler metrics of the last run (worker pool
+utilization, ready-wait, registry and lock time, see BuildMetrics) are printed
+below the timing, to help tune `max_*_workers`.
 
 Usage:
     cd lib/stardag-examples
@@ -28,13 +33,16 @@ import asyncio
 import gc
 import json
 import shutil
+import textwrap
 import time
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Literal
 
+from stardag import BaseTask
 from stardag.build import (
+    BuildMetrics,
     DefaultExecutionModeSelector,
     GlobalLockConfig,
     HybridConcurrentTaskExecutor,
@@ -108,8 +116,9 @@ async def run_concurrent_build(
     max_async_workers: int = 10,
     max_thread_workers: int = 10,
     max_process_workers: int | None = None,
-) -> float:
-    """Run a concurrent build and return duration."""
+    task_priority: Literal["critical_path", "fifo"] = "critical_path",
+) -> tuple[float, BuildMetrics]:
+    """Run a concurrent build and return duration and scheduler metrics."""
     dag = dag_factory(prefix=f"{run_id}_")
 
     task_executor = HybridConcurrentTaskExecutor(
@@ -130,16 +139,24 @@ async def run_concurrent_build(
 
     gc.collect()
     start = time.perf_counter()
-    await build_aio(
+    summary = await build_aio(
         [dag],
         task_executor=task_executor,
         registry=registry,
         global_lock_manager=global_lock_manager,
         global_lock_config=global_lock_config,
+        task_priority_selector=(
+            _fifo_task_priority if task_priority == "fifo" else None
+        ),
     )
     duration = time.perf_counter() - start
 
-    return duration
+    return duration, summary.metrics
+
+
+def _fifo_task_priority(task: BaseTask, remaining_path: float) -> float:
+    """Equal priority for all tasks: ready tasks run in submission order."""
+    return 0.0
 
 
 def run_sequential_build(
@@ -184,6 +201,18 @@ CONFIGS: dict[str, dict[str, Any]] = {
         "sync_run_default": "blocking",
         "max_async_workers": 10,
     },
+    "concurrent_fifo": {
+        "type": "concurrent",
+        "max_async_workers": 4,
+        "max_thread_workers": 4,
+        "task_priority": "fifo",
+    },
+    "concurrent_critical_path": {
+        "type": "concurrent",
+        "max_async_workers": 4,
+        "max_thread_workers": 4,
+        "task_priority": "critical_path",
+    },
 }
 
 
@@ -221,6 +250,7 @@ def run_benchmark(
         durations = []
         error = None
         success = True
+        metrics: BuildMetrics | None = None
 
         for i in range(timed_runs):
             try:
@@ -238,7 +268,7 @@ def run_benchmark(
                 if config["type"] == "sequential":
                     duration = run_sequential_build(dag_factory, run_id, registry)
                 else:
-                    duration = asyncio.run(
+                    duration, metrics = asyncio.run(
                         run_concurrent_build(
                             dag_factory,
                             run_id,
@@ -248,6 +278,7 @@ def run_benchmark(
                             max_async_workers=config.get("max_async_workers", 10),
                             max_thread_workers=config.get("max_thread_workers", 10),
                             max_process_workers=config.get("max_process_workers"),
+                            task_priority=config.get("task_priority", "critical_path"),
                         )
                     )
                 durations.append(duration)
@@ -270,6 +301,8 @@ def run_benchmark(
 
         status = f"{avg_duration:.3f}s" if success else f"FAILED: {error}"
         print(f"  {config_name}: {status}")
+        if success and metrics is not None:
+            print(textwrap.indent(metrics.report(), "      "))
 
     return results
 
@@ -344,6 +377,7 @@ def main():
 
     from stardag_examples.benchmarks.dags import (
         cpu_bound_tree,
+        critical_path_dag,
         heavy_cpu_flat,
         io_bound_flat,
         io_bound_tree,
@@ -475,6 +509,29 @@ def main():
         )
         all_results.extend(results)
 
+        # Section 4: Scheduling order
+        print()
+        print("=" * 70)
+        print("SECTION 4: Critical path scheduling")
+        print("=" * 70)
+        print("Wide DAG with one long chain, more ready tasks than workers.")
+        print("Running the chain first shortens the total wall time (makespan).")
+        print()
+
+        print("\ncritical_path (81 tasks, 64 leaves + chain of 16, 0.1s each):")
+        print("-" * 50)
+        results = run_benchmark(
+            "critical_path",
+            critical_path_dag,
+            registry_mode=registry_mode,
+            use_global_lock=use_global_lock,
+            api_key=api_key,
+            configs=["concurrent_fifo", "concurrent_critical_path"],
+            timed_runs=io_runs,
+            target_root=target_root,
+        )
+        all_results.extend(results)
+
         # Print summary table
         print("\n" + "=" * 70)
         print("SUMMARY (average time in seconds, lower is better)")
@@ -535,6 +592,9 @@ def main():
 
 4. sync_run_default="blocking" runs sync tasks on the main loop
    (via to_thread). Good for tasks that do brief sync work.
+
+5. Critical path first: when ready tasks outnumber workers, running
+   the longest remaining chain first reduces the makespan.
 """)
 
         # Save raw results
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Benchmark for S3 HEAD throughput and large-object transfer rate.
+
+Runs against a local S3 stand-in (moto server, started in-process) so that the
+numbers reflect client overhead rather than network latency to AWS:
+
+- HEAD throughput: `S3FileSystem.exists_aio` for many keys concurrently, with the
+  pooled (long-lived) async client vs. a fresh client per request (the previous
+  behaviour).
+- Transfer rate: `upload_aio`/`download_aio` of a large object for different
+  multipart chunk sizes and concurrency.
+
+Requires the `s3` extra and moto server:
+    cd lib/stardag-examples
+    uv run --with 'moto[server]' python -m stardag_examples.benchmarks.s3_transfer
+
+    # Against another endpoint (e.g. MinIO), credentials from the environment
+    uv run python -m stardag_examples.benchmarks.s3_transfer \\
+        --endpoint-url http://localhost:9000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import aioboto3
+import boto3
+from boto3.s3.transfer import TransferConfig
+
+from stardag.integration.aws.s3 import S3FileSystem, get_bucket_key, get_uri
+
+BUCKET = "stardag-benchmark"
+MB = 1024 * 1024
+
+
+def start_moto_server(port: int) -> str:
+    """Start moto server in a background thread, returns the endpoint URL."""
+    from moto.server import ThreadedMotoServer
+
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    server = ThreadedMotoServer(port=port)
+    server.start()
+    return f"http://127.0.0.1:{port}"
+
+
+class _EndpointSession(aioboto3.Session):
+    """aioboto3 session that points all S3 clients to the benchmark endpoint."""
+
+    def __init__(self, endpoint_url: str):
+        super().__init__()
+        self._endpoint_url = endpoint_url
+
+    def client(self, service_name, **kwargs):  # type: ignore[override]
+        kwargs.setdefault("endpoint_url", self._endpoint_url)
+        return super().client(service_name, **kwargs)
+
+
+def create_file_system(
+    endpoint_url: str,
+    transfer_config: TransferConfig | None = None,
+) -> S3FileSystem:
+    return S3FileSystem(
+        s3_client=boto3.client("s3", endpoint_url=endpoint_url),
+        aioboto3_session=_EndpointSession(endpoint_url),
+        transfer_config=transfer_config,
+    )
+
+
+async def _exists_fresh_client(fs: S3FileSystem, uri: str) -> None:
+    """HEAD request with a new client per call (behaviour before pooling)."""
+    bucket, key = get_bucket_key(uri)
+    async with fs.aioboto3_session.client("s3") as s3:
+        await s3.head_object(Bucket=bucket, Key=key)
+
+
+async def bench_head(fs: S3FileSystem, uris: list[str], pooled: bool) -> float:
+    """Returns HEAD requests per second."""
+    semaphore = asyncio.Semaphore(fs.max_pool_connections)
+
+    async def head(uri: str) -> None:
+        async with semaphore:
+            if pooled:
+                assert await fs.exists_aio(uri)
+            else:
+                await _exists_fresh_client(fs, uri)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(head(uri) for uri in uris))
+    duration = time.perf_counter() - start
+    await fs.aclose()
+    return len(uris) / duration
+
+
+async def bench_transfer(
+    fs: S3FileSystem, source: Path, workdir: Path
+) -> tuple[float, float]:
+    """Returns upload and download rate in MB/s."""
+    size_mb = source.stat().st_size / MB
+    uri = get_uri(BUCKET, f"large/{source.name}")
+
+    start = time.perf_counter()
+    await fs.upload_aio(source, uri)
+    upload = size_mb / (time.perf_counter() - start)
+
+    destination = workdir / "download"
+    start = time.perf_counter()
+    await fs.download_aio(uri, destination)
+    download = size_mb / (time.perf_counter() - start)
+
+    assert destination.stat().st_size == source.stat().st_size
+    destination.unlink()
+    await fs.aclose()
+    return upload, download
+
+
+def main() -> None:
+    """Run S3 benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--endpoint-url",
+        default=None,
+        help="S3 endpoint, default: start a local moto server",
+    )
+    parser.add_argument("--port", type=int, default=5055, help="moto server port")
+    parser.add_argument(
+        "--keys", type=int, default=2_000, help="Number of keys for HEAD (2000)"
+    )
+    parser.add_argument(
+        "--size-mb", type=int, default=256, help="Size of the large object (256)"
+    )
+    args = parser.parse_args()
+
+    endpoint_url = args.endpoint_url or start_moto_server(args.port)
+    s3_client = boto3.client("s3", endpoint_url=endpoint_url)
+    s3_client.create_bucket(Bucket=BUCKET)
+    uris = [get_uri(BUCKET, f"head/{i:06d}") for i in range(args.keys)]
+    for uri in uris:
+        s3_client.put_object(Bucket=BUCKET, Key=get_bucket_key(uri)[1], Body=b"x")
+
+    print("=" * 70)
+    print("S3 BENCHMARK")
+    print("=" * 70)
+    print(f"Endpoint: {endpoint_url}")
+    print()
+    print(f"HEAD throughput ({args.keys} keys)")
+    print(f"{'Client':<20}{'Requests/s':>14}")
+    print("-" * 34)
+    fs = create_file_system(endpoint_url)
+    for label, pooled in [("fresh per request", False), ("pooled", True)]:
+        rate = asyncio.run(bench_head(fs, uris, pooled=pooled))
+        print(f"{label:<20}{rate:>14.0f}")
+
+    print()
+    print(f"Transfer rate ({args.size_mb} MB object)")
+    print(f"{'Chunk (MB)':>10}{'Concurrency':>13}{'Up (MB/s)':>12}{'Down (MB/s)':>13}")
+    print("-" * 48)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workdir = Path(tmpdir)
+        source = workdir / "source"
+        with open(source, "wb") as f:
+            for _ in range(args.size_mb):
+                f.write(os.urandom(MB))
+        for chunk_mb, concurrency in [(8, 1), (8, 10), (16, 10), (64, 10)]:
+            fs = create_file_system(
+                endpoint_url,
+                TransferConfig(
+                    multipart_threshold=chunk_mb * MB,
+                    multipart_chunksize=chunk_mb * MB,
+                    max_concurrency=concurrency,
+                ),
+            )
+            upload, download = asyncio.run(bench_transfer(fs, source, workdir))
+            print(f"{chunk_mb:>10}{concurrency:>13}{upload:>12.1f}{download:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark for scheduling overhead of the concurrent builder.
+
+Builds large DAGs of no-op tasks (in-memory completion, no I/O) so that the
+measured time is dominated by the build loop itself: discovery, dependency
+bookkeeping and submission of ready tasks. Reports the overhead per task,
+which should stay roughly constant as the DAG grows.
+
+Usage:
+    cd lib/stardag-examples
+    uv run python -m stardag_examples.benchmarks.scheduler_overhead
+
+    # Only the 10k-node DAGs
+    uv run python -m stardag_examples.benchmarks.scheduler_overhead --sizes 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+import stardag as sd
+from stardag.build import HybridConcurrentTaskExecutor, build_aio
+from stardag.registry import NoOpRegistry
+
+sd.auto_namespace(__name__)
+
+# Global set to track which tasks are "complete"
+_completed_tasks: set[str] = set()
+
+
+class NoOpTask(sd.BaseTask):
+    """Task without any work or I/O, completion is tracked in memory."""
+
+    key: str
+    deps: tuple["NoOpTask", ...] = ()
+
+    def requires(self) -> sd.TaskStruct:
+        return self.deps
+
+    def complete(self) -> bool:
+        return self.key in _completed_tasks
+
+    async def run_aio(self) -> None:
+        _completed_tasks.add(self.key)
+
+
+def create_flat_dag(size: int, prefix: str = "") -> list[NoOpTask]:
+    """Create flat DAG: 1 root with `size - 1` leaf dependencies."""
+    leaves = tuple(NoOpTask(key=f"{prefix}leaf_{i}") for i in range(size - 1))
+    return [NoOpTask(key=f"{prefix}root", deps=leaves)]
+
+
+def create_layered_dag(size: int, prefix: str = "", depth: int = 10) -> list[NoOpTask]:
+    """Create `size // depth` parallel chains of length `depth`.
+
+    Every task in a layer depends on the corresponding task in the previous
+    layer; the last layer is used as roots.
+    """
+    width = size // depth
+    layer = [NoOpTask(key=f"{prefix}0_{i}") for i in range(width)]
+    for level in range(1, depth):
+        layer = [
+            NoOpTask(key=f"{prefix}{level}_{i}", deps=(layer[i],)) for i in range(width)
+        ]
+    return layer
+
+
+def _collect_ids(roots: list[NoOpTask]) -> int:
+    """Compute (and cache) all task IDs up front, returns the number of tasks.
+
+    Keeps ID hashing out of the timed section so that only scheduling is measured.
+    """
+    seen: set[str] = set()
+    stack: list[NoOpTask] = list(roots)
+    while stack:
+        task = stack.pop()
+        if task.key in seen:
+            continue
+        seen.add(task.key)
+        _ = task.id
+        stack.extend(task.deps)
+    return len(seen)
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    task_count: int
+    duration: float
+
+    @property
+    def per_task_us(self) -> float:
+        return self.duration / self.task_count * 1e6
+
+
+async def run_scenario(
+    scenario: str,
+    dag_factory: Callable[[int, str], list[NoOpTask]],
+    size: int,
+) -> BenchmarkResult:
+    """Build the DAG from scratch and measure wall time."""
+    _completed_tasks.clear()
+    roots = dag_factory(size, f"{scenario}_{size}_")
+    task_count = _collect_ids(roots)
+
+    gc.collect()
+    start = time.perf_counter()
+    summary = await build_aio(
+        roots,
+        task_executor=HybridConcurrentTaskExecutor(),
+        registry=NoOpRegistry(),
+    )
+    duration = time.perf_counter() - start
+
+    assert summary.task_count.succeeded == task_count, summary
+    return BenchmarkResult(scenario=scenario, task_count=task_count, duration=duration)
+
+
+def main() -> None:
+    """Run scheduling overhead benchmarks."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="Number of tasks per DAG (default: 10000 100000)",
+    )
+    args = parser.parse_args()
+
+    scenarios: dict[str, Callable[[int, str], list[NoOpTask]]] = {
+        "flat": create_flat_dag,
+        "layered": create_layered_dag,
+    }
+
+    print("=" * 70)
+    print("SCHEDULER OVERHEAD BENCHMARK")
+    print("=" * 70)
+    print("No-op tasks, NoOp registry, in-memory completion checks.")
+    print()
+    print(f"{'Scenario':<12}{'Tasks':>10}{'Total (s)':>14}{'Per task (us)':>16}")
+    print("-" * 52)
+    for size in args.sizes:
+        for scenario, factory in scenarios.items():
+            result = asyncio.run(run_scenario(scenario, factory, size))
+            print(
+                f"{result.scenario:<12}{result.task_count:>10}"
+                f"{result.duration:>14.3f}{result.per_task_us:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Benchmark for task ID computation on deep and wide DAGs.
+
+Task IDs are hashes of the task parameters, where nested (upstream) tasks
+contribute their own ID. Each upstream task should be hashed exactly once, so
+computing the ID of the root should be linear in the size of the DAG.
+
+Scenarios:
+- chain: a 5,000-deep chain of tasks, each depending on the previous one
+- fan_in: 1,000 tasks that all depend on the same 1,000 leaves (1M edges),
+  under a single root
+
+Usage:
+    cd lib/stardag-examples
+    uv run python -m stardag_examples.benchmarks.task_id_hashing
+"""
+
+from __future__ import annotations
+
+import time
+
+import stardag as sd
+
+sd.auto_namespace(__name__)
+
+
+class HashTask(sd.BaseTask):
+    """Task that is only used for hashing."""
+
+    key: str
+    deps: tuple[sd.SubClass[sd.BaseTask], ...] = ()
+
+    def complete(self) -> bool:
+        return False
+
+    def run(self) -> None:
+        pass
+
+
+def create_chain(depth: int) -> HashTask:
+    """Create a chain of `depth` tasks, returns the most downstream one."""
+    task = HashTask(key="chain_0")
+    for index in range(1, depth):
+        task = HashTask(key=f"chain_{index}", deps=(task,))
+    return task
+
+
+def create_fan_in(width: int, leaf_count: int) -> HashTask:
+    """Create `width` tasks each depending on the same `leaf_count` leaves."""
+    leaves = tuple(HashTask(key=f"leaf_{i}") for i in range(leaf_count))
+    middle = tuple(HashTask(key=f"middle_{i}", deps=leaves) for i in range(width))
+    return HashTask(key="root", deps=middle)
+
+
+def time_id(root: HashTask) -> float:
+    start = time.perf_counter()
+    _ = root.id
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run task ID hashing benchmarks."""
+    print("=" * 70)
+    print("TASK ID HASHING BENCHMARK")
+    print("=" * 70)
+    print(f"{'Scenario':<28}{'Tasks':>10}{'Edges':>12}{'Time (s)':>12}")
+    print("-" * 62)
+
+    depth = 5_000
+    duration = time_id(create_chain(depth))
+    print(f"{'chain (5,000 deep)':<28}{depth:>10}{depth - 1:>12}{duration:>12.3f}")
+
+    width = leaf_count = 1_000
+    duration = time_id(create_fan_in(width, leaf_count))
+    print(
+        f"{'fan_in (1,000 x 1,000)':<28}{width + leaf_count + 1:>10}"
+        f"{width * leaf_count + width:>12}{duration:>12.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Local cache commands for Stardag CLI.
+
+Manages the completion index, a local record of task outputs known to exist
+(enable with STARDAG_COMPLETION_INDEX_ENABLED=true).
+"""
+
+from pathlib import Path
+from uuid import UUID
+
+import typer
+
+from stardag.target._completion_index import (
+    CompletionIndexConfig,
+    SQLiteCompletionIndex,
+)
+
+app = typer.Typer(help="Manage local Stardag caches")
+
+
+@app.command("invalidate")
+def cache_invalidate(
+    task_id: str = typer.Option(
+        None,
+        "--task-id",
+        "-t",
+        help="Only invalidate the output of the task with this ID",
+    ),
+    prefix: str = typer.Option(
+        None,
+        "--prefix",
+        "-p",
+        help="Only invalidate outputs with URIs starting with this prefix",
+    ),
+) -> None:
+    """Invalidate entries of the completion index.
+
+    Invalidated outputs are checked against storage again on the next build.
+    Without options, all entries are invalidated.
+
+    Examples:
+        stardag cache invalidate
+        stardag cache invalidate --task-id 036f6e71-1b3c-54b8-aec1-182359f1e09a
+        stardag cache invalidate --prefix s3://my-bucket/my-namespace/
+    """
+    path = Path(CompletionIndexConfig().path).expanduser()
+    if not path.exists():
+        typer.echo(f"No completion index at: {path}")
+        return
+
+    try:
+        parsed_task_id = UUID(task_id) if task_id is not None else None
+    except ValueError:
+        typer.echo(f"Error: Invalid task ID: {task_id}", err=True)
+        raise typer.Exit(1)
+
+    completion_index = SQLiteCompletionIndex(path)
+    try:
+        count = completion_index.invalidate(task_id=parsed_task_id, prefix=prefix)
+    finally:
+        completion_index.close()
+    typer.echo(f"Invalidated {count} entries of the completion index at: {path}")
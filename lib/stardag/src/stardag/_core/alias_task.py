@@ -4,11 +4,17 @@ from pickle import dumps as pickle_dumps
 from typing import TYPE_CHECKING, Annotated, Any, Generic, Type, Union, get_args
 from uuid import UUID
 
-from pydantic import BaseModel, SerializationInfo, ValidationInfo, model_validator
+from pydantic import (
+    BaseModel,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+    ValidationInfo,
+    model_validator,
+)
 
 from stardag._core.auto_task import AutoTask, LoadedT
 from stardag._core.task import Task
-from stardag.base_model import StardagField
+from stardag.base_model import CONTEXT_MODE_KEY, StardagField
 from stardag.target import FileSystemTarget
 from stardag.target.serialize import get_serializer
 
@@ -155,6 +161,17 @@ class AliasTask(AutoTask[LoadedT], Generic[LoadedT]):
         # NOTE: UUID is stringified to match serialization mode "json"
         return {"id": str(self.id)}
 
+    def _precomputed_serialization(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Any | None:
+        """Never serialize as a reference, since the ID is that of the aliased task.
+
+        A reference would be resolved to the aliased task rather than this alias.
+        """
+        if info.context and info.context.get(CONTEXT_MODE_KEY) == "ref":
+            return None
+        return super()._precomputed_serialization(handler, info)
+
     # Override pydantic serialization for this model to use `aliased_body` if provided,
     # with extra ID and URI fields
     def _serialize_extra(self, data: Any, info: SerializationInfo[Any | None]):
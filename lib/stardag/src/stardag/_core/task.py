@@ -6,6 +6,7 @@ import inspect
 import logging
 from abc import abstractmethod
 from collections import abc as collections_abc
+from contextvars import ContextVar
 from dataclasses import dataclass
 from functools import cached_property, total_ordering
 from typing import (
@@ -25,16 +26,34 @@ if TYPE_CHECKING:
 from pickle import loads as pickle_loads
 from uuid import UUID
 
-from pydantic import ConfigDict, Field, SerializationInfo
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializationInfo,
+    SerializerFunctionWrapHandler,
+)
 from typing_extensions import TypeAlias, Union
 
 from stardag._core.target_base import TargetType
 from stardag._core.task_id import _get_task_id_from_jsonable
+from stardag._core.task_refs import REF_TASK_IDS_KEY, TASK_REF_KEY, resolve_task_refs
 from stardag.base_model import CONTEXT_MODE_KEY
 from stardag.polymorphic import PolymorphicRoot
+from stardag.target._completion_index import (
+    completion_index_provider,
+    get_indexable_uri,
+)
 
 logger = logging.getLogger(__name__)
 
+# Set while serializing the fields of a nested task in hash mode, to check which
+# schema it is serialized with, during which tasks nested further are not serialized
+_probing_hash_fields: ContextVar[bool] = ContextVar(
+    "_probing_hash_fields", default=False
+)
+_PROBED: dict[str, Any] = {}
+
 
 TaskStruct: TypeAlias = Union[
     "BaseTask", Sequence["TaskStruct"], Mapping[str, "TaskStruct"]
@@ -344,6 +363,10 @@ class BaseTask(
 
     @cached_property
     def id(self) -> UUID:
+        # Hash upstream tasks first (deepest first) so that each is hashed once, and
+        # the serialization below short-circuits nested tasks to their cached IDs.
+        for upstream_task in _get_unhashed_upstream_tasks(self):
+            upstream_task.id
         return UUID(
             self.model_dump(
                 mode="json",
@@ -351,6 +374,43 @@ class BaseTask(
             )["id"]
         )
 
+    def _precomputed_serialization(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Any | None:
+        """Short-circuit serialization of nested tasks in hash and ref mode.
+
+        In hash mode, reuse the cached ID of (nested) tasks instead of serializing
+        them again. Together with `id` computing upstream IDs first, this makes ID
+        computation linear in the size of the DAG: each upstream task is hashed
+        exactly once.
+
+        The cached ID is only reused if the task is serialized with the schema of
+        its own class. A task in a field typed with a base task class (without
+        `SubClass[...]`) is serialized with the fields of the declared class only,
+        and hashed from those, as always.
+
+        In ref mode, replace the selected nested tasks by a reference to their ID.
+        """
+        mode = info.context.get(CONTEXT_MODE_KEY) if info.context else None
+        if mode == "hash":
+            if _probing_hash_fields.get():
+                return _PROBED
+            task_id = self.__dict__.get("id")
+            if task_id is None:
+                return None
+            # Serialize the fields (one level only) to find out which schema is used
+            token = _probing_hash_fields.set(True)
+            try:
+                data = handler(self)
+            finally:
+                _probing_hash_fields.reset(token)
+            if not isinstance(data, dict) or data.keys() != _get_field_keys(type(self)):
+                return None
+            return {"id": str(task_id)}
+        if mode == "ref" and self.id in info.context[REF_TASK_IDS_KEY]:  # type: ignore
+            return {TASK_REF_KEY: str(self.id)}
+        return None
+
     def _hash_mode_finalize(self, data: dict[str, Any], info: SerializationInfo) -> Any:
         """Make hash mode serialization of tasks a container of just their ID."""
         # NOTE: UUID is stringified to match serialization mode "json"
@@ -396,14 +456,21 @@ class BaseTask(
             registry: An optional registry instance to use for loading metadata. If not
                 provided, the default registry from `registry_provider` will be used.
         Returns:
-            An AliasTask instance referencing the specified task.
+            The task instance.
+
+        References to upstream tasks (`{"__ref": "<task_id>"}`) in the registered
+        task data are resolved recursively, fetching each upstream task once.
         """
         from stardag.registry import registry_provider
 
         registry = registry or registry_provider.get()
         metadata = registry.task_get_metadata(id)
+        body = resolve_task_refs(
+            metadata.body,
+            lambda task_id: registry.task_get_metadata(task_id).body,
+        )
 
-        return cls.model_validate(metadata.body, context={CONTEXT_MODE_KEY: "compat"})
+        return cls.model_validate(body, context={CONTEXT_MODE_KEY: "compat"})
 
 
 def auto_namespace(scope: str):
@@ -458,12 +525,36 @@ def namespace(namespace: str, scope: str):
 
 class Task(BaseTask, Generic[TargetType]):
     def complete(self) -> bool:
-        """Check if the task is complete."""
-        return self.output().exists()
+        """Check if the task is complete.
+
+        Persistent file outputs recorded in the completion index are not checked
+        against storage again (see `stardag.target.completion_index_provider`).
+        """
+        output = self.output()
+        uri = get_indexable_uri(output)
+        completion_index = completion_index_provider.get()
+        if uri is not None and completion_index.contains(uri):
+            return True
+        exists = output.exists()
+        if exists and uri is not None:
+            completion_index.record(uri, task_id=self.id)
+        return exists
 
     async def complete_aio(self) -> bool:
-        """Asynchronously check if the task is complete."""
-        return await self.output().exists_aio()
+        """Asynchronously check if the task is complete.
+
+        Persistent file outputs recorded in the completion index are not checked
+        against storage again (see `stardag.target.completion_index_provider`).
+        """
+        output = self.output()
+        uri = get_indexable_uri(output)
+        completion_index = completion_index_provider.get()
+        if uri is not None and await completion_index.contains_aio(uri):
+            return True
+        exists = await output.exists_aio()
+        if exists and uri is not None:
+            await completion_index.record_many_aio([(uri, self.id)])
+        return exists
 
     @abstractmethod
     def output(self) -> TargetType:
@@ -501,6 +592,55 @@ def flatten_task_struct(task_struct: TaskStruct | None) -> list[BaseTask]:
     ValueError(f"Unsupported task struct type: {task_struct!r}")
 
 
+@functools.cache
+def _get_field_keys(task_class: type[BaseTask]) -> frozenset[str]:
+    """Keys of the serialized fields of a task class, in its own schema."""
+    return frozenset(
+        name for name, field in task_class.model_fields.items() if not field.exclude
+    )
+
+
+def _iter_nested_tasks(task: BaseTask) -> Generator[BaseTask, None, None]:
+    """Yield tasks nested in the parameters of a task (not recursing into them)."""
+    stack: list[Any] = [getattr(task, name) for name in type(task).model_fields]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, BaseTask):
+            yield value
+        elif isinstance(value, BaseModel):
+            stack.extend(getattr(value, name) for name in type(value).model_fields)
+        elif isinstance(value, collections_abc.Mapping):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+
+
+def _get_unhashed_upstream_tasks(task: BaseTask) -> list[BaseTask]:
+    """Get all upstream tasks (nested as parameters) without a cached ID.
+
+    Traverses iteratively, so that deep DAGs don't hit the recursion limit.
+
+    Returns:
+        The tasks in post-order, i.e. each task comes after its own upstream tasks.
+    """
+    ordered: list[BaseTask] = []
+    visited: set[int] = {id(task)}
+    stack: list[tuple[BaseTask, bool]] = [(task, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if expanded:
+            if current is not task:
+                ordered.append(current)
+            continue
+        stack.append((current, True))
+        for upstream_task in _iter_nested_tasks(current):
+            if id(upstream_task) in visited or "id" in upstream_task.__dict__:
+                continue
+            visited.add(id(upstream_task))
+            stack.append((upstream_task, False))
+    return ordered
+
+
 @dataclass(frozen=True)
 class TaskRef:
     name: str
@@ -50,6 +50,8 @@ def _get_task_id_jsonable(task: "BaseTask") -> dict[str, Any]:
 
     This is a testing util *bypassing/excluding* the `_hash_mode_finalize` logic."""
     task = task.model_copy()
+    # Drop the (copied) cached ID, which would otherwise short-circuit the dump
+    task.__dict__.pop("id", None)
     task._hash_mode_finalize = lambda data, info: data
     return task.model_dump(
         mode="json",
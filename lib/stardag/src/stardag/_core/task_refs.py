@@ -0,0 +1,75 @@
+"""Compact task serialization, with nested tasks replaced by references.
+
+A task's default serialization embeds its upstream tasks in full, so the size of
+the serialized DAG grows quadratically with its depth. When the upstream tasks are
+known to be available elsewhere (e.g. registered in the same registry), they can be
+replaced by a reference `{"__ref": "<task_id>"}` and resolved when needed.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable, Collection
+from uuid import UUID
+
+from stardag.base_model import CONTEXT_MODE_KEY
+
+if TYPE_CHECKING:
+    from stardag._core.task import BaseTask
+
+TASK_REF_KEY = "__ref"
+# Serialization context key for the IDs of tasks that should be serialized as refs
+REF_TASK_IDS_KEY = "ref_task_ids"
+
+
+def model_dump_with_refs(
+    task: "BaseTask", ref_task_ids: Collection[UUID]
+) -> dict[str, Any]:
+    """Serialize the task (mode="json"), replacing nested tasks by references.
+
+    Args:
+        task: The task to serialize.
+        ref_task_ids: IDs of nested tasks to replace by `{"__ref": "<task_id>"}`.
+            Other nested tasks are serialized in full. The task itself is always
+            serialized in full.
+
+    Returns:
+        The compact JSON-able serialization of the task.
+    """
+    return task.model_dump(
+        mode="json",
+        context={CONTEXT_MODE_KEY: "ref", REF_TASK_IDS_KEY: ref_task_ids},
+    )
+
+
+def resolve_task_refs(
+    data: Any,
+    get_data: Callable[[UUID], Any],
+    cache: dict[UUID, Any] | None = None,
+) -> Any:
+    """Recursively replace task references by the full serialization of the task.
+
+    Args:
+        data: JSON-able data, possibly containing `{"__ref": "<task_id>"}` items.
+        get_data: Callback returning the (possibly compact) serialization of the task
+            with the given ID.
+        cache: Resolved serializations by task ID. Each task is fetched and resolved
+            at most once per cache, which keeps resolution linear in the size of the
+            DAG also when upstream tasks are shared.
+
+    Returns:
+        A copy of the data with all references resolved.
+    """
+    if cache is None:
+        cache = {}
+
+    def resolve(value: Any) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and TASK_REF_KEY in value:
+                task_id = UUID(value[TASK_REF_KEY])
+                if task_id not in cache:
+                    cache[task_id] = resolve(get_data(task_id))
+                return cache[task_id]
+            return {key: resolve(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [resolve(item) for item in value]
+        return value
+
+    return resolve(data)
@@ -7,6 +7,7 @@ Implements a base model with advanced polymorphic serialization + validation fea
 
 2) Context-based custom serialization + validation modes (mode in context):
    - mode="hash": drop fields annotated BackwardCompat(default=...) when value == default
+   - mode="ref": (tasks only) serialize nested tasks as references, see task_refs.py
    - mode="compat": if a BackwardCompat field is missing, populate it with the compat default
 
 3) Auto-register any child class of MyBase when declared (via __init_subclass__).
@@ -21,13 +22,14 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     SerializationInfo,
+    SerializerFunctionWrapHandler,
     ValidationInfo,
     model_serializer,
     model_validator,
 )
 from pydantic.fields import FieldInfo
 
-SerializationContextMode = Literal["hash", None]
+SerializationContextMode = Literal["hash", "ref", None]
 ValidationContextMode = Literal["compat", None]
 CONTEXT_MODE_KEY = "mode"
 
@@ -93,6 +95,9 @@ class StardagBaseModel(BaseModel):
     @model_serializer(mode="wrap")
     def _wrap_serialize(self, handler, info: SerializationInfo):
         """If mode="hash", drop fields with BackwardCompat default values."""
+        precomputed = self._precomputed_serialization(handler, info)
+        if precomputed is not None:
+            return precomputed
         data = handler(self)
         data = self._serialize_extra(data, info)
         return self._handle_hash_mode(data, info)
@@ -125,6 +130,15 @@ class StardagBaseModel(BaseModel):
 
         return self._hash_mode_finalize(out, info)
 
+    def _precomputed_serialization(
+        self, handler: SerializerFunctionWrapHandler, info: SerializationInfo
+    ) -> Any | None:
+        """Return an already known (context mode specific) serialization, or None.
+
+        Allows skipping the (recursive) serialization of nested models entirely.
+        """
+        return None
+
     def _hash_mode_finalize(self, data: dict[str, Any], info: SerializationInfo) -> Any:
         """Final cleanup for hash mode serialization."""
         # Currently no-op, but could be used for additional processing if needed.
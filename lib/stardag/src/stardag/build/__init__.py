@@ -11,10 +11,19 @@ Primary build functions:
 
 Task executor:
 - HybridConcurrentTaskExecutor: Routes tasks to async/thread/process pools
+- WarmProcessPool: Process pool with preloaded modules, reusable across builds
+- StickyProcessPool: Process workers that resume tasks suspended on dynamic deps
 
 Interfaces:
 - TaskExecutorABC: Abstract base class for custom task executors
 - ExecutionModeSelector: Protocol for custom execution mode selection
+- TaskPrioritySelector: Protocol for custom task scheduling priorities
+- ResourcePools: Named resource capacities that gate task submission
+
+Tracing:
+- BuildTracer: Records timed spans of the build phases of each task, with
+    Chrome trace and OTLP JSON export
+- NoOpTracer: Tracer that records nothing (the default)
 
 Global concurrency locking:
 - GlobalConcurrencyLockManager: Protocol for distributed lock implementations
@@ -24,7 +33,9 @@ Global concurrency locking:
 
 from stardag.build._base import (
     BuildExitStatus,
+    BuildMetrics,
     BuildSummary,
+    BuildTimings,
     DefaultGlobalLockSelector,
     FailMode,
     GlobalConcurrencyLockManager,
@@ -33,33 +44,50 @@ from stardag.build._base import (
     LockAcquisitionResult,
     LockAcquisitionStatus,
     LockHandle,
+    ResourcePools,
     RoutedTaskExecutor,
     TaskCount,
     TaskExecutorABC,
 )
 from stardag.build._concurrent import (
     DefaultExecutionModeSelector,
+    DefaultTaskPrioritySelector,
     ExecutionMode,
     ExecutionModeSelector,
     HybridConcurrentTaskExecutor,
+    TaskPrioritySelector,
     build,
     build_aio,
 )
+from stardag.build._process_pool import WarmProcessPool
 from stardag.build._sequential import (
     build_sequential,
     build_sequential_aio,
 )
+from stardag.build._sticky_process import StickyProcessPool
+from stardag.build._tracing import BuildTracer, NoOpTracer, Span
 
 __all__ = [
     # Data structures
     "BuildExitStatus",
+    "BuildMetrics",
     "BuildSummary",
+    "BuildTimings",
     "FailMode",
     "TaskCount",
+    # Resource pools
+    "ResourcePools",
     # Execution mode
     "DefaultExecutionModeSelector",
     "ExecutionMode",
     "ExecutionModeSelector",
+    # Task priority
+    "DefaultTaskPrioritySelector",
+    "TaskPrioritySelector",
+    # Tracing
+    "BuildTracer",
+    "NoOpTracer",
+    "Span",
     # Global concurrency lock
     "DefaultGlobalLockSelector",
     "GlobalConcurrencyLockManager",
@@ -71,7 +99,9 @@ __all__ = [
     # Task executors
     "HybridConcurrentTaskExecutor",
     "RoutedTaskExecutor",
+    "StickyProcessPool",
     "TaskExecutorABC",
+    "WarmProcessPool",
     # Build functions
     "build",
     "build_aio",
@@ -1,21 +1,25 @@
 """Base interfaces and data structures for the build system.
 
 This module contains:
-- Data structures: BuildExitStatus, TaskCount, BuildSummary, FailMode
+- Data structures: BuildExitStatus, TaskCount, BuildTimings, BuildMetrics,
+    BuildSummary, FailMode
 - Task state tracking: TaskExecutionState
+- Resource pools: ResourcePools
 - Task executor protocol: TaskExecutorABC
 - Global concurrency lock: GlobalConcurrencyLock, GlobalLockConfig, LockAcquisitionResult
 """
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Callable, Generator, Generic, Protocol, TypeVar
+from typing import Callable, Generator, Generic, Mapping, Protocol, TypeVar
 from uuid import UUID
 
 from stardag import BaseTask, TaskStruct
+from stardag.target import OutputCacheStats
 
 # =============================================================================
 # Data Structures
@@ -42,6 +46,113 @@ class TaskCount:
         )
 
 
+@dataclass
+class BuildTimings:
+    """Wall-clock durations (in seconds) of the build startup phases.
+
+    Attributes:
+        discovery: Traversing the DAG(s) and checking completion of tasks (with
+            pipelined discovery, concurrently with task execution).
+        registration: Registering previously completed tasks in the registry.
+    """
+
+    discovery: float = 0.0
+    registration: float = 0.0
+
+
+@dataclass
+class BuildMetrics:
+    """Scheduler metrics of a concurrent build, e.g. for tuning worker counts.
+
+    Durations are in seconds. Run durations and worker pool usage are reported by
+    the task executor (HybridConcurrentTaskExecutor does), the rest by the build.
+
+    Attributes:
+        execution: Wall-clock duration of the execution phase (after discovery and
+            registration).
+        task_run_durations: Run duration per task, summed over resumptions after
+            dynamic deps.
+        task_ready_wait: Time per task spent ready to run (deps complete) but not
+            running: waiting for submission (e.g. for resources) and for a worker.
+        pool_capacity: Number of workers per worker pool ("async", "thread", ...).
+        pool_usage: Busy workers per pool over time, as (seconds since the start of
+            execution, busy workers) at each change.
+        peak_in_flight: Peak number of tasks submitted and not yet finished
+            (including those waiting for a lock or worker).
+        registry_time: Total time spent in registry calls about tasks.
+        lock_wait_time: Total time spent acquiring global concurrency locks.
+    """
+
+    execution: float = 0.0
+    task_run_durations: dict[UUID, float] = field(default_factory=dict)
+    task_ready_wait: dict[UUID, float] = field(default_factory=dict)
+    pool_capacity: dict[str, int] = field(default_factory=dict)
+    pool_usage: dict[str, list[tuple[float, int]]] = field(default_factory=dict)
+    peak_in_flight: int = 0
+    registry_time: float = 0.0
+    lock_wait_time: float = 0.0
+    _start: float = field(default=0.0, repr=False, compare=False)
+
+    def start(self) -> None:
+        """Mark the start of the execution phase."""
+        self._start = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """Seconds since the start of the execution phase."""
+        return time.perf_counter() - self._start
+
+    def record_run(self, task_id: UUID, duration: float) -> None:
+        self.task_run_durations[task_id] = (
+            self.task_run_durations.get(task_id, 0.0) + duration
+        )
+
+    def record_ready_wait(self, task_id: UUID, duration: float) -> None:
+        self.task_ready_wait[task_id] = (
+            self.task_ready_wait.get(task_id, 0.0) + duration
+        )
+
+    def record_pool_usage(self, pool: str, capacity: int, delta: int) -> None:
+        """Record that `delta` workers of the pool became busy (or free if < 0)."""
+        self.pool_capacity[pool] = capacity
+        usage = self.pool_usage.setdefault(pool, [(0.0, 0)])
+        usage.append((self.elapsed(), usage[-1][1] + delta))
+
+    def pool_utilization(self, pool: str) -> float:
+        """Average fraction of the workers of the pool that were busy."""
+        usage = self.pool_usage.get(pool)
+        if not usage or not self.execution:
+            return 0.0
+        busy_time = 0.0
+        for (t0, busy), (t1, _) in zip(usage, usage[1:] + [(self.execution, 0)]):
+            busy_time += busy * (min(t1, self.execution) - t0)
+        return busy_time / (self.pool_capacity[pool] * self.execution)
+
+    def peak_pool_usage(self, pool: str) -> int:
+        """Peak number of busy workers of the pool."""
+        return max((busy for _, busy in self.pool_usage.get(pool, [])), default=0)
+
+    def report(self) -> str:
+        """Human-readable summary of the metrics."""
+        run_total = sum(self.task_run_durations.values())
+        ready_wait_total = sum(self.task_ready_wait.values())
+        lines = [
+            f"Execution: {self.execution:.3f}s, peak in-flight tasks: "
+            f"{self.peak_in_flight}",
+            f"Task run time: {run_total:.3f}s total over "
+            f"{len(self.task_run_durations)} tasks, ready-wait: "
+            f"{ready_wait_total:.3f}s total, "
+            f"{max(self.task_ready_wait.values(), default=0.0):.3f}s max",
+            f"Registry calls: {self.registry_time:.3f}s, lock waits: "
+            f"{self.lock_wait_time:.3f}s",
+        ]
+        for pool, capacity in self.pool_capacity.items():
+            lines.append(
+                f"Pool {pool}: {self.pool_utilization(pool):.0%} utilization, "
+                f"peak {self.peak_pool_usage(pool)}/{capacity} workers"
+            )
+        return "\n".join(lines)
+
+
 @dataclass
 class BuildSummary:
     """Summary of a build execution."""
@@ -50,6 +161,9 @@ class BuildSummary:
     task_count: TaskCount
     build_id: UUID | None = None
     error: BaseException | None = None
+    timings: BuildTimings = field(default_factory=BuildTimings)
+    metrics: BuildMetrics = field(default_factory=BuildMetrics)
+    output_cache: OutputCacheStats | None = None
 
     def __repr__(self) -> str:
         """Return a human-readable summary of the build."""
@@ -70,6 +184,16 @@ class BuildSummary:
         )
         if tc.pending > 0:
             lines.append(f"  Pending: {tc.pending}")
+        lines.append(
+            f"  Startup: discovery {self.timings.discovery:.2f}s, "
+            f"registration {self.timings.registration:.2f}s"
+        )
+        if self.output_cache is not None:
+            lines.append(
+                f"  Output cache: {self.output_cache.hits} hits, "
+                f"{self.output_cache.misses} misses "
+                f"({self.output_cache.hit_rate:.0%} hit rate)"
+            )
         if self.error:
             lines.append(f"  Error: {self.error}")
         return "\n".join(lines)
@@ -112,12 +236,95 @@ class TaskExecutionState:
     exception: BaseException | None = None
     # True when task is waiting for a global lock held by another build
     waiting_for_lock: bool = False
+    # Number of linked deps (static + dynamic) that are not yet completed.
+    # The task is ready for (re-)submission when this drops to zero.
+    pending_dep_count: int = 0
+    # Reverse dependency index: IDs of tasks waiting on this task to complete
+    dependents: set[UUID] = field(default_factory=set)
+    # Cost-weighted length of the longest chain of tasks, starting with this one,
+    # through the discovered DAG to a root task (the critical path)
+    remaining_path: float = 0.0
+    # Scheduling priority, ready tasks with higher priority are submitted first
+    priority: float = 0.0
 
     @property
     def all_deps(self) -> list[BaseTask]:
         return self.static_deps + self.dynamic_deps
 
 
+# =============================================================================
+# Resource Pools
+# =============================================================================
+
+
+# Tolerance for accumulated floating point errors of fractional amounts
+_RESOURCE_EPSILON = 1e-9
+
+
+def _get_task_resources(task: BaseTask) -> Mapping[str, float]:
+    """Resource requirements of the task: its `resources` attribute, if any."""
+    return getattr(task, "resources", None) or {}
+
+
+class ResourcePools:
+    """Named pools of resources with a (fractional) capacity each.
+
+    Tasks declare the amount they need of each resource, typically as a class
+    variable, and are only submitted when all the pools they use have enough
+    capacity left:
+
+        class TrainModel(AutoTask[Model]):
+            resources: ClassVar[dict[str, float]] = {"memory_gb": 16, "gpu": 0.5}
+
+        build(tasks, resource_pools={"memory_gb": 64, "gpu": 2})
+
+    Resources without a pool are not limited.
+
+    Args:
+        capacities: Mapping from resource name to the total amount available.
+    """
+
+    def __init__(self, capacities: Mapping[str, float]) -> None:
+        for name, capacity in capacities.items():
+            if capacity < 0:
+                raise ValueError(f"Capacity of resource '{name}' must be >= 0.")
+        self.capacities = dict(capacities)
+        self.in_use: dict[str, float] = {name: 0.0 for name in capacities}
+
+    def available(self, name: str) -> float:
+        """Amount of the resource not in use."""
+        return self.capacities[name] - self.in_use[name]
+
+    def exceeds_capacity(self, requirements: Mapping[str, float]) -> list[str]:
+        """Names of the pools whose total capacity is less than required."""
+        return [
+            name
+            for name, amount in requirements.items()
+            if name in self.capacities
+            and amount > self.capacities[name] + _RESOURCE_EPSILON
+        ]
+
+    def fits(self, requirements: Mapping[str, float]) -> bool:
+        """Whether the required amounts are currently available."""
+        return all(
+            amount <= self.available(name) + _RESOURCE_EPSILON
+            for name, amount in requirements.items()
+            if name in self.capacities
+        )
+
+    def acquire(self, requirements: Mapping[str, float]) -> None:
+        """Reserve the required amounts (check `fits()` first)."""
+        for name, amount in requirements.items():
+            if name in self.in_use:
+                self.in_use[name] += amount
+
+    def release(self, requirements: Mapping[str, float]) -> None:
+        """Return amounts previously reserved with `acquire()`."""
+        for name, amount in requirements.items():
+            if name in self.in_use:
+                self.in_use[name] = max(self.in_use[name] - amount, 0.0)
+
+
 # =============================================================================
 # Task Executor Protocol
 # =============================================================================
@@ -161,6 +368,14 @@ class TaskExecutorABC(ABC):
         """Teardown any resources used by the task executor."""
         ...
 
+    def get_resource_pools(self, task: BaseTask) -> ResourcePools | None:
+        """Resource pools of the executor that the task would run against.
+
+        The build only submits the task when it fits both these pools (if any) and
+        the build's own pools.
+        """
+        return None
+
 
 # Type variable for executor routing keys
 ExecutorKeyT = TypeVar("ExecutorKeyT")
@@ -184,21 +399,40 @@ class RoutedTaskExecutor(TaskExecutorABC, Generic[ExecutorKeyT]):
             router=lambda task: "modal" if needs_gpu(task) else "local",
         )
         await build_aio([task], task_executor=routed)
+
+    Each route can have its own resource pools, e.g. to limit the total memory of
+    tasks running locally without limiting those sent to Modal:
+
+        routed = RoutedTaskExecutor(
+            executors={"local": local_executor, "modal": modal_executor},
+            router=lambda task: "modal" if needs_gpu(task) else "local",
+            resource_pools={"local": {"memory_gb": 32}},
+        )
     """
 
     def __init__(
         self,
         executors: dict[ExecutorKeyT, TaskExecutorABC],
         router: Callable[[BaseTask], ExecutorKeyT],
+        resource_pools: (
+            Mapping[ExecutorKeyT, Mapping[str, float] | ResourcePools] | None
+        ) = None,
     ) -> None:
         """Initialize the routed executor.
 
         Args:
             executors: Mapping from routing keys to task executors.
             router: Function that determines which executor to use for each task.
+            resource_pools: Optional mapping from routing keys to the resource pool
+                capacities of the route. Routes without pools fall back to the
+                pools of their executor.
         """
         self.executors = executors
         self.router = router
+        self.resource_pools: dict[ExecutorKeyT, ResourcePools] = {
+            key: pools if isinstance(pools, ResourcePools) else ResourcePools(pools)
+            for key, pools in (resource_pools or {}).items()
+        }
 
     async def submit(self, task: BaseTask) -> None | TaskStruct | Exception:
         """Route task to appropriate executor and submit."""
@@ -208,6 +442,14 @@ class RoutedTaskExecutor(TaskExecutorABC, Generic[ExecutorKeyT]):
             return KeyError(f"No executor found for routing key: {key}")
         return await executor.submit(task)
 
+    def get_resource_pools(self, task: BaseTask) -> ResourcePools | None:
+        """Resource pools of the route of the task."""
+        key = self.router(task)
+        if key in self.resource_pools:
+            return self.resource_pools[key]
+        executor = self.executors.get(key)
+        return executor.get_resource_pools(task) if executor is not None else None
+
     async def setup(self) -> None:
         """Setup all child executors."""
         for executor in self.executors.values():
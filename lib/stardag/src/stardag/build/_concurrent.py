@@ -9,10 +9,26 @@ This module contains:
 from __future__ import annotations
 
 import asyncio
+import functools
+import heapq
+import itertools
 import logging
+import time
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, suppress
+from contextvars import ContextVar, copy_context
 from enum import StrEnum
-from typing import Generator, Literal, Protocol, Sequence
+from typing import (
+    Any,
+    AsyncIterator,
+    Generator,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Protocol,
+    Sequence,
+)
 from uuid import UUID
 
 from stardag import (
@@ -21,12 +37,15 @@ from stardag import (
     flatten_task_struct,
 )
 from stardag._core.task import (
+    Task,
     _has_custom_run,
     _has_custom_run_aio,
 )
 from stardag.build._base import (
     BuildExitStatus,
+    BuildMetrics,
     BuildSummary,
+    BuildTimings,
     DefaultGlobalLockSelector,
     FailMode,
     GlobalConcurrencyLockManager,
@@ -34,11 +53,31 @@ from stardag.build._base import (
     GlobalLockSelector,
     LockAcquisitionResult,
     LockAcquisitionStatus,
+    ResourcePools,
     TaskCount,
     TaskExecutionState,
     TaskExecutorABC,
+    _get_task_resources,
+)
+from stardag.build._process_pool import (
+    TaskPayload,
+    WarmProcessPool,
+    dump_task,
+    load_task,
 )
+from stardag.build._sticky_process import StickyProcessPool
+from stardag.build._tracing import BuildTracer, NoOpTracer
 from stardag.registry import RegistryABC, init_registry
+from stardag.target import (
+    CompletionIndexABC,
+    OutputCacheABC,
+    Target,
+    completion_index_provider,
+    exists_many_aio,
+    supports_exists_many,
+)
+from stardag.target._completion_index import get_indexable_uri
+from stardag.target._output_cache import _build_output_cache
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +93,8 @@ class ExecutionMode(StrEnum):
     SYNC_BLOCKING = "sync_blocking"
     SYNC_THREAD = "sync_thread"
     SYNC_PROCESS = "sync_process"
+    # Process that keeps the task suspended on dynamic deps (see StickyProcessPool)
+    SYNC_STICKY_PROCESS = "sync_sticky_process"
     ASYNC_MAIN_LOOP = "async_main_loop"
 
 
@@ -84,11 +125,15 @@ class DefaultExecutionModeSelector:
             - "thread": Run in thread pool (default, good for I/O-bound)
             - "blocking": Run blocking in current thread (debugging)
             - "process": Run in process pool (good for CPU-bound)
+            - "sticky_process": Run in a sticky process worker (good for CPU-bound
+                tasks with dynamic deps, which are resumed instead of re-executed)
     """
 
     def __init__(
         self,
-        sync_run_default: Literal["thread", "blocking", "process"] = "thread",
+        sync_run_default: Literal[
+            "thread", "blocking", "process", "sticky_process"
+        ] = "thread",
     ) -> None:
         self.sync_run_default = sync_run_default
 
@@ -105,12 +150,224 @@ class DefaultExecutionModeSelector:
                 return ExecutionMode.SYNC_THREAD
             elif self.sync_run_default == "process":
                 return ExecutionMode.SYNC_PROCESS
+            elif self.sync_run_default == "sticky_process":
+                return ExecutionMode.SYNC_STICKY_PROCESS
             else:
                 return ExecutionMode.SYNC_BLOCKING
         else:
             raise ValueError(f"Task {task} has no run method.")
 
 
+# =============================================================================
+# Task Priority Selection
+# =============================================================================
+
+
+class TaskPrioritySelector(Protocol):
+    """Protocol for selecting the scheduling priority of a task.
+
+    Ready tasks are submitted, and admitted to the executor's worker pools, in order
+    of decreasing priority (ties in the order they became ready).
+
+    The selector receives the task's remaining path: the cost-weighted length of the
+    longest chain of tasks, starting with this task, through the discovered DAG to a
+    root task. The cost of each task is its `cost_hint` attribute (default 1.0).
+    """
+
+    def __call__(self, task: BaseTask, remaining_path: float) -> float: ...
+
+
+class DefaultTaskPrioritySelector:
+    """Prioritizes tasks on the critical path of the DAG.
+
+    Policy:
+    - Tasks with a `priority` attribute (not None): its value
+    - Other tasks: the remaining path, i.e. longest remaining path first
+
+    Both `priority` and `cost_hint` are typically declared as class variables:
+
+        class TrainModel(AutoTask[Model]):
+            cost_hint: ClassVar[float] = 60.0  # ~60x as slow as the average task
+    """
+
+    def __call__(self, task: BaseTask, remaining_path: float) -> float:
+        priority = getattr(task, "priority", None)
+        if priority is not None:
+            return float(priority)
+        return remaining_path
+
+
+def _get_cost_hint(task: BaseTask) -> float:
+    """Relative cost (duration) of the task, used to weight the remaining path."""
+    return float(getattr(task, "cost_hint", 1.0))
+
+
+# Priority of the task being submitted, set by build_aio() for the duration of
+# `TaskExecutorABC.submit()`, so that executors can admit queued tasks in order.
+_task_priority: ContextVar[float] = ContextVar("stardag_task_priority", default=0.0)
+# Tracer of the build, set likewise, for executors to record queue wait and run spans
+_task_tracer: ContextVar[BuildTracer] = ContextVar(
+    "stardag_task_tracer", default=NoOpTracer()
+)
+# Metrics of the build, set likewise, for executors to record run and pool usage
+_build_metrics: ContextVar[BuildMetrics | None] = ContextVar(
+    "stardag_build_metrics", default=None
+)
+
+
+class _PrioritySemaphore:
+    """Semaphore that wakes up waiters in order of decreasing priority.
+
+    Waiters with equal priority are woken up in FIFO order.
+    """
+
+    def __init__(self, value: int, name: str = "") -> None:
+        self.capacity = value
+        # Name of the worker pool, in BuildMetrics
+        self.name = name
+        self._value = value
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, priority: float = 0.0) -> None:
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Woken up (slot handed over) but cancelled before resuming
+                self.release()
+            raise
+
+    def release(self) -> None:
+        # Hand the slot over to the highest priority waiter (if any)
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+    @asynccontextmanager
+    async def slot(self, priority: float = 0.0) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+# =============================================================================
+# Batched completion checks
+# =============================================================================
+
+
+def _get_bulk_checkable_output(task: BaseTask) -> Target | None:
+    """The output of the task if its completion can be checked in bulk.
+
+    That is, if the task's completion is the existence of its output (default
+    `Task.complete_aio()`) and the output is a plain file target supported by
+    `exists_many_aio()`.
+    """
+    if not isinstance(task, Task) or type(task).complete_aio is not Task.complete_aio:
+        return None
+    output = task.output()
+    return output if supports_exists_many(output) else None
+
+
+class _ExistsCheck(NamedTuple):
+    target: Target
+    task_id: UUID | None
+    future: asyncio.Future[bool]
+
+
+class _ExistsBatcher:
+    """Collects concurrent existence checks and runs them in bulk.
+
+    Checks requested in the same event loop iteration (e.g. for all dependencies
+    of a task during discovery) are looked up in the completion index with a
+    single `contains_many()` query, and the rest are sent in a single
+    `exists_many_aio()` call, of at most `max_batch_size` targets. Existing
+    outputs are then recorded in the index. The semaphore limits concurrent calls.
+    """
+
+    def __init__(
+        self,
+        semaphore: asyncio.Semaphore,
+        completion_index: CompletionIndexABC,
+        max_batch_size: int = 1000,
+    ):
+        self.semaphore = semaphore
+        self.completion_index = completion_index
+        self.max_batch_size = max_batch_size
+        self._pending: list[_ExistsCheck] = []
+        self._flush_handle: asyncio.Handle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    async def exists(self, target: Target, task_id: UUID | None = None) -> bool:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[bool] = loop.create_future()
+        self._pending.append(_ExistsCheck(target, task_id, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_soon(self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            flush_task = asyncio.create_task(self._check(batch))
+            self._flush_tasks.add(flush_task)
+            flush_task.add_done_callback(self._flush_tasks.discard)
+
+    async def _check(self, batch: list[_ExistsCheck]) -> None:
+        try:
+            async with self.semaphore:
+                results = await self._exists_many(batch)
+        except asyncio.CancelledError:
+            for check in batch:
+                check.future.cancel()
+            raise
+        except Exception as exc:
+            for check in batch:
+                if not check.future.done():
+                    check.future.set_exception(exc)
+            return
+        for check, result in zip(batch, results):
+            if not check.future.done():
+                check.future.set_result(result)
+
+    async def _exists_many(self, batch: list[_ExistsCheck]) -> list[bool]:
+        uris = [get_indexable_uri(check.target) for check in batch]
+        indexed = await self.completion_index.contains_many_aio(
+            [uri for uri in uris if uri is not None]
+        )
+        unindexed = [i for i, uri in enumerate(uris) if uri not in indexed]
+        results = [True] * len(batch)
+        if unindexed:
+            for i, exists in zip(
+                unindexed,
+                await exists_many_aio([batch[i].target for i in unindexed]),
+            ):
+                results[i] = exists
+            await self.completion_index.record_many_aio(
+                [
+                    (uri, batch[i].task_id)
+                    for i in unindexed
+                    if results[i] and (uri := uris[i]) is not None
+                ]
+            )
+        return results
+
+
 # =============================================================================
 # Helper for process pool execution
 # =============================================================================
@@ -179,6 +436,11 @@ def _run_task_in_process(task: BaseTask) -> TaskStruct | None:
     return result  # type: ignore[return-value]
 
 
+def _run_task_payload_in_process(payload: TaskPayload) -> TaskStruct | None:
+    """Like `_run_task_in_process`, for a task sent compactly (see `dump_task`)."""
+    return _run_task_in_process(load_task(payload))
+
+
 # =============================================================================
 # Task Executor Implementation
 # =============================================================================
@@ -199,11 +461,21 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
     Alternative: For fully async multiprocessing without thread pools, one could
     implement an AIOMultiprocessingTaskExecutor using libraries like aiomultiprocess.
 
+    Tasks waiting for a free worker are admitted in order of their priority (see
+    TaskPrioritySelector), rather than in submission order.
+
     Args:
         execution_mode_selector: Callable to select execution mode per task.
         max_async_workers: Maximum concurrent async tasks (semaphore-based).
         max_thread_workers: Maximum concurrent thread pool workers.
         max_process_workers: Maximum concurrent process pool workers.
+        process_pool: Warm process pool to run SYNC_PROCESS tasks in, which is
+            not shut down on teardown and can be shared across builds. If not
+            provided, a process pool (spawn) is started for each build when
+            `max_process_workers` is set.
+        max_sticky_process_workers: Number of sticky worker processes for
+            SYNC_STICKY_PROCESS tasks (see StickyProcessPool), started for each
+            build. They preload the modules of `process_pool`, if provided.
     """
 
     def __init__(
@@ -212,6 +484,8 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
         max_async_workers: int = 10,
         max_thread_workers: int = 10,
         max_process_workers: int | None = None,
+        process_pool: WarmProcessPool | None = None,
+        max_sticky_process_workers: int | None = None,
     ) -> None:
         self.execution_mode_selector = (
             execution_mode_selector or DefaultExecutionModeSelector()
@@ -219,11 +493,19 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
         self.max_async_workers = max_async_workers
         self.max_thread_workers = max_thread_workers
         self.max_process_workers = max_process_workers
+        self.process_pool = process_pool
+        if process_pool is not None and max_process_workers is None:
+            self.max_process_workers = process_pool.max_workers
+        self.max_sticky_process_workers = max_sticky_process_workers
 
         # Pools - initialized in setup()
-        self._async_semaphore: asyncio.Semaphore | None = None
+        self._async_slots: _PrioritySemaphore | None = None
         self._thread_pool: ThreadPoolExecutor | None = None
+        self._thread_slots: _PrioritySemaphore | None = None
         self._process_pool: ProcessPoolExecutor | None = None
+        self._process_slots: _PrioritySemaphore | None = None
+        self._sticky_pool: StickyProcessPool | None = None
+        self._sticky_slots: _PrioritySemaphore | None = None
 
         # Track suspended generators (task_id -> generator)
         # For in-process execution where we can suspend and resume
@@ -238,9 +520,17 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
         """Initialize worker pools."""
         import multiprocessing as mp
 
-        self._async_semaphore = asyncio.Semaphore(self.max_async_workers)
+        self._async_slots = _PrioritySemaphore(self.max_async_workers, "async")
         self._thread_pool = ThreadPoolExecutor(max_workers=self.max_thread_workers)
-        if self.max_process_workers:
+        # Pool workers are only handed tasks when free, so that queued tasks are
+        # admitted by priority instead of the pools' FIFO order
+        self._thread_slots = _PrioritySemaphore(self.max_thread_workers, "thread")
+        if self.process_pool is not None:
+            self._process_pool = self.process_pool.executor
+            self._process_slots = _PrioritySemaphore(
+                self.max_process_workers or self.process_pool.max_workers, "process"
+            )
+        elif self.max_process_workers:
             # Use 'spawn' explicitly for cross-platform compatibility.
             # Python 3.14 changed the default from 'fork' to 'forkserver' on Linux,
             # which can cause issues with environment variable inheritance.
@@ -249,6 +539,20 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
                 max_workers=self.max_process_workers,
                 mp_context=mp.get_context("spawn"),
             )
+            self._process_slots = _PrioritySemaphore(
+                self.max_process_workers, "process"
+            )
+        if self.max_sticky_process_workers:
+            self._sticky_pool = StickyProcessPool(
+                max_workers=self.max_sticky_process_workers,
+                preload_modules=(
+                    self.process_pool.preload_modules if self.process_pool else ()
+                ),
+            )
+            self._sticky_pool.start()
+            self._sticky_slots = _PrioritySemaphore(
+                self.max_sticky_process_workers, "sticky_process"
+            )
 
     async def teardown(self) -> None:
         """Shutdown worker pools."""
@@ -256,9 +560,17 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
             self._thread_pool.shutdown(wait=True)
             self._thread_pool = None
         if self._process_pool:
-            self._process_pool.shutdown(wait=True)
+            if self.process_pool is None:
+                self._process_pool.shutdown(wait=True)
+            # else: warm pool, kept for subsequent builds
             self._process_pool = None
-        self._async_semaphore = None
+        if self._sticky_pool:
+            self._sticky_pool.close()
+            self._sticky_pool = None
+        self._async_slots = None
+        self._thread_slots = None
+        self._process_slots = None
+        self._sticky_slots = None
         self._suspended_generators.clear()
         self._pending_reexecution.clear()
 
@@ -279,6 +591,13 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
 
         mode = self.execution_mode_selector(task)
 
+        if mode == ExecutionMode.SYNC_STICKY_PROCESS:
+            # Suspended tasks are resumed by the pool, in the worker they ran in
+            try:
+                return await self._execute_sticky(task)
+            except Exception as e:
+                return e
+
         try:
             result = await self._execute_task(task, mode)
             return self._handle_result(task, result)
@@ -297,31 +616,84 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
                 in subprocess). Task will be re-executed when deps complete.
         """
         if mode == ExecutionMode.ASYNC_MAIN_LOOP:
-            assert self._async_semaphore is not None
-            async with self._async_semaphore:
+            assert self._async_slots is not None
+            async with self._admit(self._async_slots, task, mode):
                 return await task.run_aio()
 
         elif mode == ExecutionMode.SYNC_THREAD:
-            assert self._thread_pool is not None
+            assert self._thread_pool is not None and self._thread_slots is not None
             loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(self._thread_pool, task.run)
+            # Run in a copy of the context, like asyncio.to_thread() (e.g. for the
+            # build's output cache)
+            run = functools.partial(copy_context().run, task.run)
+            async with self._admit(self._thread_slots, task, mode):
+                return await loop.run_in_executor(self._thread_pool, run)
 
         elif mode == ExecutionMode.SYNC_PROCESS:
-            assert self._process_pool is not None
+            assert self._process_pool is not None and self._process_slots is not None
             loop = asyncio.get_running_loop()
             # Use helper that handles generators by collecting all yielded deps
             # and returning TaskStruct (which IS picklable, unlike generators)
-            return await loop.run_in_executor(
-                self._process_pool, _run_task_in_process, task
-            )
+            async with self._admit(self._process_slots, task, mode):
+                if self.process_pool is not None and self.process_pool.compact_transfer:
+                    return await loop.run_in_executor(
+                        self._process_pool,
+                        _run_task_payload_in_process,
+                        dump_task(task),
+                    )
+                return await loop.run_in_executor(
+                    self._process_pool, _run_task_in_process, task
+                )
 
         elif mode == ExecutionMode.SYNC_BLOCKING:
             # Block the event loop (debugging only)
-            return task.run()
+            with self._running(task, mode=mode.value):
+                return task.run()
 
         else:
             raise ValueError(f"Unsupported execution mode: {mode}")
 
+    async def _execute_sticky(self, task: BaseTask) -> TaskStruct | None:
+        """Run, or resume, the task in a sticky worker process."""
+        assert self._sticky_pool is not None and self._sticky_slots is not None
+        async with self._admit(
+            self._sticky_slots, task, ExecutionMode.SYNC_STICKY_PROCESS
+        ):
+            return await self._sticky_pool.submit(task)
+
+    @asynccontextmanager
+    async def _admit(
+        self, slots: _PrioritySemaphore, task: BaseTask, mode: ExecutionMode
+    ) -> AsyncIterator[None]:
+        """Wait for a free slot by priority, and hold it while the task runs."""
+        tracer = _task_tracer.get()
+        metrics = _build_metrics.get()
+        queue_start = time.perf_counter()
+        with tracer.span("queue_wait", task):
+            await slots.acquire(_task_priority.get())
+        if metrics is not None:
+            metrics.record_ready_wait(task.id, time.perf_counter() - queue_start)
+            metrics.record_pool_usage(slots.name, slots.capacity, 1)
+        try:
+            with self._running(task, mode=mode.value):
+                yield
+        finally:
+            slots.release()
+            if metrics is not None:
+                metrics.record_pool_usage(slots.name, slots.capacity, -1)
+
+    @contextmanager
+    def _running(self, task: BaseTask, **attributes: Any) -> Iterator[None]:
+        """Trace the run of the task, and record its duration in the metrics."""
+        metrics = _build_metrics.get()
+        start = time.perf_counter()
+        try:
+            with _task_tracer.get().span("run", task, **attributes):
+                yield
+        finally:
+            if metrics is not None:
+                metrics.record_run(task.id, time.perf_counter() - start)
+
     def _handle_result(
         self,
         task: BaseTask,
@@ -366,7 +738,9 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
     ) -> None | TaskStruct:
         """Handle a generator from task execution."""
         try:
-            yielded = next(gen)
+            # Runs the task up to its first yield, on the event loop
+            with self._running(task, generator=True):
+                yielded = next(gen)
             # Store generator for resumption
             self._suspended_generators[task.id] = gen
             return yielded
@@ -379,7 +753,8 @@ class HybridConcurrentTaskExecutor(TaskExecutorABC):
         gen = self._suspended_generators[task.id]
 
         try:
-            yielded = next(gen)
+            with self._running(task, generator=True):
+                yielded = next(gen)
             # Still more dynamic deps
             return yielded
         except StopIteration:
@@ -402,15 +777,21 @@ async def build_aio(
     fail_mode: FailMode = FailMode.FAIL_FAST,
     registry: RegistryABC | None = None,
     max_concurrent_discover: int = 50,
+    max_concurrent_register: int = 50,
     global_lock_manager: GlobalConcurrencyLockManager | None = None,
     global_lock_config: GlobalLockConfig | None = None,
     resume_build_id: UUID | None = None,
+    task_priority_selector: TaskPrioritySelector | None = None,
+    resource_pools: Mapping[str, float] | ResourcePools | None = None,
+    tracer: BuildTracer | None = None,
+    pipelined_discovery: bool = False,
+    output_cache: OutputCacheABC | None = None,
 ) -> BuildSummary:
     """Build tasks concurrently using hybrid async/thread/process execution.
 
     This is the main build function for production use. It:
     - Discovers all tasks in the DAG(s)
-    - Schedules tasks for execution when dependencies are met
+    - Schedules tasks for execution when dependencies are met, critical path first
     - Handles dynamic dependencies via generator suspension
     - Supports multiple root tasks (built concurrently)
     - Routes tasks to async/thread/process based on ExecutionModeSelector
@@ -424,17 +805,42 @@ async def build_aio(
             Use RoutedTaskExecutor to route tasks to different executors (e.g., Modal).
         fail_mode: How to handle task failures
         registry: Registry for tracking builds (default: from init_registry())
-        max_concurrent_discover: Maximum concurrent completion checks during DAG discovery.
-            Higher values speed up discovery for large DAGs with remote targets.
+        max_concurrent_discover: Number of discovery workers, i.e. maximum concurrent
+            completion checks during DAG discovery. Higher values speed up discovery
+            for large DAGs with remote targets.
+            Checks of plain file outputs are batched, and a batch counts as one.
+        max_concurrent_register: Maximum concurrent registry calls when registering
+            tasks found to be already complete during discovery. Higher values speed
+            up the start of builds where most of the DAG is already complete.
         global_lock_manager: Global concurrency lock manager for distributed builds.
             If provided with global_lock_config.enabled=True, tasks will acquire locks
             before execution to ensure exactly-once execution across processes.
         global_lock_config: Configuration for global locking behavior.
         resume_build_id: Optional build ID to resume. If provided, continues tracking
             events under this existing build instead of starting a new one.
+        task_priority_selector: Callable to select the priority of each task; ready
+            tasks are submitted in order of decreasing priority (default:
+            DefaultTaskPrioritySelector, longest remaining path first).
+        resource_pools: Capacities of named resource pools (e.g. `{"memory_gb": 64,
+            "gpu": 2}`). Tasks declaring `resources` are only submitted when the
+            required amounts are available, see ResourcePools. Ready tasks that
+            don't fit are skipped over in favour of lower priority ones that do.
+            The task executor can add pools of its own (see RoutedTaskExecutor).
+        tracer: Records timed spans of the build phases of each task, see
+            BuildTracer (default: NoOpTracer, records nothing).
+        pipelined_discovery: Execute tasks while the rest of the DAG is still being
+            discovered. The build is started first, and a task is queued as soon as
+            its deps are found to be complete (or have been built). Priorities are
+            then based on the part of the DAG discovered so far. By default, the
+            whole DAG is discovered before the first task is submitted.
+        output_cache: Cache of loaded task outputs (e.g. OutputCache), used by
+            loads in the tasks of the build executed in the build process, and
+            cleared when it ends. Its hit rate is reported in the summary (if it
+            has `stats`). By default, each load reads and deserializes the output.
 
     Returns:
-        BuildSummary with status, task counts, and build_id
+        BuildSummary with status, task counts, build_id, timings and metrics (see
+        BuildMetrics)
     """
     if isinstance(tasks, BaseTask):
         tasks = [tasks]
@@ -453,6 +859,12 @@ async def build_aio(
 
     if task_executor is None:
         task_executor = HybridConcurrentTaskExecutor()
+    if task_priority_selector is None:
+        task_priority_selector = DefaultTaskPrioritySelector()
+    if not isinstance(resource_pools, ResourcePools):
+        resource_pools = ResourcePools(resource_pools or {})
+    if tracer is None:
+        tracer = NoOpTracer()
 
     # Setup global lock selector
     if global_lock_config is None:
@@ -463,6 +875,8 @@ async def build_aio(
     held_locks: set[str] = set()
 
     task_count = TaskCount()
+    timings = BuildTimings()
+    metrics = BuildMetrics()
     completion_cache: set[UUID] = set()
     error: BaseException | None = None
 
@@ -470,61 +884,266 @@ async def build_aio(
     task_states: dict[UUID, TaskExecutionState] = {}
     # Events for completion signaling
     completion_events: dict[UUID, asyncio.Event] = {}
-    # Currently executing tasks
-    executing: set[UUID] = set()
+    # Newly discovered states whose deps are not yet linked into the reverse
+    # dependency index (see link_discovered_states)
+    unlinked_states: list[TaskExecutionState] = []
+    # Tasks whose deps are all complete, waiting to be submitted, as a heap of
+    # (-priority, sequence number, task): highest priority first, then FIFO
+    ready_heap: list[tuple[float, int, BaseTask]] = []
+    ready_counter = itertools.count()
+    # Start time of the suspension of tasks waiting for dynamic deps (for tracing)
+    suspended_since: dict[UUID, int] = {}
+    # Time (perf_counter) at which tasks became ready, until submitted
+    ready_since: dict[UUID, float] = {}
 
     # Tasks found to be already complete during discovery (to register after build starts)
     previously_completed_tasks: list[BaseTask] = []
-
-    # Synchronization for concurrent discovery
-    discover_lock = asyncio.Lock()
+    # With pipelined discovery: registration of previously completed tasks (started
+    # as they are found) and the discovery running alongside execution
+    registration_tasks: set[asyncio.Task] = set()
+    discovery_task: asyncio.Task | None = None
+
+    # In-flight executions report (task_id, result) here when done. Pipelined
+    # discovery puts (None, None) to wake up the main loop when it queued tasks.
+    done_queue: asyncio.Queue[
+        tuple[UUID | None, LockAcquisitionResult | BaseException | TaskStruct | None]
+    ] = asyncio.Queue()
+
+    # Limits concurrent completion checks during discovery
     discover_semaphore = asyncio.Semaphore(max_concurrent_discover)
+    exists_batcher = _ExistsBatcher(discover_semaphore, completion_index_provider.get())
+
+    @contextmanager
+    def registry_call(task: BaseTask, method: str) -> Iterator[None]:
+        """Trace a registry call about the task, and add it to the metrics."""
+        start = time.perf_counter()
+        try:
+            with tracer.span("registry", task, method=method):
+                yield
+        finally:
+            metrics.registry_time += time.perf_counter() - start
 
-    async def discover(task: BaseTask) -> None:
-        """Recursively discover tasks, stopping at already-complete tasks.
+    async def discover(roots: Sequence[BaseTask]) -> None:
+        """Discover tasks from roots, stopping at already-complete tasks.
 
         This optimization avoids traversing into dependency subgraphs that
         are already complete, which can significantly reduce discovery time
         for large DAGs with cached results.
 
-        Uses concurrent recursion with TaskGroup for parallel discovery,
-        with a lock protecting shared data structures and a semaphore
-        limiting concurrent completion checks.
+        Newly found tasks are put on a frontier queue, drained by a fixed number
+        (`max_concurrent_discover`) of worker coroutines. Tasks are deduplicated
+        by ID when put on the frontier, so memory and event loop overhead beyond
+        the task states themselves does not grow with the size of the DAG. No lock
+        is needed: the bookkeeping between awaits is atomic on the event loop.
         """
-        # Check if already discovered and reserve our spot (with lock)
-        async with discover_lock:
-            if task.id in task_states:
-                return
+        frontier: asyncio.Queue[TaskExecutionState] = asyncio.Queue()
+        for root in roots:
+            if root.id not in task_states:
+                frontier.put_nowait(add_state(root))
+        if frontier.empty():
+            return
+
+        async def worker() -> None:
+            while True:
+                state = await frontier.get()
+                try:
+                    await check_and_expand(state, frontier)
+                finally:
+                    frontier.task_done()
+
+        async with asyncio.TaskGroup() as tg:
+            workers = [tg.create_task(worker()) for _ in range(max_concurrent_discover)]
+            await frontier.join()
+            for worker_task in workers:
+                worker_task.cancel()
+
+    def add_state(task: BaseTask) -> TaskExecutionState:
+        """Create the state of a newly discovered task."""
+        with tracer.span("discover", task):
             static_deps = flatten_task_struct(task.requires())
-            task_states[task.id] = TaskExecutionState(
-                task=task, static_deps=static_deps
-            )
-            completion_events[task.id] = asyncio.Event()
-            task_count.discovered += 1
+        state = TaskExecutionState(task=task, static_deps=static_deps)
+        task_states[task.id] = state
+        completion_events[task.id] = asyncio.Event()
+        task_count.discovered += 1
+        if pipelined_discovery:
+            # Raised as dependents are found (see check_and_expand)
+            set_remaining_path(state, _get_cost_hint(task))
+        else:
+            unlinked_states.append(state)
+        return state
 
-        # Check completion outside lock (I/O bound, use semaphore to limit concurrency)
-        async with discover_semaphore:
-            is_complete = await task.complete_aio()
+    async def check_and_expand(
+        state: TaskExecutionState, frontier: asyncio.Queue[TaskExecutionState]
+    ) -> None:
+        """Check completion of a newly discovered task, then queue its new deps."""
+        task = state.task
+        # Check completion (I/O bound, use semaphore to limit concurrency across
+        # concurrent discovery passes). Plain file outputs are checked in bulk with
+        # those of concurrently discovered tasks (e.g. one prefix listing instead of
+        # a HEAD request each), after consulting the (opt-in) local completion index.
+        check_start = tracer.now()
+        output = _get_bulk_checkable_output(task)
+        if output is not None:
+            is_complete = await exists_batcher.exists(output, task_id=task.id)
+        else:
+            async with discover_semaphore:
+                is_complete = await task.complete_aio()
+        tracer.record(
+            "complete_check", task, check_start, tracer.now(), complete=is_complete
+        )
 
         if is_complete:
-            async with discover_lock:
+            task_count.previously_completed += 1
+            previously_completed_tasks.append(task)
+            if pipelined_discovery:
+                # Dependents linked so far may become ready
+                mark_completed(state)
+                registration_tasks.add(
+                    asyncio.create_task(register_previously_completed(task))
+                )
+                wake_main_loop()
+            else:
                 completion_cache.add(task.id)
-                task_states[task.id].completed = True
+                state.completed = True
                 completion_events[task.id].set()
-                task_count.previously_completed += 1
-                previously_completed_tasks.append(task)
             # Don't recurse into deps - they're already built
             return
 
-        # Task not complete - recurse into dependencies concurrently
-        async with asyncio.TaskGroup() as tg:
-            for dep in static_deps:
-                tg.create_task(discover(dep))
+        # Task not complete - queue its deps not discovered yet
+        for dep in state.static_deps:
+            if dep.id not in task_states:
+                frontier.put_nowait(add_state(dep))
+        if not pipelined_discovery:
+            return
+
+        # Pipelined: link the deps right away (new ones count as pending until
+        # checked), so that the task is queued as soon as they are complete
+        for dep in state.static_deps:
+            link_dependency(state, dep)
+            dep_state = task_states[dep.id]
+            if not dep_state.completed:
+                set_remaining_path(
+                    dep_state,
+                    max(
+                        dep_state.remaining_path,
+                        _get_cost_hint(dep) + state.remaining_path,
+                    ),
+                )
+        if state.pending_dep_count == 0:
+            push_ready(state)
+            wake_main_loop()
 
-    # Discover all tasks from roots concurrently
-    async with asyncio.TaskGroup() as tg:
-        for root in tasks:
-            tg.create_task(discover(root))
+    def wake_main_loop() -> None:
+        done_queue.put_nowait((None, None))
+
+    async def run_discovery() -> None:
+        """Discover all tasks from roots."""
+        discovery_start = time.perf_counter()
+        try:
+            with tracer.span("discovery"):
+                await discover(tasks)
+        finally:
+            timings.discovery = time.perf_counter() - discovery_start
+            if pipelined_discovery:
+                wake_main_loop()
+        logger.info(
+            f"Discovered {task_count.discovered} tasks "
+            f"({task_count.previously_completed} already complete) "
+            f"in {timings.discovery:.2f}s"
+        )
+
+    def link_dependency(state: TaskExecutionState, dep: BaseTask) -> None:
+        """Make `state` wait for `dep`, unless dep is complete or already linked."""
+        dep_state = task_states[dep.id]
+        if dep_state.completed or state.task.id in dep_state.dependents:
+            return
+        dep_state.dependents.add(state.task.id)
+        state.pending_dep_count += 1
+
+    def push_ready(state: TaskExecutionState) -> None:
+        ready_since[state.task.id] = time.perf_counter()
+        heapq.heappush(ready_heap, (-state.priority, next(ready_counter), state.task))
+
+    def set_remaining_path(state: TaskExecutionState, remaining_path: float) -> None:
+        assert task_priority_selector is not None  # For type checker
+        state.remaining_path = remaining_path
+        state.priority = task_priority_selector(state.task, remaining_path)
+
+    def prioritize(states: list[TaskExecutionState]) -> None:
+        """Set the remaining path and priority of newly linked states.
+
+        The remaining path of a task is its cost plus the longest remaining path of
+        its dependents. States are visited dependents first: the dependents of a new
+        state are either new themselves or have their remaining path already set.
+        """
+        new_states = {s.task.id: s for s in states if not s.completed}
+        unvisited_dependents = {
+            task_id: len(state.dependents & new_states.keys())
+            for task_id, state in new_states.items()
+        }
+        stack = [
+            new_states[task_id]
+            for task_id, count in unvisited_dependents.items()
+            if count == 0
+        ]
+        while stack:
+            state = stack.pop()
+            set_remaining_path(
+                state,
+                _get_cost_hint(state.task)
+                + max(
+                    (task_states[d].remaining_path for d in state.dependents),
+                    default=0.0,
+                ),
+            )
+            for dep_id in {dep.id for dep in state.all_deps}:
+                if dep_id in unvisited_dependents and (
+                    state.task.id in task_states[dep_id].dependents
+                ):
+                    unvisited_dependents[dep_id] -= 1
+                    if unvisited_dependents[dep_id] == 0:
+                        stack.append(new_states[dep_id])
+
+    def link_discovered_states() -> None:
+        """Index static deps of newly discovered tasks and queue the ready ones.
+
+        Must be called after each discovery pass has finished, so that all deps
+        referenced by the new states have a state of their own.
+        """
+        for state in unlinked_states:
+            if state.completed:
+                # Discovery stopped here, deps may not have been discovered
+                continue
+            for dep in state.static_deps:
+                link_dependency(state, dep)
+        prioritize(unlinked_states)
+        for state in unlinked_states:
+            if not state.completed and state.pending_dep_count == 0:
+                push_ready(state)
+        unlinked_states.clear()
+
+    def mark_completed(state: TaskExecutionState) -> None:
+        """Mark task as completed and queue dependents that became ready.
+
+        Only touches the direct dependents of the task, so the cost per
+        completion is proportional to its out-degree.
+        """
+        state.completed = True
+        completion_cache.add(state.task.id)
+        completion_events[state.task.id].set()
+        for dependent_id in state.dependents:
+            dependent = task_states[dependent_id]
+            dependent.pending_dep_count -= 1
+            if (
+                dependent.pending_dep_count == 0
+                and not dependent.completed
+                and dependent.exception is None
+            ):
+                push_ready(dependent)
+        state.dependents.clear()
+
+    if not pipelined_discovery:
+        await run_discovery()
 
     # Start or resume build
     if resume_build_id is not None:
@@ -535,17 +1154,48 @@ async def build_aio(
         logger.info(f"Started build: {build_id}")
 
     # Register previously completed tasks so they appear in the build's task list
-    # These will get TASK_REFERENCED events since they already exist
-    for task in previously_completed_tasks:
-        try:
-            await registry.task_register_aio(build_id, task)
-        except Exception as reg_err:
-            logger.warning(f"Failed to register previously completed task: {reg_err}")
+    # These will get TASK_REFERENCED events since they already exist (with pipelined
+    # discovery, they are registered as they are found instead)
+    registration_start = time.perf_counter()
+    register_semaphore = asyncio.Semaphore(max_concurrent_register)
+    registered_count = 0
+    progress_interval = max(1000, len(previously_completed_tasks) // 10)
+
+    async def register_previously_completed(task: BaseTask) -> None:
+        nonlocal registered_count
+        async with register_semaphore:
+            try:
+                with registry_call(task, "task_register"):
+                    await registry.task_register_aio(build_id, task)
+            except Exception as reg_err:
+                logger.warning(
+                    f"Failed to register previously completed task: {reg_err}"
+                )
+        registered_count += 1
+        if registered_count % progress_interval == 0:
+            logger.info(
+                f"Registered {registered_count}/{len(previously_completed_tasks)} "
+                "previously completed tasks"
+            )
+
+    with tracer.span("registration"):
+        async with asyncio.TaskGroup() as tg:
+            for task in previously_completed_tasks:
+                tg.create_task(register_previously_completed(task))
+    timings.registration = time.perf_counter() - registration_start
+    if previously_completed_tasks:
+        logger.info(
+            f"Registered {len(previously_completed_tasks)} previously completed "
+            f"tasks in {timings.registration:.2f}s"
+        )
 
+    metrics.start()
     await task_executor.setup()
 
     # Map task_id -> asyncio.Task for in-flight executions
     pending_futures: dict[UUID, asyncio.Task] = {}
+    # Map task_id -> resource pools and amounts reserved by in-flight executions
+    reserved_resources: dict[UUID, tuple[list[ResourcePools], Mapping[str, float]]] = {}
 
     async def process_result(
         task: BaseTask,
@@ -560,9 +1210,7 @@ async def build_aio(
             if result.status == LockAcquisitionStatus.ALREADY_COMPLETED:
                 # Task completed externally - wait for visibility then mark complete
                 await wait_for_completion_with_retry(task)
-                state.completed = True
-                completion_cache.add(task.id)
-                completion_events[task.id].set()
+                mark_completed(state)
                 task_count.previously_completed += 1
             else:
                 # ERROR, HELD_BY_OTHER, or CONCURRENCY_LIMIT_REACHED after timeout
@@ -581,7 +1229,8 @@ async def build_aio(
             # Task failed - release lock (not completed) and notify registry
             await release_lock_for_task(task, completed=False)
             try:
-                await registry.task_fail_aio(build_id, task, str(result))
+                with registry_call(task, "task_fail"):
+                    await registry.task_fail_aio(build_id, task, str(result))
             except Exception as reg_err:
                 logger.warning(f"Failed to notify registry of task failure: {reg_err}")
             state.exception = result
@@ -594,60 +1243,63 @@ async def build_aio(
             # Task completed - release lock (completed) and notify registry
             await release_lock_for_task(task, completed=True)
             try:
-                await registry.task_complete_aio(build_id, task)
+                with registry_call(task, "task_complete"):
+                    await registry.task_complete_aio(build_id, task)
                 assets = task.registry_assets_aio()
                 if assets:
-                    await registry.task_upload_assets_aio(build_id, task, assets)
+                    with registry_call(task, "task_upload_assets"):
+                        await registry.task_upload_assets_aio(build_id, task, assets)
             except Exception as reg_err:
                 logger.warning(
                     f"Failed to notify registry of task completion: {reg_err}"
                 )
-            state.completed = True
-            completion_cache.add(task.id)
-            completion_events[task.id].set()
+            mark_completed(state)
             task_count.succeeded += 1
 
         else:
             # Dynamic deps returned (TaskStruct) - task is suspended
             # Note: Lock is still held - release on final completion/failure
             dynamic_deps = flatten_task_struct(result)
+            suspended_since[task.id] = tracer.now()
 
             # Notify registry that task is suspended waiting for dynamic deps
             try:
-                await registry.task_suspend_aio(build_id, task)
+                with registry_call(task, "task_suspend"):
+                    await registry.task_suspend_aio(build_id, task)
             except Exception as reg_err:
                 logger.warning(
                     f"Failed to notify registry of task suspension: {reg_err}"
                 )
 
             # Discover any new dynamic deps (discover handles counting)
-            for dep in dynamic_deps:
-                if dep.id not in task_states:
-                    await discover(dep)
+            await discover(dynamic_deps)
+            new_ids = {s.task.id for s in unlinked_states}
 
             # Accumulate dynamic deps (don't overwrite)
             existing_dyn_ids = {d.id for d in state.dynamic_deps}
             for dep in dynamic_deps:
                 if dep.id not in existing_dyn_ids:
                     state.dynamic_deps.append(dep)
-
-    def find_ready_tasks() -> list[BaseTask]:
-        """Find tasks that are ready to execute."""
-        ready: list[BaseTask] = []
-        for state in task_states.values():
-            if state.completed or state.task.id in executing:
-                continue
-            if state.exception is not None:
-                continue
-
-            # Check all deps (static + dynamic) complete
-            all_deps_complete = all(
-                task_states[dep.id].completed for dep in state.all_deps
-            )
-            if all_deps_complete:
-                ready.append(state.task)
-                executing.add(state.task.id)
-        return ready
+                    existing_dyn_ids.add(dep.id)
+                link_dependency(state, dep)
+                # A dep discovered earlier may now be on a longer path (via this
+                # task). Not propagated further to its own deps.
+                dep_state = task_states[dep.id]
+                if dep.id not in new_ids and not dep_state.completed:
+                    set_remaining_path(
+                        dep_state,
+                        max(
+                            dep_state.remaining_path,
+                            _get_cost_hint(dep) + state.remaining_path,
+                        ),
+                    )
+            # Link new deps after this task, so that their remaining path is
+            # computed via it
+            link_discovered_states()
+
+            # Resume right away if all yielded deps are already complete
+            if state.pending_dep_count == 0:
+                push_ready(state)
 
     async def wait_for_completion_with_retry(task: BaseTask) -> bool:
         """Wait for task.complete_aio() to return True (handles eventual consistency).
@@ -736,7 +1388,10 @@ async def build_aio(
                 notified_waiting = True
                 lock_owner = result.error_message  # May contain owner info
                 try:
-                    await registry.task_waiting_for_lock_aio(build_id, task, lock_owner)
+                    with registry_call(task, "task_waiting_for_lock"):
+                        await registry.task_waiting_for_lock_aio(
+                            build_id, task, lock_owner
+                        )
                 except Exception as e:
                     logger.warning(f"Failed to notify registry of lock wait: {e}")
 
@@ -793,9 +1448,19 @@ async def build_aio(
             # 2. Task resuming after dynamic deps - re-acquire is safe since
             #    we're the same owner, and handles the case where lock expired
             #    during the wait for deps
+            lock_start = tracer.now()
+            lock_wait_start = time.perf_counter()
             lock_result = await acquire_lock_with_completion_check(
                 task, task_id_str, global_lock_manager, global_lock_config
             )
+            metrics.lock_wait_time += time.perf_counter() - lock_wait_start
+            tracer.record(
+                "lock_acquire",
+                task,
+                lock_start,
+                tracer.now(),
+                status=lock_result.status.value,
+            )
 
             if lock_result.status != LockAcquisitionStatus.ACQUIRED:
                 # Lock not acquired - return the lock result for handling
@@ -807,33 +1472,117 @@ async def build_aio(
         # Now we have the lock (or locking wasn't needed)
         # Start the task in registry
         if not state.started:
-            await registry.task_start_aio(build_id, task)
+            with registry_call(task, "task_start"):
+                await registry.task_start_aio(build_id, task)
             state.started = True
         elif state.dynamic_deps:
             # Task was suspended waiting for dynamic deps, now resuming
-            await registry.task_resume_aio(build_id, task)
+            if task.id in suspended_since:
+                tracer.record(
+                    "suspend", task, suspended_since.pop(task.id), tracer.now()
+                )
+            with registry_call(task, "task_resume"):
+                await registry.task_resume_aio(build_id, task)
 
         # Execute the task via the executor
-        return await task_executor.submit(task)
+        with tracer.span("execute", task):
+            return await task_executor.submit(task)
+
+    async def submit_and_report(task: BaseTask) -> None:
+        """Run submit_with_lock and report the outcome on the done queue."""
+        # Local to this asyncio task, lets the executor admit tasks by priority
+        _task_priority.set(task_states[task.id].priority)
+        _task_tracer.set(tracer)
+        _build_metrics.set(metrics)
+        # Loads of task outputs go through the build's output cache
+        _build_output_cache.set(output_cache)
+        try:
+            result = await submit_with_lock(task)
+        except Exception as e:
+            result = e
+        done_queue.put_nowait((task.id, result))
+
+    async def report_unschedulable(task: BaseTask, exceeded: list[str]) -> None:
+        """Fail a task that requires more than the capacity of resource pools."""
+        done_queue.put_nowait(
+            (
+                task.id,
+                ValueError(
+                    f"Task {task.id} requires more than the total capacity of "
+                    f"resource pool(s) {exceeded}: {_get_task_resources(task)}"
+                ),
+            )
+        )
+
+    def get_resource_pools(task: BaseTask) -> list[ResourcePools]:
+        """The build's resource pools and those of the executor, if any."""
+        assert isinstance(resource_pools, ResourcePools)  # For type checker
+        executor_pools = task_executor.get_resource_pools(task)
+        if executor_pools is None:
+            return [resource_pools]
+        return [resource_pools, executor_pools]
+
+    def release_resources(task_id: UUID) -> None:
+        if task_id in reserved_resources:
+            pools, requirements = reserved_resources.pop(task_id)
+            for pool in pools:
+                pool.release(requirements)
+
+    output_cache_stats = getattr(output_cache, "stats", None)
 
     try:
-        # Main build loop using as_completed pattern
+        if pipelined_discovery:
+            discovery_task = asyncio.create_task(run_discovery())
+        link_discovered_states()
+
+        # Main build loop: submit ready tasks, then process completions
         while True:
-            # Check if all roots complete
-            all_roots_complete = all(task_states[root.id].completed for root in tasks)
+            # Check if all roots complete (with pipelined discovery, roots may not
+            # have been discovered yet)
+            all_roots_complete = all(
+                root.id in task_states and task_states[root.id].completed
+                for root in tasks
+            )
             if all_roots_complete:
                 break
 
-            # Find and submit ready tasks
-            ready = find_ready_tasks()
-
-            # Submit ready tasks (lock acquisition + execution as single async unit)
-            for task in ready:
-                async_task = asyncio.create_task(submit_with_lock(task))
-                pending_futures[task.id] = async_task
-
-            # If nothing is pending, check for deadlock or completion
-            if not pending_futures:
+            # Submit ready tasks (lock acquisition + execution as single async unit),
+            # highest priority first. Tasks whose resources are not available are
+            # skipped over, and reconsidered when resources are released.
+            skipped: list[tuple[float, int, BaseTask]] = []
+            while ready_heap:
+                entry = heapq.heappop(ready_heap)
+                task = entry[2]
+                requirements = _get_task_resources(task)
+                if requirements:
+                    pools = get_resource_pools(task)
+                    exceeded = [
+                        name
+                        for pool in pools
+                        for name in pool.exceeds_capacity(requirements)
+                    ]
+                    if exceeded:
+                        pending_futures[task.id] = asyncio.create_task(
+                            report_unschedulable(task, exceeded)
+                        )
+                        continue
+                    if not all(pool.fits(requirements) for pool in pools):
+                        skipped.append(entry)
+                        continue
+                    for pool in pools:
+                        pool.acquire(requirements)
+                    reserved_resources[task.id] = (pools, requirements)
+                metrics.record_ready_wait(
+                    task.id, time.perf_counter() - ready_since.pop(task.id)
+                )
+                pending_futures[task.id] = asyncio.create_task(submit_and_report(task))
+            for entry in skipped:
+                heapq.heappush(ready_heap, entry)
+            metrics.peak_in_flight = max(metrics.peak_in_flight, len(pending_futures))
+
+            # If nothing is pending (and discovery has finished), check for deadlock
+            # or completion
+            if not pending_futures and discovery_task is None:
                 incomplete = [
                     s
                     for s in task_states.values()
@@ -858,35 +1607,27 @@ async def build_aio(
                     # All remaining tasks are blocked by failed deps - exit gracefully
                 break
 
-            # Wait for at least one task to complete
-            done, _ = await asyncio.wait(
-                pending_futures.values(), return_when=asyncio.FIRST_COMPLETED
-            )
+            # Wait for at least one task to complete, then drain all finished
+            done = [await done_queue.get()]
+            while not done_queue.empty():
+                done.append(done_queue.get_nowait())
 
             # Process completed tasks
-            for async_task in done:
-                # Find which task this was
-                task_id = None
-                for tid, fut in pending_futures.items():
-                    if fut is async_task:
-                        task_id = tid
-                        break
-                assert task_id is not None
-
-                # Remove from pending and executing
+            for task_id, result in done:
+                if task_id is None:
+                    # Woken up by pipelined discovery
+                    continue
                 del pending_futures[task_id]
-                executing.discard(task_id)
+                release_resources(task_id)
+                await process_result(task_states[task_id].task, result)
 
-                # Get result and process
-                task = task_states[task_id].task
-                try:
-                    result = async_task.result()
-                except Exception as e:
-                    result = e
-                await process_result(task, result)
+            # Pipelined discovery has finished (raises if it failed)
+            if discovery_task is not None and discovery_task.done():
+                discovery_task.result()
+                discovery_task = None
 
             # Check for exit-early condition: all remaining tasks waiting for locks
-            if global_lock_config.exit_early_when_all_locked:
+            if global_lock_config.exit_early_when_all_locked and discovery_task is None:
                 remaining_tasks = [
                     s
                     for s in task_states.values()
@@ -911,16 +1652,24 @@ async def build_aio(
                             task_count=task_count,
                             build_id=build_id,
                             error=None,
+                            timings=timings,
+                            metrics=metrics,
+                            output_cache=output_cache_stats,
                         )
 
+        if registration_tasks:
+            await asyncio.gather(*registration_tasks)
         await registry.build_complete_aio(build_id)
         return BuildSummary(
-            status=BuildExitStatus.SUCCESS
-            if error is None
-            else BuildExitStatus.FAILURE,
+            status=(
+                BuildExitStatus.SUCCESS if error is None else BuildExitStatus.FAILURE
+            ),
             task_count=task_count,
             build_id=build_id,
             error=error,
+            timings=timings,
+            metrics=metrics,
+            output_cache=output_cache_stats,
         )
 
     except Exception as e:
@@ -930,9 +1679,23 @@ async def build_aio(
             task_count=task_count,
             build_id=build_id,
             error=e,
+            timings=timings,
+            metrics=metrics,
+            output_cache=output_cache_stats,
         )
 
     finally:
+        if discovery_task is not None and not discovery_task.done():
+            discovery_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await discovery_task
+        # Pending when exiting early or on failure
+        for registration_task in registration_tasks:
+            registration_task.cancel()
+        await asyncio.gather(*registration_tasks, return_exceptions=True)
+        metrics.execution = metrics.elapsed()
+        if output_cache is not None:
+            output_cache.clear()
         await task_executor.teardown()
 
 
@@ -947,9 +1710,15 @@ def build(
     fail_mode: FailMode = FailMode.FAIL_FAST,
     registry: RegistryABC | None = None,
     max_concurrent_discover: int = 50,
+    max_concurrent_register: int = 50,
     global_lock_manager: GlobalConcurrencyLockManager | None = None,
     global_lock_config: GlobalLockConfig | None = None,
     resume_build_id: UUID | None = None,
+    task_priority_selector: TaskPrioritySelector | None = None,
+    resource_pools: Mapping[str, float] | ResourcePools | None = None,
+    tracer: BuildTracer | None = None,
+    pipelined_discovery: bool = False,
+    output_cache: OutputCacheABC | None = None,
 ) -> BuildSummary:
     """Build tasks concurrently (sync wrapper for build_aio).
 
@@ -969,9 +1738,15 @@ def build(
                 fail_mode,
                 registry,
                 max_concurrent_discover,
+                max_concurrent_register,
                 global_lock_manager,
                 global_lock_config,
                 resume_build_id,
+                task_priority_selector,
+                resource_pools,
+                tracer,
+                pipelined_discovery,
+                output_cache,
             )
         )
     except RuntimeError as e:
@@ -986,9 +1761,11 @@ def build(
 
 __all__ = [
     "DefaultExecutionModeSelector",
+    "DefaultTaskPrioritySelector",
     "ExecutionMode",
     "ExecutionModeSelector",
     "HybridConcurrentTaskExecutor",
+    "TaskPrioritySelector",
     "build",
     "build_aio",
 ]
@@ -0,0 +1,148 @@
+"""Warm, reusable process pool for SYNC_PROCESS task execution.
+
+By default `HybridConcurrentTaskExecutor` starts a new process pool (with the
+`spawn` start method) for every build, and each worker imports stardag, pydantic
+and the task modules before it can run its first task. `WarmProcessPool` is
+created once, can be shared by any number of builds (and executors), and
+preloads the configured modules when its workers start.
+"""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait as wait_for_futures
+from typing import Literal, Sequence
+from uuid import UUID
+
+from stardag import BaseTask
+
+# Compact, picklable representation of a task: its class (pickled by reference),
+# its JSON serialization and its precomputed ID. Or the task itself, if it can't be
+# restored from its JSON.
+TaskPayload = tuple[type[BaseTask], str, str] | BaseTask
+
+
+def dump_task(task: BaseTask) -> TaskPayload:
+    """Representation of the task without its cached values, for a worker process.
+
+    Smaller than the pickle of the task only if the task, or its nested (upstream)
+    tasks, cache large values (e.g. in cached properties). Otherwise the pickle is
+    smaller and faster to load, since it shares nested tasks by reference instead of
+    repeating them.
+
+    Tasks with nested tasks of a subclass of the field annotation (without
+    `Polymorphic`, e.g. `deps: tuple[AutoTask, ...]`) are serialized as the annotated
+    class, and can't be restored from the JSON. They are sent as is.
+    """
+    task_json = task.model_dump_json()
+    if task_json != task.model_dump_json(serialize_as_any=True):
+        return task
+    return type(task), task_json, str(task.id)
+
+
+def load_task(payload: TaskPayload) -> BaseTask:
+    """Reconstruct a task dumped with `dump_task()`, without recomputing its ID."""
+    if isinstance(payload, BaseTask):
+        return payload
+    task_class, task_json, task_id = payload
+    task = task_class.model_validate_json(task_json)
+    # Seed the cached property
+    task.__dict__["id"] = UUID(task_id)
+    return task
+
+
+def _preload_modules(modules: Sequence[str]) -> None:
+    """Process pool initializer: import the modules once per worker."""
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _noop() -> None:
+    pass
+
+
+class WarmProcessPool:
+    """Process pool for SYNC_PROCESS tasks that can be reused across builds.
+
+    Workers are started on first use (or by `warm_up()`) and kept until
+    `shutdown()`. Each worker imports `preload_modules` when it starts, typically
+    heavy libraries and the modules defining the tasks, so that it runs its first
+    task without import overhead.
+
+    Example:
+        pool = WarmProcessPool(
+            max_workers=8,
+            preload_modules=["pandas", "my_project.tasks"],
+        )
+        pool.warm_up()
+        executor = HybridConcurrentTaskExecutor(
+            execution_mode_selector=DefaultExecutionModeSelector("process"),
+            process_pool=pool,
+        )
+        for tasks in batches:
+            build(tasks, task_executor=executor)
+        pool.shutdown()
+
+    Note: Configuration read by the workers (e.g. from environment variables) is
+    fixed when they start, not when each build starts.
+
+    Args:
+        max_workers: Number of worker processes.
+        preload_modules: Modules to import in each worker on start.
+        start_method: "spawn" (default) or "forkserver". With "forkserver", the
+            modules are also preloaded in the fork server, so that workers are
+            forked with them already imported (Unix only).
+        compact_transfer: Send tasks to workers as their class, JSON and ID (see
+            `dump_task()`) instead of pickling the task. Only worthwhile for tasks
+            caching large values.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        preload_modules: Sequence[str] = (),
+        start_method: Literal["spawn", "forkserver"] = "spawn",
+        compact_transfer: bool = False,
+    ) -> None:
+        self.max_workers = max_workers
+        self.preload_modules = tuple(preload_modules)
+        self.start_method = start_method
+        self.compact_transfer = compact_transfer
+        self._executor: ProcessPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The underlying process pool, created on first access."""
+        if self._executor is None:
+            mp_context = mp.get_context(self.start_method)
+            if self.start_method == "forkserver":
+                mp_context.set_forkserver_preload(["stardag", *self.preload_modules])
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=mp_context,
+                initializer=_preload_modules,
+                initargs=(self.preload_modules,),
+            )
+        return self._executor
+
+    def warm_up(self) -> None:
+        """Start all workers (and preload modules) now, instead of on first use."""
+        futures = [self.executor.submit(_noop) for _ in range(self.max_workers)]
+        wait_for_futures(futures)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers. The pool is restarted if used again."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self) -> "WarmProcessPool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown()
+
+
+__all__ = ["WarmProcessPool"]
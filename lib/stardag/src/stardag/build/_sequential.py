@@ -32,6 +32,7 @@ from stardag.build._base import (
     LockAcquisitionStatus,
     TaskCount,
 )
+from stardag.build._tracing import BuildTracer, NoOpTracer
 from stardag.registry import RegistryABC, init_registry
 
 logger = logging.getLogger(__name__)
@@ -45,6 +46,7 @@ def build_sequential(
     resume_build_id: UUID | None = None,
     global_lock_manager: GlobalConcurrencyLockManager | None = None,
     global_lock_config: GlobalLockConfig | None = None,
+    tracer: BuildTracer | None = None,
 ) -> BuildSummary:
     """Sync API for building tasks sequentially.
 
@@ -69,6 +71,8 @@ def build_sequential(
             If provided with global_lock_config.enabled=True, tasks will acquire locks
             before execution for "exactly once" semantics across processes.
         global_lock_config: Configuration for global locking behavior.
+        tracer: Records timed spans of the build phases of each task, see
+            BuildTracer (default: NoOpTracer, records nothing).
 
     Returns:
         BuildSummary with status, task counts, and build_id
@@ -87,6 +91,8 @@ def build_sequential(
         registry = init_registry()
     if global_lock_config is None:
         global_lock_config = GlobalLockConfig()
+    if tracer is None:
+        tracer = NoOpTracer()
     lock_selector: GlobalLockSelector = DefaultGlobalLockSelector(global_lock_config)
     held_locks: set[str] = set()
 
@@ -107,7 +113,9 @@ def build_sequential(
         task_count.discovered += 1
 
         # Check if this task is already complete
-        if task.complete():
+        with tracer.span("complete_check", task):
+            is_complete = task.complete()
+        if is_complete:
             completion_cache.add(task.id)
             task_count.previously_completed += 1
             previously_completed_tasks.append(task)
@@ -115,11 +123,14 @@ def build_sequential(
             return
 
         # Task not complete - recurse into dependencies
-        for dep in flatten_task_struct(task.requires()):
+        with tracer.span("discover", task):
+            deps = flatten_task_struct(task.requires())
+        for dep in deps:
             discover(dep)
 
-    for root in tasks:
-        discover(root)
+    with tracer.span("discovery"):
+        for root in tasks:
+            discover(root)
 
     # Start or resume build
     if resume_build_id is not None:
@@ -128,11 +139,13 @@ def build_sequential(
         build_id = registry.build_start(root_tasks=tasks)
 
     # Register previously completed tasks so they appear in the build's task list
-    for task in previously_completed_tasks:
-        try:
-            registry.task_register(build_id, task)
-        except Exception:
-            pass  # Best effort
+    with tracer.span("registration"):
+        for task in previously_completed_tasks:
+            try:
+                with tracer.span("registry", task, method="task_register"):
+                    registry.task_register(build_id, task)
+            except Exception:
+                pass  # Best effort
 
     def has_failed_dep(task: BaseTask) -> bool:
         """Check if any dependency has failed."""
@@ -225,7 +238,8 @@ def build_sequential(
             # Acquire lock if needed
             use_lock = global_lock_manager is not None and lock_selector(ready_task)
             if use_lock:
-                lock_result = acquire_lock_sync(ready_task)
+                with tracer.span("lock_acquire", ready_task):
+                    lock_result = acquire_lock_sync(ready_task)
 
                 if lock_result.status == LockAcquisitionStatus.ALREADY_COMPLETED:
                     # Task completed elsewhere - skip execution
@@ -240,7 +254,8 @@ def build_sequential(
                     error = RuntimeError(
                         f"Failed to acquire lock: {lock_result.error_message}"
                     )
-                    registry.task_fail(build_id, ready_task, str(error))
+                    with tracer.span("registry", ready_task, method="task_fail"):
+                        registry.task_fail(build_id, ready_task, str(error))
                     if fail_mode == FailMode.FAIL_FAST:
                         raise error
                     continue
@@ -258,6 +273,7 @@ def build_sequential(
                     build_id,
                     registry,
                     dual_run_default,
+                    tracer,
                 )
                 task_count.succeeded += 1
                 task_completed = True
@@ -265,7 +281,8 @@ def build_sequential(
                 task_count.failed += 1
                 failed_cache.add(ready_task.id)
                 error = e
-                registry.task_fail(build_id, ready_task, str(e))
+                with tracer.span("registry", ready_task, method="task_fail"):
+                    registry.task_fail(build_id, ready_task, str(e))
                 if fail_mode == FailMode.FAIL_FAST:
                     raise
             finally:
@@ -299,9 +316,11 @@ def _run_task_sequential(
     build_id: UUID,
     registry: RegistryABC,
     dual_run_default: Literal["sync", "async"],
+    tracer: BuildTracer,
 ) -> None:
     """Run a single task in sequential mode, handling dynamic deps."""
-    registry.task_start(build_id, task)
+    with tracer.span("registry", task, method="task_start"):
+        registry.task_start(build_id, task)
 
     has_run = _has_custom_run(task)
     has_run_aio = _has_custom_run_aio(task)
@@ -317,18 +336,21 @@ def _run_task_sequential(
     # else: sync-only, use_async = False
 
     # Execute
-    if use_async:
-        result = asyncio.run(task.run_aio())
-    else:
-        result = task.run()
+    with tracer.span("run", task):
+        if use_async:
+            result = asyncio.run(task.run_aio())
+        else:
+            result = task.run()
 
     # Handle generator (dynamic deps)
     if result is not None and hasattr(result, "__next__"):
         gen = result
         while True:
             try:
-                yielded = next(gen)
+                with tracer.span("run", task, generator=True):
+                    yielded = next(gen)
                 dynamic_deps = flatten_task_struct(yielded)
+                suspend_start = tracer.now()
 
                 # Discover and build dynamic deps
                 for dep in dynamic_deps:
@@ -347,18 +369,22 @@ def _run_task_sequential(
                             build_id,
                             registry,
                             dual_run_default,
+                            tracer,
                         )
+                tracer.record("suspend", task, suspend_start, tracer.now())
 
             except StopIteration:
                 break
 
     completion_cache.add(task.id)
-    registry.task_complete(build_id, task)
+    with tracer.span("registry", task, method="task_complete"):
+        registry.task_complete(build_id, task)
 
     # Upload registry assets if any
     assets = task.registry_assets()
     if assets:
-        registry.task_upload_assets(build_id, task, assets)
+        with tracer.span("registry", task, method="task_upload_assets"):
+            registry.task_upload_assets(build_id, task, assets)
 
 
 async def build_sequential_aio(
@@ -369,6 +395,7 @@ async def build_sequential_aio(
     resume_build_id: UUID | None = None,
     global_lock_manager: GlobalConcurrencyLockManager | None = None,
     global_lock_config: GlobalLockConfig | None = None,
+    tracer: BuildTracer | None = None,
 ) -> BuildSummary:
     """Async API for building tasks sequentially.
 
@@ -393,6 +420,8 @@ async def build_sequential_aio(
             If provided with global_lock_config.enabled=True, tasks will acquire locks
             before execution for "exactly once" semantics across processes.
         global_lock_config: Configuration for global locking behavior.
+        tracer: Records timed spans of the build phases of each task, see
+            BuildTracer (default: NoOpTracer, records nothing).
 
     Returns:
         BuildSummary with status, task counts, and build_id
@@ -410,6 +439,8 @@ async def build_sequential_aio(
         registry = init_registry()
     if global_lock_config is None:
         global_lock_config = GlobalLockConfig()
+    if tracer is None:
+        tracer = NoOpTracer()
     lock_selector: GlobalLockSelector = DefaultGlobalLockSelector(global_lock_config)
     held_locks: set[str] = set()
 
@@ -430,7 +461,9 @@ async def build_sequential_aio(
         task_count.discovered += 1
 
         # Check if this task is already complete
-        if await task.complete_aio():
+        with tracer.span("complete_check", task):
+            is_complete = await task.complete_aio()
+        if is_complete:
             completion_cache.add(task.id)
             task_count.previously_completed += 1
             previously_completed_tasks.append(task)
@@ -438,11 +471,14 @@ async def build_sequential_aio(
             return
 
         # Task not complete - recurse into dependencies
-        for dep in flatten_task_struct(task.requires()):
+        with tracer.span("discover", task):
+            deps = flatten_task_struct(task.requires())
+        for dep in deps:
             await discover(dep)
 
-    for root in tasks:
-        await discover(root)
+    with tracer.span("discovery"):
+        for root in tasks:
+            await discover(root)
 
     # Start or resume build
     if resume_build_id is not None:
@@ -451,11 +487,13 @@ async def build_sequential_aio(
         build_id = await registry.build_start_aio(root_tasks=tasks)
 
     # Register previously completed tasks so they appear in the build's task list
-    for task in previously_completed_tasks:
-        try:
-            await registry.task_register_aio(build_id, task)
-        except Exception:
-            pass  # Best effort
+    with tracer.span("registration"):
+        for task in previously_completed_tasks:
+            try:
+                with tracer.span("registry", task, method="task_register"):
+                    await registry.task_register_aio(build_id, task)
+            except Exception:
+                pass  # Best effort
 
     def has_failed_dep(task: BaseTask) -> bool:
         """Check if any dependency has failed."""
@@ -550,7 +588,8 @@ async def build_sequential_aio(
             # Acquire lock if needed
             use_lock = global_lock_manager is not None and lock_selector(ready_task)
             if use_lock:
-                lock_result = await acquire_lock_aio(ready_task)
+                with tracer.span("lock_acquire", ready_task):
+                    lock_result = await acquire_lock_aio(ready_task)
 
                 if lock_result.status == LockAcquisitionStatus.ALREADY_COMPLETED:
                     # Task completed elsewhere - skip execution
@@ -565,7 +604,8 @@ async def build_sequential_aio(
                     error = RuntimeError(
                         f"Failed to acquire lock: {lock_result.error_message}"
                     )
-                    await registry.task_fail_aio(build_id, ready_task, str(error))
+                    with tracer.span("registry", ready_task, method="task_fail"):
+                        await registry.task_fail_aio(build_id, ready_task, str(error))
                     if fail_mode == FailMode.FAIL_FAST:
                         raise error
                     continue
@@ -583,6 +623,7 @@ async def build_sequential_aio(
                     build_id,
                     registry,
                     sync_run_default,
+                    tracer,
                 )
                 task_count.succeeded += 1
                 task_completed = True
@@ -590,7 +631,8 @@ async def build_sequential_aio(
                 task_count.failed += 1
                 failed_cache.add(ready_task.id)
                 error = e
-                await registry.task_fail_aio(build_id, ready_task, str(e))
+                with tracer.span("registry", ready_task, method="task_fail"):
+                    await registry.task_fail_aio(build_id, ready_task, str(e))
                 if fail_mode == FailMode.FAIL_FAST:
                     raise
             finally:
@@ -624,34 +666,39 @@ async def _run_task_sequential_aio(
     build_id: UUID,
     registry: RegistryABC,
     sync_run_default: Literal["thread", "blocking"],
+    tracer: BuildTracer,
 ) -> None:
     """Run a single task in async sequential mode, handling dynamic deps."""
-    await registry.task_start_aio(build_id, task)
+    with tracer.span("registry", task, method="task_start"):
+        await registry.task_start_aio(build_id, task)
 
     has_run = _has_custom_run(task)
     has_run_aio = _has_custom_run_aio(task)
 
     # Determine how to run
-    if has_run_aio:
-        # Async-only or Dual - use async
-        result = await task.run_aio()
-    elif has_run:
-        # Sync-only
-        if sync_run_default == "thread":
-            result = await asyncio.to_thread(task.run)
+    with tracer.span("run", task):
+        if has_run_aio:
+            # Async-only or Dual - use async
+            result = await task.run_aio()
+        elif has_run:
+            # Sync-only
+            if sync_run_default == "thread":
+                result = await asyncio.to_thread(task.run)
+            else:
+                # Blocking - not recommended but useful for debugging
+                result = task.run()
         else:
-            # Blocking - not recommended but useful for debugging
-            result = task.run()
-    else:
-        raise ValueError(f"Task {task} has no run method")
+            raise ValueError(f"Task {task} has no run method")
 
     # Handle generator (dynamic deps)
     if result is not None and hasattr(result, "__next__"):
         gen = result
         while True:
             try:
-                yielded = next(gen)
+                with tracer.span("run", task, generator=True):
+                    yielded = next(gen)
                 dynamic_deps = flatten_task_struct(yielded)
+                suspend_start = tracer.now()
 
                 # Discover and build dynamic deps
                 for dep in dynamic_deps:
@@ -670,18 +717,22 @@ async def _run_task_sequential_aio(
                             build_id,
                             registry,
                             sync_run_default,
+                            tracer,
                         )
+                tracer.record("suspend", task, suspend_start, tracer.now())
 
             except StopIteration:
                 break
 
     completion_cache.add(task.id)
-    await registry.task_complete_aio(build_id, task)
+    with tracer.span("registry", task, method="task_complete"):
+        await registry.task_complete_aio(build_id, task)
 
     # Upload registry assets if any
     assets = task.registry_assets_aio()
     if assets:
-        await registry.task_upload_assets_aio(build_id, task, assets)
+        with tracer.span("registry", task, method="task_upload_assets"):
+            await registry.task_upload_assets_aio(build_id, task, assets)
 
 
 __all__ = [
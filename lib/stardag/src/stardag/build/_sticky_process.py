@@ -0,0 +1,198 @@
+"""Process workers that keep tasks with dynamic dependencies suspended.
+
+A task executed in a regular process pool cannot return its generator to the
+build process (generators can't be pickled), so a task that yields incomplete
+dynamic dependencies is re-executed from scratch once they are built (see
+`_run_task_in_process`). With K yield points, the work before the first yield
+is repeated K times.
+
+`StickyProcessPool` instead runs each task in a dedicated worker process that
+keeps the generator suspended. When the yielded dependencies are built, the
+task is resumed in the same process, so each task is executed once regardless
+of how many times it yields.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Generator, Literal, Sequence
+from uuid import UUID
+
+from stardag import BaseTask, TaskStruct, flatten_task_struct
+from stardag.build._process_pool import _preload_modules
+
+# Seconds to wait for a worker to exit on close, before terminating it
+_STOP_TIMEOUT = 5.0
+
+
+def _advance(
+    generators: dict[UUID, Generator[TaskStruct, None, None]], task_id: UUID
+) -> tuple[str, Any]:
+    """Drive the generator of the task until it yields incomplete deps or ends.
+
+    Like `_run_task_in_process`, the generator is only advanced past a yield when
+    all tasks yielded in that step are complete.
+    """
+    gen = generators[task_id]
+    try:
+        while True:
+            deps = flatten_task_struct(next(gen))
+            if not all(dep.complete() for dep in deps):
+                return "yielded", tuple(deps)
+    except StopIteration:
+        del generators[task_id]
+        return "done", None
+
+
+def _sticky_worker_main(conn: Connection, preload_modules: Sequence[str]) -> None:
+    """Message loop of a sticky worker process.
+
+    Messages are `("run", task)`, `("resume", task_id)` and `("stop", None)`.
+    Replies are `("yielded", deps)`, `("done", None)` and `("error", exception)`.
+    """
+    _preload_modules(preload_modules)
+    generators: dict[UUID, Generator[TaskStruct, None, None]] = {}
+    while True:
+        try:
+            command, arg = conn.recv()
+        except EOFError:
+            break
+        if command == "stop":
+            break
+        task_id: UUID | None = None
+        try:
+            if command == "run":
+                task = arg
+                task_id = task.id
+                result = task.run()
+                if hasattr(result, "__next__"):
+                    generators[task_id] = result  # type: ignore[assignment]
+                    reply = _advance(generators, task_id)
+                else:
+                    reply = ("done", result)
+            elif command == "resume":
+                task_id = arg
+                reply = _advance(generators, arg)
+            else:
+                reply = ("error", ValueError(f"Unknown command: {command}"))
+        except Exception as e:
+            if task_id is not None:
+                generators.pop(task_id, None)
+            reply = ("error", e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # E.g. an exception that can't be pickled
+            conn.send(("error", RuntimeError(f"{reply[0]}: {reply[1]!r} ({e})")))
+    conn.close()
+
+
+class _StickyWorker:
+    def __init__(self, process: BaseProcess, conn: Connection) -> None:
+        self.process = process
+        self.conn = conn
+        # One request at a time per worker
+        self.lock = asyncio.Lock()
+        # Number of requests in progress or waiting for the worker
+        self.load = 0
+
+    async def request(self, message: tuple[str, Any]) -> tuple[str, Any]:
+        self.load += 1
+        try:
+            async with self.lock:
+                self.conn.send(message)
+                try:
+                    return await asyncio.to_thread(self.conn.recv)
+                except EOFError:
+                    raise RuntimeError(
+                        f"Sticky worker process {self.process.pid} exited "
+                        f"(exit code {self.process.exitcode})"
+                    ) from None
+        finally:
+            self.load -= 1
+
+
+class StickyProcessPool:
+    """Worker processes that resume suspended tasks in the process they ran in.
+
+    New tasks go to the least loaded worker. A task that yields incomplete dynamic
+    deps stays suspended in its worker (which meanwhile runs other tasks) and is
+    resumed there when resubmitted.
+
+    Args:
+        max_workers: Number of worker processes.
+        preload_modules: Modules to import in each worker on start.
+        start_method: Multiprocessing start method (default "spawn").
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        preload_modules: Sequence[str] = (),
+        start_method: Literal["spawn", "forkserver"] = "spawn",
+    ) -> None:
+        self.max_workers = max_workers
+        self.preload_modules = tuple(preload_modules)
+        self.start_method = start_method
+        self._workers: list[_StickyWorker] = []
+        # Task ID -> worker holding its suspended generator
+        self._affinity: dict[UUID, _StickyWorker] = {}
+
+    def start(self) -> None:
+        """Start the worker processes."""
+        mp_context = mp.get_context(self.start_method)
+        for _ in range(self.max_workers):
+            parent_conn, child_conn = mp_context.Pipe()
+            process = mp_context.Process(
+                target=_sticky_worker_main,
+                args=(child_conn, self.preload_modules),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._workers.append(_StickyWorker(process, parent_conn))
+
+    async def submit(self, task: BaseTask) -> TaskStruct | None:
+        """Run the task, or resume it if it is suspended in one of the workers.
+
+        Returns:
+            - None: The task completed.
+            - TaskStruct: The task yielded deps that are not complete. Resubmit
+                the task when they are.
+
+        Raises:
+            Exception: The exception raised by the task.
+        """
+        if not self._workers:
+            raise RuntimeError("StickyProcessPool is not started.")
+        worker = self._affinity.pop(task.id, None)
+        if worker is not None:
+            status, value = await worker.request(("resume", task.id))
+        else:
+            worker = min(self._workers, key=lambda w: w.load)
+            status, value = await worker.request(("run", task))
+        if status == "yielded":
+            self._affinity[task.id] = worker
+            return value
+        if status == "error":
+            raise value
+        return value
+
+    def close(self) -> None:
+        """Stop the worker processes (discarding suspended tasks)."""
+        for worker in self._workers:
+            try:
+                worker.conn.send(("stop", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=_STOP_TIMEOUT)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+        self._workers.clear()
+        self._affinity.clear()
@@ -0,0 +1,268 @@
+"""Per-task span tracing of builds.
+
+Pass a `BuildTracer` to `build()`/`build_aio()` (or the sequential builds) to
+record how long each task spends in each phase of the build:
+
+- "discover": Collecting the static deps of the task.
+- "complete_check": Checking whether the task is already complete.
+- "lock_acquire": Acquiring the global concurrency lock (incl. waiting for it).
+- "queue_wait": Waiting for a free worker of the executor.
+- "execute": Submission to the task executor, until it returns (concurrent build).
+- "run": Running the task (or resuming it after dynamic deps).
+- "suspend": Suspended on dynamic deps, until resumed.
+- "registry": A registry call about the task (the method in attribute "method").
+
+Recorded spans can be exported as Chrome trace event JSON (open in Perfetto or
+chrome://tracing) or as OTLP JSON (`ExportTraceServiceRequest`), e.g.:
+
+    tracer = BuildTracer()
+    build([root], tracer=tracer)
+    tracer.export_chrome_trace("build_trace.json")
+
+Without a tracer, builds use `NoOpTracer`, which records nothing.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+from uuid import UUID, uuid4
+
+from stardag import BaseTask
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+@dataclass
+class Span:
+    """A timed phase of the build, of a task or of the build as a whole.
+
+    Attributes:
+        name: Name of the phase, e.g. "run".
+        start_ns: Start time, nanoseconds since the Unix epoch.
+        end_ns: End time, nanoseconds since the Unix epoch.
+        task_id: ID of the task, None for build-level spans.
+        task_name: Name of the task, None for build-level spans.
+        attributes: Additional details, e.g. the execution mode.
+    """
+
+    name: str
+    start_ns: int
+    end_ns: int
+    task_id: UUID | None = None
+    task_name: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class BuildTracer:
+    """Records spans of the build phases of each task.
+
+    Spans are appended to `spans`. Override `on_span()` to forward them elsewhere
+    instead (e.g. to an OpenTelemetry exporter).
+
+    Timestamps are taken from a monotonic clock, anchored to the wall clock when
+    the tracer is created.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._epoch_anchor_ns = time.time_ns()
+        self._perf_anchor_ns = time.perf_counter_ns()
+
+    def now(self) -> int:
+        """Current time, nanoseconds since the Unix epoch."""
+        return self._epoch_anchor_ns + time.perf_counter_ns() - self._perf_anchor_ns
+
+    def span(
+        self, name: str, task: BaseTask | None = None, **attributes: Any
+    ) -> ContextManager[None]:
+        """Context manager recording a span for its duration."""
+        return self._span(name, task, attributes)
+
+    @contextlib.contextmanager
+    def _span(
+        self, name: str, task: BaseTask | None, attributes: dict[str, Any]
+    ) -> Iterator[None]:
+        start_ns = self.now()
+        try:
+            yield
+        finally:
+            self.record(name, task, start_ns, self.now(), **attributes)
+
+    def record(
+        self,
+        name: str,
+        task: BaseTask | None,
+        start_ns: int,
+        end_ns: int,
+        **attributes: Any,
+    ) -> None:
+        """Record a span with known start and end times (see `now()`)."""
+        self.on_span(
+            Span(
+                name=name,
+                start_ns=start_ns,
+                end_ns=end_ns,
+                task_id=task.id if task is not None else None,
+                task_name=task.get_name() if task is not None else None,
+                attributes=attributes,
+            )
+        )
+
+    def on_span(self, span: Span) -> None:
+        """Called with each finished span."""
+        self.spans.append(span)
+
+    def export_chrome_trace(self, path: str | Path) -> None:
+        """Write the recorded spans as Chrome trace event JSON."""
+        Path(path).write_text(json.dumps(to_chrome_trace(self.spans)))
+
+    def export_otlp_json(self, path: str | Path, service_name: str = "stardag") -> None:
+        """Write the recorded spans as an OTLP JSON trace export request."""
+        Path(path).write_text(
+            json.dumps(to_otlp_json(self.spans, service_name=service_name))
+        )
+
+
+class NoOpTracer(BuildTracer):
+    """Tracer that records nothing (the default)."""
+
+    def now(self) -> int:
+        return 0
+
+    def span(
+        self, name: str, task: BaseTask | None = None, **attributes: Any
+    ) -> ContextManager[None]:
+        return _NULL_CONTEXT
+
+    def record(
+        self,
+        name: str,
+        task: BaseTask | None,
+        start_ns: int,
+        end_ns: int,
+        **attributes: Any,
+    ) -> None:
+        pass
+
+
+def to_chrome_trace(spans: list[Span]) -> dict[str, Any]:
+    """Convert spans to the Chrome trace event format.
+
+    Each task gets its own track (thread), named after the task, and build-level
+    spans go on the first track.
+    """
+    pid = os.getpid()
+    track_ids: dict[UUID | None, int] = {None: 0}
+    events: list[dict[str, Any]] = [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": pid,
+            "tid": 0,
+            "args": {"name": "build"},
+        }
+    ]
+    for span in sorted(spans, key=lambda s: s.start_ns):
+        tid = track_ids.get(span.task_id)
+        if tid is None:
+            tid = track_ids[span.task_id] = len(track_ids)
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": f"{span.task_name} {span.task_id}"},
+                }
+            )
+        args = {key: str(value) for key, value in span.attributes.items()}
+        if span.task_id is not None:
+            args["task_id"] = str(span.task_id)
+        events.append(
+            {
+                "name": span.name,
+                "cat": "task" if span.task_id is not None else "build",
+                "ph": "X",
+                "pid": pid,
+                "tid": tid,
+                "ts": span.start_ns / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "args": args,
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    return [
+        {"key": key, "value": _otlp_value(value)} for key, value in attributes.items()
+    ]
+
+
+def to_otlp_json(spans: list[Span], service_name: str = "stardag") -> dict[str, Any]:
+    """Convert spans to an OTLP JSON `ExportTraceServiceRequest`.
+
+    All spans belong to one trace. Task attributes are `stardag.task.id` and
+    `stardag.task.name`.
+    """
+    trace_id = uuid4().hex
+    otlp_spans = []
+    for span in spans:
+        attributes = dict(span.attributes)
+        if span.task_id is not None:
+            attributes["stardag.task.id"] = str(span.task_id)
+            attributes["stardag.task.name"] = span.task_name
+        otlp_spans.append(
+            {
+                "traceId": trace_id,
+                "spanId": uuid4().hex[:16],
+                "name": span.name,
+                # SPAN_KIND_INTERNAL
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": _otlp_attributes(attributes),
+            }
+        )
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [
+                    {"scope": {"name": "stardag.build"}, "spans": otlp_spans}
+                ],
+            }
+        ]
+    }
+
+
+__all__ = [
+    "BuildTracer",
+    "NoOpTracer",
+    "Span",
+    "to_chrome_trace",
+    "to_otlp_json",
+]
@@ -513,10 +513,13 @@ class APIConfig(BaseModel):
     Attributes:
         url: Base URL of the Stardag API.
         timeout: Request timeout in seconds.
+        event_batch_size: If set, task registrations and events are buffered
+            and sent to the API in batches of (up to) this size.
     """
 
     url: str = DEFAULT_API_URL
     timeout: float = DEFAULT_API_TIMEOUT
+    event_batch_size: int | None = None
 
 
 class ContextConfig(BaseModel):
@@ -556,6 +559,7 @@ class StardagSettings(BaseSettings):
 
     # API settings
     api_timeout: float | None = None
+    api_event_batch_size: int | None = None
 
     # API key
     api_key: str | None = None
@@ -765,6 +769,7 @@ def load_config(
         api=APIConfig(
             url=registry_url,
             timeout=env_settings.api_timeout or DEFAULT_API_TIMEOUT,
+            event_batch_size=env_settings.api_event_batch_size,
         ),
         context=ContextConfig(
             profile=profile_name,
@@ -1,3 +1,7 @@
+import asyncio
+import os
+import typing
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,6 +17,8 @@ from stardag.utils.resource_provider import resource_provider
 try:
     import aioboto3
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError as e:
     raise ImportError(
@@ -28,6 +34,19 @@ else:
     AsyncS3Client = object
 
 DEFAULT_CACHE_ROOT = Path("~/.stardag/cache/s3/").expanduser().absolute()
+# Read-ahead of streaming reads, in the order of the S3 multipart chunk size
+DEFAULT_STREAM_BUFFER_SIZE = 8 * 1024 * 1024
+# Multipart transfers: objects larger than the threshold are transferred in
+# chunks of `multipart_chunksize`, `max_concurrency` chunks at a time.
+DEFAULT_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 10
+# Connections kept open by the (long-lived) async client. Bounds the number of
+# concurrent requests, e.g. HEAD requests during discovery.
+DEFAULT_MAX_POOL_CONNECTIONS = 100
+# Bulk existence checks list the objects under a common prefix when at least this
+# many keys share the same "directory", instead of a HEAD request per key.
+DEFAULT_LIST_MIN_KEYS = 3
 
 
 class S3CacheConfig(CachedRemoteFileSystemConfig):
@@ -42,6 +61,13 @@ class S3CacheConfig(CachedRemoteFileSystemConfig):
 class S3FileSystemConfig(BaseSettings):
     use_cache: bool = False
     cache: S3CacheConfig = S3CacheConfig()
+    streaming_reads: bool = True
+    stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE
+    multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD
+    multipart_chunksize: int = DEFAULT_MULTIPART_CHUNKSIZE
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS
+    list_min_keys: int = DEFAULT_LIST_MIN_KEYS
 
     model_config = SettingsConfigDict(env_prefix="stardag_target_s3_")
 
@@ -53,9 +79,32 @@ class S3FileSystem(RemoteFileSystemABC):
         self,
         s3_client: S3Client | None = None,
         aioboto3_session: aioboto3.Session | None = None,
+        streaming_reads: bool = True,
+        stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE,
+        transfer_config: TransferConfig | None = None,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        list_min_keys: int = DEFAULT_LIST_MIN_KEYS,
     ):
         self.s3_client: S3Client = s3_client or boto3.client("s3")
         self.aioboto3_session = aioboto3_session or aioboto3.Session()
+        self.supports_streaming = streaming_reads
+        self.stream_buffer_size = stream_buffer_size
+        self.transfer_config = transfer_config or TransferConfig(
+            multipart_threshold=DEFAULT_MULTIPART_THRESHOLD,
+            multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE,
+            max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        )
+        self.max_pool_connections = max_pool_connections
+        self.list_min_keys = list_min_keys
+        # aiobotocore clients are bound to the event loop they are created in, so
+        # we keep one long-lived client per loop (see `_get_async_client`).
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            tuple[AsyncS3Client, typing.AsyncGenerator[AsyncS3Client, None]],
+        ] = weakref.WeakKeyDictionary()
+        self._async_client_locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
 
     def exists(self, uri: str) -> bool:
         bucket, key = get_bucket_key(uri)
@@ -72,41 +121,204 @@ class S3FileSystem(RemoteFileSystemABC):
 
     def download(self, uri: str, destination: Path):
         bucket, key = get_bucket_key(uri)
-        self.s3_client.download_file(bucket, key, str(destination))
+        try:
+            self.s3_client.download_file(
+                bucket, key, str(destination), Config=self.transfer_config
+            )
+        except ClientError as exc:
+            if _is_not_found(exc):
+                raise FileNotFoundError(uri) from exc
+            raise
 
     def upload(self, source: Path, uri: str, ok_remove: bool = False):
         bucket, key = get_bucket_key(uri)
-        self.s3_client.upload_file(str(source), bucket, key)
+        self.s3_client.upload_file(
+            str(source), bucket, key, Config=self.transfer_config
+        )
+
+    def size(self, uri: str) -> int:
+        bucket, key = get_bucket_key(uri)
+        try:
+            response = self.s3_client.head_object(Bucket=bucket, Key=key)
+        except ClientError as exc:
+            if _is_not_found(exc):
+                raise FileNotFoundError(uri) from exc
+            raise
+        return response["ContentLength"]
+
+    def read_range(self, uri: str, start: int, end: int) -> bytes:
+        if end <= start:
+            return b""
+        bucket, key = get_bucket_key(uri)
+        # NOTE the HTTP Range header is inclusive of the last byte
+        try:
+            response = self.s3_client.get_object(
+                Bucket=bucket, Key=key, Range=f"bytes={start}-{end - 1}"
+            )
+        except ClientError as exc:
+            if _is_not_found(exc):
+                raise FileNotFoundError(uri) from exc
+            raise
+        with response["Body"] as body:
+            return body.read()
 
     # Async implementations using aioboto3
 
+    async def _get_async_client(self) -> AsyncS3Client:
+        """Get the long-lived async client of the running event loop.
+
+        The client (and its connection pool) is created on first use and reused
+        for all subsequent requests in the same loop, which saves the client and
+        TLS setup per request. It is closed with the loop (see
+        `_async_client_lifetime`), or earlier with `aclose()`.
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is not None:
+            return entry[0]
+
+        lock = self._async_client_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            entry = self._async_clients.get(loop)
+            if entry is None:
+                lifetime = self._async_client_lifetime(loop)
+                entry = (await anext(lifetime), lifetime)
+                self._async_clients[loop] = entry
+
+        return entry[0]
+
+    async def _async_client_lifetime(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> typing.AsyncGenerator[AsyncS3Client, None]:
+        """Keep an async client open until this generator is closed.
+
+        The event loop closes the async generators it runs on shutdown
+        (`loop.shutdown_asyncgens()`, e.g. at the end of `asyncio.run`), so the
+        client and its aiohttp session don't outlive the loop.
+        """
+        client = None
+        try:
+            async with self.aioboto3_session.client(
+                "s3", config=Config(max_pool_connections=self.max_pool_connections)
+            ) as client:
+                yield client
+        finally:
+            entry = self._async_clients.get(loop)
+            if entry is not None and entry[0] is client:
+                del self._async_clients[loop]
+            self._async_client_locks.pop(loop, None)
+
+    async def aclose(self) -> None:
+        """Close the async client of the running event loop, if any."""
+        entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
     async def exists_aio(self, uri: str) -> bool:
         """Asynchronously check if the S3 object exists."""
         bucket, key = get_bucket_key(uri)
-        s3: AsyncS3Client
-        async with self.aioboto3_session.client("s3") as s3:
-            try:
-                await s3.head_object(Bucket=bucket, Key=key)
-                return True
-            except ClientError as exc:
-                error = exc.response.get("Error", {})
-                if error.get("Code") == "404":
-                    return False
-                raise
+        s3 = await self._get_async_client()
+        try:
+            await s3.head_object(Bucket=bucket, Key=key)
+            return True
+        except ClientError as exc:
+            error = exc.response.get("Error", {})
+            if error.get("Code") == "404":
+                return False
+            raise
+
+    async def exists_many_aio(self, uris: typing.Sequence[str]) -> dict[str, bool]:
+        """Asynchronously check if each of the S3 objects exists.
+
+        Keys are grouped by "directory" (up to the last "/"). If a group has at least
+        `list_min_keys` keys, the objects under the common prefix of the keys are
+        listed (1000 keys per request), otherwise, or if the listing would take more
+        requests than there are keys, each key is checked with a HEAD request.
+        """
+        groups: dict[tuple[str, str], list[str]] = {}
+        for uri in uris:
+            bucket, key = get_bucket_key(uri)
+            groups.setdefault((bucket, key.rpartition("/")[0]), []).append(key)
+
+        result: dict[str, bool] = {}
+
+        async def check_group(bucket: str, keys: list[str]) -> None:
+            remaining = set(keys)
+            if len(remaining) >= self.list_min_keys:
+                existing = await self._list_existing_keys(bucket, remaining)
+                if existing is not None:
+                    for key in remaining:
+                        result[get_uri(bucket, key)] = key in existing
+                    return
+
+            uris = [get_uri(bucket, key) for key in remaining]
+            exists = await asyncio.gather(*(self.exists_aio(uri) for uri in uris))
+            result.update(zip(uris, exists))
+
+        await asyncio.gather(
+            *(check_group(bucket, keys) for (bucket, _), keys in groups.items())
+        )
+
+        return result
+
+    async def _list_existing_keys(self, bucket: str, keys: set[str]) -> set[str] | None:
+        """Which of the keys exist, by listing the objects under their common prefix.
+
+        Returns None if the listing is not worth it (more pages than keys) or not
+        permitted, in which case the keys should be checked individually.
+        """
+        prefix = os.path.commonprefix(list(keys))
+        last_key = max(keys)
+        existing: set[str] = set()
+        s3 = await self._get_async_client()
+        paginator = s3.get_paginator("list_objects_v2")
+        try:
+            pages = 0
+            async for page in paginator.paginate(
+                Bucket=bucket, Prefix=prefix, Delimiter="/"
+            ):
+                pages += 1
+                for obj in page.get("Contents", []):
+                    if obj["Key"] in keys:
+                        existing.add(obj["Key"])
+                    # NOTE keys are listed in (UTF-8 binary) sorted order
+                    if obj["Key"] >= last_key:
+                        return existing
+                if pages >= len(keys) and page.get("IsTruncated"):
+                    return None
+        except ClientError as exc:
+            error = exc.response.get("Error", {})
+            if error.get("Code") == "AccessDenied":
+                # HEAD requests only require s3:GetObject, not s3:ListBucket
+                return None
+            raise
+
+        return existing
 
     async def download_aio(self, uri: str, destination: Path) -> None:
         """Asynchronously download a file from S3."""
         bucket, key = get_bucket_key(uri)
-        s3: AsyncS3Client
-        async with self.aioboto3_session.client("s3") as s3:
-            await s3.download_file(bucket, key, str(destination))
+        s3 = await self._get_async_client()
+        try:
+            await s3.download_file(
+                bucket, key, str(destination), Config=self.transfer_config
+            )
+        except ClientError as exc:
+            if _is_not_found(exc):
+                raise FileNotFoundError(uri) from exc
+            raise
 
     async def upload_aio(self, source: Path, uri: str, ok_remove: bool = False) -> None:
         """Asynchronously upload a file to S3."""
         bucket, key = get_bucket_key(uri)
-        s3: AsyncS3Client
-        async with self.aioboto3_session.client("s3") as s3:
-            await s3.upload_file(str(source), bucket, key)
+        s3 = await self._get_async_client()
+        await s3.upload_file(str(source), bucket, key, Config=self.transfer_config)
+
+
+def _is_not_found(exc: ClientError) -> bool:
+    """Whether the request failed because the object does not exist."""
+    # "404" for HEAD requests (incl. those of downloads), "NoSuchKey" for GET
+    return exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey")
 
 
 def get_bucket_key(uri: str) -> tuple[str, str]:
@@ -129,11 +341,20 @@ aioboto3_session_provider = resource_provider(aioboto3.Session, aioboto3.Session
 
 
 def _init_s3_file_system() -> RemoteFileSystemABC:
+    config = S3FileSystemConfig()
     file_system = S3FileSystem(
         s3_client=s3_client_provider.get(),
         aioboto3_session=aioboto3_session_provider.get(),
+        streaming_reads=config.streaming_reads,
+        stream_buffer_size=config.stream_buffer_size,
+        transfer_config=TransferConfig(
+            multipart_threshold=config.multipart_threshold,
+            multipart_chunksize=config.multipart_chunksize,
+            max_concurrency=config.max_concurrency,
+        ),
+        max_pool_connections=config.max_pool_connections,
+        list_min_keys=config.list_min_keys,
     )
-    config = S3FileSystemConfig()
     if config.use_cache:
         file_system = CachedRemoteFileSystem(
             wrapped=file_system,
@@ -1,6 +1,9 @@
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Generator
 
 import modal
+import modal.exception
 from grpclib import GRPCError, Status
 from modal.volume import FileEntryType
 
@@ -76,7 +79,7 @@ class ModalVolumeRemoteFileSystem(RemoteFileSystemABC):
     def download(self, uri: str, destination: Path):
         volume_name, in_volume_path = get_volume_name_and_path(uri)
         volume = modal.Volume.from_name(volume_name)
-        with destination.open("wb") as dest_handle:
+        with _not_found_as_file_not_found(uri), destination.open("wb") as dest_handle:
             volume.read_file_into_fileobj(in_volume_path, dest_handle)
 
     def upload(self, source: Path, uri: str, ok_remove: bool = False):
@@ -116,9 +119,10 @@ class ModalVolumeRemoteFileSystem(RemoteFileSystemABC):
 
         # Modal's read_file returns an iterator of bytes chunks
         # We need to write them to the destination file
-        async with aiofiles.open(destination, "wb") as dest_handle:
-            async for chunk in volume.read_file.aio(in_volume_path):
-                await dest_handle.write(chunk)
+        with _not_found_as_file_not_found(uri):
+            async with aiofiles.open(destination, "wb") as dest_handle:
+                async for chunk in volume.read_file.aio(in_volume_path):
+                    await dest_handle.write(chunk)
 
     async def upload_aio(self, source: Path, uri: str, ok_remove: bool = False) -> None:
         """Asynchronously upload a file to the Modal volume."""
@@ -130,6 +134,23 @@ class ModalVolumeRemoteFileSystem(RemoteFileSystemABC):
             batch.put_file(source, in_volume_path)
 
 
+@contextmanager
+def _not_found_as_file_not_found(uri: str) -> Generator[None, None, None]:
+    """Raise FileNotFoundError if the file is missing from the volume.
+
+    As in `exists`, a missing file is reported differently in and outside of
+    modal functions (and by client versions).
+    """
+    try:
+        yield
+    except GRPCError as exc:
+        if exc.status == Status.NOT_FOUND:
+            raise FileNotFoundError(uri) from exc
+        raise
+    except modal.exception.NotFoundError as exc:
+        raise FileNotFoundError(uri) from exc
+
+
 modal_volume_rfs_provider = resource_provider(
     RemoteFileSystemABC, ModalVolumeRemoteFileSystem
 )
@@ -1,8 +1,9 @@
 """API-based registry that communicates with the stardag-api service."""
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
-from uuid import UUID
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Collection
+from uuid import UUID, uuid4
 
 import httpx
 
@@ -45,6 +46,18 @@ class APIRegistry(RegistryABC):
     - API key can be provided directly or via STARDAG_API_KEY env var
     - JWT token from browser login (stored in registry credentials)
 
+    Event batching:
+    When `event_batch_size` is set (or STARDAG_API_EVENT_BATCH_SIZE), the async
+    task methods don't make one request per call. Registrations and events are
+    instead buffered per build and sent via the batch endpoint when
+    `event_batch_size` items are buffered, every `event_flush_interval` seconds,
+    and before the build is completed/failed/cancelled/exited early. If the API
+    can't keep up and `max_buffered_events` items are pending, callers wait for
+    the buffer to be sent (back-pressure). Failed sends are retried, and events
+    that can't be sent are kept for the next flush. Events rejected by the API
+    (e.g. 422) are logged and dropped. Errors of background sends are logged, not
+    raised by unrelated calls. The sync methods are never buffered.
+
     Configuration is loaded from the central config module (stardag.config).
     """
 
@@ -54,6 +67,9 @@ class APIRegistry(RegistryABC):
         timeout: float | None = None,
         environment_id: str | None = None,
         api_key: str | None = None,
+        event_batch_size: int | None = None,
+        event_flush_interval: float = 1.0,
+        max_buffered_events: int = 10_000,
     ):
         # Load central config
         config = config_provider.get()
@@ -73,8 +89,23 @@ class APIRegistry(RegistryABC):
         # Environment ID: explicit > config
         self.environment_id = environment_id or config.context.environment_id
 
+        # Event batching: explicit > config (None means disabled)
+        self.event_batch_size = (
+            event_batch_size
+            if event_batch_size is not None
+            else config.api.event_batch_size
+        )
+        if self.event_batch_size is not None and self.event_batch_size < 1:
+            raise ValueError("event_batch_size must be a positive integer")
+        self.event_flush_interval = event_flush_interval
+        self.max_buffered_events = max(max_buffered_events, self.event_batch_size or 0)
+
         self._client = None
         self._async_client = None
+        self._event_buffers: dict[UUID, _EventBuffer] = {}
+        # Tasks registered (or queued for registration) by this registry, which
+        # registrations of their dependents can refer to instead of including them
+        self._registered_task_ids: set[UUID] = set()
 
         if self.api_key:
             logger.debug("APIRegistry initialized with API key authentication")
@@ -254,10 +285,11 @@ class APIRegistry(RegistryABC):
         """Register a task within a build."""
         response = self.client.post(
             f"{self.api_url}/api/v1/builds/{build_id}/tasks",
-            json=_get_task_data_for_registration(task),
+            json=_get_task_data_for_registration(task, self._registered_task_ids),
             params=self._get_params(),
         )
         self._handle_response_error(response, f"Register task {task.id}")
+        self._registered_task_ids.add(task.id)
 
     def task_start(self, build_id: UUID, task: "BaseTask") -> None:
         """Mark a task as started."""
@@ -385,7 +417,9 @@ class APIRegistry(RegistryABC):
             self._client = None
 
     async def aclose(self) -> None:
-        """Close the async HTTP client."""
+        """Send any buffered events and close the async HTTP client."""
+        for build_id in list(self._event_buffers):
+            await self._close_event_buffer(build_id)
         if self._async_client is not None:
             await self._async_client.aclose()
             self._async_client = None
@@ -447,6 +481,7 @@ class APIRegistry(RegistryABC):
 
     async def build_complete_aio(self, build_id: UUID) -> None:
         """Async version - mark a build as completed."""
+        await self._close_event_buffer(build_id)
         response = await self.async_client.post(
             f"{self.api_url}/api/v1/builds/{build_id}/complete",
             params=self._get_params(),
@@ -458,6 +493,7 @@ class APIRegistry(RegistryABC):
         self, build_id: UUID, error_message: str | None = None
     ) -> None:
         """Async version - mark a build as failed."""
+        await self._close_event_buffer(build_id)
         params = self._get_params()
         if error_message:
             params["error_message"] = error_message
@@ -470,6 +506,7 @@ class APIRegistry(RegistryABC):
 
     async def build_cancel_aio(self, build_id: UUID) -> None:
         """Async version - cancel a build."""
+        await self._close_event_buffer(build_id)
         response = await self.async_client.post(
             f"{self.api_url}/api/v1/builds/{build_id}/cancel",
             params=self._get_params(),
@@ -481,6 +518,7 @@ class APIRegistry(RegistryABC):
         self, build_id: UUID, reason: str | None = None
     ) -> None:
         """Async version - mark build as exited early."""
+        await self._close_event_buffer(build_id)
         params = self._get_params()
         if reason:
             params["reason"] = reason
@@ -493,15 +531,28 @@ class APIRegistry(RegistryABC):
 
     async def task_register_aio(self, build_id: UUID, task: "BaseTask") -> None:
         """Async version - register a task within a build."""
+        if self.event_batch_size is not None:
+            await self._buffer_event(build_id, self._registration_item(task))
+            return
+
         response = await self.async_client.post(
             f"{self.api_url}/api/v1/builds/{build_id}/tasks",
-            json=_get_task_data_for_registration(task),
+            json=_get_task_data_for_registration(task, self._registered_task_ids),
             params=self._get_params(),
         )
         self._handle_response_error(response, f"Register task {task.id}")
+        self._registered_task_ids.add(task.id)
 
     async def task_start_aio(self, build_id: UUID, task: "BaseTask") -> None:
         """Async version - mark a task as started."""
+        if self.event_batch_size is not None:
+            await self._buffer_event(
+                build_id,
+                self._registration_item(task),
+                _event_item(task, "task_started"),
+            )
+            return
+
         await self.task_register_aio(build_id, task)
 
         response = await self.async_client.post(
@@ -512,6 +563,10 @@ class APIRegistry(RegistryABC):
 
     async def task_complete_aio(self, build_id: UUID, task: "BaseTask") -> None:
         """Async version - mark a task as completed."""
+        if self.event_batch_size is not None:
+            await self._buffer_event(build_id, _event_item(task, "task_completed"))
+            return
+
         response = await self.async_client.post(
             f"{self.api_url}/api/v1/builds/{build_id}/tasks/{task.id}/complete",
             params=self._get_params(),
@@ -522,6 +577,13 @@ class APIRegistry(RegistryABC):
         self, build_id: UUID, task: "BaseTask", error_message: str | None = None
     ) -> None:
         """Async version - mark a task as failed."""
+        if self.event_batch_size is not None:
+            await self._buffer_event(
+                build_id,
+                _event_item(task, "task_failed", error_message=error_message),
+            )
+            return
+
         params = self._get_params()
         if error_message:
             params["error_message"] = error_message
@@ -533,6 +595,10 @@ class APIRegistry(RegistryABC):
 
     async def task_suspend_aio(self, build_id: UUID, task: "BaseTask") -> None:
         """Async version - mark a task as suspended."""
+        if self.event_batch_size is not None:
+            await self._buffer_event(build_id, _event_item(task, "task_suspended"))
+            return
+
         response = await self.async_client.post(
             f"{self.api_url}/api/v1/builds/{build_id}/tasks/{task.id}/suspend",
             params=self._get_params(),
@@ -541,6 +607,10 @@ class APIRegistry(RegistryABC):
 
     async def task_resume_aio(self, build_id: UUID, task: "BaseTask") -> None:
         """Async version - mark a task as resumed."""
+        if self.event_batch_size is not None:
+            await self._buffer_event(build_id, _event_item(task, "task_resumed"))
+            return
+
         response = await self.async_client.post(
             f"{self.api_url}/api/v1/builds/{build_id}/tasks/{task.id}/resume",
             params=self._get_params(),
@@ -549,6 +619,10 @@ class APIRegistry(RegistryABC):
 
     async def task_cancel_aio(self, build_id: UUID, task: "BaseTask") -> None:
         """Async version - cancel a task."""
+        if self.event_batch_size is not None:
+            await self._buffer_event(build_id, _event_item(task, "task_cancelled"))
+            return
+
         response = await self.async_client.post(
             f"{self.api_url}/api/v1/builds/{build_id}/tasks/{task.id}/cancel",
             params=self._get_params(),
@@ -559,6 +633,17 @@ class APIRegistry(RegistryABC):
         self, build_id: UUID, task: "BaseTask", lock_owner: str | None = None
     ) -> None:
         """Async version - record that task is waiting for global lock."""
+        if self.event_batch_size is not None:
+            await self._buffer_event(
+                build_id,
+                _event_item(
+                    task,
+                    "task_waiting_for_lock",
+                    event_metadata={"lock_owner": lock_owner} if lock_owner else None,
+                ),
+            )
+            return
+
         params = self._get_params()
         if lock_owner:
             params["lock_owner"] = lock_owner
@@ -575,6 +660,11 @@ class APIRegistry(RegistryABC):
         if not assets:
             return
 
+        # The task must be registered before assets can be attached
+        event_buffer = self._event_buffers.get(build_id)
+        if event_buffer is not None:
+            await event_buffer.flush()
+
         assets_data = []
         for asset in assets:
             data = asset.model_dump(mode="json")
@@ -602,11 +692,227 @@ class APIRegistry(RegistryABC):
 
         return TaskMetadata.model_validate(data)
 
+    # -------------------------------------------------------------------------
+    # Event batching
+    # -------------------------------------------------------------------------
+
+    def _registration_item(self, task: "BaseTask") -> dict[str, Any]:
+        item = {
+            "kind": "register",
+            "task": _get_task_data_for_registration(task, self._registered_task_ids),
+        }
+        # Batches are applied in order, so later registrations can refer to it
+        self._registered_task_ids.add(task.id)
+        return item
+
+    async def _buffer_event(self, build_id: UUID, *items: dict[str, Any]) -> None:
+        """Add registrations/events to the build's buffer."""
+        event_buffer = self._event_buffers.get(build_id)
+        if event_buffer is None:
+            assert self.event_batch_size is not None
+
+            async def send(batch_id: UUID, batch: list[dict[str, Any]]) -> None:
+                await self._send_event_batch(build_id, batch_id, batch)
+
+            event_buffer = _EventBuffer(
+                send=send,
+                batch_size=self.event_batch_size,
+                flush_interval=self.event_flush_interval,
+                max_buffered=self.max_buffered_events,
+            )
+            self._event_buffers[build_id] = event_buffer
+        await event_buffer.add(*items)
+
+    async def _send_event_batch(
+        self, build_id: UUID, batch_id: UUID, batch: list[dict[str, Any]]
+    ) -> None:
+        response = await self.async_client.post(
+            f"{self.api_url}/api/v1/builds/{build_id}/events:batch",
+            json={"batch_id": str(batch_id), "items": batch},
+            params=self._get_params(),
+        )
+        self._handle_response_error(response, "Send event batch")
+        logger.debug(f"Sent {len(batch)} buffered events for build {build_id}")
+
+    async def _close_event_buffer(self, build_id: UUID) -> None:
+        """Send all buffered events of a build and stop its periodic flushing."""
+        event_buffer = self._event_buffers.pop(build_id, None)
+        if event_buffer is not None:
+            await event_buffer.close()
+
+
+class _EventBuffer:
+    """Buffer of task registrations and events for a single build.
+
+    Batches are sent one at a time and in order, so the server sees events in
+    the same order as they were added. Sending happens in the background when
+    `batch_size` items are buffered or every `flush_interval` seconds. If
+    `max_buffered` items are buffered, `add` waits until they are sent.
+
+    Sends failing with a connection or server error are retried `retries` times,
+    with exponential backoff. A batch that still can't be sent is kept at the
+    front of the buffer, to be sent by the next flush. Each batch has an ID,
+    kept when it is resent, so that the server applies it at most once. A batch
+    rejected by the server (e.g. 422) is split in halves until the rejected items
+    are isolated. Items that can't be sent for other reasons (e.g. 401) are not
+    retried. Both are logged and dropped. Errors from background sends (incl.
+    those triggered by `add`) are logged; `flush` and `close` raise their send
+    errors.
+    """
+
+    retries = 3
+    retry_delay = 0.5
+
+    def __init__(
+        self,
+        send: Callable[[UUID, list[dict[str, Any]]], Awaitable[None]],
+        batch_size: int,
+        flush_interval: float,
+        max_buffered: int,
+    ) -> None:
+        self._send = send
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_buffered = max_buffered
+        self._items: list[dict[str, Any]] = []
+        # Batches that failed to send, with their IDs, to be resent first
+        self._unsent: list[tuple[UUID, list[dict[str, Any]]]] = []
+        self._send_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._timer_task: asyncio.Task | None = None
+
+    async def add(self, *items: dict[str, Any]) -> None:
+        self._items.extend(items)
+        if self._timer_task is None:
+            self._timer_task = asyncio.create_task(self._flush_periodically())
+
+        buffered = len(self._items) + sum(len(batch) for _, batch in self._unsent)
+        if buffered >= self._max_buffered:
+            # Back-pressure: don't let the buffer grow unbounded
+            await self._flush_in_background()
+        elif len(self._items) >= self._batch_size and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self._flush_in_background())
+
+    async def flush(self) -> None:
+        """Send all buffered items."""
+        async with self._send_lock:
+            while self._unsent or self._items:
+                if self._unsent:
+                    batch_id, batch = self._unsent.pop(0)
+                else:
+                    batch_id, batch = uuid4(), self._items[: self._batch_size]
+                    del self._items[: self._batch_size]
+                await self._send_batch(batch_id, batch)
+
+    async def close(self) -> None:
+        """Stop periodic flushing and send all buffered items."""
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            self._timer_task = None
+        await self.flush()
+
+    async def _send_batch(self, batch_id: UUID, batch: list[dict[str, Any]]) -> None:
+        # Stack of parts of the batch to send, the next one last
+        parts = [(batch_id, batch)]
+        while parts:
+            part_id, part = parts.pop()
+            try:
+                await self._send_with_retries(part_id, part)
+            except Exception as e:
+                if _is_retryable(e):
+                    self._requeue((part_id, part), *reversed(parts))
+                    raise
+                if _is_rejection(e) and len(part) > 1:
+                    # Isolate the rejected items, and send the others
+                    middle = len(part) // 2
+                    parts.extend([(uuid4(), part[middle:]), (uuid4(), part[:middle])])
+                    continue
+                logger.error(f"Dropped {len(part)} registry events: {e}")
+                logger.debug(f"Dropped registry events: {part}")
+            except BaseException:
+                self._requeue((part_id, part), *reversed(parts))
+                raise
+
+    def _requeue(self, *batches: tuple[UUID, list[dict[str, Any]]]) -> None:
+        """Put unsent batches back at the front of the buffer (in order)."""
+        self._unsent[:0] = batches
+
+    async def _send_with_retries(
+        self, batch_id: UUID, batch: list[dict[str, Any]]
+    ) -> None:
+        for attempt in range(self.retries + 1):
+            try:
+                await self._send(batch_id, batch)
+                return
+            except Exception as e:
+                if attempt == self.retries or not _is_retryable(e):
+                    raise
+                delay = self.retry_delay * 2**attempt
+                logger.debug(f"Retrying to send registry events in {delay}s: {e}")
+                await asyncio.sleep(delay)
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.warning(f"Failed to send buffered registry events: {e}")
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self._flush_in_background()
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed request may succeed if sent again."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, APIError) and (
+        error.status_code == 429 or (error.status_code or 0) >= 500
+    )
+
+
+def _is_rejection(error: Exception) -> bool:
+    """Whether a request failed because of its content (e.g. an invalid item)."""
+    return (
+        isinstance(error, APIError)
+        and error.status_code is not None
+        and 400 <= error.status_code < 500
+        and error.status_code not in (401, 403, 404, 429)
+    )
+
+
+def _event_item(
+    task: "BaseTask",
+    event_type: str,
+    error_message: str | None = None,
+    event_metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    return {
+        "kind": "event",
+        "task_id": str(task.id),
+        "event_type": event_type,
+        "error_message": error_message,
+        "event_metadata": event_metadata,
+    }
+
 
-def _get_task_data_for_registration(task: "BaseTask") -> dict:
-    """Helper to serialize task data for registration API call."""
+def _get_task_data_for_registration(
+    task: "BaseTask", registered_task_ids: Collection[UUID]
+) -> dict:
+    """Helper to serialize task data for registration API call.
+
+    Dependencies registered as separate tasks (`registered_task_ids`) are included
+    in the task data as references (`{"__ref": "<task_id>"}`) instead of in full.
+    Other dependencies, e.g. those of a task that was already complete (which
+    discovery does not visit), are included in full, since the registry may not
+    know them.
+    """
     # Avoid circular import:
     from stardag._core.task import flatten_task_struct  # noqa: F401
+    from stardag._core.task_refs import model_dump_with_refs
 
     # Extract output_uri if the task has a FileSystemTarget output with a uri
     output_uri: str | None = None
@@ -620,14 +926,16 @@ def _get_task_data_for_registration(task: "BaseTask") -> dict:
         # Log but don't fail - task may not have output() or it may fail
         logger.debug(f"Could not extract output_uri for task {task.id}: {e}")
 
+    dep_ids = [dep.id for dep in flatten_task_struct(task.requires())]
+
     return {
         "task_id": str(task.id),
         "task_namespace": task.get_namespace(),
         "task_name": task.get_name(),
-        "task_data": task.model_dump(mode="json"),
+        "task_data": model_dump_with_refs(
+            task, {dep_id for dep_id in dep_ids if dep_id in registered_task_ids}
+        ),
         "version": task.version,
         "output_uri": output_uri,
-        "dependency_task_ids": [
-            str(dep.id) for dep in flatten_task_struct(task.requires())
-        ],
+        "dependency_task_ids": [str(dep_id) for dep_id in dep_ids],
     }
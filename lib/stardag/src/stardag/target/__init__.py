@@ -14,19 +14,41 @@ from stardag.target._base import (
     RemoteFileSystemTarget,
     SaveableTarget,
 )
+from stardag.target._completion_index import (
+    CompletionIndexABC,
+    NoOpCompletionIndex,
+    SQLiteCompletionIndex,
+    completion_index_provider,
+)
+from stardag.target._exists import exists_many_aio, supports_exists_many
 from stardag.target._factory import (
     TargetFactory,
     get_directory_target,
     get_target,
     target_factory_provider,
 )
+from stardag.target._file_cache import FileCacheStats
 from stardag.target._in_memory import InMemoryFileSystemTarget, InMemoryTarget
+from stardag.target._output_cache import (
+    NoOpOutputCache,
+    OutputCache,
+    OutputCacheABC,
+    OutputCacheStats,
+    estimate_size,
+    get_output_cache,
+    output_cache_provider,
+)
 from stardag.target.serialize import Serializable
 
 __all__ = [
     "CachedRemoteFileSystem",
     "CachedRemoteFileSystemConfig",
+    "CompletionIndexABC",
+    "completion_index_provider",
     "DirectoryTarget",
+    "estimate_size",
+    "exists_many_aio",
+    "FileCacheStats",
     "FileSystemTarget",
     "get_target",
     "get_directory_target",
@@ -38,10 +60,19 @@ __all__ = [
     "LoadableTarget",
     "LoadedT",
     "LocalTarget",
+    "NoOpCompletionIndex",
+    "NoOpOutputCache",
+    "OutputCache",
+    "OutputCacheABC",
+    "output_cache_provider",
+    "get_output_cache",
+    "OutputCacheStats",
     "RemoteFileSystemABC",
     "RemoteFileSystemTarget",
     "SaveableTarget",
     "Serializable",
+    "SQLiteCompletionIndex",
+    "supports_exists_many",
     "Target",
     "TargetFactory",
     "target_factory_provider",
@@ -1,7 +1,8 @@
 import abc
+import asyncio
 import contextlib
+import io
 import os
-import shutil
 import tempfile
 import typing
 from contextlib import asynccontextmanager
@@ -21,6 +22,15 @@ from types import TracebackType
 import uuid6
 
 from stardag._core.target_base import Target
+from stardag.target._file_cache import (
+    EvictionPolicy,
+    FileCacheIndex,
+    FileCacheLock,
+    FileCacheStats,
+    make_read_only,
+    materialize_file,
+    remove_cached_file,
+)
 
 LoadedT = typing.TypeVar("LoadedT")
 LoadedT_co = typing.TypeVar("LoadedT_co", covariant=True)
@@ -322,6 +332,11 @@ class LocalTarget(FileSystemTarget):
     def exists(self) -> bool:
         return self.path.exists()
 
+    @classmethod
+    def exists_many(cls, uris: typing.Sequence[str]) -> dict[str, bool]:
+        """Check if each of the files exists, returns a mapping from URI to result."""
+        return {uri: cls(uri).exists() for uri in uris}
+
     def _open(self, mode: OpenMode) -> FileSystemTargetHandle:  # type: ignore
         if mode in ["r", "rb"]:
             return self.path.open(mode)
@@ -359,6 +374,11 @@ class LocalTarget(FileSystemTarget):
         """Asynchronously check if the local file exists."""
         return await aiofiles.os.path.exists(self.path)
 
+    @classmethod
+    async def exists_many_aio(cls, uris: typing.Sequence[str]) -> dict[str, bool]:
+        """Async version of exists_many(), checks all files in a single thread."""
+        return await asyncio.to_thread(cls.exists_many, uris)
+
     def _open_aio(self, mode: OpenMode) -> AIOFileSystemTargetHandle:  # type: ignore
         if mode in ["r", "rb"]:
             return _AIOReadFileHandle(  # type: ignore
@@ -547,10 +567,15 @@ class _AIOAtomicWriteFileHandle(
                 await aiofiles.os.remove(self._tmp_path)
 
 
+DEFAULT_STREAM_BUFFER_SIZE = 1024 * 1024
+
+
 class RemoteFileSystemABC(metaclass=abc.ABCMeta):
     """*Minimal* interface for a remote file system."""
 
     URI_PREFIX: str
+    # Whether files outlive the process (recorded in the completion index if so)
+    persistent: bool = True
 
     @abc.abstractmethod
     def exists(self, uri: str) -> bool: ...
@@ -561,6 +586,14 @@ class RemoteFileSystemABC(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def upload(self, source: Path, uri: str, ok_remove: bool = False): ...
 
+    def exists_many(self, uris: typing.Sequence[str]) -> dict[str, bool]:
+        """Check if each of the files exists, returns a mapping from URI to result.
+
+        Default implementation calls exists() per file. Subclasses can override
+        with a bulk implementation (e.g. prefix listings).
+        """
+        return {uri: self.exists(uri) for uri in uris}
+
     def enter_readable_proxy_path(self, uri: str) -> Path:
         """Provides a local path for reading the file.
 
@@ -579,6 +612,39 @@ class RemoteFileSystemABC(metaclass=abc.ABCMeta):
             local_path.unlink()
             local_path.parent.rmdir()
 
+    # Optional streaming reads. File systems that can read byte ranges of a file
+    # set `supports_streaming = True` and implement `size()` and `read_range()`,
+    # then `RemoteFileSystemTarget.open("rb")` fetches data lazily, as it is read,
+    # instead of downloading the whole file to a temporary file first.
+
+    supports_streaming: bool = False
+    stream_buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE
+
+    def size(self, uri: str) -> int:
+        """Size of the file in bytes.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support size()")
+
+    def read_range(self, uri: str, start: int, end: int) -> bytes:
+        """Read the bytes in the range [start, end) of the file."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support read_range()"
+        )
+
+    def open_stream(self, uri: str) -> io.BufferedReader:
+        """Open the file as a seekable binary stream that is fetched lazily.
+
+        Data is read with `read_range()`, at least `stream_buffer_size` bytes at a
+        time (read-ahead), and reading the rest of the file (`read()`) takes a
+        single request.
+        """
+        return io.BufferedReader(
+            _RangeReader(self, uri), buffer_size=self.stream_buffer_size
+        )
+
     # Async versions - default implementations delegate to sync
 
     async def exists_aio(self, uri: str) -> bool:
@@ -589,6 +655,14 @@ class RemoteFileSystemABC(metaclass=abc.ABCMeta):
         """
         return self.exists(uri)
 
+    async def exists_many_aio(self, uris: typing.Sequence[str]) -> dict[str, bool]:
+        """Asynchronously check if each of the files exists.
+
+        Default implementation calls exists_aio() per file, concurrently.
+        """
+        results = await asyncio.gather(*(self.exists_aio(uri) for uri in uris))
+        return dict(zip(uris, results))
+
     async def download_aio(self, uri: str, destination: Path) -> None:
         """Asynchronously download a file.
 
@@ -619,6 +693,12 @@ class RemoteFileSystemABC(metaclass=abc.ABCMeta):
             await aiofiles.os.remove(local_path)
             await aiofiles.os.rmdir(local_path.parent)
 
+    async def aclose(self) -> None:
+        """Close the resources (e.g. async clients) used in the running event loop.
+
+        Default implementation does nothing.
+        """
+
 
 class RemoteFileSystemTarget(FileSystemTarget):
     def __init__(self, uri: str, rfs: RemoteFileSystemABC) -> None:
@@ -634,6 +714,9 @@ class RemoteFileSystemTarget(FileSystemTarget):
 
     def _open(self, mode: OpenMode) -> FileSystemTargetHandle:  # type: ignore
         if mode in ["r", "rb"]:
+            if self.rfs.supports_streaming:
+                stream = self.rfs.open_stream(self.uri)
+                return stream if mode == "rb" else io.TextIOWrapper(stream)  # type: ignore
             return _RemoteReadFileHandle(self.uri, mode, self.rfs)  # type: ignore
         if mode in ["w", "wb"]:
             return _RemoteWriteFileHandle(self.uri, mode, self.rfs)  # type: ignore
@@ -738,6 +821,59 @@ class _RemoteReadFileHandle(
             self.rfs.exit_readable_proxy_path(self._proxy_path)
 
 
+class _RangeReader(io.RawIOBase):
+    """Seekable raw binary stream over a remote file, read with ranged requests.
+
+    Unbuffered: wrap in `io.BufferedReader` for read-ahead (see
+    `RemoteFileSystemABC.open_stream()`).
+    """
+
+    def __init__(self, rfs: RemoteFileSystemABC, uri: str) -> None:
+        self.rfs = rfs
+        self.name = uri
+        self._size = rfs.size(uri)  # NOTE raises FileNotFoundError, like open()
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        end = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+        data = self.rfs.read_range(self.name, self._position, end)
+        memoryview(buffer).cast("B")[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def readall(self) -> bytes:
+        if self._position >= self._size:
+            return b""
+        data = self.rfs.read_range(self.name, self._position, self._size)
+        self._position += len(data)
+        return data
+
+
 class _RemoteWriteFileHandle(
     WritableFileSystemTargetHandle[StreamT_contra],
     typing.Generic[StreamT_contra],
@@ -904,6 +1040,7 @@ class InMemoryRemoteFileSystem(RemoteFileSystemABC):
     """Mock in-memory implementation of a remote file system."""
 
     URI_PREFIX = "in-memory://"
+    persistent = False
 
     def __init__(self) -> None:
         self.uri_to_bytes = {}
@@ -911,6 +1048,9 @@ class InMemoryRemoteFileSystem(RemoteFileSystemABC):
     def exists(self, uri: str) -> bool:
         return uri in self.uri_to_bytes
 
+    def exists_many(self, uris: typing.Sequence[str]) -> dict[str, bool]:
+        return {uri: uri in self.uri_to_bytes for uri in uris}
+
     def download(self, uri: str, destination: Path):
         with open(destination, "wb") as f:
             f.write(self.uri_to_bytes[uri])
@@ -919,9 +1059,22 @@ class InMemoryRemoteFileSystem(RemoteFileSystemABC):
         with open(source, "rb") as f:
             self.uri_to_bytes[uri] = f.read()
 
+    supports_streaming = True
+
+    def size(self, uri: str) -> int:
+        if uri not in self.uri_to_bytes:
+            raise FileNotFoundError(uri)
+        return len(self.uri_to_bytes[uri])
+
+    def read_range(self, uri: str, start: int, end: int) -> bytes:
+        return self.uri_to_bytes[uri][start:end]
+
     async def exists_aio(self, uri: str) -> bool:
         return uri in self.uri_to_bytes
 
+    async def exists_many_aio(self, uris: typing.Sequence[str]) -> dict[str, bool]:
+        return self.exists_many(uris)
+
     async def download_aio(self, uri: str, destination: Path) -> None:
         import aiofiles
 
@@ -935,21 +1088,50 @@ class InMemoryRemoteFileSystem(RemoteFileSystemABC):
             self.uri_to_bytes[uri] = await f.read()
 
 
+# Index and lock files of the cache, under its root (next to the cached files)
+_CACHE_INDEX_FILE_NAME = ".stardag-cache-index.sqlite"
+_CACHE_LOCK_DIR_NAME = ".stardag-cache-locks"
+
+
 class CachedRemoteFileSystemConfig(BaseSettings):
     root: str
     root_by_prefix: typing.Dict[str, str] = {}
     allow_cache_check_exists: bool = True
+    max_size: int | None = None
+    eviction_policy: EvictionPolicy = "lru"
+    eviction_grace: float = 10.0
+    hardlink_downloads: bool = True
 
 
 class CachedRemoteFileSystem(RemoteFileSystemABC):
+    """Remote file system with a local cache of downloaded and uploaded files.
+
+    Concurrent reads of the same file, by threads or processes sharing the cache,
+    are served by a single download. With `max_size` (bytes), the cache is bounded:
+    files are tracked in an index under `root` and the least recently ("lru") or
+    least frequently ("lfu") used are evicted when the budget is exceeded. Files
+    used in the last `eviction_grace` seconds are not evicted. Hits, misses and
+    evictions are counted in `stats`.
+
+    Cached files are read-only, and readers use them in place (see
+    `enter_readable_proxy_path`). Downloads are reflinks of the cached file, or
+    hardlinks (read-only, unless `hardlink_downloads=False`) if the destination is
+    on the same file system, and in-kernel copies otherwise.
+    """
+
     def __init__(
         self,
         wrapped: RemoteFileSystemABC,
         root: str,
         root_by_prefix: typing.Dict[str, str] | None = None,
         allow_cache_check_exists: bool = True,
+        max_size: int | None = None,
+        eviction_policy: EvictionPolicy = "lru",
+        eviction_grace: float = 10.0,
+        hardlink_downloads: bool = True,
     ) -> None:
         self.wrapped = wrapped
+        self.persistent = wrapped.persistent
         self.root = Path(root)
         self.root_by_prefix = (
             {prefix: Path(root) for prefix, root in root_by_prefix.items()}
@@ -963,6 +1145,21 @@ class CachedRemoteFileSystem(RemoteFileSystemABC):
                     f"expected format {wrapped.URI_PREFIX}..."
                 )
         self.allow_cache_check_exists = allow_cache_check_exists
+        self.hardlink_downloads = hardlink_downloads
+        self.index = (
+            FileCacheIndex(
+                self.root / _CACHE_INDEX_FILE_NAME,
+                max_size=max_size,
+                eviction_policy=eviction_policy,
+                eviction_grace=eviction_grace,
+            )
+            if max_size is not None
+            else None
+        )
+        self.stats = FileCacheStats()
+        self._download_lock = FileCacheLock(self.root / _CACHE_LOCK_DIR_NAME)
+        # Async downloads in progress in this process, by cache path
+        self._downloads_aio: dict[Path, asyncio.Future[None]] = {}
 
     @property
     def URI_PREFIX(self) -> str:  # type: ignore  # TODO
@@ -988,43 +1185,100 @@ class CachedRemoteFileSystem(RemoteFileSystemABC):
 
         return self.wrapped.exists(uri)
 
+    def exists_many(self, uris: typing.Sequence[str]) -> dict[str, bool]:
+        result = {}
+        if self.allow_cache_check_exists:
+            result = {uri: True for uri in uris if self.get_cache_path(uri).exists()}
+        result.update(
+            self.wrapped.exists_many([uri for uri in uris if uri not in result])
+        )
+        return result
+
     def download(self, uri: str, destination: Path):
         cache_path = self.get_cache_path(uri)
-        if not cache_path.exists():
-            self._load_to_cache_atomically(uri, cache_path)
-
-        shutil.copy(cache_path, destination)
+        self._ensure_cached(uri, cache_path)
+        materialize_file(cache_path, destination, hardlink=self.hardlink_downloads)
 
     def upload(self, source: Path, uri: str, ok_remove: bool = False):
         self.wrapped.upload(source, uri, ok_remove=False)
         # NOTE only cache the file if the upload was successful!
         cache_path = self.get_cache_path(uri)
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        if ok_remove:
-            # NOTE faster to rename than to copy!
-            source.rename(cache_path)
-        else:
-            shutil.copy(source, cache_path)
+        self._store_in_cache(source, cache_path, ok_remove=ok_remove)
+        self._add_to_index(cache_path)
 
     def enter_readable_proxy_path(self, uri: str) -> Path:
         cache_path = self.get_cache_path(uri)
-        if not cache_path.exists():
-            self._load_to_cache_atomically(uri, cache_path)
-
+        self._ensure_cached(uri, cache_path)
         return cache_path
 
     def exit_readable_proxy_path(self, local_path: Path) -> None:
         pass
 
+    def _ensure_cached(self, uri: str, cache_path: Path) -> None:
+        """Download the file to the cache, unless it is there already.
+
+        Only one thread or process downloads a given file, the others wait for it.
+        """
+        if cache_path.exists():
+            self._on_hit(cache_path)
+            return
+        with self._download_lock.hold(cache_path):
+            if cache_path.exists():
+                # Downloaded meanwhile by another thread or process
+                self._on_hit(cache_path)
+                return
+            self._load_to_cache_atomically(uri, cache_path)
+        self.stats.add(misses=1)
+        self._add_to_index(cache_path)
+
+    def _on_hit(self, cache_path: Path) -> None:
+        self.stats.add(hits=1)
+        if self.index is not None and not self.index.touch(cache_path):
+            # E.g. cached before the size budget was set
+            self._add_to_index(cache_path)
+
+    def _add_to_index(self, cache_path: Path) -> None:
+        """Track a newly cached file, evicting others to stay within the budget."""
+        if self.index is None:
+            return
+        try:
+            size = cache_path.stat().st_size
+        except FileNotFoundError:
+            # Evicted meanwhile by another process
+            return
+        evicted = self.index.add(cache_path, size)
+        if evicted:
+            self.stats.add(
+                evictions=len(evicted),
+                evicted_bytes=sum(evicted_size for _, evicted_size in evicted),
+            )
+
+    def _store_in_cache(self, source: Path, cache_path: Path, ok_remove: bool) -> None:
+        """Put an uploaded file in the cache (replacing a previous version)."""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        if ok_remove:
+            # NOTE faster to rename than to copy!
+            source.rename(cache_path)
+            make_read_only(cache_path)
+            return
+        # Not a hardlink: the source may still be modified
+        tmp_cache_path = cache_path.with_suffix(f".tmp-{uuid6.uuid7()}")
+        try:
+            materialize_file(source, tmp_cache_path, hardlink=False)
+            make_read_only(tmp_cache_path)
+            os.replace(tmp_cache_path, cache_path)
+        finally:
+            remove_cached_file(tmp_cache_path)
+
     def _load_to_cache_atomically(self, uri: str, cache_path: Path):
         tmp_cache_path = cache_path.with_suffix(f".tmp-{uuid6.uuid7()}")
         tmp_cache_path.parent.mkdir(parents=True, exist_ok=True)
         try:
             self.wrapped.download(uri, tmp_cache_path)
+            make_read_only(tmp_cache_path)
             tmp_cache_path.rename(cache_path)  # type: ignore
         finally:
-            if tmp_cache_path.exists():
-                tmp_cache_path.unlink()
+            remove_cached_file(tmp_cache_path)
 
     # Async implementations
 
@@ -1036,45 +1290,109 @@ class CachedRemoteFileSystem(RemoteFileSystemABC):
                 return True
         return await self.wrapped.exists_aio(uri)
 
+    async def exists_many_aio(self, uris: typing.Sequence[str]) -> dict[str, bool]:
+        """Async bulk check with cache optimization."""
+        result = {}
+        if self.allow_cache_check_exists:
+            cache_paths = [self.get_cache_path(uri) for uri in uris]
+            cached = await asyncio.to_thread(
+                lambda: [path.exists() for path in cache_paths]
+            )
+            result = {uri: True for uri, hit in zip(uris, cached) if hit}
+        result.update(
+            await self.wrapped.exists_many_aio(
+                [uri for uri in uris if uri not in result]
+            )
+        )
+        return result
+
     async def download_aio(self, uri: str, destination: Path) -> None:
         """Async download with cache."""
         cache_path = self.get_cache_path(uri)
-        if not await aiofiles.os.path.exists(cache_path):
-            await self._load_to_cache_atomically_aio(uri, cache_path)
+        await self._ensure_cached_aio(uri, cache_path)
         await aiofiles.os.makedirs(destination.parent, exist_ok=True)
-        shutil.copy(cache_path, destination)  # Local copy is fast, keep sync
+        await asyncio.to_thread(
+            materialize_file,
+            cache_path,
+            destination,
+            hardlink=self.hardlink_downloads,
+        )
 
     async def upload_aio(self, source: Path, uri: str, ok_remove: bool = False) -> None:
         """Async upload with cache update."""
         await self.wrapped.upload_aio(source, uri, ok_remove=False)
         cache_path = self.get_cache_path(uri)
-        await aiofiles.os.makedirs(cache_path.parent, exist_ok=True)
-        if ok_remove:
-            await aiofiles.os.rename(source, cache_path)
-        else:
-            shutil.copy(source, cache_path)
+        await asyncio.to_thread(
+            self._store_in_cache, source, cache_path, ok_remove=ok_remove
+        )
+        self._add_to_index(cache_path)
 
     async def enter_readable_proxy_path_aio(self, uri: str) -> Path:
         """Async version returns cached path."""
         cache_path = self.get_cache_path(uri)
-        if not await aiofiles.os.path.exists(cache_path):
-            await self._load_to_cache_atomically_aio(uri, cache_path)
+        await self._ensure_cached_aio(uri, cache_path)
         return cache_path
 
     async def exit_readable_proxy_path_aio(self, local_path: Path) -> None:
         """Cache persists, no cleanup needed."""
         pass
 
+    async def aclose(self) -> None:
+        await self.wrapped.aclose()
+
+    async def _ensure_cached_aio(self, uri: str, cache_path: Path) -> None:
+        """Async version of `_ensure_cached`.
+
+        Concurrent coroutines (of the same event loop) await the same download,
+        and only that one waits for other threads and processes.
+        """
+        if await aiofiles.os.path.exists(cache_path):
+            self._on_hit(cache_path)
+            return
+        download = self._downloads_aio.get(cache_path)
+        if download is None or download.get_loop() is not asyncio.get_running_loop():
+            download = asyncio.ensure_future(
+                self._load_to_cache_single_flight_aio(uri, cache_path)
+            )
+            self._downloads_aio[cache_path] = download
+
+            def forget(done: asyncio.Future[None]) -> None:
+                if self._downloads_aio.get(cache_path) is done:
+                    del self._downloads_aio[cache_path]
+
+            download.add_done_callback(forget)
+            # Don't cancel the download for the other waiters
+            await asyncio.shield(download)
+        else:
+            await asyncio.shield(download)
+            self._on_hit(cache_path)
+
+    async def _load_to_cache_single_flight_aio(
+        self, uri: str, cache_path: Path
+    ) -> None:
+        release = await self._download_lock.acquire_aio(cache_path)
+        try:
+            if await aiofiles.os.path.exists(cache_path):
+                # Downloaded meanwhile by another thread or process
+                self._on_hit(cache_path)
+                return
+            await self._load_to_cache_atomically_aio(uri, cache_path)
+        finally:
+            release()
+        self.stats.add(misses=1)
+        self._add_to_index(cache_path)
+
     async def _load_to_cache_atomically_aio(self, uri: str, cache_path: Path) -> None:
         """Async atomic download to cache."""
         tmp_cache_path = cache_path.with_suffix(f".tmp-{uuid6.uuid7()}")
         await aiofiles.os.makedirs(tmp_cache_path.parent, exist_ok=True)
         try:
             await self.wrapped.download_aio(uri, tmp_cache_path)
+            make_read_only(tmp_cache_path)
             await aiofiles.os.rename(tmp_cache_path, cache_path)
         finally:
             if await aiofiles.os.path.exists(tmp_cache_path):
-                await aiofiles.os.remove(tmp_cache_path)
+                remove_cached_file(tmp_cache_path)
 
 
 _FSTargetType = typing.TypeVar("_FSTargetType", bound=FileSystemTarget)
@@ -0,0 +1,274 @@
+"""Persistent local index of completed task outputs.
+
+Task outputs are immutable by construction (the task ID, and hence the output URI,
+is a content hash of the task parameters), so once an output is known to exist it
+does not need to be checked against storage again. The index records the URIs of
+local and remote (not in-memory) file outputs, and the ID of the producing task
+when known, in a local SQLite database, which `Task.complete()`/
+`Task.complete_aio()` and build discovery consult before checking storage.
+
+The index is opt-in: set `STARDAG_COMPLETION_INDEX_ENABLED=true`.
+
+Invalidation policies:
+- TTL (`STARDAG_COMPLETION_INDEX_TTL`, seconds): entries older than this are
+  ignored, and refreshed when storage confirms the output exists.
+- Explicit: `stardag cache invalidate` (all, by task ID or by URI prefix).
+- Verify-on-load (`STARDAG_COMPLETION_INDEX_VERIFY_ON_LOAD`, default true): an
+  entry is removed when loading its output fails because the file is missing.
+"""
+
+import abc
+import asyncio
+import sqlite3
+import threading
+import time
+import typing
+from pathlib import Path
+from uuid import UUID
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from stardag.config import get_stardag_dir
+from stardag.target._base import LocalTarget, RemoteFileSystemTarget
+from stardag.utils.resource_provider import resource_provider
+
+# Max number of bound parameters per query (SQLite's default limit is 999 for old
+# versions)
+_MAX_QUERY_PARAMS = 500
+
+
+def get_indexable_uri(target: object) -> str | None:
+    """The URI of the target if its existence can be recorded in the index.
+
+    Only files in persistent storage are indexed: local files and remote files,
+    but not in-memory targets, which do not outlive the process.
+    """
+    # Avoid circular import (serialize records saved outputs in the index)
+    from stardag.target.serialize import Serializable
+
+    while isinstance(target, Serializable):
+        target = target.wrapped
+    if isinstance(target, LocalTarget) or (
+        isinstance(target, RemoteFileSystemTarget) and target.rfs.persistent
+    ):
+        return target.uri
+    return None
+
+
+class CompletionIndexABC(metaclass=abc.ABCMeta):
+    """Index of output URIs known to exist.
+
+    The `*_aio` methods run the (blocking) sync methods in a worker thread.
+    """
+
+    @abc.abstractmethod
+    def contains_many(self, uris: typing.Sequence[str]) -> set[str]:
+        """Get the subset of `uris` that are recorded as complete (and not expired)."""
+        ...
+
+    def contains(self, uri: str) -> bool:
+        """Check if the URI is recorded as complete (and not expired)."""
+        return bool(self.contains_many([uri]))
+
+    @abc.abstractmethod
+    def record(self, uri: str, task_id: UUID | None = None) -> None:
+        """Record that the output at `uri` exists."""
+        ...
+
+    def record_many(self, entries: typing.Sequence[tuple[str, UUID | None]]) -> None:
+        """Record that the outputs exist, given as (uri, task_id) pairs."""
+        for uri, task_id in entries:
+            self.record(uri, task_id=task_id)
+
+    async def contains_many_aio(self, uris: typing.Sequence[str]) -> set[str]:
+        """Async version of `contains_many`."""
+        return await asyncio.to_thread(self.contains_many, uris)
+
+    async def contains_aio(self, uri: str) -> bool:
+        """Async version of `contains`."""
+        return bool(await self.contains_many_aio([uri]))
+
+    async def record_many_aio(
+        self, entries: typing.Sequence[tuple[str, UUID | None]]
+    ) -> None:
+        """Async version of `record_many`."""
+        await asyncio.to_thread(self.record_many, entries)
+
+    @abc.abstractmethod
+    def invalidate(
+        self,
+        uri: str | None = None,
+        task_id: UUID | None = None,
+        prefix: str | None = None,
+    ) -> int:
+        """Remove entries matching all of the given filters (all entries if none).
+
+        Returns:
+            The number of removed entries.
+        """
+        ...
+
+    @property
+    def verify_on_load(self) -> bool:
+        """Whether to invalidate the entry of an output that fails to load."""
+        return False
+
+
+class NoOpCompletionIndex(CompletionIndexABC):
+    """Index that records nothing, used when the completion index is disabled."""
+
+    def contains_many(self, uris: typing.Sequence[str]) -> set[str]:
+        return set()
+
+    def record(self, uri: str, task_id: UUID | None = None) -> None:
+        pass
+
+    # Nothing to do, don't spend a thread on it
+    async def contains_many_aio(self, uris: typing.Sequence[str]) -> set[str]:
+        return set()
+
+    async def record_many_aio(
+        self, entries: typing.Sequence[tuple[str, UUID | None]]
+    ) -> None:
+        pass
+
+    def invalidate(
+        self,
+        uri: str | None = None,
+        task_id: UUID | None = None,
+        prefix: str | None = None,
+    ) -> int:
+        return 0
+
+
+class SQLiteCompletionIndex(CompletionIndexABC):
+    """Completion index stored in a local SQLite database.
+
+    Safe to use from multiple threads and processes (WAL journal mode).
+
+    Args:
+        path: Path to the database file, created if it does not exist.
+        ttl: If set, entries older than this many seconds are ignored.
+        verify_on_load: Whether to invalidate the entry of an output that fails to
+            load because it is missing.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl: float | None = None,
+        verify_on_load: bool = True,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.ttl = ttl
+        self._verify_on_load = verify_on_load
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS completed_outputs ("
+            "uri TEXT PRIMARY KEY, task_id TEXT, recorded_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_completed_outputs_task_id "
+            "ON completed_outputs (task_id)"
+        )
+
+    @property
+    def verify_on_load(self) -> bool:
+        return self._verify_on_load
+
+    def contains_many(self, uris: typing.Sequence[str]) -> set[str]:
+        min_recorded_at = time.time() - self.ttl if self.ttl is not None else 0.0
+        unique_uris = list(dict.fromkeys(uris))
+        found: set[str] = set()
+        with self._lock:
+            for start in range(0, len(unique_uris), _MAX_QUERY_PARAMS):
+                chunk = unique_uris[start : start + _MAX_QUERY_PARAMS]
+                rows = self._connection.execute(
+                    "SELECT uri FROM completed_outputs "
+                    f"WHERE uri IN ({', '.join('?' * len(chunk))}) "
+                    "AND recorded_at >= ?",
+                    (*chunk, min_recorded_at),
+                )
+                found.update(uri for (uri,) in rows)
+        return found
+
+    def record(self, uri: str, task_id: UUID | None = None) -> None:
+        self.record_many([(uri, task_id)])
+
+    def record_many(self, entries: typing.Sequence[tuple[str, UUID | None]]) -> None:
+        if not entries:
+            return
+        recorded_at = time.time()
+        # In a single transaction (committed, or rolled back on error, on exit)
+        with self._lock, self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "INSERT INTO completed_outputs (uri, task_id, recorded_at) "
+                "VALUES (?, ?, ?) ON CONFLICT (uri) DO UPDATE SET "
+                "task_id = COALESCE(excluded.task_id, task_id), "
+                "recorded_at = excluded.recorded_at",
+                [
+                    (uri, str(task_id) if task_id is not None else None, recorded_at)
+                    for uri, task_id in entries
+                ],
+            )
+
+    def invalidate(
+        self,
+        uri: str | None = None,
+        task_id: UUID | None = None,
+        prefix: str | None = None,
+    ) -> int:
+        conditions: list[str] = []
+        params: list[str | int] = []
+        if uri is not None:
+            conditions.append("uri = ?")
+            params.append(uri)
+        if task_id is not None:
+            conditions.append("task_id = ?")
+            params.append(str(task_id))
+        if prefix is not None:
+            conditions.append("substr(uri, 1, ?) = ?")
+            params.extend([len(prefix), prefix])
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            cursor = self._connection.execute(
+                f"DELETE FROM completed_outputs{where}", params
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class CompletionIndexConfig(BaseSettings):
+    enabled: bool = False
+    path: str = str(get_stardag_dir() / "completion-index.sqlite")
+    ttl: float | None = None
+    verify_on_load: bool = True
+
+    model_config = SettingsConfigDict(env_prefix="stardag_completion_index_")
+
+
+def _init_completion_index() -> CompletionIndexABC:
+    config = CompletionIndexConfig()
+    if not config.enabled:
+        return NoOpCompletionIndex()
+    return SQLiteCompletionIndex(
+        path=config.path,
+        ttl=config.ttl,
+        verify_on_load=config.verify_on_load,
+    )
+
+
+completion_index_provider = resource_provider(
+    CompletionIndexABC,
+    _init_completion_index,
+    doc_str="Provides the completion index consulted before checking task outputs.",
+)
@@ -0,0 +1,72 @@
+import asyncio
+import typing
+
+from stardag._core.target_base import Target
+from stardag.target._base import LocalTarget, RemoteFileSystemTarget
+from stardag.target._in_memory import InMemoryFileSystemTarget
+from stardag.target.serialize import Serializable
+
+_ExistsMany = typing.Callable[[typing.Sequence[str]], typing.Awaitable[dict[str, bool]]]
+
+
+def _unwrap(target: Target) -> Target:
+    while isinstance(target, Serializable):
+        target = target.wrapped
+    return target
+
+
+def _get_exists_many(
+    target: Target,
+) -> tuple[typing.Hashable, _ExistsMany] | None:
+    """Get the bulk existence check for the target, with a key to group by."""
+    target = _unwrap(target)
+    if isinstance(target, RemoteFileSystemTarget):
+        return id(target.rfs), target.rfs.exists_many_aio
+    if isinstance(target, (LocalTarget, InMemoryFileSystemTarget)):
+        return type(target), type(target).exists_many_aio
+    return None
+
+
+def supports_exists_many(target: Target) -> bool:
+    """Whether the target is checked in bulk by `exists_many_aio()`."""
+    return _get_exists_many(target) is not None
+
+
+async def exists_many_aio(targets: typing.Sequence[Target]) -> list[bool]:
+    """Asynchronously check if each of the targets exists.
+
+    File system targets (see `supports_exists_many()`) are grouped by their (remote)
+    file system and each group is checked with a single `exists_many_aio()` call,
+    which lets e.g. `S3FileSystem` answer many checks with a few prefix listings.
+    Other targets are checked individually with `exists_aio()`.
+
+    Returns:
+        The result for each target, in the order of `targets`.
+    """
+    results: list[bool] = [False] * len(targets)
+    groups: dict[typing.Hashable, tuple[_ExistsMany, list[int]]] = {}
+    individual: list[int] = []
+    for idx, target in enumerate(targets):
+        exists_many = _get_exists_many(target)
+        if exists_many is None:
+            individual.append(idx)
+            continue
+        key, check = exists_many
+        groups.setdefault(key, (check, []))[1].append(idx)
+
+    async def check_group(check: _ExistsMany, indices: list[int]) -> None:
+        uris = [_unwrap(targets[idx]).uri for idx in indices]  # type: ignore
+        exists = await check(uris)
+        for idx, uri in zip(indices, uris):
+            results[idx] = exists[uri]
+
+    async def check_individual(idx: int) -> None:
+        results[idx] = await targets[idx].exists_aio()
+
+    async with asyncio.TaskGroup() as tg:
+        for check, indices in groups.values():
+            tg.create_task(check_group(check, indices))
+        for idx in individual:
+            tg.create_task(check_individual(idx))
+
+    return results
@@ -0,0 +1,420 @@
+"""Size-bounded local cache of remote files, shared across threads and processes.
+
+Used by `CachedRemoteFileSystem`:
+
+- `FileCacheIndex` tracks the size and accesses of cached files in a local SQLite
+  database, and evicts the least recently (LRU) or least frequently (LFU) used
+  files when the total size exceeds the budget.
+- `FileCacheLock` makes sure that only one thread or process at a time downloads
+  a given file; the others wait for it and then read the cached file.
+- `FileCacheStats` counts hits, misses and evictions (per process).
+- `materialize_file` makes a cached file available at another path without
+  copying it in user space where possible (reflink, hardlink, in-kernel copy).
+
+Cached files are read-only, so that hardlinks handed out to readers can't be
+used to modify the cache.
+"""
+
+import asyncio
+import contextlib
+import errno
+import hashlib
+import os
+import shutil
+import sqlite3
+import stat
+import threading
+import time
+import typing
+from dataclasses import dataclass, field
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: locks are only shared across threads
+    fcntl = None  # type: ignore[assignment]
+
+EvictionPolicy = typing.Literal["lru", "lfu"]
+
+MaterializeMethod = typing.Literal["reflink", "hardlink", "copy"]
+
+# Linux ioctl cloning a file (copy-on-write), supported by e.g. Btrfs and XFS
+_FICLONE = 0x40049409
+# Errors of an unsupported reflink or hardlink, e.g. across file systems
+_UNSUPPORTED_LINK_ERRNOS = {
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EPERM,
+    errno.EMLINK,
+}
+_READ_ONLY_MODE = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+# Bounds of the interval (in seconds) at which async code polls for a held lock
+_LOCK_POLL_MIN_INTERVAL = 0.001
+_LOCK_POLL_MAX_INTERVAL = 0.05
+
+
+@dataclass
+class FileCacheStats:
+    """Counters of a file cache, since the cache was created (in this process).
+
+    Attributes:
+        hits: Reads served from the cache, incl. files downloaded concurrently by
+            another thread or process.
+        misses: Reads that downloaded the file.
+        evictions: Files removed from the cache to stay within its size budget.
+        evicted_bytes: Total size of the evicted files.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(
+        self,
+        hits: int = 0,
+        misses: int = 0,
+        evictions: int = 0,
+        evicted_bytes: int = 0,
+    ) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+            self.evicted_bytes += evicted_bytes
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of reads served from the cache (0.0 without reads)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class FileCacheIndex:
+    """Size and accesses of cached files, in a local SQLite database.
+
+    Safe to use from multiple threads and processes (WAL journal mode).
+
+    Args:
+        path: Path to the database file, created if it does not exist.
+        max_size: Size budget of the cache in bytes.
+        eviction_policy: "lru" evicts the least recently used files first, "lfu"
+            the least frequently used (then least recently used) first.
+        eviction_grace: Files used less than this many seconds ago are not evicted,
+            so that a file is not removed between being cached and being read.
+            The cache may temporarily exceed its budget because of this.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int,
+        eviction_policy: EvictionPolicy = "lru",
+        eviction_grace: float = 10.0,
+    ) -> None:
+        if eviction_policy not in typing.get_args(EvictionPolicy):
+            raise ValueError(
+                f"Unknown eviction policy {eviction_policy!r}, "
+                f"expected one of {typing.get_args(EvictionPolicy)}"
+            )
+        self.path = Path(path).expanduser()
+        self.max_size = max_size
+        self.eviction_policy = eviction_policy
+        self.eviction_grace = eviction_grace
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS cached_files ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "last_access REAL NOT NULL, access_count INTEGER NOT NULL)"
+        )
+
+    def touch(self, path: Path) -> bool:
+        """Record an access to a cached file.
+
+        Returns:
+            Whether the file is in the index.
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "UPDATE cached_files SET last_access = ?, "
+                "access_count = access_count + 1 WHERE path = ?",
+                (time.time(), str(path)),
+            )
+        return cursor.rowcount > 0
+
+    def add(self, path: Path, size: int) -> list[tuple[Path, int]]:
+        """Record a newly cached file and evict files to stay within the budget.
+
+        The evicted files are removed from the index, and from disk.
+
+        Returns:
+            The evicted files and their sizes.
+        """
+        now = time.time()
+        order_by = (
+            "last_access"
+            if self.eviction_policy == "lru"
+            else "access_count, last_access"
+        )
+        evicted: list[tuple[Path, int]] = []
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute(
+                    "INSERT INTO cached_files (path, size, last_access, access_count) "
+                    "VALUES (?, ?, ?, 1) ON CONFLICT (path) DO UPDATE SET "
+                    "size = excluded.size, last_access = excluded.last_access, "
+                    "access_count = access_count + 1",
+                    (str(path), size, now),
+                )
+                (total_size,) = self._connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM cached_files"
+                ).fetchone()
+                if total_size > self.max_size:
+                    candidates = self._connection.execute(
+                        "SELECT path, size FROM cached_files "
+                        f"WHERE last_access < ? ORDER BY {order_by}",
+                        (now - self.eviction_grace,),
+                    ).fetchall()
+                    for candidate_path, candidate_size in candidates:
+                        if total_size <= self.max_size:
+                            break
+                        evicted.append((Path(candidate_path), candidate_size))
+                        total_size -= candidate_size
+                    self._connection.executemany(
+                        "DELETE FROM cached_files WHERE path = ?",
+                        [(str(evicted_path),) for evicted_path, _ in evicted],
+                    )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+        for evicted_path, _ in evicted:
+            remove_cached_file(evicted_path)
+        return evicted
+
+    def total_size(self) -> int:
+        """Total size in bytes of the files in the index."""
+        with self._lock:
+            (total_size,) = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cached_files"
+            ).fetchone()
+        return total_size
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class FileCacheLock:
+    """Exclusive locks on cache paths, shared across threads and processes.
+
+    Each cache path has its own lock file under `lock_dir` (locked with `flock`,
+    where available, and removed on release) and its own thread lock for the
+    threads of this process. Async code polls for the lock, so that waiting for
+    one file does not tie up a thread needed to download another.
+    """
+
+    def __init__(self, lock_dir: str | Path) -> None:
+        self.lock_dir = Path(lock_dir).expanduser()
+        self._lock = threading.Lock()
+        # Thread lock of each cache path, with its number of holders and waiters
+        self._thread_locks: dict[Path, tuple[threading.Lock, int]] = {}
+
+    def acquire(self, path: Path) -> typing.Callable[[], None]:
+        """Acquire the lock of the path (blocking).
+
+        Returns:
+            A function releasing the lock (can be called from any thread).
+        """
+        thread_lock = self._use_thread_lock(path)
+        try:
+            thread_lock.acquire()
+            try:
+                lock_file = self._lock_file(path, blocking=True)
+            except BaseException:
+                thread_lock.release()
+                raise
+        except BaseException:
+            self._unuse_thread_lock(path)
+            raise
+        return self._release_function(path, thread_lock, lock_file)
+
+    async def acquire_aio(self, path: Path) -> typing.Callable[[], None]:
+        """Async version of `acquire`, polling for the lock without a thread."""
+        thread_lock = self._use_thread_lock(path)
+        try:
+            interval = _LOCK_POLL_MIN_INTERVAL
+            while True:
+                if thread_lock.acquire(blocking=False):
+                    try:
+                        lock_file = self._lock_file(path, blocking=False)
+                    except BlockingIOError:
+                        # Held by another process
+                        thread_lock.release()
+                    except BaseException:
+                        thread_lock.release()
+                        raise
+                    else:
+                        return self._release_function(path, thread_lock, lock_file)
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, _LOCK_POLL_MAX_INTERVAL)
+        except BaseException:
+            self._unuse_thread_lock(path)
+            raise
+
+    @contextlib.contextmanager
+    def hold(self, path: Path) -> typing.Iterator[None]:
+        """Context manager holding the lock of the path."""
+        release = self.acquire(path)
+        try:
+            yield
+        finally:
+            release()
+
+    def _use_thread_lock(self, path: Path) -> threading.Lock:
+        with self._lock:
+            thread_lock, users = self._thread_locks.get(path, (threading.Lock(), 0))
+            self._thread_locks[path] = (thread_lock, users + 1)
+        return thread_lock
+
+    def _unuse_thread_lock(self, path: Path) -> None:
+        with self._lock:
+            thread_lock, users = self._thread_locks[path]
+            if users == 1:
+                del self._thread_locks[path]
+            else:
+                self._thread_locks[path] = (thread_lock, users - 1)
+
+    def _lock_path(self, path: Path) -> Path:
+        return self.lock_dir / f"{hashlib.sha256(str(path).encode()).hexdigest()}.lock"
+
+    def _lock_file(self, path: Path, blocking: bool) -> typing.BinaryIO | None:
+        """Open and lock the lock file of the path (None without `flock`).
+
+        Raises:
+            BlockingIOError: If not `blocking` and the file is locked by another
+                process.
+        """
+        if fcntl is None:
+            return None
+        lock_path = self._lock_path(path)
+        operation = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        while True:
+            self.lock_dir.mkdir(parents=True, exist_ok=True)
+            lock_file = open(lock_path, "a+b")
+            try:
+                fcntl.flock(lock_file.fileno(), operation)
+                # Unless the previous holder removed the file meanwhile
+                if os.path.samestat(os.fstat(lock_file.fileno()), os.stat(lock_path)):
+                    return lock_file
+            except FileNotFoundError:
+                pass
+            except BaseException:
+                lock_file.close()
+                raise
+            lock_file.close()
+
+    def _release_function(
+        self,
+        path: Path,
+        thread_lock: threading.Lock,
+        lock_file: typing.BinaryIO | None,
+    ) -> typing.Callable[[], None]:
+        def release() -> None:
+            if lock_file is not None:
+                # Removed while still locked, so that waiters on the removed file
+                # lock the next one (and lock files don't pile up)
+                self._lock_path(path).unlink(missing_ok=True)
+                # Closing the file releases the flock
+                lock_file.close()
+            thread_lock.release()
+            self._unuse_thread_lock(path)
+
+        return release
+
+
+def make_read_only(path: Path) -> None:
+    """Make a newly cached file read-only."""
+    os.chmod(path, _READ_ONLY_MODE)
+
+
+def remove_cached_file(path: Path) -> None:
+    """Remove a (read-only) cached file, if it exists."""
+    try:
+        path.unlink(missing_ok=True)
+    except PermissionError:
+        # Windows does not remove read-only files
+        os.chmod(path, stat.S_IWUSR | _READ_ONLY_MODE)
+        path.unlink(missing_ok=True)
+
+
+def materialize_file(
+    source: Path, destination: Path, hardlink: bool = True
+) -> MaterializeMethod:
+    """Make the content of `source` available at `destination`.
+
+    Uses the cheapest method supported by the file system(s), in order:
+
+    - "reflink": A copy-on-write clone (Linux, e.g. Btrfs and XFS), which shares
+      the data blocks until either file is modified.
+    - "hardlink": If `hardlink`, the destination is the same file as the source
+      (same inode), so it is read-only if the source is.
+    - "copy": A copy done by the kernel (`os.copy_file_range`, or `sendfile` via
+      `shutil.copyfile`), without passing the data through user space.
+
+    An existing destination is replaced. Blocking, run it in a thread from async
+    code.
+
+    Returns:
+        The method used.
+    """
+    destination.unlink(missing_ok=True)
+    if fcntl is not None and hasattr(fcntl, "ioctl"):
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                return "reflink"
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_LINK_ERRNOS:
+                    raise
+        destination.unlink()
+    if hardlink:
+        try:
+            os.link(source, destination)
+            return "hardlink"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_LINK_ERRNOS:
+                raise
+    _copy_file(source, destination)
+    return "copy"
+
+
+def _copy_file(source: Path, destination: Path) -> None:
+    if hasattr(os, "copy_file_range"):
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                else:
+                    return
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_LINK_ERRNOS | {errno.ENOSYS}:
+                    raise
+    # Uses sendfile on Linux, fcopyfile on macOS
+    shutil.copyfile(source, destination)
@@ -1,5 +1,9 @@
+import shutil
+import tempfile
+import typing
 from contextlib import contextmanager
 from io import BytesIO, StringIO
+from pathlib import Path
 
 from stardag.target._base import (
     FileSystemTarget,
@@ -81,6 +85,10 @@ class InMemoryFileSystemTarget(FileSystemTarget):
     def exists(self):  # type: ignore
         return self.uri in self.uri_to_bytes
 
+    @classmethod
+    def exists_many(cls, uris: typing.Sequence[str]) -> dict[str, bool]:
+        return {uri: uri in cls.uri_to_bytes for uri in uris}
+
     def _open(self, mode: OpenMode) -> FileSystemTargetHandle:  # type: ignore
         try:
             if mode == "r":
@@ -101,12 +109,39 @@ class InMemoryFileSystemTarget(FileSystemTarget):
 
         raise ValueError(f"Invalid mode {mode}")
 
+    @contextmanager
+    def _readable_proxy_path(self) -> typing.Generator[Path, None, None]:
+        try:
+            data = self.uri_to_bytes[self.uri]
+        except KeyError:
+            raise FileNotFoundError(f"No such file: {self.uri}")
+        tmp_path = Path(tempfile.mkdtemp()) / Path(self.uri).name
+        try:
+            tmp_path.write_bytes(data)
+            yield tmp_path
+        finally:
+            shutil.rmtree(tmp_path.parent)
+
+    @contextmanager
+    def _writable_proxy_path(self) -> typing.Generator[Path, None, None]:
+        tmp_path = Path(tempfile.mkdtemp()) / Path(self.uri).name
+        try:
+            yield tmp_path
+            InMemoryFileSystemTarget.uri_to_bytes[self.uri] = tmp_path.read_bytes()
+        finally:
+            shutil.rmtree(tmp_path.parent)
+
     # Async implementations (trivial since in-memory is fast)
 
     async def exists_aio(self) -> bool:
         """Async check - trivial for in-memory."""
         return self.exists()
 
+    @classmethod
+    async def exists_many_aio(cls, uris: typing.Sequence[str]) -> dict[str, bool]:
+        """Async bulk check - trivial for in-memory."""
+        return cls.exists_many(uris)
+
 
 class _InMemoryBytesWritableFileSystemTargetHandle(
     WritableFileSystemTargetHandle[bytes]
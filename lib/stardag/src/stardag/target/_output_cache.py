@@ -0,0 +1,323 @@
+"""In-memory cache of loaded task outputs, scoped to a build.
+
+Task outputs are immutable by construction (the output URI is derived from the task
+ID, a content hash of the task parameters), so an output loaded once can be handed
+to every downstream task that loads it, instead of being read and deserialized
+once per task.
+
+The cache is opt-in, per build:
+
+    build([root], output_cache=OutputCache(max_bytes=2 * 1024**3))
+
+In the tasks of the build, `Serializable.load()`/`load_aio()`, and hence the inputs
+of `@task` functions, go through the cache (see `get_output_cache()`), which is
+cleared when the build ends. Concurrent builds each use their own cache.
+Concurrent loads of the same output are served by a single load. Objects are
+kept up to `max_bytes` of estimated size, least recently used evicted first.
+
+Only loads in the build process are cached: tasks executed in process pools load
+their inputs themselves.
+"""
+
+import abc
+import asyncio
+import contextlib
+import copy
+import sys
+import threading
+import typing
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from stardag.utils.resource_provider import resource_provider
+
+_T = typing.TypeVar("_T")
+
+SizeEstimator = typing.Callable[[typing.Any], int]
+
+_SCALAR_TYPES = (str, bytes, int, float, complex, bool, type(None))
+# Returned as is with copy_on_read
+_IMMUTABLE_TYPES = (*_SCALAR_TYPES, frozenset)
+
+_MISSING = object()
+
+
+@dataclass
+class OutputCacheStats:
+    """Counters of an output cache.
+
+    Attributes:
+        hits: Loads served from the cache (incl. by a concurrent load).
+        misses: Loads that read and deserialized the output.
+        evictions: Objects evicted to stay within the memory budget.
+        peak_bytes: Peak estimated size of the cached objects.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    peak_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of loads served from the cache (0.0 without loads)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class OutputCacheABC(metaclass=abc.ABCMeta):
+    """Cache of loaded outputs, by URI."""
+
+    @abc.abstractmethod
+    def get_or_load(self, uri: str, load: typing.Callable[[], _T]) -> _T:
+        """The cached object of the URI, or the result of `load()` (then cached)."""
+        ...
+
+    @abc.abstractmethod
+    async def get_or_load_aio(
+        self, uri: str, load: typing.Callable[[], typing.Awaitable[_T]]
+    ) -> _T:
+        """Async version of `get_or_load`."""
+        ...
+
+    @abc.abstractmethod
+    def discard(self, uri: str) -> None:
+        """Remove the object of the URI, if cached (e.g. when it is saved again)."""
+        ...
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Remove all cached objects."""
+        ...
+
+
+class NoOpOutputCache(OutputCacheABC):
+    """Cache that caches nothing, used outside of builds with an output cache."""
+
+    def get_or_load(self, uri: str, load: typing.Callable[[], _T]) -> _T:
+        return load()
+
+    async def get_or_load_aio(
+        self, uri: str, load: typing.Callable[[], typing.Awaitable[_T]]
+    ) -> _T:
+        return await load()
+
+    def discard(self, uri: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class OutputCache(OutputCacheABC):
+    """Least recently used loaded outputs, within a memory budget.
+
+    Safe to use from multiple threads.
+
+    Args:
+        max_bytes: Memory budget, in estimated bytes (see `estimate_size`). Larger
+            objects are not cached.
+        copy_on_read: Return a deep copy of the cached object on each load (except
+            for immutable types), so that tasks mutating their inputs don't affect
+            each other.
+        size_estimators: Size estimators by type, tried before the defaults (in
+            order, with `isinstance`).
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        copy_on_read: bool = False,
+        size_estimators: typing.Mapping[type, SizeEstimator] | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.copy_on_read = copy_on_read
+        self.size_estimators = dict(size_estimators or {})
+        self.stats = OutputCacheStats()
+        self._lock = threading.Lock()
+        # URI -> (object, estimated size), least recently used first
+        self._entries: OrderedDict[str, tuple[typing.Any, int]] = OrderedDict()
+        self._size = 0
+        # Loads in progress: thread lock (and number of users), and async loads
+        self._loading: dict[str, tuple[threading.Lock, list[int]]] = {}
+        self._loading_aio: dict[str, asyncio.Future] = {}
+
+    @property
+    def size_bytes(self) -> int:
+        """Estimated size of the cached objects."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_load(self, uri: str, load: typing.Callable[[], _T]) -> _T:
+        obj = self._lookup(uri)
+        if obj is _MISSING:
+            with self._single_flight(uri):
+                obj = self._lookup(uri)
+                if obj is _MISSING:
+                    obj = load()
+                    self._add(uri, obj)
+        return self._read(obj)
+
+    async def get_or_load_aio(
+        self, uri: str, load: typing.Callable[[], typing.Awaitable[_T]]
+    ) -> _T:
+        obj = self._lookup(uri)
+        if obj is not _MISSING:
+            return self._read(obj)
+        loading = self._loading_aio.get(uri)
+        if loading is not None and loading.get_loop() is asyncio.get_running_loop():
+            obj = await asyncio.shield(loading)
+            with self._lock:
+                self.stats.hits += 1
+            return self._read(obj)
+
+        async def load_and_add() -> typing.Any:
+            obj = await load()
+            self._add(uri, obj)
+            return obj
+
+        loading = asyncio.ensure_future(load_and_add())
+        self._loading_aio[uri] = loading
+
+        def forget(done: asyncio.Future) -> None:
+            if self._loading_aio.get(uri) is done:
+                del self._loading_aio[uri]
+
+        loading.add_done_callback(forget)
+        # Don't cancel the load for the other waiters
+        return self._read(await asyncio.shield(loading))
+
+    def discard(self, uri: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(uri, None)
+            if entry is not None:
+                self._size -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _lookup(self, uri: str) -> typing.Any:
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is None:
+                return _MISSING
+            self._entries.move_to_end(uri)
+            self.stats.hits += 1
+            return entry[0]
+
+    def _add(self, uri: str, obj: typing.Any) -> None:
+        size = estimate_size(obj, self.size_estimators)
+        with self._lock:
+            self.stats.misses += 1
+            if size > self.max_bytes:
+                return
+            previous = self._entries.pop(uri, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[uri] = (obj, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.stats.evictions += 1
+            self.stats.peak_bytes = max(self.stats.peak_bytes, self._size)
+
+    def _read(self, obj: _T) -> _T:
+        if self.copy_on_read and not isinstance(obj, _IMMUTABLE_TYPES):
+            return copy.deepcopy(obj)
+        return obj
+
+    @contextlib.contextmanager
+    def _single_flight(self, uri: str) -> typing.Iterator[None]:
+        """Hold a lock per URI, so that only one thread at a time loads it."""
+        with self._lock:
+            lock, users = self._loading.setdefault(uri, (threading.Lock(), [0]))
+            users[0] += 1
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                users[0] -= 1
+                if users[0] == 0:
+                    del self._loading[uri]
+
+
+def estimate_size(
+    obj: typing.Any,
+    size_estimators: typing.Mapping[type, SizeEstimator] | None = None,
+) -> int:
+    """Estimate the memory used by an object, in bytes.
+
+    Uses, for the object and (recursively) the items, keys, values and attributes
+    it contains: the first matching estimator of `size_estimators`, then
+    `memory_usage(deep=True)` (pandas), `nbytes` (NumPy, Arrow), and otherwise
+    `sys.getsizeof`. Objects referenced more than once are counted once.
+    """
+    size_estimators = size_estimators or {}
+    size = 0
+    seen: set[int] = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        estimator = next(
+            (
+                estimator
+                for type_, estimator in size_estimators.items()
+                if isinstance(item, type_)
+            ),
+            None,
+        )
+        if estimator is not None:
+            size += estimator(item)
+            continue
+        if isinstance(item, _SCALAR_TYPES):
+            size += sys.getsizeof(item)
+            continue
+        memory_usage = getattr(item, "memory_usage", None)
+        if callable(memory_usage) and hasattr(item, "dtypes"):
+            usage = memory_usage(deep=True)
+            size += int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+            continue
+        nbytes = getattr(item, "nbytes", None)
+        if isinstance(nbytes, int):
+            size += nbytes
+            continue
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__") and not isinstance(item, type):
+            stack.append(vars(item))
+    return size
+
+
+output_cache_provider = resource_provider(
+    OutputCacheABC,
+    NoOpOutputCache,
+    doc_str="Provides the cache that loads of task outputs go through.",
+)
+
+# Cache of the build running in the current context, set by build_aio() for the
+# execution of each task, so that concurrent builds don't share caches
+_build_output_cache: ContextVar[OutputCacheABC | None] = ContextVar(
+    "stardag_build_output_cache", default=None
+)
+
+
+def get_output_cache() -> OutputCacheABC:
+    """Get the output cache of the current build, else that of the provider."""
+    output_cache = _build_output_cache.get()
+    if output_cache is None:
+        return output_cache_provider.get()
+    return output_cache
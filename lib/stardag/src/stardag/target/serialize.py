@@ -1,4 +1,5 @@
 import abc
+import asyncio
 import contextlib
 import pickle
 import typing
@@ -15,27 +16,57 @@ from pydantic import PydanticSchemaGenerationError, TypeAdapter
 
 from stardag.target._base import (
     AIOFileSystemTargetHandle,
+    CachedRemoteFileSystem,
     FileSystemTarget,
     FileSystemTargetHandle,
     LoadableSaveableFileSystemTarget,
     LoadedT,
+    LocalTarget,
     OpenMode,
     ReadableAIOFileSystemTargetHandle,
     ReadableFileSystemTargetHandle,
+    RemoteFileSystemTarget,
     WritableAIOFileSystemTargetHandle,
     WritableFileSystemTargetHandle,
 )
+from stardag.target._completion_index import (
+    completion_index_provider,
+    get_indexable_uri,
+)
+from stardag.target._output_cache import get_output_cache
 from stardag.utils.resource_provider import resource_provider
 
 try:
     from pandas import DataFrame as DataFrame  # type: ignore
     from pandas import read_csv as pd_read_csv  # type: ignore
+    from pandas import read_parquet as pd_read_parquet  # type: ignore
 except ImportError:
 
     class DataFrame: ...
 
     def pd_read_csv(*args, **kwargs): ...
 
+    def pd_read_parquet(*args, **kwargs): ...
+
+
+try:
+    from numpy import load as np_load  # type: ignore
+    from numpy import ndarray as ndarray  # type: ignore
+    from numpy import save as np_save  # type: ignore
+    from numpy import savez as np_savez  # type: ignore
+    from numpy import savez_compressed as np_savez_compressed  # type: ignore
+except ImportError:
+
+    class ndarray: ...
+
+    def np_load(*args, **kwargs): ...
+
+    def np_save(*args, **kwargs): ...
+
+    def np_savez(*args, **kwargs): ...
+
+    def np_savez_compressed(*args, **kwargs): ...
+
 
 @typing.runtime_checkable
 class Serializer(typing.Generic[LoadedT], typing.Protocol):
@@ -124,6 +155,66 @@ class _DumpsLoadsSerializer(typing.Generic[LoadedT, StreamT], abc.ABC):
             return self.loads(await handle.read())  # type: ignore[arg-type]
 
 
+class _ProxyPathSerializer(typing.Generic[LoadedT], abc.ABC):
+    """Base class for serializers that write/read a local file (see `proxy_path`).
+
+    For libraries that read and write files themselves: the serialized object is
+    streamed to/from disk instead of being held in memory as a whole. For remote
+    targets, the local file is a temporary (or cached) copy.
+    """
+
+    @abc.abstractmethod
+    def dump_path(self, obj: LoadedT, path: Path) -> None:
+        """Serialize object to the file at path."""
+        ...
+
+    @abc.abstractmethod
+    def load_path(self, path: Path) -> LoadedT:
+        """Deserialize object from the file at path."""
+        ...
+
+    def dump(
+        self,
+        obj: LoadedT,
+        target: FileSystemTarget,
+    ) -> None:
+        with target.proxy_path("w") as path:
+            self.dump_path(obj, path)
+
+    def load(self, target: FileSystemTarget) -> LoadedT:
+        with target.proxy_path("r") as path:
+            return self.load_path(path)
+
+    async def dump_aio(
+        self,
+        obj: LoadedT,
+        target: FileSystemTarget,
+    ) -> None:
+        async with target.proxy_path_aio("w") as path:
+            await asyncio.to_thread(self.dump_path, obj, path)
+
+    async def load_aio(self, target: FileSystemTarget) -> LoadedT:
+        async with target.proxy_path_aio("r") as path:
+            return await asyncio.to_thread(self.load_path, path)
+
+
+@typing.runtime_checkable
+class ColumnProjectingSerializer(typing.Generic[LoadedT], typing.Protocol):
+    """Protocol for serializers that can load a subset of the columns of a table."""
+
+    def load_columns(
+        self,
+        target: FileSystemTarget,
+        columns: typing.Sequence[str],
+    ) -> LoadedT: ...
+
+    async def load_columns_aio(
+        self,
+        target: FileSystemTarget,
+        columns: typing.Sequence[str],
+    ) -> LoadedT: ...
+
+
 class Serializable(
     LoadableSaveableFileSystemTarget[LoadedT],
     typing.Generic[LoadedT],
@@ -141,10 +232,59 @@ class Serializable(
         return self.wrapped.uri
 
     def load(self) -> LoadedT:
-        return self.serializer.load(self.wrapped)
+        return get_output_cache().get_or_load(self.uri, self._load)
+
+    def _load(self) -> LoadedT:
+        try:
+            return self.serializer.load(self.wrapped)
+        except FileNotFoundError:
+            self._invalidate_completion_index()
+            raise
+
+    def load_columns(self, columns: typing.Sequence[str]) -> LoadedT:
+        """Load only the given columns of a tabular output.
+
+        Projected loads are not cached (see `OutputCache`).
+
+        Raises:
+            TypeError: If the serializer does not support column projection.
+        """
+        serializer = self._column_projecting_serializer()
+        try:
+            return serializer.load_columns(self.wrapped, columns)
+        except FileNotFoundError:
+            self._invalidate_completion_index()
+            raise
 
     def save(self, obj: LoadedT) -> None:
+        get_output_cache().discard(self.uri)
         self.serializer.dump(obj, self.wrapped)
+        self._record_completion_index()
+
+    def _column_projecting_serializer(self) -> ColumnProjectingSerializer[LoadedT]:
+        if not isinstance(self.serializer, ColumnProjectingSerializer):
+            raise TypeError(
+                f"{type(self.serializer).__name__} does not support loading a "
+                "subset of columns."
+            )
+        return self.serializer
+
+    def _record_completion_index(self) -> None:
+        """Record that the output exists, if it is in persistent storage."""
+        uri = get_indexable_uri(self.wrapped)
+        if uri is not None:
+            completion_index_provider.get().record(uri)
+
+    async def _record_completion_index_aio(self) -> None:
+        uri = get_indexable_uri(self.wrapped)
+        if uri is not None:
+            await completion_index_provider.get().record_many_aio([(uri, None)])
+
+    def _invalidate_completion_index(self) -> None:
+        """Forget that the output exists (verify-on-load), e.g. after it was deleted."""
+        completion_index = completion_index_provider.get()
+        if completion_index.verify_on_load:
+            completion_index.invalidate(uri=self.uri)
 
     def exists(self) -> bool:
         return self.wrapped.exists()
@@ -212,12 +352,30 @@ class Serializable(
         return await self.wrapped.exists_aio()
 
     async def load_aio(self) -> LoadedT:
-        """Async load - delegates to serializer."""
-        return await self.serializer.load_aio(self.wrapped)
+        """Async load - delegates to serializer (via the output cache)."""
+        return await get_output_cache().get_or_load_aio(self.uri, self._load_aio)
+
+    async def _load_aio(self) -> LoadedT:
+        try:
+            return await self.serializer.load_aio(self.wrapped)
+        except FileNotFoundError:
+            self._invalidate_completion_index()
+            raise
+
+    async def load_columns_aio(self, columns: typing.Sequence[str]) -> LoadedT:
+        """Async version of `load_columns`."""
+        serializer = self._column_projecting_serializer()
+        try:
+            return await serializer.load_columns_aio(self.wrapped, columns)
+        except FileNotFoundError:
+            self._invalidate_completion_index()
+            raise
 
     async def save_aio(self, obj: LoadedT) -> None:
         """Async save - delegates to serializer."""
+        get_output_cache().discard(self.uri)
         await self.serializer.dump_aio(obj, self.wrapped)
+        await self._record_completion_index_aio()
 
     @asynccontextmanager
     async def _readable_proxy_path_aio(self) -> AsyncGenerator[Path, None]:
@@ -336,6 +494,225 @@ class PandasDataFrameCSVSerializer(_DumpsLoadsSerializer[DataFrame, str]):
         return type(self) == type(value)  # noqa: E721
 
 
+class _PandasDataFrameColumnarSerializer(_ProxyPathSerializer[DataFrame]):
+    """Base class for serializers of pandas.DataFrame to columnar file formats.
+
+    The index is stored (and restored) along with the columns, also when loading a
+    subset of the columns.
+    """
+
+    def __init__(self, compression: str | None) -> None:
+        self.compression = compression
+
+    @classmethod
+    def type_checked_init(cls, annotation: typing.Type[DataFrame]) -> Self:
+        if strip_annotation(annotation) != DataFrame:  # noqa: E721
+            raise ValueError(f"{annotation} must be DataFrame.")
+        return cls()  # type: ignore[call-arg]
+
+    def load_path(self, path: Path) -> DataFrame:
+        return self.load_columns_path(path, columns=None)
+
+    @abc.abstractmethod
+    def load_columns_path(
+        self, path: Path, columns: typing.Sequence[str] | None
+    ) -> DataFrame:
+        """Deserialize the columns (all if None) from the file at path."""
+        ...
+
+    def load_columns(
+        self,
+        target: FileSystemTarget,
+        columns: typing.Sequence[str],
+    ) -> DataFrame:
+        with target.proxy_path("r") as path:
+            return self.load_columns_path(path, columns)
+
+    async def load_columns_aio(
+        self,
+        target: FileSystemTarget,
+        columns: typing.Sequence[str],
+    ) -> DataFrame:
+        async with target.proxy_path_aio("r") as path:
+            return await asyncio.to_thread(self.load_columns_path, path, columns)
+
+    def __eq__(self, value: object) -> bool:
+        return (
+            type(self) == type(value)  # noqa: E721
+            and isinstance(value, _PandasDataFrameColumnarSerializer)
+            and self.compression == value.compression
+        )
+
+
+class PandasDataFrameParquetSerializer(_PandasDataFrameColumnarSerializer):
+    """Serializer for pandas.DataFrame to Parquet (requires pyarrow or fastparquet).
+
+    Compact on disk, with typed columns. Select it with e.g.
+    `AutoTask[Annotated[pd.DataFrame, PandasDataFrameParquetSerializer()]]`.
+    """
+
+    def __init__(self, compression: str | None = "snappy") -> None:
+        super().__init__(compression)
+
+    def dump_path(self, obj: DataFrame, path: Path) -> None:
+        obj.to_parquet(path, compression=self.compression)  # type: ignore
+
+    def load_columns_path(
+        self, path: Path, columns: typing.Sequence[str] | None
+    ) -> DataFrame:
+        return pd_read_parquet(  # type: ignore
+            path, columns=list(columns) if columns is not None else None
+        )
+
+    def get_default_extension(self) -> str:
+        return "parquet"
+
+
+class PandasDataFrameFeatherSerializer(_PandasDataFrameColumnarSerializer):
+    """Serializer for pandas.DataFrame to Feather, i.e. Arrow IPC (requires pyarrow).
+
+    Faster to load than Parquet, typically larger on disk. Select it with e.g.
+    `AutoTask[Annotated[pd.DataFrame, PandasDataFrameFeatherSerializer()]]`.
+    """
+
+    def __init__(self, compression: str | None = "lz4") -> None:
+        super().__init__(compression)
+
+    def dump_path(self, obj: DataFrame, path: Path) -> None:
+        from pyarrow import feather  # type: ignore
+
+        feather.write_feather(obj, path, compression=self.compression or "uncompressed")
+
+    def load_columns_path(
+        self, path: Path, columns: typing.Sequence[str] | None
+    ) -> DataFrame:
+        import pyarrow  # type: ignore
+        from pyarrow import feather, ipc  # type: ignore
+
+        if columns is not None:
+            # Include the columns of the index (unlike `read_feather`)
+            with pyarrow.memory_map(str(path)) as source:
+                pandas_metadata = ipc.open_file(source).schema.pandas_metadata or {}
+            index_columns = [
+                column
+                for column in pandas_metadata.get("index_columns", [])
+                if isinstance(column, str) and column not in columns
+            ]
+            columns = [*columns, *index_columns]
+        return feather.read_table(path, columns=columns).to_pandas()
+
+    def get_default_extension(self) -> str:
+        return "feather"
+
+
+def _is_ndarray_annotation(annotation: typing.Any) -> bool:
+    """Whether the annotation is np.ndarray, optionally parametrized (npt.NDArray)."""
+    return (typing.get_origin(annotation) or annotation) is ndarray
+
+
+def _has_persistent_proxy_path(target: FileSystemTarget) -> bool:
+    """Whether the readable proxy path of the target remains after reading it.
+
+    True for the file of a local target and for the cached copy of a remote file,
+    which can then be memory mapped. Other proxy paths are temporary copies.
+    """
+    if isinstance(target, LocalTarget):
+        return True
+    return isinstance(target, RemoteFileSystemTarget) and isinstance(
+        target.rfs, CachedRemoteFileSystem
+    )
+
+
+class NumpyArraySerializer(_ProxyPathSerializer[ndarray]):
+    """Serializer for numpy.ndarray to .npy.
+
+    Arrays are loaded as read-only memory maps (`np.load(..., mmap_mode="r")`)
+    from local targets and from the cache of a `CachedRemoteFileSystem`, so that
+    only the parts of the array that are accessed are read into memory. Other
+    targets, and `mmap=False`, load the array into memory.
+
+    Arrays of Python objects are not supported (they would require pickle).
+    """
+
+    def __init__(self, mmap: bool = True) -> None:
+        self.mmap = mmap
+
+    @classmethod
+    def type_checked_init(cls, annotation: typing.Type[ndarray]) -> Self:
+        if not _is_ndarray_annotation(strip_annotation(annotation)):
+            raise ValueError(f"{annotation} must be numpy.ndarray.")
+        return cls()
+
+    def dump_path(self, obj: ndarray, path: Path) -> None:
+        # Via a file object, np.save would otherwise add the extension ".npy"
+        with open(path, "wb") as f:
+            np_save(f, obj, allow_pickle=False)
+
+    def load_path(self, path: Path, mmap: bool = False) -> ndarray:
+        return np_load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+
+    def load(self, target: FileSystemTarget) -> ndarray:
+        mmap = self.mmap and _has_persistent_proxy_path(target)
+        with target.proxy_path("r") as path:
+            return self.load_path(path, mmap)
+
+    async def load_aio(self, target: FileSystemTarget) -> ndarray:
+        mmap = self.mmap and _has_persistent_proxy_path(target)
+        async with target.proxy_path_aio("r") as path:
+            return await asyncio.to_thread(self.load_path, path, mmap)
+
+    def get_default_extension(self) -> str:
+        return "npy"
+
+    def __eq__(self, value: object) -> bool:
+        return (
+            type(self) == type(value)  # noqa: E721
+            and isinstance(value, NumpyArraySerializer)
+            and self.mmap == value.mmap
+        )
+
+
+class NumpyArrayDictSerializer(_ProxyPathSerializer[dict[str, ndarray]]):
+    """Serializer for dicts of numpy.ndarray (by name) to .npz.
+
+    The arrays are loaded into memory (.npz files can't be memory mapped).
+    """
+
+    def __init__(self, compressed: bool = False) -> None:
+        self.compressed = compressed
+
+    @classmethod
+    def type_checked_init(cls, annotation: typing.Type[dict[str, ndarray]]) -> Self:
+        stripped = strip_annotation(annotation)
+        if not (
+            typing.get_origin(stripped) is dict
+            and typing.get_args(stripped)[0] is str
+            and _is_ndarray_annotation(typing.get_args(stripped)[1])
+        ):
+            raise ValueError(f"{annotation} must be dict[str, numpy.ndarray].")
+        return cls()
+
+    def dump_path(self, obj: dict[str, ndarray], path: Path) -> None:
+        savez = np_savez_compressed if self.compressed else np_savez
+        # Via a file object, np.savez would otherwise add the extension ".npz"
+        with open(path, "wb") as f:
+            savez(f, **obj)
+
+    def load_path(self, path: Path) -> dict[str, ndarray]:
+        with np_load(path, allow_pickle=False) as npz:
+            return {name: npz[name] for name in npz.files}
+
+    def get_default_extension(self) -> str:
+        return "npz"
+
+    def __eq__(self, value: object) -> bool:
+        return (
+            type(self) == type(value)  # noqa: E721
+            and isinstance(value, NumpyArrayDictSerializer)
+            and self.compressed == value.compressed
+        )
+
+
 @typing.runtime_checkable
 class SelfSerializing(typing.Protocol):
     def dump(self, target: FileSystemTarget) -> None: ...
@@ -428,6 +805,8 @@ _DEFAULT_SERIALIZER_CANDIDATES: tuple[SerializerFactoryProtocol] = (
     SelfSerializer.type_checked_init,  # type: ignore
     # specific type serializers
     PandasDataFrameCSVSerializer.type_checked_init,
+    NumpyArraySerializer.type_checked_init,
+    NumpyArrayDictSerializer.type_checked_init,
     PlainTextSerializer.type_checked_init,
     # generic serializers
     JSONSerializer.type_checked_init,
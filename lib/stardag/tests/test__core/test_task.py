@@ -2,6 +2,7 @@ import asyncio
 from datetime import datetime
 from typing import Annotated, Type
 from unittest.mock import Mock
+from uuid import UUID
 
 import pytest
 
@@ -17,7 +18,8 @@ from stardag._core.task import (
     flatten_task_struct,
 )
 from stardag._core.task_id import _get_task_id_from_jsonable, _get_task_id_jsonable
-from stardag.base_model import StardagBaseModel, StardagField
+from stardag._core.task_refs import model_dump_with_refs
+from stardag.base_model import CONTEXT_MODE_KEY, StardagBaseModel, StardagField
 from stardag.polymorphic import NAME_KEY, NAMESPACE_KEY, SubClass, TypeId
 from stardag.registry._base import RegistryABC, TaskMetadata
 from stardag.target._in_memory import InMemoryTarget
@@ -230,6 +232,59 @@ def test__id_hashable_jsonable(
     assert_serialize_validate_roundtrip(task.__class__, task)
 
 
+class ChainTask(MockBaseTask):
+    index: int
+    upstream: tuple[SubClass[BaseTask], ...] = ()
+
+
+class WithBaseTypedTasks(MockBaseTask):
+    tasks: tuple[BaseTask, ...]
+
+
+def test_id_deep_chain():
+    task = ChainTask(index=0)
+    for index in range(1, 2000):
+        task = ChainTask(index=index, upstream=(task,))
+
+    # Upstream IDs are computed iteratively (no RecursionError) and then reused
+    assert task.id == _get_task_id_from_jsonable(_get_task_id_jsonable(task))
+    assert "id" in task.upstream[0].__dict__
+
+
+def test_id_independent_of_cached_upstream_ids():
+    fresh = WithNestedTask(task=BasicTask(a=1))
+    upstream = BasicTask(a=1)
+    _ = upstream.id
+    with_cached_upstream = WithNestedTask(task=upstream)
+
+    assert fresh.id == with_cached_upstream.id
+
+
+def _get_unmemoized_id(task: BaseTask) -> UUID:
+    """Hash a task (with no cached upstream IDs) by plain recursive serialization."""
+    return UUID(task.model_dump(mode="json", context={CONTEXT_MODE_KEY: "hash"})["id"])
+
+
+@pytest.mark.parametrize(
+    "make_task",
+    [
+        lambda: WithBaseTypedTasks(tasks=(BasicTask(a=1),)),
+        lambda: WithBaseTypedTasks(tasks=(ChainTask(index=1),)),
+        lambda: WithNestedTask(task=BasicTask(a=1)),
+        lambda: ChainTask(index=2, upstream=(ChainTask(index=1),)),
+    ],
+)
+def test_id_unchanged_by_memoization(make_task):
+    task = make_task()
+    expected = _get_unmemoized_id(make_task())
+
+    assert task.id == expected
+    # Hashed again, with all upstream IDs cached
+    task_copy = task.model_copy()
+    del task_copy.__dict__["id"]
+    assert _get_unmemoized_id(task_copy) == expected
+
+
 class TaskWithTarget(Task[InMemoryTarget[str]]):
     data: str = "hello world"
 
@@ -595,3 +650,39 @@ def test_from_registry(default_in_memory_fs_target):
     )
     loaded_task = MockTask.from_registry(id=task.id, registry=mock_registry)
     assert loaded_task == task
+
+
+def test_from_registry_resolves_refs():
+    leaf = ChainTask(index=0)
+    left = ChainTask(index=1, upstream=(leaf,))
+    right = ChainTask(index=2, upstream=(leaf,))
+    root = ChainTask(index=3, upstream=(left, right))
+
+    def metadata(task: ChainTask) -> TaskMetadata:
+        return TaskMetadata(
+            id=task.id,
+            body=model_dump_with_refs(task, {dep.id for dep in task.upstream}),
+            name=task.get_name(),
+            namespace=task.get_namespace(),
+            version=task.version,
+            output_uri=None,
+            status="completed",
+            registered_at=None,
+            started_at=None,
+            completed_at=None,
+            error_message=None,
+        )
+
+    metadata_by_id = {task.id: metadata(task) for task in [leaf, left, right, root]}
+    assert metadata_by_id[root.id].body["upstream"] == [
+        {"__ref": str(left.id)},
+        {"__ref": str(right.id)},
+    ]
+
+    mock_registry = Mock(spec=RegistryABC)
+    mock_registry.task_get_metadata.side_effect = metadata_by_id.__getitem__
+    loaded_task = ChainTask.from_registry(id=root.id, registry=mock_registry)
+
+    assert loaded_task == root
+    # The shared upstream task is fetched once
+    assert mock_registry.task_get_metadata.call_count == 4
@@ -17,17 +17,26 @@ from stardag import AutoTask, auto_namespace
 from stardag._core.task import _has_custom_run_aio
 from stardag.build import (
     BuildExitStatus,
+    BuildMetrics,
     DefaultExecutionModeSelector,
     FailMode,
     GlobalLockConfig,
     HybridConcurrentTaskExecutor,
     LockAcquisitionResult,
     LockAcquisitionStatus,
+    RoutedTaskExecutor,
     build,
     build_aio,
 )
+from stardag.build._concurrent import _PrioritySemaphore
 from stardag.registry import NoOpRegistry
-from stardag.target import InMemoryFileSystemTarget
+from stardag.target import (
+    InMemoryFileSystemTarget,
+    NoOpOutputCache,
+    OutputCache,
+    get_output_cache,
+    output_cache_provider,
+)
 from stardag.utils.testing.dynamic_deps_dag import (
     assert_dynamic_deps_task_complete_recursive,
     get_dynamic_deps_dag,
@@ -550,6 +559,706 @@ class TestBuildSummary:
         assert summary.task_count.previously_completed == 1
         assert summary.task_count.succeeded == 1
 
+    def test_metrics(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """Test run durations, ready-wait and pool usage in BuildMetrics."""
+        leaves = tuple(SlowTask(name=f"metrics_leaf_{i}", delay=0.05) for i in range(4))
+        root = SlowTask(name="metrics_root", delay=0.05, deps=leaves)
+        executor = HybridConcurrentTaskExecutor(max_thread_workers=2)
+
+        summary = build([root], task_executor=executor, registry=noop_registry)
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        metrics = summary.metrics
+        assert set(metrics.task_run_durations) == {t.id for t in (root, *leaves)}
+        assert all(d >= 0.05 for d in metrics.task_run_durations.values())
+        # Two of the leaves wait for a free thread worker
+        assert sum(metrics.task_ready_wait.values()) >= 0.1
+        assert metrics.peak_in_flight == 4
+        assert metrics.pool_capacity["thread"] == 2
+        assert metrics.peak_pool_usage("thread") == 2
+        assert 0.3 < metrics.pool_utilization("thread") <= 1.0
+        assert metrics.execution >= 0.15
+        assert "Pool thread" in metrics.report()
+
+    def test_metrics_pool_utilization(self):
+        """Test utilization as busy worker time over capacity and duration."""
+        metrics = BuildMetrics(
+            execution=2.0,
+            pool_capacity={"thread": 2},
+            pool_usage={"thread": [(0.0, 0), (0.0, 2), (1.0, 1), (2.0, 0)]},
+        )
+
+        assert metrics.pool_utilization("thread") == 0.75
+        assert metrics.peak_pool_usage("thread") == 2
+        assert metrics.pool_utilization("process") == 0.0
+
+
+# ============================================================================
+# Test: Ready-queue scheduling
+# ============================================================================
+
+
+class TestReadyQueueScheduling:
+    """Tests for incremental (indegree + reverse dependency index) scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_layered_dag_executes_each_task_once(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """Each task in a layered DAG with shared deps runs exactly once."""
+        reset_execution_counts()
+        width, depth = 10, 4
+        layer = [DiamondTask(name=f"0_{i}", test_id="layered") for i in range(width)]
+        for level in range(1, depth):
+            layer = [
+                DiamondTask(
+                    name=f"{level}_{i}",
+                    test_id="layered",
+                    deps=(layer[i], layer[(i + 1) % width]),
+                )
+                for i in range(width)
+            ]
+
+        summary = await build_aio(layer, registry=noop_registry)
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert summary.task_count.discovered == width * depth
+        assert summary.task_count.succeeded == width * depth
+        for level in range(depth):
+            for i in range(width):
+                assert get_execution_count("layered", f"{level}_{i}") == 1
+
+    @pytest.mark.asyncio
+    async def test_dynamic_deps_already_complete(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """A task yielding only complete deps is resumed without waiting."""
+        reset_execution_counts()
+        dep = DynamicDiamondTask(name="dep", test_id="dyn_complete")
+        dep.output().save("dep:pre")
+        root = DynamicDiamondTask(
+            name="root", test_id="dyn_complete", dynamic_task_deps=(dep,)
+        )
+
+        summary = await build_aio([root], registry=noop_registry)
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert root.complete()
+        assert get_execution_count("dyn_complete", "dep") == 0
+        assert summary.task_count.previously_completed == 1
+
+
+class TestPriorityScheduling:
+    """Tests for critical-path-first ordering of ready tasks."""
+
+    @pytest.mark.asyncio
+    async def test_remaining_path_is_cost_weighted(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """The selector gets the cost-weighted longest path to the root."""
+        remaining_paths: dict[str, float] = {}
+
+        class PathTask(AutoTask[str]):
+            name: str
+            deps: tuple[AutoTask, ...] = ()
+
+            def requires(self):
+                return self.deps
+
+            def run(self):
+                self.output().save(self.name)
+
+        class SlowPathTask(PathTask):
+            cost_hint: typing.ClassVar[float] = 3.0
+
+        def selector(task, remaining_path: float) -> float:
+            remaining_paths[task.name] = remaining_path
+            return remaining_path
+
+        leaf = PathTask(name="leaf")
+        middle = SlowPathTask(name="middle", deps=(leaf,))
+        other = PathTask(name="other")
+        root = PathTask(name="root", deps=(middle, other, leaf))
+
+        summary = await build_aio(
+            [root], registry=noop_registry, task_priority_selector=selector
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert remaining_paths == {
+            "root": 1.0,
+            "middle": 4.0,
+            "other": 2.0,
+            "leaf": 5.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_priority_attribute_orders_ready_tasks(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """Ready tasks are run in order of their `priority` attribute."""
+        execution_order: list[int] = []
+
+        class PrioritizedTask(AutoTask[int]):
+            priority: int
+            deps: tuple[AutoTask, ...] = ()
+
+            def requires(self):
+                return self.deps
+
+            def run(self):
+                execution_order.append(self.priority)
+                self.output().save(self.priority)
+
+        leaves = tuple(PrioritizedTask(priority=p) for p in (1, 5, 3, 4, 2))
+        root = PrioritizedTask(priority=0, deps=leaves)
+
+        summary = await build_aio(
+            [root],
+            task_executor=HybridConcurrentTaskExecutor(max_thread_workers=1),
+            registry=noop_registry,
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert execution_order == [5, 4, 3, 2, 1, 0]
+
+    @pytest.mark.asyncio
+    async def test_priority_semaphore_wakes_highest_priority_first(self):
+        semaphore = _PrioritySemaphore(1)
+        await semaphore.acquire()
+        acquired: list[float] = []
+
+        async def acquire(priority: float) -> None:
+            async with semaphore.slot(priority):
+                acquired.append(priority)
+
+        waiters = [asyncio.create_task(acquire(p)) for p in (1.0, 3.0, 2.0, 3.0)]
+        cancelled = asyncio.create_task(acquire(10.0))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        semaphore.release()
+        await asyncio.gather(*waiters)
+
+        assert acquired == [3.0, 3.0, 2.0, 1.0]
+
+
+class TestResourcePools:
+    """Tests for gating task submission on resource pools."""
+
+    @staticmethod
+    def make_task_class(started: list[str], memory_in_use: list[float]):
+        class ResourceTask(AutoTask[str]):
+            name: str
+            memory: float = 0.0
+            priority: int = 0
+            deps: tuple[AutoTask, ...] = ()
+
+            @property
+            def resources(self) -> dict[str, float]:
+                return {"memory": self.memory}
+
+            def requires(self):
+                return self.deps
+
+            async def run_aio(self):
+                started.append(self.name)
+                memory_in_use.append(memory_in_use[-1] + self.memory)
+                await asyncio.sleep(0.05)
+                memory_in_use.append(memory_in_use[-1] - self.memory)
+                self.output().save(self.name)
+
+        return ResourceTask
+
+    @pytest.mark.asyncio
+    async def test_tasks_that_dont_fit_are_skipped_over(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        started: list[str] = []
+        memory_in_use = [0.0]
+        ResourceTask = self.make_task_class(started, memory_in_use)
+        leaves = (
+            ResourceTask(name="big_1", memory=0.75, priority=10),
+            ResourceTask(name="big_2", memory=0.75, priority=9),
+            *(
+                ResourceTask(name=f"small_{i}", memory=0.25, priority=1)
+                for i in range(3)
+            ),
+        )
+        root = ResourceTask(name="root", deps=leaves)
+
+        summary = await build_aio(
+            [root], registry=noop_registry, resource_pools={"memory": 1.0}
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        # big_2 does not fit next to big_1, but small_0 does
+        assert started[:2] == ["big_1", "small_0"]
+        assert max(memory_in_use) == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_route_pools(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        started: list[str] = []
+        memory_in_use = [0.0]
+        ResourceTask = self.make_task_class(started, memory_in_use)
+        root = ResourceTask(
+            name="root",
+            deps=tuple(ResourceTask(name=f"{i}", memory=0.5) for i in range(4)),
+        )
+        executor = RoutedTaskExecutor(
+            executors={"local": HybridConcurrentTaskExecutor()},
+            router=lambda task: "local",
+            resource_pools={"local": {"memory": 0.5}},
+        )
+
+        summary = await build_aio(
+            [root], task_executor=executor, registry=noop_registry
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert max(memory_in_use) == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_task_exceeding_capacity_fails(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        ResourceTask = self.make_task_class([], [0.0])
+        task = ResourceTask(name="too_big", memory=2.0)
+
+        summary = await build_aio(
+            [task], registry=noop_registry, resource_pools={"memory": 1.0}
+        )
+
+        assert summary.status == BuildExitStatus.FAILURE
+        assert "resource pool(s) ['memory']" in str(summary.error)
+
+
+class TestBatchedCompletionChecks:
+    """Tests for bulk existence checks of plain file outputs during discovery."""
+
+    @pytest.mark.asyncio
+    async def test_sibling_checks_are_batched(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Outputs of the deps of a task are checked in one exists_many call."""
+        batches: list[list[str]] = []
+        exists_many_aio = InMemoryFileSystemTarget.exists_many_aio
+
+        async def counting_exists_many_aio(uris) -> dict[str, bool]:
+            batches.append(list(uris))
+            return await exists_many_aio(uris)
+
+        monkeypatch.setattr(
+            InMemoryFileSystemTarget, "exists_many_aio", counting_exists_many_aio
+        )
+
+        leaves = tuple(
+            DiamondTask(name=f"leaf_{i}", test_id="batched") for i in range(20)
+        )
+        for leaf in leaves[:10]:
+            leaf.output().save("pre")
+        root = DiamondTask(name="root", test_id="batched", deps=leaves)
+
+        summary = await build_aio([root], registry=noop_registry)
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert summary.task_count.previously_completed == 10
+        assert summary.task_count.succeeded == 11
+        assert [len(batch) for batch in batches] == [1, 20]
+
+
+class TestDiscoveryWorkers:
+    """Tests for discovery by a bounded pool of worker coroutines."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pipelined_discovery", [False, True])
+    async def test_asyncio_tasks_bounded_by_workers(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+        pipelined_discovery: bool,
+    ):
+        """The number of asyncio tasks does not grow with the width of the DAG."""
+        max_tasks_alive = 0
+        checking = 0
+        max_checking = 0
+
+        class CountingTask(AutoTask[str]):
+            name: str
+            deps: tuple["CountingTask", ...] = ()
+
+            def requires(self):
+                return self.deps
+
+            async def complete_aio(self) -> bool:
+                nonlocal max_tasks_alive, checking, max_checking
+                max_tasks_alive = max(max_tasks_alive, len(asyncio.all_tasks()))
+                checking += 1
+                max_checking = max(max_checking, checking)
+                await asyncio.sleep(0.001)
+                checking -= 1
+                return await super().complete_aio()
+
+            def run(self):
+                self.output().save(self.name)
+
+        shared = CountingTask(name="shared")
+        mids = tuple(CountingTask(name=f"mid_{i}", deps=(shared,)) for i in range(200))
+        root = CountingTask(name="root", deps=mids)
+
+        summary = await build_aio(
+            [root],
+            registry=noop_registry,
+            max_concurrent_discover=4,
+            pipelined_discovery=pipelined_discovery,
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert summary.task_count.discovered == 202
+        assert summary.task_count.succeeded == 202
+        assert max_checking == 4
+        assert max_tasks_alive < 20
+
+
+class TestPipelinedDiscovery:
+    """Tests for executing tasks while the DAG is still being discovered."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pipelined_discovery", [False, True])
+    async def test_execution_overlaps_discovery(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+        pipelined_discovery: bool,
+    ):
+        """A ready leaf runs while a sibling's completion check is in progress."""
+        events: list[str] = []
+
+        class SlowCheckTask(AutoTask[str]):
+            name: str
+            check_delay: float = 0.0
+            deps: tuple["SlowCheckTask", ...] = ()
+
+            def requires(self):
+                return self.deps
+
+            async def complete_aio(self) -> bool:
+                await asyncio.sleep(self.check_delay)
+                events.append(f"checked {self.name}")
+                return await super().complete_aio()
+
+            def run(self):
+                events.append(f"run {self.name}")
+                self.output().save(self.name)
+
+        fast = SlowCheckTask(name="fast")
+        slow = SlowCheckTask(name="slow", check_delay=0.3)
+        root = SlowCheckTask(name="root", deps=(fast, slow))
+
+        summary = await build_aio(
+            [root], registry=noop_registry, pipelined_discovery=pipelined_discovery
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert summary.task_count.discovered == 3
+        assert summary.task_count.succeeded == 3
+        assert events.index("run root") > events.index("run slow")
+        if pipelined_discovery:
+            assert events.index("run fast") < events.index("checked slow")
+        else:
+            assert events.index("run fast") > events.index("checked slow")
+
+    @pytest.mark.asyncio
+    async def test_previously_completed_tasks(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """Complete deps are counted and not executed, their dependents are."""
+        reset_execution_counts()
+        shared = DiamondTask(name="shared", test_id="pipelined")
+        shared.output().save("shared:pre")
+        left = DiamondTask(name="left", test_id="pipelined", deps=(shared,))
+        right = DiamondTask(name="right", test_id="pipelined", deps=(shared,))
+        root = DiamondTask(name="root", test_id="pipelined", deps=(left, right))
+
+        summary = await build_aio(
+            [root], registry=noop_registry, pipelined_discovery=True
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert summary.task_count.discovered == 4
+        assert summary.task_count.previously_completed == 1
+        assert summary.task_count.succeeded == 3
+        assert get_execution_count("pipelined", "shared") == 0
+        for name in ("left", "right", "root"):
+            assert get_execution_count("pipelined", name) == 1
+
+    @pytest.mark.asyncio
+    async def test_dynamic_deps(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """Dynamic deps are discovered and built with pipelined discovery."""
+        dag = get_dynamic_deps_dag()
+
+        summary = await build_aio(
+            [dag], registry=noop_registry, pipelined_discovery=True
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert_dynamic_deps_task_complete_recursive(dag, True)
+
+    @pytest.mark.asyncio
+    async def test_discovery_failure_fails_build(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """An exception during discovery fails the build."""
+
+        class BrokenRequiresTask(AutoTask[str]):
+            def requires(self):
+                raise ValueError("broken requires")
+
+            def run(self):
+                self.output().save("never")
+
+        root = SyncOnlyTask(name="pipelined_root", deps=(BrokenRequiresTask(),))
+
+        summary = await build_aio(
+            [root], registry=noop_registry, pipelined_discovery=True
+        )
+
+        assert summary.status == BuildExitStatus.FAILURE
+        assert not root.complete()
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_pending_registrations(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+    ):
+        """Registrations of previously completed tasks don't outlive the build."""
+        registering = asyncio.Event()
+        cancelled = False
+
+        class HangingRegistry(NoOpRegistry):
+            async def task_register_aio(self, build_id, task) -> None:
+                nonlocal cancelled
+                registering.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
+
+        class BrokenCheckTask(AutoTask[str]):
+            async def complete_aio(self) -> bool:
+                # Fail once the registration is in progress
+                await registering.wait()
+                raise ValueError("broken complete check")
+
+            def run(self):
+                self.output().save("never")
+
+        done = DiamondTask(name="done", test_id="pipelined_registration")
+        done.output().save("done:pre")
+        root = SyncOnlyTask(
+            name="pipelined_registration_root", deps=(done, BrokenCheckTask())
+        )
+
+        summary = await build_aio(
+            [root], registry=HangingRegistry(), pipelined_discovery=True
+        )
+
+        assert summary.status == BuildExitStatus.FAILURE
+        assert cancelled
+
+
+class TestOutputCache:
+    """Tests for the build-scoped cache of loaded task outputs."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("copy_on_read", [False, True])
+    async def test_shared_input_loaded_once(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+        copy_on_read: bool,
+    ):
+        """Concurrent consumers of an output share a single load."""
+        loaded: list[list[int]] = []
+
+        class Upstream(AutoTask[list[int]]):
+            def run(self):
+                self.output().save([1, 2, 3])
+
+        class Consumer(AutoTask[int]):
+            index: int
+            upstream: Upstream
+
+            def requires(self):
+                return self.upstream
+
+            def run(self):
+                values = self.upstream.output().load()
+                loaded.append(values)
+                values.append(self.index)
+                self.output().save(len(values))
+
+        upstream = Upstream()
+        consumers = [Consumer(index=i, upstream=upstream) for i in range(10)]
+        output_cache = OutputCache(max_bytes=2**20, copy_on_read=copy_on_read)
+
+        summary = await build_aio(
+            consumers, registry=noop_registry, output_cache=output_cache
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert summary.output_cache is output_cache.stats
+        assert summary.output_cache.misses == 1
+        assert summary.output_cache.hits == 9
+        assert "Output cache: 9 hits, 1 misses" in repr(summary)
+        if copy_on_read:
+            assert len({id(values) for values in loaded}) == 10
+            assert all(c.output().load() == 4 for c in consumers)
+        else:
+            assert all(values is loaded[0] for values in loaded)
+        # Scoped to the build
+        assert len(output_cache) == 0
+        assert isinstance(output_cache_provider.get(), NoOpOutputCache)
+        assert upstream.output().load() is not upstream.output().load()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_builds_use_own_cache(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """The cache of a build is only used by the tasks of that build."""
+
+        class Upstream(AutoTask[str]):
+            name: str
+
+            def run(self):
+                self.output().save(self.name)
+
+        class Consumer(AutoTask[str]):
+            index: int
+            upstream: Upstream
+
+            def requires(self):
+                return self.upstream
+
+            def run(self):
+                # Overlap with the tasks of the other build
+                time.sleep(0.01)
+                self.output().save(self.upstream.output().load())
+
+        output_caches = [OutputCache(max_bytes=2**20) for _ in range(2)]
+        summaries = await asyncio.gather(
+            *(
+                build_aio(
+                    [
+                        Consumer(index=i, upstream=Upstream(name=f"build_{build}"))
+                        for i in range(5)
+                    ],
+                    registry=noop_registry,
+                    output_cache=output_cache,
+                )
+                for build, output_cache in enumerate(output_caches)
+            )
+        )
+
+        for summary, output_cache in zip(summaries, output_caches):
+            assert summary.status == BuildExitStatus.SUCCESS
+            assert summary.output_cache is output_cache.stats
+            assert summary.output_cache.misses == 1
+            assert summary.output_cache.hits == 4
+            assert len(output_cache) == 0
+        assert isinstance(output_cache_provider.get(), NoOpOutputCache)
+        assert isinstance(get_output_cache(), NoOpOutputCache)
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+        noop_registry,
+    ):
+        """Without an output cache, no cache stats are reported."""
+        summary = await build_aio(
+            [SyncOnlyTask(name="no_output_cache")], registry=noop_registry
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert summary.output_cache is None
+        assert "Output cache" not in repr(summary)
+
+
+class TestPreviouslyCompletedRegistration:
+    """Tests for registration of tasks found complete during discovery."""
+
+    @pytest.mark.asyncio
+    async def test_registration_is_concurrent_and_bounded(
+        self,
+        default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+    ):
+        """Previously completed tasks are registered with bounded concurrency."""
+
+        class SlowRegistry(NoOpRegistry):
+            def __init__(self) -> None:
+                self.registered: list[str] = []
+                self.in_flight = 0
+                self.peak_in_flight = 0
+
+            async def task_register_aio(self, build_id, task) -> None:
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                self.registered.append(task.name)
+
+        leaves = tuple(
+            DiamondTask(name=f"leaf_{i}", test_id="prev_completed") for i in range(20)
+        )
+        for leaf in leaves:
+            leaf.output().save("pre")
+        root = DiamondTask(name="root", test_id="prev_completed", deps=leaves)
+        registry = SlowRegistry()
+
+        summary = await build_aio([root], registry=registry, max_concurrent_register=5)
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert summary.task_count.previously_completed == 20
+        assert sorted(registry.registered[:20]) == sorted(leaf.name for leaf in leaves)
+        assert registry.peak_in_flight == 5
+        # 20 registrations of 10ms each would take at least 0.2s serially
+        assert summary.timings.registration < 0.2
+        assert summary.timings.discovery > 0
+
 
 # ============================================================================
 # Test: Diamond DAG Patterns (Concurrent)
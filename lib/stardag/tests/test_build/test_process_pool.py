@@ -0,0 +1,93 @@
+"""Tests for the warm, reusable process pool."""
+
+import pickle
+
+import pytest
+
+from stardag import AutoTask, TaskLoads
+from stardag.build import (
+    BuildExitStatus,
+    DefaultExecutionModeSelector,
+    HybridConcurrentTaskExecutor,
+    WarmProcessPool,
+    build_aio,
+)
+from stardag.build._process_pool import dump_task, load_task
+from stardag.utils.testing.dynamic_deps_dag import (
+    assert_dynamic_deps_task_complete_recursive,
+    get_dynamic_deps_dag,
+)
+from stardag.utils.testing.helper_tasks import DiamondTask
+
+
+class _PayloadLeaf(AutoTask[str]):
+    name: str
+
+    def run(self):
+        self.output().save(self.name)
+
+
+class _PayloadRoot(AutoTask[str]):
+    upstream: TaskLoads[str]
+
+    def run(self):
+        self.output().save(self.upstream.output().load())
+
+
+def test_dump_and_load_task():
+    leaf = _PayloadLeaf(name="leaf")
+    task = _PayloadRoot(upstream=leaf)
+
+    payload = dump_task(task)
+    loaded = load_task(pickle.loads(pickle.dumps(payload)))
+
+    assert loaded == task
+    assert loaded.id == task.id
+    assert loaded.upstream.id == leaf.id
+
+
+def test_dump_and_load_task_not_restorable_from_json():
+    # `deps` is annotated with the base class AutoTask, without Polymorphic
+    leaf = DiamondTask(name="leaf", test_id="payload")
+    task = DiamondTask(name="root", test_id="payload", deps=(leaf,))
+
+    payload = dump_task(task)
+    loaded = load_task(pickle.loads(pickle.dumps(payload)))
+
+    assert loaded == task
+    assert loaded.deps[0].id == leaf.id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compact_transfer", [False, True])
+async def test_warm_process_pool_is_reused_across_builds(
+    default_local_target_tmp_path,
+    noop_registry,
+    compact_transfer: bool,
+):
+    with WarmProcessPool(
+        max_workers=2, preload_modules=["json"], compact_transfer=compact_transfer
+    ) as pool:
+        executor = HybridConcurrentTaskExecutor(
+            execution_mode_selector=DefaultExecutionModeSelector(
+                sync_run_default="process"
+            ),
+            process_pool=pool,
+        )
+        assert executor.max_process_workers == 2
+
+        leaf = DiamondTask(name="leaf", test_id="warm_pool")
+        summary = await build_aio(
+            [leaf], task_executor=executor, registry=noop_registry
+        )
+        assert summary.status == BuildExitStatus.SUCCESS
+        process_pool_executor = pool.executor
+
+        # Dynamic deps (re-execution from the returned deps) with the same workers
+        dag = get_dynamic_deps_dag()
+        summary = await build_aio([dag], task_executor=executor, registry=noop_registry)
+        assert summary.status == BuildExitStatus.SUCCESS
+        assert_dynamic_deps_task_complete_recursive(dag, True)
+        assert pool.executor is process_pool_executor
+
+    assert pool._executor is None
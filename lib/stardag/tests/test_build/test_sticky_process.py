@@ -0,0 +1,81 @@
+"""Tests for sticky process workers (tasks with dynamic deps are resumed)."""
+
+import pytest
+
+from stardag.build import (
+    BuildExitStatus,
+    DefaultExecutionModeSelector,
+    HybridConcurrentTaskExecutor,
+    StickyProcessPool,
+    build_aio,
+)
+from stardag.utils.testing.dynamic_deps_dag import (
+    DynamicDepsTask,
+    assert_dynamic_deps_task_complete_recursive,
+    get_dynamic_deps_dag,
+)
+
+
+@pytest.mark.asyncio
+async def test_sticky_process_pool_resumes_suspended_task(
+    default_local_target_tmp_path,
+):
+    dynamic_deps = (DynamicDepsTask(value="a"), DynamicDepsTask(value="b"))
+    task = DynamicDepsTask(value="parent", dynamic_deps=dynamic_deps)
+
+    pool = StickyProcessPool(max_workers=2)
+    pool.start()
+    try:
+        deps = await pool.submit(task)
+        assert deps is not None
+        assert {dep.id for dep in deps} == {dep.id for dep in dynamic_deps}  # type: ignore
+        assert task.id in pool._affinity
+        assert not task.complete()
+
+        for dep in dynamic_deps:
+            assert await pool.submit(dep) is None
+
+        # Resumed in the worker holding the generator, not re-executed
+        assert await pool.submit(task) is None
+        assert task.id not in pool._affinity
+        assert task.complete()
+    finally:
+        pool.close()
+
+
+@pytest.mark.asyncio
+async def test_sticky_process_pool_raises_task_exception(
+    default_local_target_tmp_path,
+):
+    # The dynamic deps contract is violated: deps are not built before resuming
+    task = DynamicDepsTask(
+        value="parent", dynamic_deps=(DynamicDepsTask(value="missing"),)
+    )
+    pool = StickyProcessPool(max_workers=1)
+    pool.start()
+    try:
+        assert await pool.submit(task) is not None
+        with pytest.raises(AssertionError, match="contract violated"):
+            await pool.submit(task)
+        assert task.id not in pool._affinity
+    finally:
+        pool.close()
+
+
+@pytest.mark.asyncio
+async def test_build_with_sticky_process_workers(
+    default_local_target_tmp_path,
+    noop_registry,
+):
+    executor = HybridConcurrentTaskExecutor(
+        execution_mode_selector=DefaultExecutionModeSelector(
+            sync_run_default="sticky_process"
+        ),
+        max_sticky_process_workers=2,
+    )
+    dag = get_dynamic_deps_dag()
+    summary = await build_aio([dag], task_executor=executor, registry=noop_registry)
+
+    assert summary.status == BuildExitStatus.SUCCESS
+    assert_dynamic_deps_task_complete_recursive(dag, True)
+    assert executor._sticky_pool is None
@@ -0,0 +1,130 @@
+"""Tests for per-task span tracing of builds."""
+
+import json
+import typing
+
+import pytest
+
+from stardag.build import (
+    BuildExitStatus,
+    BuildTracer,
+    NoOpTracer,
+    build_aio,
+    build_sequential,
+)
+from stardag.target import InMemoryFileSystemTarget
+from stardag.utils.testing.helper_tasks import DynamicDiamondTask
+
+
+def _get_dynamic_dag(test_id: str) -> DynamicDiamondTask:
+    dynamic = DynamicDiamondTask(name="dynamic", test_id=test_id)
+    static = DynamicDiamondTask(name="static", test_id=test_id)
+    return DynamicDiamondTask(
+        name="root",
+        test_id=test_id,
+        static_task_deps=(static,),
+        dynamic_task_deps=(dynamic,),
+    )
+
+
+def _span_names(tracer: BuildTracer, task_id=None) -> set[str]:
+    return {span.name for span in tracer.spans if span.task_id == task_id}
+
+
+@pytest.mark.asyncio
+async def test_build_aio_records_task_spans(
+    default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+    noop_registry,
+):
+    root = _get_dynamic_dag("tracing_concurrent")
+    tracer = BuildTracer()
+
+    summary = await build_aio([root], registry=noop_registry, tracer=tracer)
+
+    assert summary.status == BuildExitStatus.SUCCESS
+    assert _span_names(tracer) == {"discovery", "registration"}
+    assert {
+        "discover",
+        "complete_check",
+        "registry",
+        "execute",
+        "queue_wait",
+        "run",
+        "suspend",
+    } <= _span_names(tracer, root.id)
+    registry_methods = {
+        span.attributes["method"]
+        for span in tracer.spans
+        if span.task_id == root.id and span.name == "registry"
+    }
+    assert {"task_start", "task_suspend", "task_resume", "task_complete"} <= (
+        registry_methods
+    )
+    for span in tracer.spans:
+        assert span.start_ns <= span.end_ns
+
+
+def test_build_sequential_records_task_spans(
+    default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+    noop_registry,
+):
+    root = _get_dynamic_dag("tracing_sequential")
+    tracer = BuildTracer()
+
+    summary = build_sequential([root], registry=noop_registry, tracer=tracer)
+
+    assert summary.status == BuildExitStatus.SUCCESS
+    assert {"discover", "complete_check", "registry", "run", "suspend"} <= (
+        _span_names(tracer, root.id)
+    )
+
+
+@pytest.mark.asyncio
+async def test_no_op_tracer_records_nothing(
+    default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+    noop_registry,
+):
+    tracer = NoOpTracer()
+    root = _get_dynamic_dag("tracing_noop")
+
+    summary = await build_aio([root], registry=noop_registry, tracer=tracer)
+
+    assert summary.status == BuildExitStatus.SUCCESS
+    assert tracer.spans == []
+
+
+def test_export_chrome_trace_and_otlp_json(
+    default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+    noop_registry,
+    tmp_path,
+):
+    root = _get_dynamic_dag("tracing_export")
+    tracer = BuildTracer()
+    build_sequential([root], registry=noop_registry, tracer=tracer)
+
+    tracer.export_chrome_trace(tmp_path / "trace.json")
+    chrome_trace = json.loads((tmp_path / "trace.json").read_text())
+    complete_events = [e for e in chrome_trace["traceEvents"] if e["ph"] == "X"]
+    assert len(complete_events) == len(tracer.spans)
+    track_names = {
+        e["args"]["name"] for e in chrome_trace["traceEvents"] if e["ph"] == "M"
+    }
+    # The build track plus one per task
+    assert len(track_names) == 4
+    assert all(e["dur"] >= 0 for e in complete_events)
+
+    tracer.export_otlp_json(tmp_path / "trace.otlp.json")
+    otlp = json.loads((tmp_path / "trace.otlp.json").read_text())
+    (resource_spans,) = otlp["resourceSpans"]
+    (scope_spans,) = resource_spans["scopeSpans"]
+    spans = scope_spans["spans"]
+    assert len(spans) == len(tracer.spans)
+    assert len({span["traceId"] for span in spans}) == 1
+    root_run = next(
+        span
+        for span in spans
+        if span["name"] == "run"
+        and {"key": "stardag.task.id", "value": {"stringValue": str(root.id)}}
+        in span["attributes"]
+    )
+    assert int(root_run["endTimeUnixNano"]) >= int(root_run["startTimeUnixNano"])
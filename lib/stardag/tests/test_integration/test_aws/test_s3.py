@@ -0,0 +1,419 @@
+import asyncio
+import io
+import re
+import typing
+from pathlib import Path
+
+import pytest
+
+try:
+    from botocore.exceptions import ClientError
+
+    from stardag.integration.aws.s3 import S3FileSystem
+
+    s3_available = True
+except ImportError:
+    ClientError = Exception
+    S3FileSystem = None
+    s3_available = False
+
+from stardag.target import (
+    CachedRemoteFileSystem,
+    RemoteFileSystemTarget,
+    Serializable,
+    SQLiteCompletionIndex,
+    completion_index_provider,
+)
+from stardag.target.serialize import JSONSerializer
+
+pytestmark = pytest.mark.skipif(not s3_available, reason="S3 extras not installed")
+
+
+def _client_error(code: str, operation_name: str) -> ClientError:
+    return ClientError({"Error": {"Code": code}}, operation_name)
+
+
+class StubS3Client:
+    """Serves `objects` by (bucket, key) and records the requests.
+
+    Listings return `page_size` keys per page, and are denied if `list_denied`.
+    In the "forbidden" bucket, all requests are denied.
+    """
+
+    def __init__(self, objects: dict[tuple[str, str], bytes]) -> None:
+        self.objects = objects
+        self.page_size = 1000
+        self.list_denied = False
+        self.requests: list[tuple[str, dict]] = []
+
+    def _get(self, bucket: str, key: str, operation_name: str) -> bytes:
+        if bucket == "forbidden":
+            raise _client_error("403", operation_name)
+        if (bucket, key) not in self.objects:
+            raise _client_error("404", operation_name)
+        return self.objects[(bucket, key)]
+
+    def head_object(self, Bucket: str, Key: str) -> dict:
+        self.requests.append(("head_object", {"Bucket": Bucket, "Key": Key}))
+        return {"ContentLength": len(self._get(Bucket, Key, "HeadObject"))}
+
+    def get_object(self, Bucket: str, Key: str, Range: str) -> dict:
+        self.requests.append(
+            ("get_object", {"Bucket": Bucket, "Key": Key, "Range": Range})
+        )
+        data = self._get(Bucket, Key, "GetObject")
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", Range)
+        assert match is not None
+        first, last = int(match[1]), int(match[2])
+        return {"Body": io.BytesIO(data[first : last + 1])}
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str, Config=None) -> None:
+        self.requests.append(("upload_file", {"Bucket": Bucket, "Key": Key}))
+        self.objects[(Bucket, Key)] = Path(Filename).read_bytes()
+
+    def download_file(self, Bucket: str, Key: str, Filename: str, Config=None) -> None:
+        self.requests.append(("download_file", {"Bucket": Bucket, "Key": Key}))
+        Path(Filename).write_bytes(self._get(Bucket, Key, "HeadObject"))
+
+    def list_objects_v2(
+        self, Bucket: str, Prefix: str, Delimiter: str, StartAfter: str = ""
+    ) -> dict:
+        self.requests.append(("list_objects_v2", {"Bucket": Bucket, "Prefix": Prefix}))
+        if self.list_denied:
+            raise _client_error("AccessDenied", "ListObjectsV2")
+        keys = sorted(
+            key
+            for bucket, key in self.objects
+            if bucket == Bucket
+            and key.startswith(Prefix)
+            and key > StartAfter
+            # Keys in "subdirectories" are grouped as common prefixes
+            and Delimiter not in key[len(Prefix) :]
+        )
+        return {
+            "Contents": [{"Key": key} for key in keys[: self.page_size]],
+            "IsTruncated": len(keys) > self.page_size,
+        }
+
+
+class StubAsyncS3Client:
+    """Async version of (and sharing the objects of) a `StubS3Client`."""
+
+    def __init__(self, s3_client: StubS3Client) -> None:
+        self.s3_client = s3_client
+        self.closed = False
+
+    async def head_object(self, Bucket: str, Key: str) -> dict:
+        return self.s3_client.head_object(Bucket=Bucket, Key=Key)
+
+    async def upload_file(
+        self, Filename: str, Bucket: str, Key: str, Config=None
+    ) -> None:
+        self.s3_client.upload_file(Filename, Bucket, Key, Config=Config)
+
+    async def download_file(
+        self, Bucket: str, Key: str, Filename: str, Config=None
+    ) -> None:
+        self.s3_client.download_file(Bucket, Key, Filename, Config=Config)
+
+    def get_paginator(self, operation_name: str) -> "StubAsyncS3Client":
+        assert operation_name == "list_objects_v2"
+        return self
+
+    async def paginate(
+        self, Bucket: str, Prefix: str, Delimiter: str
+    ) -> typing.AsyncGenerator[dict, None]:
+        start_after = ""
+        while True:
+            page = self.s3_client.list_objects_v2(
+                Bucket=Bucket,
+                Prefix=Prefix,
+                Delimiter=Delimiter,
+                StartAfter=start_after,
+            )
+            yield page
+            if not page["IsTruncated"]:
+                return
+            start_after = page["Contents"][-1]["Key"]
+
+
+class StubAioboto3Session:
+    """Creates stub async clients and records them."""
+
+    def __init__(self, s3_client: StubS3Client) -> None:
+        self.s3_client = s3_client
+        self.clients: list[StubAsyncS3Client] = []
+
+    def client(self, service_name: str, **kwargs) -> typing.AsyncContextManager:
+        client = StubAsyncS3Client(self.s3_client)
+        self.clients.append(client)
+
+        class ClientContext:
+            async def __aenter__(self) -> StubAsyncS3Client:
+                return client
+
+            async def __aexit__(self, *exc_info) -> None:
+                client.closed = True
+
+        return ClientContext()
+
+
+DATA = bytes(range(100))
+
+
+@pytest.fixture
+def s3_client() -> StubS3Client:
+    return StubS3Client({("bucket", "dir/file"): DATA})
+
+
+@pytest.fixture
+def aioboto3_session(s3_client: StubS3Client) -> StubAioboto3Session:
+    return StubAioboto3Session(s3_client)
+
+
+@pytest.fixture
+def file_system(
+    s3_client: StubS3Client, aioboto3_session: StubAioboto3Session
+) -> S3FileSystem:
+    return S3FileSystem(
+        s3_client=s3_client,  # type: ignore
+        aioboto3_session=aioboto3_session,  # type: ignore
+        stream_buffer_size=16,
+    )
+
+
+def test_size(file_system: S3FileSystem):
+    assert file_system.size("s3://bucket/dir/file") == len(DATA)
+
+    with pytest.raises(FileNotFoundError):
+        file_system.size("s3://bucket/dir/missing")
+    with pytest.raises(ClientError):
+        file_system.size("s3://forbidden/dir/file")
+
+
+def test_read_range(file_system: S3FileSystem, s3_client: StubS3Client):
+    uri = "s3://bucket/dir/file"
+    assert file_system.read_range(uri, 10, 20) == DATA[10:20]
+    # The Range header is inclusive of the last byte
+    assert s3_client.requests == [
+        ("get_object", {"Bucket": "bucket", "Key": "dir/file", "Range": "bytes=10-19"})
+    ]
+    assert file_system.read_range(uri, 99, 100) == DATA[99:]
+
+    # Empty ranges make no request
+    s3_client.requests.clear()
+    assert file_system.read_range(uri, 5, 5) == b""
+    assert file_system.read_range(uri, 5, 4) == b""
+    assert s3_client.requests == []
+
+    with pytest.raises(FileNotFoundError):
+        file_system.read_range("s3://bucket/dir/missing", 0, 10)
+    with pytest.raises(ClientError):
+        file_system.read_range("s3://forbidden/dir/file", 0, 10)
+
+
+@pytest.mark.asyncio
+async def test_download(file_system: S3FileSystem, tmp_path: Path):
+    file_system.download("s3://bucket/dir/file", tmp_path / "file")
+    assert (tmp_path / "file").read_bytes() == DATA
+    await file_system.download_aio("s3://bucket/dir/file", tmp_path / "file-aio")
+    assert (tmp_path / "file-aio").read_bytes() == DATA
+
+    with pytest.raises(FileNotFoundError):
+        file_system.download("s3://bucket/dir/missing", tmp_path / "missing")
+    with pytest.raises(FileNotFoundError):
+        await file_system.download_aio("s3://bucket/dir/missing", tmp_path / "missing")
+    with pytest.raises(ClientError):
+        file_system.download("s3://forbidden/dir/file", tmp_path / "forbidden")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cached", [False, True])
+@pytest.mark.parametrize("use_aio", [False, True])
+async def test_missing_output_is_removed_from_completion_index(
+    file_system: S3FileSystem,
+    s3_client: StubS3Client,
+    tmp_path: Path,
+    cached: bool,
+    use_aio: bool,
+):
+    rfs = (
+        CachedRemoteFileSystem(wrapped=file_system, root=str(tmp_path / "cache"))
+        if cached
+        else file_system
+    )
+    uri = "s3://bucket/dir/output.json"
+    output = Serializable(RemoteFileSystemTarget(uri, rfs), JSONSerializer(str))
+    completion_index = SQLiteCompletionIndex(tmp_path / "completion-index.sqlite")
+    with completion_index_provider.override(completion_index):
+        # Saved elsewhere, so that the object is not in the local cache
+        Serializable(
+            RemoteFileSystemTarget(uri, file_system), JSONSerializer(str)
+        ).save("a")
+        assert completion_index.contains(uri)
+
+        # Deleted from storage, e.g. by a lifecycle rule
+        del s3_client.objects[("bucket", "dir/output.json")]
+        with pytest.raises(FileNotFoundError):
+            await output.load_aio() if use_aio else output.load()
+        assert not completion_index.contains(uri)
+    completion_index.close()
+
+
+def test_open_stream(file_system: S3FileSystem, s3_client: StubS3Client):
+    target = RemoteFileSystemTarget("s3://bucket/dir/file", file_system)
+    with target.open("rb") as handle:
+        assert handle.read(4) == DATA[:4]
+        handle.seek(50)
+        assert handle.read() == DATA[50:]
+
+    ranges = [
+        request["Range"] for name, request in s3_client.requests if name == "get_object"
+    ]
+    # Read-ahead of `stream_buffer_size` bytes, then the rest in one request
+    assert ranges == ["bytes=0-15", "bytes=50-99"]
+
+
+def test_async_client_closed_with_event_loop(
+    file_system: S3FileSystem, aioboto3_session: StubAioboto3Session
+):
+    async def use_client() -> None:
+        client = await file_system._get_async_client()
+        assert await file_system._get_async_client() is client
+        assert not client.closed  # type: ignore
+
+    asyncio.run(use_client())
+    asyncio.run(use_client())
+
+    # One client per event loop, closed when the loop shuts down
+    assert len(aioboto3_session.clients) == 2
+    assert all(client.closed for client in aioboto3_session.clients)
+    assert len(file_system._async_clients) == 0
+
+
+@pytest.mark.asyncio
+async def test_aclose(
+    file_system: S3FileSystem, aioboto3_session: StubAioboto3Session, tmp_path: Path
+):
+    cached = CachedRemoteFileSystem(wrapped=file_system, root=str(tmp_path))
+    await file_system._get_async_client()
+    await cached.aclose()
+    assert [client.closed for client in aioboto3_session.clients] == [True]
+
+    # A new client is created on next use
+    await file_system._get_async_client()
+    await file_system.aclose()
+    assert [client.closed for client in aioboto3_session.clients] == [True, True]
+
+
+def _requests_by_name(s3_client: StubS3Client) -> dict[str, list[dict]]:
+    requests: dict[str, list[dict]] = {}
+    for name, request in s3_client.requests:
+        requests.setdefault(name, []).append(request)
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_exists_many_aio(file_system: S3FileSystem, s3_client: StubS3Client):
+    for key in ["a/1", "a/3", "a/sub/2", "a/9", "b/1", "c/x/1", "c/x/2", "c/x/3"]:
+        s3_client.objects[("bucket", key)] = b""
+    s3_client.objects[("other", "a/1")] = b""
+    uris = [
+        # Listed: common prefix "a/"
+        "s3://bucket/a/1",
+        "s3://bucket/a/2",
+        "s3://bucket/a/3",
+        # In a "subdirectory", checked separately
+        "s3://bucket/a/sub/2",
+        # HEAD requests, fewer than `list_min_keys` keys
+        "s3://bucket/b/1",
+        "s3://bucket/b/2",
+        # Listed: common prefix "c/x/"
+        "s3://bucket/c/x/1",
+        "s3://bucket/c/x/2",
+        "s3://bucket/c/x/4",
+        # Same directory, other bucket
+        "s3://other/a/1",
+    ]
+
+    result = await file_system.exists_many_aio(uris)
+
+    assert result == {
+        "s3://bucket/a/1": True,
+        "s3://bucket/a/2": False,
+        "s3://bucket/a/3": True,
+        "s3://bucket/a/sub/2": True,
+        "s3://bucket/b/1": True,
+        "s3://bucket/b/2": False,
+        "s3://bucket/c/x/1": True,
+        "s3://bucket/c/x/2": True,
+        "s3://bucket/c/x/4": False,
+        "s3://other/a/1": True,
+    }
+    requests = _requests_by_name(s3_client)
+    assert sorted(request["Prefix"] for request in requests["list_objects_v2"]) == [
+        "a/",
+        "c/x/",
+    ]
+    assert sorted(
+        (request["Bucket"], request["Key"]) for request in requests["head_object"]
+    ) == [("bucket", "a/sub/2"), ("bucket", "b/1"), ("bucket", "b/2"), ("other", "a/1")]
+
+
+@pytest.mark.asyncio
+async def test_exists_many_aio_head_requests(
+    file_system: S3FileSystem, s3_client: StubS3Client
+):
+    s3_client.objects[("bucket", "a/1")] = b""
+    uris = ["s3://bucket/a/1", "s3://bucket/a/2", "s3://bucket/a/3"]
+
+    # Fewer keys than `list_min_keys`
+    file_system.list_min_keys = 4
+    assert await file_system.exists_many_aio(uris) == {
+        "s3://bucket/a/1": True,
+        "s3://bucket/a/2": False,
+        "s3://bucket/a/3": False,
+    }
+    assert set(_requests_by_name(s3_client)) == {"head_object"}
+
+    # Listing would take more requests than there are keys
+    file_system.list_min_keys = 3
+    s3_client.requests.clear()
+    s3_client.page_size = 1
+    for index in range(10):
+        s3_client.objects[("bucket", f"a/0{index}")] = b""
+    assert (await file_system.exists_many_aio(uris))["s3://bucket/a/1"]
+    requests = _requests_by_name(s3_client)
+    assert len(requests["list_objects_v2"]) == 3
+    assert len(requests["head_object"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_exists_many_aio_listing_stops_after_last_key(
+    file_system: S3FileSystem, s3_client: StubS3Client
+):
+    s3_client.page_size = 2
+    for key in ["a/1", "a/2", "a/3", "a/4", "a/5", "a/6", "a/7"]:
+        s3_client.objects[("bucket", key)] = b""
+    uris = ["s3://bucket/a/1", "s3://bucket/a/2", "s3://bucket/a/3"]
+
+    assert all((await file_system.exists_many_aio(uris)).values())
+    # Listed up to "a/3", on the second page
+    assert [name for name, _ in s3_client.requests] == ["list_objects_v2"] * 2
+
+
+@pytest.mark.asyncio
+async def test_exists_many_aio_listing_denied(
+    file_system: S3FileSystem, s3_client: StubS3Client
+):
+    s3_client.list_denied = True
+    s3_client.objects[("bucket", "a/1")] = b""
+    uris = ["s3://bucket/a/1", "s3://bucket/a/2", "s3://bucket/a/3"]
+
+    # Without s3:ListBucket, checked with HEAD requests instead
+    assert await file_system.exists_many_aio(uris) == {
+        "s3://bucket/a/1": True,
+        "s3://bucket/a/2": False,
+        "s3://bucket/a/3": False,
+    }
+    assert len(_requests_by_name(s3_client)["head_object"]) == 3
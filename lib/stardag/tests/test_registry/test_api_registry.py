@@ -0,0 +1,312 @@
+"""Tests for APIRegistry task registration and event batching."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from uuid import UUID, uuid4
+
+import httpx
+import pytest
+
+from stardag.build import BuildExitStatus, HybridConcurrentTaskExecutor, build_aio
+from stardag.exceptions import APIError
+from stardag.registry import APIRegistry
+from stardag.registry._api_registry import _EventBuffer
+from stardag.target import InMemoryFileSystemTarget
+from stardag.utils.testing.helper_tasks import DiamondTask
+
+
+class MockRegistryAPI:
+    """Records requests to the registry API and responds with canned data."""
+
+    def __init__(
+        self,
+        fail_batches: bool = False,
+        failing_batches: int = 0,
+        rejected_task_ids: set[str] | None = None,
+    ) -> None:
+        self.build_id = uuid4()
+        self.fail_batches = fail_batches
+        # Number of batch requests to fail before succeeding
+        self.failing_batches = failing_batches
+        # Batches with items of these tasks are rejected (422)
+        self.rejected_task_ids = rejected_task_ids or set()
+        self.requests: list[tuple[str, dict | None]] = []
+
+    @property
+    def paths(self) -> list[str]:
+        return [path for path, _ in self.requests]
+
+    @property
+    def batches(self) -> list[list[dict]]:
+        return [
+            body["items"]
+            for path, body in self.requests
+            if path.endswith("/events:batch") and body is not None
+        ]
+
+    @property
+    def delivered(self) -> list[dict]:
+        """Items of the batches that were not rejected."""
+        return [
+            item
+            for batch in self.batches
+            if not any(_item_task_id(i) in self.rejected_task_ids for i in batch)
+            for item in batch
+        ]
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        body = json.loads(request.content) if request.content else None
+        self.requests.append((path, body))
+        if path == "/api/v1/builds":
+            return httpx.Response(
+                201, json={"id": str(self.build_id), "name": "test-build"}
+            )
+        if path.endswith("/events:batch"):
+            if self.fail_batches or self.failing_batches > 0:
+                self.failing_batches -= 1
+                return httpx.Response(500, json={"detail": "boom"})
+            assert body is not None
+            if any(
+                _item_task_id(item) in self.rejected_task_ids for item in body["items"]
+            ):
+                return httpx.Response(422, json={"detail": "invalid"})
+            return httpx.Response(201, json={"registered": 0, "events": 0})
+        return httpx.Response(200, json={})
+
+
+def _item_task_id(item: dict) -> str:
+    return item["task"]["task_id"] if item["kind"] == "register" else item["task_id"]
+
+
+def _registry(api: MockRegistryAPI, **kwargs) -> APIRegistry:
+    registry = APIRegistry(api_url="http://test", api_key="sk_test", **kwargs)
+    registry._async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(api.handler)
+    )
+    return registry
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_EventBuffer, "retry_delay", 0.0)
+
+
+def _diamond(test_id: str) -> DiamondTask:
+    a = DiamondTask(name="a", test_id=test_id)
+    b = DiamondTask(name="b", test_id=test_id, deps=(a,))
+    c = DiamondTask(name="c", test_id=test_id, deps=(a,))
+    return DiamondTask(name="d", test_id=test_id, deps=(b, c))
+
+
+class TestEventBatching:
+    @pytest.mark.asyncio
+    async def test_build_sends_events_in_batches(
+        self, default_in_memory_fs_target: type[InMemoryFileSystemTarget]
+    ) -> None:
+        api = MockRegistryAPI()
+        registry = _registry(api, event_batch_size=3)
+
+        summary = await build_aio(
+            [_diamond("batched_build")],
+            task_executor=HybridConcurrentTaskExecutor(),
+            registry=registry,
+        )
+        assert summary.status == BuildExitStatus.SUCCESS
+
+        build_path = f"/api/v1/builds/{api.build_id}"
+        assert set(api.paths) == {
+            "/api/v1/builds",
+            f"{build_path}/events:batch",
+            f"{build_path}/complete",
+        }
+        # All events are sent before the build is completed
+        assert api.paths[-1] == f"{build_path}/complete"
+        assert all(len(batch) <= 3 for batch in api.batches)
+
+        # Per task: registered, started, completed - in that order
+        items = [item for batch in api.batches for item in batch]
+        events_by_task: dict[str, list[str]] = {}
+        for item in items:
+            events_by_task.setdefault(_item_task_id(item), []).append(
+                "register" if item["kind"] == "register" else item["event_type"]
+            )
+        assert len(events_by_task) == 4
+        for events in events_by_task.values():
+            assert events[-2:] == ["task_started", "task_completed"]
+            assert events.index("register") < events.index("task_started")
+
+    @pytest.mark.asyncio
+    async def test_flush_interval(self) -> None:
+        api = MockRegistryAPI()
+        registry = _registry(api, event_batch_size=100, event_flush_interval=0.01)
+        build_id = UUID(int=1)
+
+        await registry.task_register_aio(build_id, DiamondTask(name="a", test_id="x"))
+        assert api.batches == []
+
+        await asyncio.sleep(0.1)
+        assert len(api.batches) == 1
+
+        await registry.build_complete_aio(build_id)
+        assert api.paths[-1] == f"/api/v1/builds/{build_id}/complete"
+
+    @pytest.mark.asyncio
+    async def test_back_pressure(self) -> None:
+        api = MockRegistryAPI()
+        registry = _registry(
+            api, event_batch_size=2, event_flush_interval=60, max_buffered_events=4
+        )
+        build_id = UUID(int=1)
+        task = DiamondTask(name="a", test_id="x")
+
+        for _ in range(4):
+            await registry.task_complete_aio(build_id, task)
+        # The fourth event exceeds the buffer limit and waits for it to be sent
+        assert sum(len(batch) for batch in api.batches) == 4
+
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_send_error_is_raised(self) -> None:
+        api = MockRegistryAPI(fail_batches=True)
+        registry = _registry(api, event_batch_size=10)
+        build_id = UUID(int=1)
+
+        await registry.task_complete_aio(build_id, DiamondTask(name="a", test_id="x"))
+        with pytest.raises(APIError):
+            await registry.build_complete_aio(build_id)
+
+    @pytest.mark.asyncio
+    async def test_send_error_is_retried(self) -> None:
+        api = MockRegistryAPI(failing_batches=1)
+        registry = _registry(api, event_batch_size=10)
+        build_id = UUID(int=1)
+
+        await registry.task_complete_aio(build_id, DiamondTask(name="a", test_id="x"))
+        await registry.build_complete_aio(build_id)
+        assert [len(batch) for batch in api.batches] == [1, 1]
+        assert api.paths[-1] == f"/api/v1/builds/{build_id}/complete"
+
+    @pytest.mark.asyncio
+    async def test_resent_batch_keeps_its_id(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_EventBuffer, "retries", 1)
+        sent: list[tuple[UUID, list[dict]]] = []
+
+        async def send(batch_id: UUID, batch: list[dict]) -> None:
+            sent.append((batch_id, batch))
+            if len(sent) <= 2:
+                raise httpx.ReadTimeout("timeout")
+
+        event_buffer = _EventBuffer(
+            send, batch_size=10, flush_interval=60, max_buffered=100
+        )
+        await event_buffer.add({"n": 1})
+        with pytest.raises(httpx.ReadTimeout):
+            await event_buffer.flush()
+        # The batch is resent as is, the new item in a batch of its own
+        await event_buffer.add({"n": 2})
+        await event_buffer.close()
+
+        assert [batch for _, batch in sent] == [[{"n": 1}]] * 3 + [[{"n": 2}]]
+        assert len({batch_id for batch_id, _ in sent}) == 2
+
+    @pytest.mark.asyncio
+    async def test_events_after_send_error_are_sent(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_EventBuffer, "retries", 0)
+        api = MockRegistryAPI(failing_batches=1)
+        registry = _registry(api, event_batch_size=1, event_flush_interval=0.01)
+        build_id = UUID(int=1)
+        tasks = [DiamondTask(name=name, test_id="x") for name in "abc"]
+
+        # The background send of the first event fails, the event is kept
+        await registry.task_complete_aio(build_id, tasks[0])
+        await asyncio.sleep(0.005)
+        # ...and the error is not raised by calls about other tasks
+        await registry.task_complete_aio(build_id, tasks[1])
+        await registry.task_complete_aio(build_id, tasks[2])
+
+        # Sent by the next flushes, in order
+        await asyncio.sleep(0.1)
+        sent = [item["task_id"] for batch in api.batches[1:] for item in batch]
+        assert sent == [str(task.id) for task in tasks]
+
+        await registry.build_complete_aio(build_id)
+        assert api.paths[-1] == f"/api/v1/builds/{build_id}/complete"
+
+    @pytest.mark.asyncio
+    async def test_rejected_events_are_dropped(self) -> None:
+        tasks = [DiamondTask(name=name, test_id="x") for name in "abcde"]
+        api = MockRegistryAPI(rejected_task_ids={str(tasks[1].id)})
+        registry = _registry(api, event_batch_size=10)
+        build_id = UUID(int=1)
+
+        for task in tasks:
+            await registry.task_complete_aio(build_id, task)
+        await registry.build_complete_aio(build_id)
+
+        # The batch is split until the rejected event is isolated
+        sent = [item["task_id"] for item in api.delivered]
+        assert sent == [str(task.id) for task in tasks if task != tasks[1]]
+        assert api.paths[-1] == f"/api/v1/builds/{build_id}/complete"
+
+    @pytest.mark.asyncio
+    async def test_rejected_events_dont_fail_build(
+        self, default_in_memory_fs_target: type[InMemoryFileSystemTarget]
+    ) -> None:
+        root = _diamond("rejected_events")
+        api = MockRegistryAPI(rejected_task_ids={str(root.id)})
+        registry = _registry(api, event_batch_size=1)
+
+        summary = await build_aio(
+            [root], task_executor=HybridConcurrentTaskExecutor(), registry=registry
+        )
+
+        assert summary.status == BuildExitStatus.SUCCESS
+        delivered = {_item_task_id(item) for item in api.delivered}
+        assert len(delivered) == 3
+        # Incl. the events after the rejected ones
+        assert api.delivered[-1]["event_type"] == "task_completed"
+        assert api.paths[-1] == f"/api/v1/builds/{api.build_id}/complete"
+
+
+class TestRegistration:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("event_batch_size", [None, 1])
+    async def test_unregistered_deps_are_included_in_full(
+        self,
+        default_in_memory_fs_target: type[InMemoryFileSystemTarget],
+        event_batch_size: int | None,
+    ) -> None:
+        a = DiamondTask(name="a", test_id=f"registration_refs_{event_batch_size}")
+        b = DiamondTask(name="b", test_id=a.test_id, deps=(a,))
+        root = DiamondTask(name="root", test_id=a.test_id, deps=(b,))
+        a.run()
+        b.run()
+        api = MockRegistryAPI()
+        registry = _registry(api, event_batch_size=event_batch_size)
+
+        summary = await build_aio(
+            [root], task_executor=HybridConcurrentTaskExecutor(), registry=registry
+        )
+        assert summary.status == BuildExitStatus.SUCCESS
+
+        registrations = {
+            task["task_id"]: task["task_data"]
+            for task in [
+                *(body for path, body in api.requests if path.endswith("/tasks")),
+                *(item["task"] for item in api.delivered if item["kind"] == "register"),
+            ]
+        }
+        # Discovery stops at b (complete), so a is not registered in this build
+        assert set(registrations) == {str(b.id), str(root.id)}
+        (a_data,) = registrations[str(b.id)]["deps"]
+        assert "__ref" not in a_data
+        assert a_data["__name"] == "DiamondTask"
+        assert registrations[str(root.id)]["deps"] == [{"__ref": str(b.id)}]
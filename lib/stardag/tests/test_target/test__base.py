@@ -1,13 +1,19 @@
+import asyncio
 import os
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from stardag.target import (
     DirectoryTarget,
+    InMemoryFileSystemTarget,
     InMemoryRemoteFileSystem,
     LocalTarget,
     RemoteFileSystemTarget,
+    exists_many_aio,
 )
 from stardag.target._base import CachedRemoteFileSystem
 
@@ -161,6 +167,45 @@ def test_remote_filesystem_target_proxy_path():
     assert rfs.uri_to_bytes[uri] == b"test"
 
 
+class _RangeCountingFileSystem(InMemoryRemoteFileSystem):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ranges: list[tuple[int, int]] = []
+
+    def read_range(self, uri: str, start: int, end: int) -> bytes:
+        self.ranges.append((start, end))
+        return super().read_range(uri, start, end)
+
+
+def test_remote_filesystem_target_streaming_reads():
+    rfs = _RangeCountingFileSystem()
+    rfs.stream_buffer_size = 16
+    uri = "in-memory://bucket/key"
+    data = bytes(range(100))
+    rfs.uri_to_bytes[uri] = data
+    target = RemoteFileSystemTarget(uri=uri, rfs=rfs)
+
+    with target.open("rb") as f:
+        assert rfs.ranges == []  # nothing fetched until read
+        assert f.read(4) == data[:4]
+        assert f.read(4) == data[4:8]  # served from the read-ahead buffer
+        assert rfs.ranges == [(0, 16)]
+
+        assert f.seek(-10, os.SEEK_END) == 90
+        assert f.read(4) == data[90:94]
+        assert f.tell() == 94
+        assert rfs.ranges[1:] == [(90, 100)]
+
+        f.seek(50)
+        assert f.read() == data[50:]
+        assert rfs.ranges[2:] == [(50, 100)]  # the rest of the file in one request
+        assert f.read() == b""
+
+    with pytest.raises(FileNotFoundError):
+        target = RemoteFileSystemTarget(uri="in-memory://bucket/missing", rfs=rfs)
+        target.open("rb")
+
+
 def test_cached_remote_filesystem_target(tmp_path: Path):
     rfs_base = InMemoryRemoteFileSystem()
     rfs = CachedRemoteFileSystem(
@@ -192,6 +237,179 @@ def test_cached_remote_filesystem_target(tmp_path: Path):
     assert cache_path.read_text() == "test"
 
 
+class _ExistsManyCountingFileSystem(InMemoryRemoteFileSystem):
+    def __init__(self) -> None:
+        super().__init__()
+        self.exists_many_calls: list[list[str]] = []
+
+    async def exists_many_aio(self, uris) -> dict[str, bool]:
+        self.exists_many_calls.append(list(uris))
+        return await super().exists_many_aio(uris)
+
+
+@pytest.mark.asyncio
+async def test_exists_many_aio(tmp_path: Path):
+    rfs = _ExistsManyCountingFileSystem()
+    rfs.uri_to_bytes["in-memory://bucket/a"] = b"a"
+    local_a = tmp_path / "a"
+    local_a.write_text("a")
+
+    with InMemoryFileSystemTarget.cleared() as uri_to_bytes:
+        uri_to_bytes["mem://a"] = b"a"
+        targets = [
+            RemoteFileSystemTarget("in-memory://bucket/a", rfs),
+            LocalTarget(str(local_a)),
+            InMemoryFileSystemTarget("mem://a"),
+            RemoteFileSystemTarget("in-memory://bucket/b", rfs),
+            LocalTarget(str(tmp_path / "b")),
+            InMemoryFileSystemTarget("mem://b"),
+        ]
+        assert await exists_many_aio(targets) == [True] * 3 + [False] * 3
+
+    # One bulk check for both remote targets
+    assert rfs.exists_many_calls == [["in-memory://bucket/a", "in-memory://bucket/b"]]
+
+
+@pytest.mark.asyncio
+async def test_cached_remote_filesystem_exists_many(tmp_path: Path):
+    rfs_base = _ExistsManyCountingFileSystem()
+    rfs = CachedRemoteFileSystem(wrapped=rfs_base, root=str(tmp_path / "cache"))
+    uris = [f"in-memory://bucket/{key}" for key in ["cached", "remote", "missing"]]
+    with RemoteFileSystemTarget(uri=uris[0], rfs=rfs).open("w") as f:
+        f.write("cached")
+    rfs_base.uri_to_bytes[uris[1]] = b"remote"
+
+    expected = {uris[0]: True, uris[1]: True, uris[2]: False}
+    assert rfs.exists_many(uris) == expected
+    assert await rfs.exists_many_aio(uris) == expected
+    # Only the keys not in the cache are checked remotely
+    assert rfs_base.exists_many_calls == [uris[1:]]
+
+
+def test_cached_remote_filesystem_size_budget(tmp_path: Path):
+    rfs_base = InMemoryRemoteFileSystem()
+    rfs = CachedRemoteFileSystem(
+        wrapped=rfs_base,
+        root=str(tmp_path / "cache"),
+        max_size=10,
+        eviction_grace=0.0,
+    )
+    uris = [f"in-memory://bucket/{key}" for key in ["a", "b"]]
+    for uri in uris:
+        with RemoteFileSystemTarget(uri=uri, rfs=rfs).open("w") as f:
+            f.write("123456")
+
+    # The least recently used file is evicted to stay within the budget
+    assert not rfs.get_cache_path(uris[0]).exists()
+    assert rfs.get_cache_path(uris[1]).exists()
+    assert rfs.stats.evictions == 1
+    assert rfs.stats.evicted_bytes == 6
+
+    with RemoteFileSystemTarget(uri=uris[0], rfs=rfs).open("r") as f:
+        assert f.read() == "123456"
+    with RemoteFileSystemTarget(uri=uris[0], rfs=rfs).open("r") as f:
+        assert f.read() == "123456"
+    assert (rfs.stats.hits, rfs.stats.misses, rfs.stats.evictions) == (1, 1, 2)
+    assert not rfs.get_cache_path(uris[1]).exists()
+
+
+@pytest.mark.asyncio
+async def test_cached_remote_filesystem_download(tmp_path: Path):
+    rfs = CachedRemoteFileSystem(
+        wrapped=InMemoryRemoteFileSystem(),
+        root=str(tmp_path / "cache"),
+        hardlink_downloads=False,
+    )
+    uri = "in-memory://bucket/key"
+    source = tmp_path / "source"
+    source.write_bytes(b"data")
+    await rfs.upload_aio(source, uri)
+
+    # Cached files are read-only, readers use them in place
+    cache_path = await rfs.enter_readable_proxy_path_aio(uri)
+    assert cache_path == rfs.get_cache_path(uri)
+    assert not cache_path.stat().st_mode & stat.S_IWUSR
+    source.write_bytes(b"modified")
+    assert cache_path.read_bytes() == b"data"
+
+    # Downloads are private (without hardlinks)
+    destination = tmp_path / "downloaded" / "key"
+    await rfs.download_aio(uri, destination)
+    destination.write_bytes(b"modified")
+    rfs.download(uri, tmp_path / "downloaded" / "key_sync")
+    assert (tmp_path / "downloaded" / "key_sync").read_bytes() == b"data"
+    assert cache_path.read_bytes() == b"data"
+
+
+class _SlowDownloadFileSystem(InMemoryRemoteFileSystem):
+    def __init__(self) -> None:
+        super().__init__()
+        self.downloads = 0
+
+    def download(self, uri: str, destination: Path):
+        self.downloads += 1
+        time.sleep(0.05)
+        super().download(uri, destination)
+
+    async def download_aio(self, uri: str, destination: Path) -> None:
+        self.downloads += 1
+        await asyncio.sleep(0.05)
+        await super().download_aio(uri, destination)
+
+
+def test_cached_remote_filesystem_single_flight(tmp_path: Path):
+    rfs_base = _SlowDownloadFileSystem()
+    rfs = CachedRemoteFileSystem(wrapped=rfs_base, root=str(tmp_path / "cache"))
+    uri = "in-memory://bucket/key"
+    rfs_base.uri_to_bytes[uri] = b"data"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        paths = list(
+            executor.map(lambda _: rfs.enter_readable_proxy_path(uri), range(4))
+        )
+
+    assert {path.read_bytes() for path in paths} == {b"data"}
+    assert rfs_base.downloads == 1
+    assert (rfs.stats.hits, rfs.stats.misses) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_cached_remote_filesystem_single_flight_aio(tmp_path: Path):
+    rfs_base = _SlowDownloadFileSystem()
+    rfs = CachedRemoteFileSystem(wrapped=rfs_base, root=str(tmp_path / "cache"))
+    uri = "in-memory://bucket/key"
+    rfs_base.uri_to_bytes[uri] = b"data"
+
+    destinations = [tmp_path / f"destination_{i}" for i in range(4)]
+    await asyncio.gather(
+        *(rfs.download_aio(uri, destination) for destination in destinations)
+    )
+
+    assert {destination.read_bytes() for destination in destinations} == {b"data"}
+    assert rfs_base.downloads == 1
+    assert (rfs.stats.hits, rfs.stats.misses) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_cached_remote_filesystem_concurrent_reads_aio(tmp_path: Path):
+    rfs_base = _SlowDownloadFileSystem()
+    rfs = CachedRemoteFileSystem(wrapped=rfs_base, root=str(tmp_path / "cache"))
+    uris = [f"in-memory://bucket/key_{i}" for i in range(100)]
+    for uri in uris:
+        rfs_base.uri_to_bytes[uri] = uri.encode()
+
+    # Far more concurrent downloads (of different files) than executor threads
+    executor = ThreadPoolExecutor(max_workers=4)
+    asyncio.get_running_loop().set_default_executor(executor)
+    paths = await asyncio.wait_for(
+        asyncio.gather(*(rfs.enter_readable_proxy_path_aio(uri) for uri in uris)),
+        timeout=10,
+    )
+
+    assert [path.read_bytes() for path in paths] == [uri.encode() for uri in uris]
+    assert rfs_base.downloads == 100
+
+
 def test_directory_target(tmp_path: Path):
     dir_target = DirectoryTarget(uri=str(tmp_path / "test"), prototype=LocalTarget)
     assert not dir_target.exists()
@@ -0,0 +1,171 @@
+import shutil
+import time
+import typing
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from stardag.build import build_aio, build_sequential
+from stardag.registry import NoOpRegistry
+from stardag.target import (
+    InMemoryFileSystemTarget,
+    SQLiteCompletionIndex,
+    completion_index_provider,
+)
+from stardag.utils.testing.helper_tasks import DiamondTask
+
+
+@pytest.fixture
+def completion_index(
+    tmp_path: Path,
+) -> typing.Generator[SQLiteCompletionIndex, None, None]:
+    completion_index = SQLiteCompletionIndex(tmp_path / "completion-index.sqlite")
+    with completion_index_provider.override(completion_index):
+        yield completion_index
+    completion_index.close()
+
+
+def test_sqlite_completion_index(tmp_path: Path):
+    path = tmp_path / "completion-index.sqlite"
+    completion_index = SQLiteCompletionIndex(path)
+    task_id = UUID("036f6e71-1b3c-54b8-aec1-182359f1e09a")
+    completion_index.record("s3://bucket/a/1")
+    completion_index.record("s3://bucket/a/2", task_id=task_id)
+    completion_index.record("s3://bucket/b/3")
+
+    assert completion_index.contains("s3://bucket/a/1")
+    assert not completion_index.contains("s3://bucket/a/4")
+    assert completion_index.contains_many(
+        ["s3://bucket/a/1", "s3://bucket/a/2", "s3://bucket/a/4"] * 1000
+    ) == {"s3://bucket/a/1", "s3://bucket/a/2"}
+
+    # Persisted across instances (/processes)
+    completion_index.close()
+    completion_index = SQLiteCompletionIndex(path)
+    assert completion_index.invalidate(task_id=task_id) == 1
+    assert completion_index.invalidate(prefix="s3://bucket/a/") == 1
+    assert completion_index.contains("s3://bucket/b/3")
+    assert completion_index.invalidate() == 1
+    assert not completion_index.contains("s3://bucket/b/3")
+
+    # Expired entries are ignored
+    completion_index.ttl = 0.01
+    completion_index.record("s3://bucket/c/5")
+    time.sleep(0.02)
+    assert not completion_index.contains("s3://bucket/c/5")
+
+    completion_index.ttl = None
+    completion_index.record_many(
+        [("s3://bucket/d/6", task_id), ("s3://bucket/d/7", None)]
+    )
+    assert completion_index.contains_many(["s3://bucket/d/6", "s3://bucket/d/7"]) == {
+        "s3://bucket/d/6",
+        "s3://bucket/d/7",
+    }
+    assert completion_index.invalidate(task_id=task_id) == 1
+    completion_index.close()
+
+
+def test_task_complete_consults_completion_index(
+    default_local_target_tmp_path: Path,
+    completion_index: SQLiteCompletionIndex,
+):
+    task = DiamondTask(name="a", test_id="completion_index")
+    uri = task.output().uri
+    assert not task.complete()
+
+    # Populated on save
+    task.output().save("a")
+    assert completion_index.contains(uri)
+
+    # Not checked against storage once recorded
+    Path(uri).unlink()
+    assert task.complete()
+
+    # Verify-on-load: a missing output is removed from the index
+    with pytest.raises(FileNotFoundError):
+        task.output().load()
+    assert not completion_index.contains(uri)
+    assert not task.complete()
+
+
+@pytest.mark.asyncio
+async def test_task_complete_aio_records_existing_output(
+    default_local_target_tmp_path: Path,
+    completion_index: SQLiteCompletionIndex,
+):
+    task = DiamondTask(name="a", test_id="completion_index_aio")
+    uri = task.output().uri
+    # Written bypassing the serializer, e.g. by another process
+    Path(uri).parent.mkdir(parents=True, exist_ok=True)
+    Path(uri).write_bytes(b'"a"')
+    assert not completion_index.contains(uri)
+
+    assert await task.complete_aio()
+    assert completion_index.contains(uri)
+    assert completion_index.invalidate(task_id=task.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_in_memory_outputs_are_not_recorded(
+    default_in_memory_fs_target: typing.Type[InMemoryFileSystemTarget],
+    completion_index: SQLiteCompletionIndex,
+):
+    task = DiamondTask(name="a", test_id="completion_index_in_memory")
+    task.output().save("a")
+    assert task.complete()
+    assert await task.complete_aio()
+    await build_aio([task], registry=NoOpRegistry())
+    assert not completion_index.contains(task.output().uri)
+
+
+def test_build_skips_storage_checks_for_indexed_tasks(
+    default_local_target_tmp_path: Path,
+    completion_index: SQLiteCompletionIndex,
+):
+    leaf = DiamondTask(name="leaf", test_id="completion_index_build")
+    root = DiamondTask(name="root", test_id="completion_index_build", deps=(leaf,))
+    build_sequential([root], registry=NoOpRegistry())
+    assert completion_index.contains_many([leaf.output().uri, root.output().uri])
+
+    # Outputs are gone from storage, but the index says the DAG is complete
+    shutil.rmtree(default_local_target_tmp_path)
+    summary = build_sequential([root], registry=NoOpRegistry())
+    assert summary.task_count.previously_completed == 1
+    assert summary.task_count.succeeded == 0
+
+
+@pytest.mark.asyncio
+async def test_build_aio_batches_completion_index_lookups(
+    default_local_target_tmp_path: Path,
+    completion_index: SQLiteCompletionIndex,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    leaves = [
+        DiamondTask(name=f"leaf-{i}", test_id="completion_index_build_aio")
+        for i in range(5)
+    ]
+    root = DiamondTask(
+        name="root", test_id="completion_index_build_aio", deps=tuple(leaves)
+    )
+    await build_aio([root], registry=NoOpRegistry())
+    completion_index.invalidate()
+    Path(root.output().uri).unlink()
+
+    lookups: list[list[str]] = []
+    contains_many = completion_index.contains_many
+
+    def contains_many_spy(uris: typing.Sequence[str]) -> set[str]:
+        lookups.append(list(uris))
+        return contains_many(uris)
+
+    monkeypatch.setattr(completion_index, "contains_many", contains_many_spy)
+    summary = await build_aio([root], registry=NoOpRegistry())
+    assert summary.task_count.previously_completed == 5
+    assert summary.task_count.succeeded == 1
+    # All leaves are looked up at once
+    assert sorted(lookups[1]) == sorted(leaf.output().uri for leaf in leaves)
+    # ...and recorded by discovery, with the ID of the task
+    for leaf in leaves:
+        assert completion_index.invalidate(uri=leaf.output().uri, task_id=leaf.id)
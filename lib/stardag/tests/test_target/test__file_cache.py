@@ -0,0 +1,139 @@
+import asyncio
+import stat
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from stardag.target._file_cache import (
+    FileCacheIndex,
+    FileCacheLock,
+    make_read_only,
+    materialize_file,
+)
+
+
+def _cache_file(index: FileCacheIndex, path: Path, size: int = 10) -> list[Path]:
+    path.write_bytes(b"x" * size)
+    evicted = index.add(path, size)
+    # Distinct access times
+    time.sleep(0.01)
+    return [evicted_path for evicted_path, _ in evicted]
+
+
+@pytest.mark.parametrize(
+    "eviction_policy, expected_evicted",
+    [("lru", "a"), ("lfu", "b")],
+)
+def test_file_cache_index_eviction(
+    tmp_path: Path, eviction_policy: str, expected_evicted: str
+):
+    index = FileCacheIndex(
+        tmp_path / "index.sqlite",
+        max_size=35,
+        eviction_policy=eviction_policy,  # type: ignore[arg-type]
+        eviction_grace=0.0,
+    )
+    # "a" is used most often but least recently, "b" is used least often
+    assert _cache_file(index, tmp_path / "a") == []
+    assert index.touch(tmp_path / "a")
+    assert index.touch(tmp_path / "a")
+    assert _cache_file(index, tmp_path / "b") == []
+    assert _cache_file(index, tmp_path / "c") == []
+    assert index.total_size() == 30
+    assert not index.touch(tmp_path / "unknown")
+
+    assert _cache_file(index, tmp_path / "d") == [tmp_path / expected_evicted]
+    assert not (tmp_path / expected_evicted).exists()
+    assert index.total_size() == 30
+    index.close()
+
+
+def test_file_cache_index_eviction_grace(tmp_path: Path):
+    path = tmp_path / "index.sqlite"
+    index = FileCacheIndex(path, max_size=15, eviction_grace=60.0)
+    assert _cache_file(index, tmp_path / "a") == []
+    # Recently used files are kept, even beyond the budget
+    assert _cache_file(index, tmp_path / "b") == []
+    assert index.total_size() == 20
+
+    # Persisted across instances (/processes)
+    index.close()
+    index = FileCacheIndex(path, max_size=15, eviction_grace=0.0)
+    assert _cache_file(index, tmp_path / "c") == [tmp_path / "a", tmp_path / "b"]
+    index.close()
+
+    with pytest.raises(ValueError, match="Unknown eviction policy"):
+        FileCacheIndex(path, max_size=15, eviction_policy="fifo")  # type: ignore
+
+
+def test_file_cache_lock(tmp_path: Path):
+    lock = FileCacheLock(tmp_path / "locks")
+    events: list[str] = []
+
+    def hold(name: str) -> None:
+        with lock.hold(tmp_path / "file"):
+            events.append(f"enter {name}")
+            time.sleep(0.02)
+            events.append(f"exit {name}")
+
+    threads = [threading.Thread(target=hold, args=(str(i),)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Never held by two threads at a time
+    for i in range(0, len(events), 2):
+        assert events[i].replace("enter", "exit") == events[i + 1]
+    # Lock files are removed on release
+    assert list((tmp_path / "locks").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_file_cache_lock_aio(tmp_path: Path):
+    lock = FileCacheLock(tmp_path / "locks")
+    release = lock.acquire(tmp_path / "file")
+
+    acquired = asyncio.ensure_future(lock.acquire_aio(tmp_path / "file"))
+    # Other paths are not blocked
+    (await lock.acquire_aio(tmp_path / "other"))()
+    await asyncio.sleep(0.02)
+    assert not acquired.done()
+
+    release()
+    (await asyncio.wait_for(acquired, timeout=1))()
+
+    # Cancelled while waiting
+    release = lock.acquire(tmp_path / "file")
+    acquired = asyncio.ensure_future(lock.acquire_aio(tmp_path / "file"))
+    await asyncio.sleep(0.01)
+    acquired.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await acquired
+    release()
+    with lock.hold(tmp_path / "file"):
+        pass
+
+
+def test_materialize_file(tmp_path: Path):
+    source = tmp_path / "source"
+    source.write_bytes(b"data")
+    make_read_only(source)
+    destination = tmp_path / "destination"
+    destination.write_bytes(b"previous")
+
+    method = materialize_file(source, destination)
+    assert method in ("reflink", "hardlink")
+    assert destination.read_bytes() == b"data"
+    if method == "hardlink":
+        assert destination.stat().st_ino == source.stat().st_ino
+        assert not destination.stat().st_mode & stat.S_IWUSR
+
+    method = materialize_file(source, destination, hardlink=False)
+    assert method in ("reflink", "copy")
+    assert destination.read_bytes() == b"data"
+    assert destination.stat().st_ino != source.stat().st_ino
+    destination.write_bytes(b"modified")
+    assert source.read_bytes() == b"data"
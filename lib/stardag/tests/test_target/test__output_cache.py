@@ -0,0 +1,120 @@
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+
+from stardag.target._output_cache import OutputCache, estimate_size
+
+
+def test_output_cache_lru_eviction():
+    size = estimate_size([0] * 10)
+    cache = OutputCache(max_bytes=2 * size)
+    loads: list[str] = []
+
+    def loader(uri: str):
+        def load() -> list[int]:
+            loads.append(uri)
+            return [0] * 10
+
+        return load
+
+    a = cache.get_or_load("a", loader("a"))
+    assert cache.get_or_load("a", loader("a")) is a
+    cache.get_or_load("b", loader("b"))
+    # "a" was used less recently than "b"
+    cache.get_or_load("b", loader("b"))
+    cache.get_or_load("c", loader("c"))
+    assert len(cache) == 2
+    assert cache.size_bytes == 2 * size
+    cache.get_or_load("a", loader("a"))
+    assert loads == ["a", "b", "c", "a"]
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 4
+    assert cache.stats.evictions == 2
+    assert cache.stats.peak_bytes == 2 * size
+
+    # Larger than the budget: loaded, not cached
+    cache.get_or_load("large", lambda: [0] * 100)
+    assert len(cache) == 2
+
+    cache.discard("a")
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_output_cache_copy_on_read():
+    cache = OutputCache(max_bytes=2**20, copy_on_read=True)
+    first = cache.get_or_load("uri", lambda: {"values": [1, 2]})
+    first["values"].append(3)
+    assert cache.get_or_load("uri", lambda: {}) == {"values": [1, 2]}
+    assert cache.get_or_load("text", lambda: "immutable") == "immutable"
+
+
+def test_output_cache_single_flight():
+    cache = OutputCache(max_bytes=2**20)
+    loads = 0
+
+    def load() -> list[int]:
+        nonlocal loads
+        loads += 1
+        time.sleep(0.05)
+        return [1, 2, 3]
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("u", load)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 7
+
+
+@pytest.mark.asyncio
+async def test_output_cache_single_flight_aio():
+    cache = OutputCache(max_bytes=2**20)
+    loads = 0
+
+    async def load() -> list[int]:
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.05)
+        return [1, 2, 3]
+
+    results = await asyncio.gather(
+        *(cache.get_or_load_aio("u", load) for _ in range(8))
+    )
+
+    assert loads == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 7
+
+
+def test_estimate_size():
+    class Array:
+        nbytes = 1000
+
+    class Record:
+        def __init__(self) -> None:
+            self.array = Array()
+
+    assert estimate_size(1) == sys.getsizeof(1)
+    shared = "x" * 100
+    # Referenced twice, counted once
+    assert estimate_size([shared, shared]) == sys.getsizeof(
+        [shared, shared]
+    ) + sys.getsizeof(shared)
+    assert estimate_size({"a": Array()}) > 1000
+    assert estimate_size(Record()) > 1000
+    assert estimate_size(Record(), {Array: lambda _: 5}) < 1000
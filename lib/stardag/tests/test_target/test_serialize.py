@@ -2,17 +2,29 @@ import typing
 
 import pytest
 
-from stardag.target._base import FileSystemTarget
+from stardag.target import InMemoryRemoteFileSystem, RemoteFileSystemTarget
+from stardag.target._base import (
+    CachedRemoteFileSystem,
+    FileSystemTarget,
+    LocalTarget,
+)
+from stardag.target._in_memory import InMemoryFileSystemTarget
 from stardag.target.serialize import (
     DataFrame,
     JSONSerializer,
+    NumpyArrayDictSerializer,
+    NumpyArraySerializer,
     PandasDataFrameCSVSerializer,
+    PandasDataFrameFeatherSerializer,
+    PandasDataFrameParquetSerializer,
     PickleSerializer,
     PlainTextSerializer,
     SelfSerializer,
     SelfSerializing,
+    Serializable,
     Serializer,
     get_serializer,
+    ndarray,
 )
 
 
@@ -68,6 +80,16 @@ class CustomMockSerializer(Serializer[str]):
         (_SelfSerializing, SelfSerializer(_SelfSerializing)),
         (_NoDefaultSerializerType, PickleSerializer()),
         (typing.Annotated[str, CustomMockSerializer()], CustomMockSerializer()),
+        (ndarray, NumpyArraySerializer()),
+        (dict[str, ndarray], NumpyArrayDictSerializer()),
+        (
+            typing.Annotated[DataFrame, PandasDataFrameParquetSerializer()],
+            PandasDataFrameParquetSerializer(),
+        ),
+        (
+            typing.Annotated[DataFrame, PandasDataFrameFeatherSerializer(None)],
+            PandasDataFrameFeatherSerializer(None),
+        ),
     ],
 )
 def test_get_serializer(annotation, expected_serializer):
@@ -77,3 +99,113 @@ def test_get_serializer(annotation, expected_serializer):
     extra_annotation = typing.Annotated[annotation, "extra"]
     serializer_from_extra_annotated = get_serializer(extra_annotation)  # type: ignore
     assert serializer_from_extra_annotated == expected_serializer
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    [PandasDataFrameParquetSerializer(), PandasDataFrameFeatherSerializer()],
+)
+@pytest.mark.parametrize("local", [False, True])
+async def test_pandas_data_frame_columnar_serializer(serializer, local, tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [0.5, 1.5, 2.5]},
+        index=pd.Index(["i", "j", "k"], name="key"),
+    )
+    extension = serializer.get_default_extension()
+    wrapped = (
+        LocalTarget(str(tmp_path / f"df.{extension}"))
+        if local
+        else InMemoryFileSystemTarget(f"in-memory://df.{extension}")
+    )
+    target = Serializable(wrapped, serializer)
+
+    with InMemoryFileSystemTarget.cleared():
+        target.save(df)
+        pd.testing.assert_frame_equal(target.load(), df)
+        # The index is kept when loading a subset of the columns
+        pd.testing.assert_frame_equal(target.load_columns(["c", "a"]), df[["c", "a"]])
+
+        await target.save_aio(df[["a"]])
+        pd.testing.assert_frame_equal(await target.load_aio(), df[["a"]])
+        pd.testing.assert_frame_equal(await target.load_columns_aio(["a"]), df[["a"]])
+
+
+def test_load_columns_not_supported():
+    with InMemoryFileSystemTarget.cleared():
+        target = Serializable(
+            InMemoryFileSystemTarget("in-memory://text.txt"), PlainTextSerializer()
+        )
+        target.save("text")
+        with pytest.raises(TypeError, match="does not support"):
+            target.load_columns(["a"])
+
+
+def _numpy_target(kind: str, tmp_path) -> FileSystemTarget:
+    if kind == "local":
+        return LocalTarget(str(tmp_path / "array.npy"))
+    if kind == "in_memory":
+        return InMemoryFileSystemTarget("in-memory://array.npy")
+    rfs = InMemoryRemoteFileSystem()
+    if kind == "cached_remote":
+        rfs = CachedRemoteFileSystem(wrapped=rfs, root=str(tmp_path / "cache"))
+    return RemoteFileSystemTarget(uri="in-memory://bucket/array.npy", rfs=rfs)
+
+
+@pytest.mark.parametrize(
+    "kind, memory_mapped",
+    [
+        ("local", True),
+        ("cached_remote", True),
+        ("in_memory", False),
+        ("remote", False),
+    ],
+)
+@pytest.mark.parametrize("mmap", [False, True])
+async def test_numpy_array_serializer(kind, memory_mapped, mmap, tmp_path):
+    np = pytest.importorskip("numpy")
+    array = np.arange(12, dtype=np.float32).reshape(3, 4)
+    serializer = NumpyArraySerializer(mmap=mmap)
+    target = Serializable(_numpy_target(kind, tmp_path), serializer)
+
+    with InMemoryFileSystemTarget.cleared():
+        target.save(array)
+        for loaded in (target.load(), await target.load_aio()):
+            np.testing.assert_array_equal(loaded, array)
+            assert loaded.dtype == array.dtype
+            # Memory mapped from local and cached files only
+            assert isinstance(loaded, np.memmap) == (mmap and memory_mapped)
+            if isinstance(loaded, np.memmap):
+                assert not loaded.flags.writeable
+
+        await target.save_aio(array[:1])
+        np.testing.assert_array_equal(target.load(), array[:1])
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+async def test_numpy_array_dict_serializer(compressed, tmp_path):
+    np = pytest.importorskip("numpy")
+    arrays = {"a": np.arange(5), "b": np.ones((2, 2))}
+    target = Serializable(
+        LocalTarget(str(tmp_path / "arrays.npz")),
+        NumpyArrayDictSerializer(compressed=compressed),
+    )
+
+    target.save(arrays)
+    for loaded in (target.load(), await target.load_aio()):
+        assert loaded.keys() == arrays.keys()
+        for name, array in arrays.items():
+            np.testing.assert_array_equal(loaded[name], array)
+
+
+def test_numpy_array_annotations():
+    np = pytest.importorskip("numpy")
+    npt = pytest.importorskip("numpy.typing")
+
+    assert get_serializer(np.ndarray) == NumpyArraySerializer()
+    assert get_serializer(npt.NDArray[np.float64]) == NumpyArraySerializer()
+    assert get_serializer(dict[str, npt.NDArray[np.int64]]) == (
+        NumpyArrayDictSerializer()
+    )
+    assert get_serializer(dict[str, int]) == JSONSerializer(dict[str, int])